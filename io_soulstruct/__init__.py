@@ -415,6 +415,8 @@ CLASSES = (
     MSBPartCreationTemplates,
     CreateMSBPart,
     CreateMSBRegion,
+    ConvertRegionScaleMode,
+    ShareMSBRegionMeshes,
     CreateMSBEnvironmentEvent,
     DuplicateMSBPartModel,
     BatchSetPartGroups,
@@ -629,6 +631,8 @@ BONE_ATTRIBUTES = []
 LOAD_POST_HANDLERS = []
 SPACE_VIEW_3D_HANDLERS = []
 DEPSGRAPH_UPDATE_POST_HANDLERS = []
+UNDO_POST_HANDLERS = []
+REDO_POST_HANDLERS = []
 
 
 def register():
@@ -726,6 +730,42 @@ def register():
         bpy.types.SpaceView3D.draw_handler_add(draw_msb_regions, (), "WINDOW", "POST_VIEW")
     )
 
+    # MSB export cache handlers
+    bpy.app.handlers.depsgraph_update_post.append(track_msb_export_updates)
+    DEPSGRAPH_UPDATE_POST_HANDLERS.append(track_msb_export_updates)
+    bpy.app.handlers.load_post.append(clear_msb_export_cache)
+    LOAD_POST_HANDLERS.append(clear_msb_export_cache)
+    bpy.app.handlers.undo_post.append(clear_msb_export_cache)
+    UNDO_POST_HANDLERS.append(clear_msb_export_cache)
+    bpy.app.handlers.redo_post.append(clear_msb_export_cache)
+    REDO_POST_HANDLERS.append(clear_msb_export_cache)
+
+    # MCG draw cache and edge cost cache invalidation handlers
+    bpy.app.handlers.depsgraph_update_post.append(track_mcg_draw_updates)
+    DEPSGRAPH_UPDATE_POST_HANDLERS.append(track_mcg_draw_updates)
+    bpy.app.handlers.load_post.append(mark_mcg_draw_caches_dirty)
+    LOAD_POST_HANDLERS.append(mark_mcg_draw_caches_dirty)
+    bpy.app.handlers.undo_post.append(mark_mcg_draw_caches_dirty)
+    UNDO_POST_HANDLERS.append(mark_mcg_draw_caches_dirty)
+    bpy.app.handlers.redo_post.append(mark_mcg_draw_caches_dirty)
+    REDO_POST_HANDLERS.append(mark_mcg_draw_caches_dirty)
+    bpy.app.handlers.load_post.append(clear_navmesh_edge_cost_caches)
+    LOAD_POST_HANDLERS.append(clear_navmesh_edge_cost_caches)
+    bpy.app.handlers.undo_post.append(clear_navmesh_edge_cost_caches)
+    UNDO_POST_HANDLERS.append(clear_navmesh_edge_cost_caches)
+    bpy.app.handlers.redo_post.append(clear_navmesh_edge_cost_caches)
+    REDO_POST_HANDLERS.append(clear_navmesh_edge_cost_caches)
+
+    # MSB entity ID index handlers
+    bpy.app.handlers.depsgraph_update_post.append(track_entity_id_updates)
+    DEPSGRAPH_UPDATE_POST_HANDLERS.append(track_entity_id_updates)
+    bpy.app.handlers.load_post.append(clear_entity_id_indices)
+    LOAD_POST_HANDLERS.append(clear_entity_id_indices)
+    bpy.app.handlers.undo_post.append(clear_entity_id_indices)
+    UNDO_POST_HANDLERS.append(clear_entity_id_indices)
+    bpy.app.handlers.redo_post.append(clear_entity_id_indices)
+    REDO_POST_HANDLERS.append(clear_entity_id_indices)
+
     # FLVER submesh sync handler
     bpy.app.handlers.depsgraph_update_post.append(flver_submesh_sync_handler)
     DEPSGRAPH_UPDATE_POST_HANDLERS.append(flver_submesh_sync_handler)
@@ -780,6 +820,14 @@ def unregister():
         bpy.app.handlers.depsgraph_update_post.remove(handler)
     DEPSGRAPH_UPDATE_POST_HANDLERS.clear()
 
+    for handler in UNDO_POST_HANDLERS:
+        bpy.app.handlers.undo_post.remove(handler)
+    UNDO_POST_HANDLERS.clear()
+
+    for handler in REDO_POST_HANDLERS:
+        bpy.app.handlers.redo_post.remove(handler)
+    REDO_POST_HANDLERS.clear()
+
 
 if __name__ == "__main__":
     register()
@@ -125,6 +125,7 @@ class ImportHKXCutscene(LoggingImportOperator):
                 continue
             bl_part_class: type[BaseBlenderMSBPart]
 
+            remo_flver_parts = []  # type: list[tuple[RemoPart, BaseBlenderMSBPart]]
             for remo_part in remo_parts_dict.values():
 
                 self.debug(f"Adding RemoPart: {remo_part.name}")
@@ -140,6 +141,24 @@ class ImportHKXCutscene(LoggingImportOperator):
                     # e.g. Collisions. Not animated, only used for display groups.
                     continue  # next RemoPart
 
+                remo_flver_parts.append((remo_part, bl_part))
+
+            # We need to add an Armature to each Part, if it doesn't already have one (including default Armatures).
+            # This is batched so that the view layer is only updated once (so we can set poses below).
+            # TODO: Do we actually need the Map Pieces to have default Armatures...?
+            #  Surely they don't have any actual animation data in the REMOBND.
+            #  (Correct: just root motion, which doesn't require an Armature. Animation drives transform only.)
+            # TODO: try/except, etc.
+            bl_part_class.duplicate_flver_model_armatures(
+                self,
+                context,
+                [bl_part for _, bl_part in remo_flver_parts],
+                mode=MSBPartArmatureMode.IF_PRESENT,
+                copy_pose=False,
+            )
+
+            for remo_part, bl_part in remo_flver_parts:
+
                 all_cut_frames = self._get_remo_part_cut_arma_frames_or_counts(remobnd, remo_part)
 
                 # TODO: `RemoPart` method that checks if animation data, for a given cut:
@@ -149,20 +168,6 @@ class ImportHKXCutscene(LoggingImportOperator):
                 #  If (a) is true, we can animate the object's transform only.
                 #  We can maybe just assert that Map Pieces are NEVER animated, as well.
 
-                # We need to add an Armature to the Part, if it doesn't already have one (including default Armatures).
-                # TODO: Do we actually need the Map Pieces to have default Armatures...?
-                #  Surely they don't have any actual animation data in the REMOBND.
-                #  (Correct: just root motion, which doesn't require an Armature. Animation drives transform only.)
-                if not bl_part.armature:
-                    # TODO: try/except, etc.
-                    bl_part.duplicate_flver_model_armature(
-                        self,
-                        context,
-                        mode=MSBPartArmatureMode.IF_PRESENT,
-                        copy_pose=False,
-                    )
-                    context.view_layer.update()  # so we can set pose below  TODO: slight optimization to batch this
-
                 if not bl_part.armature:
                     if remo_part_type != RemoPartType.MapPiece:
                         self.warning(f"MSB Part '{remo_part.map_part_name}' does not have an Armature. Cannot animate.")
@@ -352,6 +352,11 @@ class BaseGameFLVERBinderExportOperator(LoggingOperator):
         """Export FLVER from Blender object and return Binder, FLVER, and texture collection.
 
         NOTE: Returned Binder does not load FLVER entries automatically (and they typically aren't needed).
+
+        NOTE: All other Binder entries (animations, existing TPFs, etc.) keep their raw, already-packed entry bytes and
+        are copied through verbatim on write. Only managed entries (the FLVER set with `set_flver()` and any TPF set
+        via `binder.tpf`) are re-packed, so there is no need to pre-load or otherwise touch the other entries here.
+        The outer Binder DCX (if any) still has to be re-compressed as one stream.
         """
         bl_flver = BlenderFLVER.from_armature_or_mesh(context.active_object)
         cls_name = binder_class.__name__
@@ -21,10 +21,18 @@ from collections import deque
 
 import bmesh
 import bpy
+import numpy as np
 from mathutils import Matrix, Vector, kdtree
 
 from soulstruct.blender.types import MeshObject
-from soulstruct.blender.utilities import LoggingOperator
+from soulstruct.blender.utilities import (
+    LoggingOperator,
+    get_mesh_vertex_coords,
+    get_mesh_loop_face_indices,
+    get_mesh_face_island_labels,
+    get_mesh_vertex_adjacency,
+    get_csr_hop_distances,
+)
 
 
 def move_mesh_selection(
@@ -293,48 +301,80 @@ class ScaleMeshIslands(LoggingOperator):
 
         # noinspection PyTypeChecker
         obj = context.edit_object  # type: MeshObject
+        mesh = obj.data
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
-
-        # Record the initially selected faces to restore later.
-        initially_selected_faces = {face for face in bm.faces if face.select}
-
-        # Use face `tag` to track visited faces.
-        for face in bm.faces:
-            face.tag = False
-
-        for face in initially_selected_faces:
-            if face.tag:
-                continue  # part of a previous island
-
-            # Select the connected geometry (island) using 'select linked'
-            self.deselect_all()
-            face.select_set(True)
-            bpy.ops.mesh.select_linked(delimit={"NORMAL"})  # select connected geometry by connectivity
-
-            current_island_faces = {f for f in bm.faces if f.select}
-            for island_face in current_island_faces:
-                island_face.tag = True  # visited
-
-            # Compute the center of the island.
-            island_verts = {v for f in current_island_faces for v in f.verts}
-            center = sum((v.co for v in island_verts), Vector()) / len(island_verts)
-
-            # Scale the vertices around the island's center (wrapping with translation to origin).
-            scale_matrix = Matrix.Translation(center) @ Matrix.Scale(self.scale_factor, 4) @ Matrix.Translation(-center)
-            for vert in island_verts:
-                vert.co = scale_matrix @ vert.co
-
-        bmesh.update_edit_mesh(obj.data)
-        self.info(f"Scaled each selected island by a factor of {self.scale_factor}.")
+        # We toggle out of Edit Mode to read and write the mesh arrays directly, then back in.
+        bpy.ops.object.mode_set(mode="OBJECT")
+        try:
+            island_count = self._scale_selected_islands(mesh, self.scale_factor)
+        finally:
+            bpy.ops.object.mode_set(mode="EDIT")
 
-        # Restore the initial face selection.
-        self.deselect_all()
-        for face in initially_selected_faces:
-            face.select = True
+        self.info(f"Scaled each of {island_count} selected islands by a factor of {self.scale_factor}.")
         return {"FINISHED"}
 
+    @staticmethod
+    def _scale_selected_islands(mesh: bpy.types.Mesh, scale_factor: float) -> int:
+        """Scale every island of edge-linked faces (delimited by normal, like 'Select Linked') containing at least one
+        selected face about the centroid of its vertices. Returns the number of islands scaled.
+
+        Islands that share no vertices with other scaled islands are all scaled at once. Islands that do share vertices
+        are then scaled one at a time, in order of their first selected face, so shared vertices are scaled about each
+        of their islands' centroids in turn (as the old island-by-island `BMesh` loop did).
+        """
+        face_count = len(mesh.polygons)
+        face_select = np.empty(face_count, dtype=bool)
+        mesh.polygons.foreach_get("select", face_select)
+        if not face_select.any():
+            return 0
+
+        face_labels = get_mesh_face_island_labels(mesh, delimit_normal=True)
+        island_count = face_labels.max() + 1
+        selected_face_indices = np.flatnonzero(face_select)
+        first_selected_faces = np.full(island_count, face_count)
+        np.minimum.at(first_selected_faces, face_labels[selected_face_indices], selected_face_indices)
+        island_selected = first_selected_faces < face_count
+
+        # Get the unique (vertex, island) pairs of scaled islands.
+        loop_vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+        loop_labels = face_labels[get_mesh_loop_face_indices(mesh)]
+        loop_mask = island_selected[loop_labels]
+        pair_vertices, pair_labels = np.unique(
+            np.stack((loop_vertex_indices[loop_mask], loop_labels[loop_mask]), axis=1), axis=0
+        ).T
+        shared_vertex_mask = np.bincount(pair_vertices, minlength=len(mesh.vertices)) > 1
+        shared_island_mask = np.zeros(island_count, dtype=bool)
+        shared_island_mask[pair_labels[shared_vertex_mask[pair_vertices]]] = True
+        shared_pair_mask = shared_island_mask[pair_labels]
+
+        # Compute centroids of islands with their own vertices and scale around them in one pass.
+        coords = get_mesh_vertex_coords(mesh).astype(np.float64)
+        scaled_vertices = pair_vertices[~shared_pair_mask]
+        scaled_labels = pair_labels[~shared_pair_mask]
+        scaled_coords = coords[scaled_vertices]
+        centroids = np.zeros((island_count, 3), dtype=np.float64)
+        np.add.at(centroids, scaled_labels, scaled_coords)
+        centroids /= np.maximum(np.bincount(scaled_labels, minlength=island_count), 1)[:, np.newaxis]
+        vertex_centroids = centroids[scaled_labels]
+        coords[scaled_vertices] = vertex_centroids + scale_factor * (scaled_coords - vertex_centroids)
+
+        # Scale islands with shared vertices one at a time.
+        if shared_pair_mask.any():
+            shared_vertices = pair_vertices[shared_pair_mask]
+            shared_labels = pair_labels[shared_pair_mask]
+            order = np.argsort(first_selected_faces[shared_labels], kind="stable")
+            island_starts = np.flatnonzero(np.diff(shared_labels[order], prepend=-1))
+            for island_vertices in np.split(shared_vertices[order], island_starts[1:]):
+                island_coords = coords[island_vertices]
+                centroid = island_coords.mean(axis=0)
+                coords[island_vertices] = centroid + scale_factor * (island_coords - centroid)
+
+        mesh.vertices.foreach_set("co", coords.astype(np.float32).ravel())
+        mesh.update()
+
+        return int(island_selected.sum())
+
 
 class SelectActiveMeshVerticesNearSelected(LoggingOperator):
 
@@ -367,15 +407,13 @@ class SelectActiveMeshVerticesNearSelected(LoggingOperator):
     def execute(self, context):
 
         if context.mode == "OBJECT":
-            bm = bmesh.new()
             # noinspection PyTypeChecker
             active_obj = context.active_object  # type: MeshObject
-            bm.from_mesh(active_obj.data)
             is_edit_mode = False
         elif context.mode == "EDIT_MESH":
             # noinspection PyTypeChecker
             active_obj = context.edit_object  # type: MeshObject
-            bm = bmesh.from_edit_mesh(active_obj.data)
+            active_obj.update_from_editmode()  # sync edit mesh coordinates to `active_obj.data` for `foreach_get`
             is_edit_mode = True
         else:
             return self.error("Active object must be a mesh in Object or Edit Mesh mode.")
@@ -383,36 +421,34 @@ class SelectActiveMeshVerticesNearSelected(LoggingOperator):
         # noinspection PyTypeChecker
         other_objs = [obj for obj in context.selected_objects if obj != active_obj]  # type: list[MeshObject]
 
-        # Build a KD-tree from the other object's vertices (in global space)
-        kd_trees = []
-        for other_obj in other_objs:
-            other_mesh = other_obj.data
-            size = len(other_mesh.vertices)
-            kd = kdtree.KDTree(size)
-            for i, v in enumerate(other_mesh.vertices):
-                # Transform vertex coordinate to global space
-                kd.insert(other_obj.matrix_world @ v.co, i)
-            kd.balance()
-            kd_trees.append(kd)
-
-        # For each vertex in the active mesh, check if it's close to any vertex from the other mesh
-        for v in bm.verts:
-            global_co = active_obj.matrix_world @ v.co
-            for kd in kd_trees:
-                # `kd.find_range()` returns a list of (co, index, distance) for points within `max_distance`
-                if kd.find_range(global_co, self.max_distance):
-                    v.select = True
-                    break
-            else:
-                # Deselect vertex.
-                v.select = False
+        # Build a single KD-tree from all other objects' vertices (in global space).
+        other_coords = [get_mesh_vertex_coords(other_obj.data, other_obj.matrix_world) for other_obj in other_objs]
+        other_coords = np.concatenate(other_coords) if other_coords else np.empty((0, 3), dtype=np.float32)
+        kd = kdtree.KDTree(len(other_coords))
+        for i, co in enumerate(other_coords.tolist()):
+            kd.insert(co, i)
+        kd.balance()
+
+        # For each vertex in the active mesh, check if its nearest vertex from the other meshes is close enough.
+        active_coords = get_mesh_vertex_coords(active_obj.data, active_obj.matrix_world)
+        select = np.zeros(len(active_coords), dtype=bool)
+        if len(other_coords) > 0:
+            max_distance = self.max_distance
+            for i, co in enumerate(active_coords.tolist()):
+                # `kd.find()` returns (co, index, distance) of the nearest point.
+                select[i] = kd.find(co)[2] <= max_distance
 
         if is_edit_mode:
+            # Mesh data will be overwritten by the edit mesh, so we write selection to the BMesh.
+            bm = bmesh.from_edit_mesh(active_obj.data)
+            for v, v_select in zip(bm.verts, select.tolist()):
+                v.select = v_select
             # Update the mesh in Edit Mesh mode to reflect the selection changes.
             bmesh.update_edit_mesh(active_obj.data)
         else:
-            # Update the mesh in Object Mode to reflect the selection changes.
-            bm.to_mesh(active_obj.data)
+            # Write selection directly to mesh data in Object Mode.
+            active_obj.data.vertices.foreach_set("select", select)
+            active_obj.data.update()
 
         return {"FINISHED"}
 
@@ -660,83 +696,260 @@ class SpawnObjectIntoMeshAtFaces(LoggingOperator):
         if dest_obj is None or dest_obj.type != 'MESH':
             return self.error("Active object must be a mesh in Edit Mode.")
 
-        dest_mesh = dest_obj.data
-        bm = bmesh.from_edit_mesh(dest_mesh)
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
+        source_mesh = source_obj.data
+        if not source_mesh.polygons:
+            return self.error(f"Source object '{self.object_name}' has no faces to spawn.")
 
-        # Store spawn data: for each selected face, record its centroid and normal.
-        spawn_data = []
-        for face in bm.faces:
-            if face.select:
-                spawn_data.append((face.calc_center_median(), face.normal.copy()))
-        if not spawn_data:
+        # Get spawn data from selected faces: centroid (median) and normal.
+        dest_mesh = dest_obj.data
+        dest_obj.update_from_editmode()  # sync edit mesh to `dest_mesh` for `foreach_get`
+        face_count = len(dest_mesh.polygons)
+        face_select = np.empty(face_count, dtype=bool)
+        dest_mesh.polygons.foreach_get("select", face_select)
+        face_centers = np.empty((face_count, 3), dtype=np.float32)
+        dest_mesh.polygons.foreach_get("center", face_centers.ravel())
+        face_normals = np.empty((face_count, 3), dtype=np.float32)
+        dest_mesh.polygons.foreach_get("normal", face_normals.ravel())
+        spawn_centroids = face_centers[face_select].astype(np.float64)
+        spawn_normals = face_normals[face_select].astype(np.float64)
+        spawn_count = len(spawn_centroids)
+        if spawn_count == 0:
             return self.error("No selected faces to spawn onto.")
 
-        # Store original face count.
-        orig_face_count = len(bm.faces)
+        # Draw random translation, rotation, and scale values for each spawn, in the same order as always (so seeded
+        # results are unchanged).
+        rand_values = np.empty((spawn_count, 3), dtype=np.float64)
+        for i in range(spawn_count):
+            rand_values[i] = (
+                random.uniform(self.translation_min, self.translation_max),
+                math.radians(random.uniform(self.rotation_min, self.rotation_max)),
+                random.uniform(self.scale_min, self.scale_max),
+            )
 
-        # Merge in the source mesh.
-        bm.from_mesh(source_obj.data)  # merges into `bm`
-        bm.faces.ensure_lookup_table()
-        bm.verts.ensure_lookup_table()
+        # Get source geometry. Only vertices used by faces are spawned.
+        source_coords = get_mesh_vertex_coords(source_mesh).astype(np.float64)
+        source_loop_vertex_indices = np.empty(len(source_mesh.loops), dtype=np.int32)
+        source_mesh.loops.foreach_get("vertex_index", source_loop_vertex_indices)
+        source_face_count = len(source_mesh.polygons)
+        source_loop_starts = np.empty(source_face_count, dtype=np.int32)
+        source_mesh.polygons.foreach_get("loop_start", source_loop_starts)
+        loop_totals = np.empty(source_face_count, dtype=np.int32)
+        source_mesh.polygons.foreach_get("loop_total", loop_totals)
+
+        # Source loop indices in face order, so each face's loops are contiguous from `loop_starts` (even if the
+        # source's own loop starts are not sorted).
+        loop_starts = np.cumsum(loop_totals) - loop_totals
+        loop_count = int(loop_totals.sum())
+        source_loop_indices = np.repeat(source_loop_starts - loop_starts, loop_totals) + np.arange(loop_count)
+
+        used_vertex_indices, loop_vertex_indices = np.unique(
+            source_loop_vertex_indices[source_loop_indices], return_inverse=True
+        )
+        source_coords = source_coords[used_vertex_indices]
 
-        # The newly merged source geometry is now appended.
-        # noinspection PyTypeChecker
-        source_faces = bm.faces[orig_face_count:]  # type: list[bmesh.types.BMFace]
-        if not source_faces:
-            raise Exception("No new faces were merged from the source.")
-
-        # Compute the centroid of the merged source geometry once.
-        temp_center = Vector((0, 0, 0))
-        for f in source_faces:
-            temp_center += f.calc_center_median()
-        temp_center /= len(source_faces)
-
-        # For each spawn location, duplicate the merged source geometry and transform it.
-        for centroid, normal in spawn_data:
-            dup_result = bmesh.ops.duplicate(bm, geom=source_faces)
-            new_geom = dup_result["geom"]
-            new_verts = [elem for elem in new_geom if isinstance(elem, bmesh.types.BMVert)]
-
-            # Compute random rotation (in radians) and random scale factor.
-            rand_slide = random.uniform(self.translation_min, self.translation_max)
-            rand_angle = math.radians(random.uniform(self.rotation_min, self.rotation_max))
-            rand_scale = random.uniform(self.scale_min, self.scale_max)
-            rand_slide *= rand_scale  # scale affects translation
-
-            # Build transformation matrices.
-            # 1. T1: Translate source so that its center is at the origin.
-            t_to_origin = Matrix.Translation(-temp_center)  # move source center to origin
-
-            if self.rotate_to_face_normal:
-                r_to_face = Vector((0, 0, 1)).rotation_difference(normal).to_matrix().to_4x4()  # align to face normal
-            else:
-                r_to_face = Matrix.Identity(4)  # don't align
+        # Source center is the mean of source face median centers.
+        source_face_centers = np.add.reduceat(source_coords[loop_vertex_indices], loop_starts, axis=0)
+        source_center = np.mean(source_face_centers / loop_totals[:, np.newaxis], axis=0)
 
-            # Random rotation around face normal.
-            r_random = Matrix.Rotation(rand_angle, 4, normal)
-            # Random uniform scaling.
-            s_random = Matrix.Scale(rand_scale, 4)
-            # Translate source to face centroid.
-            t_to_face = Matrix.Translation(centroid)
-            # Random translation along face normal.
-            t_random = Matrix.Translation(normal * rand_slide)
+        transforms = _get_spawn_transforms(
+            spawn_centroids, spawn_normals, rand_values, source_center, self.rotate_to_face_normal
+        )  # (N, 4, 4)
 
-            # Compose the final transformation.
-            transform = t_random @ t_to_face @ s_random @ r_random @ r_to_face @ t_to_origin
+        # Transform all copies of source vertices at once: (N, V, 3).
+        spawn_coords = (
+            np.einsum("nij,vj->nvi", transforms[:, :3, :3], source_coords) + transforms[:, np.newaxis, :3, 3]
+        )
 
-            for v in new_verts:
-                v.co = transform @ v.co
+        # Offset face loops and vertex indices for each copy.
+        vertex_count = len(source_coords)
+        spawn_loop_vertex_indices = (
+            loop_vertex_indices[np.newaxis, :] + vertex_count * np.arange(spawn_count)[:, np.newaxis]
+        )
+        spawn_loop_starts = loop_starts[np.newaxis, :] + loop_count * np.arange(spawn_count)[:, np.newaxis]
 
-        # Delete the original merged source geometry, which has now been duplicated to each face.
-        bmesh.ops.delete(bm, geom=source_faces, context="VERTS")
+        # Build all copies in one temporary Mesh, then merge it into the edited BMesh in one go.
+        spawn_mesh = bpy.data.meshes.new(f"{source_mesh.name} <Spawn>")
+        try:
+            spawn_mesh.vertices.add(spawn_count * vertex_count)
+            spawn_mesh.vertices.foreach_set("co", spawn_coords.astype(np.float32).ravel())
+            spawn_mesh.loops.add(spawn_count * loop_count)
+            spawn_mesh.loops.foreach_set("vertex_index", spawn_loop_vertex_indices.astype(np.int32).ravel())
+            spawn_mesh.polygons.add(spawn_count * source_face_count)
+            spawn_mesh.polygons.foreach_set("loop_start", spawn_loop_starts.astype(np.int32).ravel())
+            spawn_mesh.polygons.foreach_set("loop_total", np.tile(loop_totals, spawn_count))
+            spawn_mesh.update(calc_edges=True)
+
+            # Copy all other attributes (material indices, UVs, colors, smooth shading, custom normals, etc.) to
+            # every copy.
+            _copy_spawn_attributes(source_mesh, spawn_mesh, spawn_count, used_vertex_indices, source_loop_indices)
+
+            bm = bmesh.from_edit_mesh(dest_mesh)
+            bm.from_mesh(spawn_mesh)  # merges into `bm`
+        finally:
+            bpy.data.meshes.remove(spawn_mesh)
 
         bmesh.update_edit_mesh(dest_mesh)
-        self.info(f"Spawned {len(spawn_data)} copies of the source mesh.")
+        self.info(f"Spawned {spawn_count} copies of the source mesh.")
         return {"FINISHED"}
 
 
+# Data `foreach_get()` key, NumPy dtype, and component count of each attribute type copied when spawning.
+_SPAWN_ATTRIBUTE_DATA = {
+    "FLOAT": ("value", np.float32, 1),
+    "INT": ("value", np.int32, 1),
+    "INT8": ("value", np.int32, 1),
+    "BOOLEAN": ("value", bool, 1),
+    "FLOAT2": ("vector", np.float32, 2),
+    "INT16_2D": ("value", np.int32, 2),
+    "INT32_2D": ("value", np.int32, 2),
+    "FLOAT_VECTOR": ("vector", np.float32, 3),
+    "FLOAT_COLOR": ("color", np.float32, 4),
+    "BYTE_COLOR": ("color", np.float32, 4),
+    "QUATERNION": ("value", np.float32, 4),
+    "FLOAT4X4": ("value", np.float32, 16),
+}
+
+
+def _get_attribute_array(attribute: bpy.types.Attribute) -> np.ndarray:
+    key, dtype, size = _SPAWN_ATTRIBUTE_DATA[attribute.data_type]
+    values = np.empty((len(attribute.data), size), dtype=dtype)
+    attribute.data.foreach_get(key, values.ravel())
+    return values
+
+
+def _copy_spawn_attributes(
+    source_mesh: bpy.types.Mesh,
+    spawn_mesh: bpy.types.Mesh,
+    spawn_count: int,
+    used_vertex_indices: np.ndarray,
+    source_loop_indices: np.ndarray,
+):
+    """Copy every non-internal attribute of `source_mesh` to each of the `spawn_count` copies of its faces in
+    `spawn_mesh`, as `BMesh` duplication would.
+
+    `used_vertex_indices` are the source vertices of each copy and `source_loop_indices` are the source loops of each
+    copy (in face order). Copy edges are matched to source edges by their source vertices. Attributes of other types
+    (e.g. strings) are skipped.
+    """
+    spawn_edge_source_indices = None  # computed on demand
+
+    for source_attribute in source_mesh.attributes:
+        if source_attribute.is_internal or source_attribute.is_required:
+            continue  # e.g. 'position' or selection states
+        if source_attribute.data_type not in _SPAWN_ATTRIBUTE_DATA:
+            continue
+        values = _get_attribute_array(source_attribute)
+        domain = source_attribute.domain
+        if domain == "POINT":
+            values = np.tile(values[used_vertex_indices], (spawn_count, 1))
+        elif domain == "CORNER":
+            values = np.tile(values[source_loop_indices], (spawn_count, 1))
+        elif domain == "FACE":
+            values = np.tile(values, (spawn_count, 1))
+        elif domain == "EDGE":
+            if spawn_edge_source_indices is None:
+                spawn_edge_source_indices = _get_spawn_edge_source_indices(
+                    source_mesh, spawn_mesh, used_vertex_indices
+                )
+            values = values[spawn_edge_source_indices]
+        else:
+            continue
+
+        key = _SPAWN_ATTRIBUTE_DATA[source_attribute.data_type][0]
+        spawn_attribute = spawn_mesh.attributes.get(source_attribute.name)
+        if spawn_attribute is None:
+            spawn_attribute = spawn_mesh.attributes.new(source_attribute.name, source_attribute.data_type, domain)
+        spawn_attribute.data.foreach_set(key, values.ravel())
+
+
+def _get_spawn_edge_source_indices(
+    source_mesh: bpy.types.Mesh, spawn_mesh: bpy.types.Mesh, used_vertex_indices: np.ndarray
+) -> np.ndarray:
+    """Get the source edge index of each edge in `spawn_mesh`, which contains copies of the faces of `source_mesh`
+    that use (only) `used_vertex_indices`."""
+    source_vertex_count = len(source_mesh.vertices)
+    source_edges = np.empty((len(source_mesh.edges), 2), dtype=np.int64)
+    source_mesh.edges.foreach_get("vertices", source_edges.ravel())
+    source_edges.sort(axis=1)
+    source_keys = source_edges[:, 0] * source_vertex_count + source_edges[:, 1]
+    source_order = np.argsort(source_keys)
+
+    spawn_edges = np.empty((len(spawn_mesh.edges), 2), dtype=np.int64)
+    spawn_mesh.edges.foreach_get("vertices", spawn_edges.ravel())
+    spawn_edges = used_vertex_indices[spawn_edges % len(used_vertex_indices)]
+    spawn_edges.sort(axis=1)
+    spawn_keys = spawn_edges[:, 0] * source_vertex_count + spawn_edges[:, 1]
+    # Every face edge of a valid source mesh exists in its edges.
+    return source_order[np.searchsorted(source_keys, spawn_keys, sorter=source_order)]
+
+
+def _get_spawn_transforms(
+    centroids: np.ndarray,
+    normals: np.ndarray,
+    rand_values: np.ndarray,
+    source_center: np.ndarray,
+    rotate_to_face_normal: bool,
+) -> np.ndarray:
+    """Compute an `(N, 4, 4)` stack of spawn transforms for `SpawnObjectIntoMeshAtFaces`.
+
+    Each transform is equivalent to this `mathutils` composition, for random `(slide, angle, scale)` in `rand_values`:
+        `T(normal * slide * scale) @ T(centroid) @ S(scale) @ R(angle, normal) @ R(+Z -> normal) @ T(-source_center)`
+    """
+    count = len(centroids)
+    normals = normals / np.linalg.norm(normals, axis=1)[:, np.newaxis]
+    slides, angles, scales = rand_values.T
+    identity = np.broadcast_to(np.eye(3), (count, 3, 3))
+
+    if rotate_to_face_normal:
+        # Equivalent to `Vector((0, 0, 1)).rotation_difference(normal)`.
+        axes = np.stack((-normals[:, 1], normals[:, 0], np.zeros(count)), axis=1)  # +Z cross normal
+        axis_lengths = np.linalg.norm(axes, axis=1)
+        degenerate = axis_lengths <= 1e-7
+        axes[~degenerate] /= axis_lengths[~degenerate, np.newaxis]
+        face_angles = np.arccos(np.clip(normals[:, 2], -1.0, 1.0))
+        # Normal parallel to +Z needs no rotation; normal parallel to -Z is rotated 180 degrees around the same
+        # orthogonal axis `mathutils` chooses.
+        antiparallel = degenerate & (normals[:, 2] < 0.0)
+        axes[degenerate] = 0.0
+        axes[antiparallel] = (math.sqrt(0.5), math.sqrt(0.5), 0.0)
+        face_angles[degenerate] = 0.0
+        face_angles[antiparallel] = math.pi
+        r_to_face = _get_axis_angle_matrices(axes, face_angles)
+    else:
+        r_to_face = identity
+
+    r_random = _get_axis_angle_matrices(normals, angles)
+    linear = scales[:, np.newaxis, np.newaxis] * (r_random @ r_to_face)
+
+    transforms = np.zeros((count, 4, 4), dtype=np.float64)
+    transforms[:, :3, :3] = linear
+    transforms[:, :3, 3] = (
+        normals * (slides * scales)[:, np.newaxis]
+        + centroids
+        - np.einsum("nij,j->ni", linear, source_center)
+    )
+    transforms[:, 3, 3] = 1.0
+    return transforms
+
+
+def _get_axis_angle_matrices(axes: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    """Rodrigues rotation matrices (N, 3, 3) for unit `axes` (N, 3) and `angles` (N)."""
+    cos = np.cos(angles)[:, np.newaxis, np.newaxis]
+    sin = np.sin(angles)[:, np.newaxis, np.newaxis]
+    x, y, z = axes.T
+    zero = np.zeros_like(x)
+    cross = np.stack(
+        (
+            np.stack((zero, -z, y), axis=1),
+            np.stack((z, zero, -x), axis=1),
+            np.stack((-y, x, zero), axis=1),
+        ),
+        axis=1,
+    )
+    outer = axes[:, :, np.newaxis] * axes[:, np.newaxis, :]
+    return cos * np.eye(3) + sin * cross + (1.0 - cos) * outer
+
+
 class WeightVerticesWithFalloff(LoggingOperator):
 
     bl_idname = "mesh.weight_vertices_with_falloff"
@@ -774,50 +987,35 @@ class WeightVerticesWithFalloff(LoggingOperator):
         obj = context.edit_object  # type: MeshObject
 
         mesh = obj.data
-        bm = bmesh.from_edit_mesh(mesh)
-        bm.verts.ensure_lookup_table()
 
         # Get the vertex group (must already exist).
         vg = obj.vertex_groups.get(self.vertex_group)
         if vg is None:
             return self.error(f"Vertex group '{self.vertex_group}' not found in Mesh '{obj.name}'.")
 
-        # Start with the currently selected vertices.
-        initial_verts = set(v.index for v in bm.verts if v.select)
-        if not initial_verts:
-            return self.error("No vertices are selected.")
-
-        # Mark visited vertices using a set of vertex indices.
-        visited = set(initial_verts)
-
-        # Assign weight 1.0 to the initial (selected) vertices.
-        for idx in initial_verts:
-            vg.add([idx], 1.0, 'REPLACE')
-
-        # The current "ring" is the set of vertices we just processed.
-        current_ring = initial_verts
-
-        # For each step, find neighbors not yet visited. The weight for the final step is `1 / num_steps`.
-        falloff = 1.0 / (self.steps + 1)
-        for step in range(1, self.steps + 1):
-            new_ring = set()
-            for vertex_idx in current_ring:
-                v = bm.verts[vertex_idx]
-                # For each edge connected to v, check the other vertex.
-                for edge in v.link_edges:
-                    for other in edge.verts:
-                        if other.index not in visited:
-                            new_ring.add(other.index)
-            weight = 1.0 - step * falloff
-            # Assign that weight to all vertices in this new ring.
-            for idx in new_ring:
-                vg.add([idx], weight, 'REPLACE')
-            # Update visited and current_ring for the next iteration.
-            visited.update(new_ring)
-            current_ring = new_ring
-
-        # Update the mesh.
-        bmesh.update_edit_mesh(mesh)
+        # Vertex groups cannot be modified in Edit Mode, so we toggle out of it, then back in.
+        bpy.ops.object.mode_set(mode="OBJECT")
+        try:
+            # Start with the currently selected vertices.
+            vertex_select = np.empty(len(mesh.vertices), dtype=bool)
+            mesh.vertices.foreach_get("select", vertex_select)
+            if not vertex_select.any():
+                return self.error("No vertices are selected.")
+
+            # Get the expansion step (ring) of every vertex within range of the selection in one BFS.
+            offsets, neighbors = get_mesh_vertex_adjacency(mesh)
+            rings = get_csr_hop_distances(offsets, neighbors, vertex_select, self.steps)
+
+            # Every vertex in a ring shares a weight, so we add each ring at once. Selected vertices (ring 0) have
+            # weight 1.0 and the weight for the final step is `1 / num_steps`.
+            falloff = 1.0 / (self.steps + 1)
+            for step in range(self.steps + 1):
+                ring_indices = np.flatnonzero(rings == step)
+                if ring_indices.size:
+                    vg.add(ring_indices.tolist(), 1.0 - step * falloff, "REPLACE")
+        finally:
+            bpy.ops.object.mode_set(mode="EDIT")
+
         self.info(f"Vertex group '{self.vertex_group}' updated with falloff weights over {self.steps} steps.")
         return {"FINISHED"}
 
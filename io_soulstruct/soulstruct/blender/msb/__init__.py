@@ -5,6 +5,10 @@ __all__ = [
     "ImportAnyMSB",
     "ExportMapMSB",
     "ExportAnyMSB",
+    "track_msb_export_updates",
+    "clear_msb_export_cache",
+    "track_entity_id_updates",
+    "clear_entity_id_indices",
 
     "RegionDrawSettings",
     "draw_msb_regions",
@@ -16,6 +20,8 @@ __all__ = [
     "MSBPartCreationTemplates",
     "CreateMSBPart",
     "CreateMSBRegion",
+    "ConvertRegionScaleMode",
+    "ShareMSBRegionMeshes",
     "CreateMSBEnvironmentEvent",
     "DuplicateMSBPartModel",
     "BatchSetPartGroups",
@@ -99,6 +105,8 @@ __all__ = [
 
 from .import_operators import *
 from .export_operators import *
+from .export_cache import track_msb_export_updates, clear_msb_export_cache
+from .entity_id_index import track_entity_id_updates, clear_entity_id_indices
 from .misc_operators import *
 from .draw_regions import *
 from .gui import *
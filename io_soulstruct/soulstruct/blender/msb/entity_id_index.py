@@ -0,0 +1,143 @@
+"""Cached index of MSB entry objects by entity ID, for fast repeated lookups (e.g. `FindEntityID` in scripts).
+
+One index is built per searched collection (including child collections) and rebuilt lazily when the number of objects
+in that collection changes, or an MSB Part, Event, or Region object updated in the depsgraph has a different name or
+entity ID than when it was last seen. Other updates (e.g. moving or selecting objects, as `FindEntityID` itself does)
+keep all indices. Objects found in an index are always checked against their current entity ID, and the index is
+rebuilt once if any are dropped or none are found, as not every property change is reported as a depsgraph update (e.g.
+changes made by scripts). Like the MSB export cache, nothing here is saved to the `.blend` file, and indices are cleared
+whenever a file is loaded or undo/redo is used.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "EntityIDIndex",
+    "get_entity_id_index",
+    "get_entity_id_objects",
+    "track_entity_id_updates",
+    "clear_entity_id_indices",
+]
+
+from dataclasses import dataclass, field
+
+import bpy
+from bpy.app.handlers import persistent
+
+from soulstruct.blender.types import SoulstructType
+
+
+_ENTITY_ID_TYPES = (SoulstructType.MSB_PART, SoulstructType.MSB_EVENT, SoulstructType.MSB_REGION)
+
+
+@dataclass(slots=True)
+class EntityIDIndex:
+    """Names of MSB entry objects with each (positive) entity ID in one collection."""
+
+    object_count: int
+    generation: int
+    object_names: dict[int, list[str]] = field(default_factory=dict)
+
+    @property
+    def duplicate_entity_ids(self) -> dict[int, list[str]]:
+        """Entity IDs used by more than one MSB entry, with the names of those entries."""
+        return {entity_id: names for entity_id, names in self.object_names.items() if len(names) > 1}
+
+    def get_objects(self, entity_id: int) -> list[bpy.types.Object]:
+        """Get all MSB entry objects with `entity_id` (usually just one).
+
+        Objects that no longer exist or no longer have `entity_id` (i.e. this index is out of date) are skipped.
+        """
+        objects = []
+        for name in self.object_names.get(entity_id, ()):
+            obj = bpy.data.objects.get(name)
+            if obj is None or obj.soulstruct_type not in _ENTITY_ID_TYPES:
+                continue
+            if getattr(obj, obj.soulstruct_type).entity_id == entity_id:
+                objects.append(obj)
+        return objects
+
+
+# Maps collection `session_uid` to its current index.
+_ENTITY_ID_INDICES = {}  # type: dict[int, EntityIDIndex]
+
+# Maps MSB entry object `session_uid` to its `(name, entity_id)` when it was last indexed or updated.
+_OBJECT_ENTITY_IDS = {}  # type: dict[int, tuple[str, int]]
+
+# Incremented whenever the name or entity ID of any MSB entry object may have changed.
+_GENERATION = 0
+
+
+def get_entity_id_index(collection: bpy.types.Collection) -> tuple[EntityIDIndex, bool]:
+    """Get the entity ID index of all objects in `collection` and its children, and whether it was just (re)built."""
+    index = _ENTITY_ID_INDICES.get(collection.session_uid)
+    if index is not None and index.object_count == len(collection.all_objects) and index.generation == _GENERATION:
+        return index, False
+    return _build_entity_id_index(collection), True
+
+
+def get_entity_id_objects(
+    collection: bpy.types.Collection, entity_id: int
+) -> tuple[list[bpy.types.Object], EntityIDIndex, bool]:
+    """Get all MSB entry objects in `collection` and its children with `entity_id`, the index used to find them, and
+    whether that index was just (re)built.
+
+    If a cached index finds no objects, or finds any that no longer have `entity_id`, it is rebuilt once and searched
+    again, in case entity IDs were changed without a depsgraph update.
+    """
+    index, is_new = get_entity_id_index(collection)
+    objects = index.get_objects(entity_id)
+    if not is_new and (not objects or len(objects) < len(index.object_names.get(entity_id, ()))):
+        index, is_new = _build_entity_id_index(collection), True
+        objects = index.get_objects(entity_id)
+    return objects, index, is_new
+
+
+def _build_entity_id_index(collection: bpy.types.Collection) -> EntityIDIndex:
+    all_objects = collection.all_objects
+    index = EntityIDIndex(len(all_objects), _GENERATION)
+    for obj in all_objects:
+        soulstruct_type = obj.soulstruct_type
+        if soulstruct_type not in _ENTITY_ID_TYPES:
+            continue
+        entity_id = getattr(obj, soulstruct_type).entity_id
+        _OBJECT_ENTITY_IDS[obj.session_uid] = (obj.name, entity_id)
+        if entity_id > 0:
+            index.object_names.setdefault(entity_id, []).append(obj.name)
+    _ENTITY_ID_INDICES[collection.session_uid] = index
+    return index
+
+
+def _check_entity_id_changed(obj: bpy.types.Object) -> bool:
+    """Record the current name and entity ID of MSB entry `obj` and check if either changed since it was last seen.
+
+    Objects never seen before only count as changed if they have an entity ID (e.g. new objects or objects that may
+    have been linked into an indexed collection).
+    """
+    entity_id = getattr(obj, obj.soulstruct_type).entity_id
+    name_and_entity_id = (obj.name, entity_id)
+    last_name_and_entity_id = _OBJECT_ENTITY_IDS.get(obj.session_uid)
+    _OBJECT_ENTITY_IDS[obj.session_uid] = name_and_entity_id
+    if last_name_and_entity_id is None:
+        return entity_id > 0
+    return last_name_and_entity_id != name_and_entity_id
+
+
+@persistent  # prevent Blender from unloading handler when a new file is loaded
+def track_entity_id_updates(_scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph):
+    """Invalidate all entity ID indices if any updated MSB entry object has a new name or entity ID."""
+    global _GENERATION
+    changed = False
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        if id_data.id_type == "OBJECT" and id_data.soulstruct_type in _ENTITY_ID_TYPES:
+            # Check every updated object (even after a change is found) so all last seen values stay current.
+            changed |= _check_entity_id_changed(id_data)
+    if changed:
+        _GENERATION += 1
+
+
+@persistent  # prevent Blender from unloading handler when a new file is loaded
+def clear_entity_id_indices(*_):
+    """Clear all entity ID indices. Used as a load and undo/redo handler."""
+    _ENTITY_ID_INDICES.clear()
+    _OBJECT_ENTITY_IDS.clear()
@@ -0,0 +1,193 @@
+"""In-memory caches that let repeated MSB exports of the same map skip work that is unchanged since the last export.
+
+MSB entries are cached per Blender object along with the raw Blender values they were converted from, so unchanged
+entries are reused without any field conversion. Model side files (NVMBND, HKXBHDs) are skipped entirely if none of
+their model objects, Meshes, or Materials have been updated in the depsgraph since they were last exported, and all
+files written then are still on disk, unmodified.
+
+Nothing here is saved to the `.blend` file. Caches are cleared whenever a file is loaded or undo/redo is used, as
+data changes from those are not reliably reported as depsgraph updates.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "get_cached_msb_entry",
+    "cache_msb_entry",
+    "get_or_convert_msb_entry",
+    "is_msb_model_file_unchanged",
+    "cache_msb_model_file",
+    "track_msb_export_updates",
+    "clear_msb_export_cache",
+]
+
+import typing as tp
+from pathlib import Path
+
+import bpy
+from bpy.app.handlers import persistent
+
+if tp.TYPE_CHECKING:
+    from soulstruct.base.maps.msb.msb_entry import MSBEntry
+    from soulstruct.blender.msb.types.base import BaseBlenderMSBEntry
+
+
+# Maps `(game_name, map_stem)` to `{obj.session_uid: (entry_key, msb_entry)}`, where `entry_key` captures everything
+# that `msb_entry` was built from.
+_CACHED_MSB_ENTRIES = {}  # type: dict[tuple[str, str], dict[int, tuple[tuple, MSBEntry]]]
+
+# Maps model file keys (e.g. `("DARK_SOULS_DSR", "m10_00_00_00", "NVMBND", <export roots>)`) to
+# `(update_tick, id_names, file_stats)` from the last successful export of that file, where `file_stats` holds the
+# `(path, mtime_ns, size)` of every file written.
+_CACHED_MODEL_FILES = {}  # type: dict[tuple[str, ...], tuple[int, frozenset[str], tuple[tuple[Path, int, int], ...]]]
+
+# Maps `(id_type, id_name)` to the tick of the last depsgraph update that included that ID.
+_ID_UPDATE_TICKS = {}  # type: dict[tuple[str, str], int]
+_UPDATE_TICK = 0
+
+# Maps MSB entry classes to their entry field names, as `get_entry_fields()` is slow to call for every entry.
+_ENTRY_FIELD_NAMES = {}  # type: dict[type[MSBEntry], tuple[str, ...]]
+
+
+def _get_entry_key(msb_entry: MSBEntry, field_values: list[tp.Any]) -> tuple:
+    """Build a comparable key from a new (unconverted) `msb_entry` and the raw Blender values to be written to it.
+
+    Field values that are views of Blender data (e.g. `bpy_prop_array`) are copied to tuples, so they don't silently
+    change along with the Blender data.
+    """
+    entry_class = type(msb_entry)
+    try:
+        field_names = _ENTRY_FIELD_NAMES[entry_class]
+    except KeyError:
+        field_names = _ENTRY_FIELD_NAMES[entry_class] = tuple(f.name for f in entry_class.get_entry_fields())
+    creation_values = tuple(getattr(msb_entry, name) for name in field_names)
+    raw_values = tuple(
+        tuple(value) if isinstance(value, bpy.types.bpy_prop_array) else value
+        for value in field_values
+    )
+    return entry_class, creation_values, raw_values
+
+
+def get_cached_msb_entry(
+    game_name: str,
+    map_stem: str,
+    bl_entry_obj: bpy.types.Object,
+    msb_entry: MSBEntry,
+    field_values: list[tp.Any],
+) -> tuple[tuple, MSBEntry | None]:
+    """Check if `bl_entry_obj` was exported to this map before from exactly the same new `msb_entry` and raw
+    `field_values` (from `read_soulstruct_obj_snapshot()`).
+
+    Returns the entry key (for `cache_msb_entry()`) and the cached, fully converted MSB entry, or `None` if the object
+    has changed since. MSB entry references of a cached entry are reset, as they are resolved again on every export.
+    """
+    entry_key = _get_entry_key(msb_entry, field_values)
+    cached = _CACHED_MSB_ENTRIES.get((game_name, map_stem), {}).get(bl_entry_obj.session_uid)
+    if cached is None or cached[0] != entry_key:
+        return entry_key, None
+    cached_entry = cached[1]
+    cached_entry.referring_entry_fields.clear()
+    return entry_key, cached_entry
+
+
+def cache_msb_entry(
+    game_name: str, map_stem: str, bl_entry_obj: bpy.types.Object, entry_key: tuple, msb_entry: MSBEntry
+):
+    """Cache fully converted `msb_entry` for `bl_entry_obj` under `entry_key` from `get_cached_msb_entry()`."""
+    _CACHED_MSB_ENTRIES.setdefault((game_name, map_stem), {})[bl_entry_obj.session_uid] = (entry_key, msb_entry)
+
+
+def get_or_convert_msb_entry(
+    game_name: str,
+    map_stem: str,
+    bl_entry: BaseBlenderMSBEntry,
+    msb_entry: MSBEntry,
+    field_values: list[tp.Any],
+) -> tuple[MSBEntry, bool]:
+    """Get the cached MSB entry of `bl_entry` (see `get_cached_msb_entry()`), or convert `field_values` into new
+    `msb_entry` with `bl_entry.write_soulstruct_obj_snapshot()` and cache it.
+
+    Returns the MSB entry to use and whether it was converted.
+    """
+    entry_key, cached_entry = get_cached_msb_entry(game_name, map_stem, bl_entry.obj, msb_entry, field_values)
+    if cached_entry is not None:
+        return cached_entry, False
+    bl_entry.write_soulstruct_obj_snapshot(msb_entry, field_values)
+    cache_msb_entry(game_name, map_stem, bl_entry.obj, entry_key, msb_entry)
+    return msb_entry, True
+
+
+def _get_model_id_names(model_objs: tp.Iterable[bpy.types.Object]) -> frozenset[tuple[str, str]]:
+    """Get `(id_type, id_name)` for all given model objects, their child objects, and their Meshes and Materials."""
+    id_names = set()
+    for model_obj in model_objs:
+        for obj in (model_obj, *model_obj.children_recursive):
+            id_names.add(("OBJECT", obj.name))
+            if obj.type == "MESH":
+                id_names.add(("MESH", obj.data.name))
+                id_names |= {("MATERIAL", mat.name) for mat in obj.data.materials if mat}
+    return frozenset(id_names)
+
+
+def _get_file_stat(path: Path) -> tuple[Path, int, int] | None:
+    """Get `(path, mtime_ns, size)` of file `path`, or `None` if it is not a file."""
+    if not path.is_file():
+        return None
+    stat = path.stat()
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def is_msb_model_file_unchanged(file_key: tuple[str, ...], model_objs: tp.Iterable[bpy.types.Object]) -> bool:
+    """Check if the same `model_objs` were exported to file `file_key` before, none of them (or their children,
+    Meshes, or Materials) have been updated since, and all files written by that export are still unmodified.
+
+    `file_key` should include everything that determines where the file is written (e.g. export root directories).
+    """
+    try:
+        export_tick, cached_id_names, file_stats = _CACHED_MODEL_FILES[file_key]
+    except KeyError:
+        return False
+    if not file_stats or any(_get_file_stat(file_stat[0]) != file_stat for file_stat in file_stats):
+        return False  # file deleted, replaced, or modified
+    id_names = _get_model_id_names(model_objs)
+    if id_names != cached_id_names:
+        return False
+    return all(_ID_UPDATE_TICKS.get(id_name, -1) < export_tick for id_name in id_names)
+
+
+def cache_msb_model_file(
+    file_key: tuple[str, ...], model_objs: tp.Iterable[bpy.types.Object], exported_paths: tp.Iterable[Path]
+):
+    """Record that `model_objs` were just exported to file `file_key`, written to absolute `exported_paths`."""
+    file_stats = tuple(_get_file_stat(Path(path)) for path in exported_paths)
+    if not file_stats or None in file_stats:
+        _CACHED_MODEL_FILES.pop(file_key, None)  # nothing (reliable) to compare against next time
+        return
+    _CACHED_MODEL_FILES[file_key] = (_UPDATE_TICK + 1, _get_model_id_names(model_objs), file_stats)
+
+
+_ID_TYPES = (
+    (bpy.types.Object, "OBJECT"),
+    (bpy.types.Mesh, "MESH"),
+    (bpy.types.Material, "MATERIAL"),
+)
+
+
+@persistent  # prevent Blender from unloading handler when a new file is loaded
+def track_msb_export_updates(_scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph):
+    """Record the update tick of every updated Object, Mesh, and Material."""
+    global _UPDATE_TICK
+    _UPDATE_TICK += 1
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        for id_class, id_type in _ID_TYPES:
+            if isinstance(id_data, id_class):
+                _ID_UPDATE_TICKS[id_type, id_data.name] = _UPDATE_TICK
+                break
+
+
+@persistent  # prevent Blender from unloading handler when a new file is loaded
+def clear_msb_export_cache(*_):
+    """Clear all cached MSB entries and model files. Used as a load and undo/redo handler."""
+    _CACHED_MSB_ENTRIES.clear()
+    _CACHED_MODEL_FILES.clear()
+    _ID_UPDATE_TICKS.clear()
@@ -29,11 +29,14 @@ from soulstruct.blender.navmesh.nvm.types import BlenderNVM
 from soulstruct.blender.types import SoulstructType
 from soulstruct.blender.utilities.operators import LoggingOperator, LoggingExportOperator
 
+from .export_cache import *
 from .operator_config import *
 from .properties import BlenderMSBPartSubtype
 from .utilities import MSB_COLLECTION_RE
 
 if tp.TYPE_CHECKING:
+    from soulstruct.base.maps.msb.msb_entry import MSBEntry
+    from soulstruct.blender.general import SoulstructSettings
     from soulstruct.blender.msb.types.base import *
     MSB_TYPING = tp.Union[MSB_PTDE, MSB_DSR, MSB_DES]
 
@@ -122,20 +125,33 @@ def _export_msb(
         SoulstructType.MSB_PART: [],
         SoulstructType.MSB_EVENT: [],
     }
+
+    # Entry export is done in two stages. First, we read raw values of all fields from Blender, which must happen here
+    # on the main thread. Second, we convert those values to MSB Entry fields, which is pure Python (no Blender access).
+    all_snapshots = []  # type: list[tuple[BaseBlenderMSBEntry, MSBEntry, list[tp.Any]]]
     for bl_entry_classes, bl_entry_objs, soulstruct_type in (
         (BLENDER_MSB_REGION_CLASSES[settings.game], bl_region_objs, SoulstructType.MSB_REGION),
         (BLENDER_MSB_PART_CLASSES[settings.game], bl_part_objs, SoulstructType.MSB_PART),
         (BLENDER_MSB_EVENT_CLASSES[settings.game], bl_event_objs, SoulstructType.MSB_EVENT),
     ):
-        bl_and_msb_entries = all_bl_and_msb_entries[soulstruct_type]
         for bl_entry_obj in bl_entry_objs:
             subtype_enum = getattr(bl_entry_obj, soulstruct_type.name).entry_subtype_enum
             bl_entry_class = bl_entry_classes[subtype_enum]
             bl_entry = bl_entry_class(bl_entry_obj)
-            msb_entry = bl_entry.to_soulstruct_obj(operator, context)
-            msb.add_entry(msb_entry)
-            bl_and_msb_entries.append((bl_entry, msb_entry))
-            # self.info(f"Added MSB {subtype_enum.name}: {msb_entry.name}")
+            msb_entry, field_values = bl_entry.read_soulstruct_obj_snapshot(operator, context)
+            all_snapshots.append((bl_entry, msb_entry, field_values))
+
+    # Entries are added to the MSB in the same order as before. Entries that are unchanged since the last export of
+    # this map are reused from the export cache, skipping conversion.
+    converted_count = 0
+    for bl_entry, msb_entry, field_values in all_snapshots:
+        msb_entry, converted = get_or_convert_msb_entry(
+            settings.game.name, map_stem, bl_entry, msb_entry, field_values
+        )
+        converted_count += converted
+        msb.add_entry(msb_entry)
+        all_bl_and_msb_entries[bl_entry.TYPE].append((bl_entry, msb_entry))
+    operator.debug(f"Converted {converted_count} changed MSB entries (others reused from last export).")
 
     # Set all MSB Entry references and Part models/SIB paths.
     for bl_and_msb_entries in all_bl_and_msb_entries.values():
@@ -321,8 +337,15 @@ class ExportMapMSB(LoggingOperator):
                 bl_navmesh_class(obj) for obj in bl_part_objs
                 if obj.MSB_PART.entry_subtype == BlenderMSBPartSubtype.Navmesh
             ]
-            self.info(f"Exporting models for {len(bl_navmesh_parts)} MSB Navmesh Parts (should be fast).")
-            self.export_nvmbnd(context, map_stem, bl_navmesh_parts)
+            navmesh_models = [bl_navmesh.model for bl_navmesh in bl_navmesh_parts if bl_navmesh.model]
+            nvmbnd_key = self._get_model_file_key(settings, map_stem, "NVMBND")
+            if export_settings.skip_unchanged_models and is_msb_model_file_unchanged(nvmbnd_key, navmesh_models):
+                self.info("MSB Navmesh models are unchanged since last export. NVMBND not written.")
+            else:
+                self.info(f"Exporting models for {len(bl_navmesh_parts)} MSB Navmesh Parts (should be fast).")
+                exported_paths = []
+                if self.export_nvmbnd(context, map_stem, bl_navmesh_parts, exported_paths) == {"FINISHED"}:
+                    cache_msb_model_file(nvmbnd_key, navmesh_models, exported_paths)
 
         if export_settings.is_bool_prop_active_and_true(context, "export_collision_models"):
             if not settings.game_config.supports_collision_model:
@@ -333,19 +356,40 @@ class ExportMapMSB(LoggingOperator):
                     bl_collision_class(obj) for obj in bl_part_objs
                     if obj.MSB_PART.entry_subtype == BlenderMSBPartSubtype.Collision
                 ]
-                self.info(
-                    f"Exporting models for {len(bl_collision_parts)} MSB Collision Parts (might take a few seconds)."
-                )
-
-                if settings.game_config.uses_loose_collision_files:
-                    self.export_loose_hkxs(context, map_stem, bl_collision_parts)
+                collision_models = [
+                    bl_collision.model for bl_collision in bl_collision_parts if bl_collision.model
+                ]
+                collision_key = self._get_model_file_key(settings, map_stem, "HKX")
+                if (
+                    export_settings.skip_unchanged_models
+                    and is_msb_model_file_unchanged(collision_key, collision_models)
+                ):
+                    self.info("MSB Collision models are unchanged since last export. HKX files not written.")
                 else:
-                    self.export_hkxbhds(context, map_stem, bl_collision_parts)
+                    self.info(
+                        f"Exporting models for {len(bl_collision_parts)} MSB Collision Parts (might take a few "
+                        f"seconds)."
+                    )
+
+                    exported_paths = []
+                    if settings.game_config.uses_loose_collision_files:
+                        result = self.export_loose_hkxs(context, map_stem, bl_collision_parts, exported_paths)
+                    else:
+                        result = self.export_hkxbhds(context, map_stem, bl_collision_parts, exported_paths)
+                    if result == {"FINISHED"}:
+                        cache_msb_model_file(collision_key, collision_models, exported_paths)
 
         # NOTE: There is no option to export FLVER models, as this is slow and better done individually by user.
 
         return {"FINISHED"}
 
+    @staticmethod
+    def _get_model_file_key(settings: SoulstructSettings, map_stem: str, file_type: str) -> tuple[str, ...]:
+        """Key of a map model file in the MSB export cache, which includes the root directories it is exported to."""
+        project_root = str(settings.project_root_path or "")
+        game_root = str(settings.game_root_path or "") if settings.also_export_to_game else ""
+        return settings.game.name, map_stem, file_type, project_root, game_root
+
     # TODO: A lot of redundancy below, with the existing Model export operators.
 
     def export_loose_nvms(
@@ -386,9 +430,16 @@ class ExportMapMSB(LoggingOperator):
         return {"FINISHED"}
 
     def export_nvmbnd(
-        self, context: bpy.types.Context, map_stem: str, bl_navmeshes: list[BaseBlenderMSBPart]
+        self,
+        context: bpy.types.Context,
+        map_stem: str,
+        bl_navmeshes: list[BaseBlenderMSBPart],
+        exported_paths: list[Path] | None = None,
     ) -> set[str]:
-        """Collect and export brand new NVMBND containing all MSB Navmesh models."""
+        """Collect and export brand new NVMBND containing all MSB Navmesh models.
+
+        Written file paths are appended to `exported_paths`, if given.
+        """
         settings = context.scene.soulstruct_settings
 
         relative_nvmbnd_path = Path(f"map/{map_stem}/{map_stem}.nvmbnd")
@@ -436,16 +487,25 @@ class ExportMapMSB(LoggingOperator):
             return {"CANCELLED"}
 
         try:
-            settings.export_file(self, nvmbnd, relative_nvmbnd_path)
+            written_paths = settings.export_file(self, nvmbnd, relative_nvmbnd_path)
         except Exception as ex:
             return self.error(f"MSB {map_stem} was exported, but could not export new NVMBND. Error: {ex}")
+        if exported_paths is not None:
+            exported_paths += written_paths
 
         return {"FINISHED"}
 
     def export_loose_hkxs(
-        self, context: bpy.types.Context, map_stem: str, bl_collisions: list[BaseBlenderMSBPart]
+        self,
+        context: bpy.types.Context,
+        map_stem: str,
+        bl_collisions: list[BaseBlenderMSBPart],
+        exported_paths: list[Path] | None = None,
     ) -> set[str]:
-        """Collect and export all both-res loose HKXs for all MSB Collision models."""
+        """Collect and export all both-res loose HKXs for all MSB Collision models.
+
+        Written file paths are appended to `exported_paths`, if given.
+        """
         settings = context.scene.soulstruct_settings
         dcx_type = settings.game.get_dcx_type("hkx")  # probably no DCX
         havok_module = settings.game_config.havok_module
@@ -454,7 +514,8 @@ class ExportMapMSB(LoggingOperator):
 
         relative_map_dir = Path(f"map/{map_stem}")
         added_models = set()
-        exported_paths = []
+        if exported_paths is None:
+            exported_paths = []
 
         for bl_collision in bl_collisions:
             if not bl_collision.model:
@@ -499,9 +560,16 @@ class ExportMapMSB(LoggingOperator):
         return {"FINISHED"}
 
     def export_hkxbhds(
-        self, context: bpy.types.Context, map_stem: str, bl_collisions: list[BaseBlenderMSBPart]
+        self,
+        context: bpy.types.Context,
+        map_stem: str,
+        bl_collisions: list[BaseBlenderMSBPart],
+        exported_paths: list[Path] | None = None,
     ) -> set[str]:
-        """Collect and export brand new both-res HKXBHDs containing all MSB Collision models."""
+        """Collect and export brand new both-res HKXBHDs containing all MSB Collision models.
+
+        Written file paths are appended to `exported_paths`, if given.
+        """
         settings = context.scene.soulstruct_settings
         dcx_type = settings.game.get_dcx_type("hkx")  # will have DCX inside HKXBHD
         havok_module = settings.game_config.havok_module
@@ -547,9 +615,11 @@ class ExportMapMSB(LoggingOperator):
 
         try:
             # HKX paths are already set to correct relative path.
-            settings.export_file(self, both_res_hkxbhd.hi_res, both_res_hkxbhd.hi_res.path)
-            settings.export_file(self, both_res_hkxbhd.lo_res, both_res_hkxbhd.lo_res.path)
+            written_paths = settings.export_file(self, both_res_hkxbhd.hi_res, both_res_hkxbhd.hi_res.path)
+            written_paths += settings.export_file(self, both_res_hkxbhd.lo_res, both_res_hkxbhd.lo_res.path)
         except Exception as ex:
             return self.error(f"MSB {map_stem} was exported, but could not export new Collision HKXBHDs. Error: {ex}")
+        if exported_paths is not None:
+            exported_paths += written_paths
 
         return {"FINISHED"}
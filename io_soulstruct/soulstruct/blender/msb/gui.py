@@ -45,6 +45,7 @@ from .import_operators import *
 from .export_operators import *
 from .misc_operators import *
 from .properties import *
+from .utilities import is_shared_region_shape_mesh
 
 
 class MSBImportPanel(SoulstructPanel):
@@ -128,6 +129,12 @@ class MSBToolsPanel(SoulstructPanel):
         event_box.prop(context.scene.msb_tool_settings, "event_color_active_collection_only")
         event_box.operator(ColorMSBEvents.bl_idname, icon='COLOR')
 
+        region_box = layout.box()
+        region_box.label(text="Region Scale:")
+        region_box.prop(context.scene.msb_tool_settings, "use_region_scale_drivers")
+        region_box.operator(ConvertRegionScaleMode.bl_idname, icon='DRIVER')
+        region_box.operator(ShareMSBRegionMeshes.bl_idname, icon='MESH_DATA')
+
         header, panel = layout.panel("Region Draw Settings", default_closed=True)
         header.label(text="Region Draw Settings")
         if panel:
@@ -496,6 +503,9 @@ class MSBRegionPanel(SoulstructPanel):
         header.label(text="Shape Settings")
         if panel:
             panel.prop(props, "shape_type")
+            if obj.type == "MESH" and is_shared_region_shape_mesh(obj.data) and obj.data.users > 1:
+                # Shape Meshes are shared by all Regions of that shape.
+                panel.label(text=f"Mesh is shared by {obj.data.users} Regions. Do not edit it.", icon='ERROR')
             if props.shape_type_enum == RegionShapeType.Point:
                 panel.label(text="No shape data for Point.")
             elif props.shape_type_enum == RegionShapeType.Circle:
@@ -22,6 +22,7 @@ from soulstruct.demonssouls.maps import MSB as DES_MSB
 from soulstruct.games import *
 
 from soulstruct.blender.msb.types import darksouls1ptde, darksouls1r, demonssouls
+from soulstruct.blender.msb.types.base import BaseBlenderMSBPart
 from soulstruct.blender.flver.models.properties import FLVERImportSettings
 from soulstruct.blender.general.cached import get_cached_file
 from soulstruct.blender.types import SoulstructCollectionType
@@ -169,10 +170,8 @@ def _import_msb(
                 bl_parts_with_armatures.append(bl_part)
     operator.debug(f"Imported {len(msb_and_bl_parts)} Parts in {time.perf_counter() - p:.3f} s.")
 
-    # Create any duplicated Part Armature poses, then copy FLVER pose to them.
-    context.view_layer.update()  # SLOW - we call it just ONCE here, after all Parts are created
-    for bl_part in bl_parts_with_armatures:
-        bl_part.copy_model_armature_pose()
+    # Create any duplicated Part Armature poses (one view layer update), then copy FLVER pose to them.
+    BaseBlenderMSBPart.copy_model_armature_poses(context, bl_parts_with_armatures)
 
     missing_collection = None  # type: bpy.types.Collection | None
 
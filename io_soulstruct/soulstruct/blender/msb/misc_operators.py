@@ -8,6 +8,8 @@ __all__ = [
     "MSBPartCreationTemplates",
     "CreateMSBPart",
     "CreateMSBRegion",
+    "ConvertRegionScaleMode",
+    "ShareMSBRegionMeshes",
     "CreateMSBEnvironmentEvent",
     "DuplicateMSBPartModel",
     "BatchSetPartGroups",
@@ -25,8 +27,10 @@ __all__ = [
 ]
 
 import ast
+import typing as tp
 
 import bpy
+import numpy as np
 from mathutils import Matrix
 
 from soulstruct.base.maps.msb.region_shapes import RegionShapeType
@@ -42,9 +46,11 @@ from soulstruct.blender.navmesh.nvm.types import BlenderNVM
 from soulstruct.blender.types import *
 from soulstruct.blender.utilities import *
 
+from .entity_id_index import get_entity_id_objects
 from .properties import BlenderMSBPartSubtype
+from .types.adapters import MSBPartGroupsAdapter
 from .types.base.parts import BaseBlenderMSBPart
-from .utilities import primitive_cube
+from .utilities import get_region_shape_mesh, is_generated_region_shape_mesh, set_region_scale_mode
 
 
 class EnableAllImportModels(LoggingOperator):
@@ -499,9 +505,7 @@ class CreateMSBRegion(LoggingOperator):
             f"{settings.map_stem} Regions",
         )
 
-        region_mesh = bpy.data.meshes.new(f"{settings.map_stem}_Region")
-        primitive_cube(region_mesh)
-        region_obj = bpy.data.objects.new(f"{settings.map_stem}_Region", region_mesh)
+        region_obj = bpy.data.objects.new(f"{settings.map_stem}_Region", get_region_shape_mesh("Box"))
         region_obj.display_type = "WIRE"
         region_obj.soulstruct_type = SoulstructType.MSB_REGION
         region_obj.MSB_REGION.entry_subtype = "ALL"
@@ -518,6 +522,78 @@ class CreateMSBRegion(LoggingOperator):
         return {"FINISHED"}
 
 
+class ConvertRegionScaleMode(LoggingOperator):
+
+    bl_idname = "object.convert_region_scale_mode"
+    bl_label = "Convert Region Scale Mode"
+    bl_description = ("Convert selected MSB Regions (or all MSB Regions in the scene, if none are selected) to use "
+                      "scale drivers or direct scale, according to 'Use Region Scale Drivers'")
+
+    def execute(self, context):
+        use_drivers = context.scene.msb_tool_settings.use_region_scale_drivers
+
+        region_objs = [
+            obj for obj in context.selected_objects if obj.soulstruct_type == SoulstructType.MSB_REGION
+        ]
+        if not region_objs:
+            region_objs = [
+                obj for obj in context.scene.objects if obj.soulstruct_type == SoulstructType.MSB_REGION
+            ]
+
+        for region_obj in region_objs:
+            set_region_scale_mode(region_obj, use_drivers)
+
+        mode = "scale drivers" if use_drivers else "direct scale"
+        self.info(f"Converted {len(region_objs)} MSB Regions to use {mode}.")
+        return {"FINISHED"}
+
+
+class ShareMSBRegionMeshes(LoggingOperator):
+
+    bl_idname = "object.share_msb_region_meshes"
+    bl_label = "Share Region Meshes"
+    bl_description = ("Make selected MSB Regions (or all MSB Regions in the scene, if none are selected) that own a "
+                      "copy of their shape Mesh (from older files) use the single Mesh shared by all Regions of that "
+                      "shape. Meshes that have been edited are kept. Unused copies are deleted")
+
+    def execute(self, context):
+        region_objs = [
+            obj for obj in context.selected_objects if obj.soulstruct_type == SoulstructType.MSB_REGION
+        ]
+        if not region_objs:
+            region_objs = [
+                obj for obj in context.scene.objects if obj.soulstruct_type == SoulstructType.MSB_REGION
+            ]
+
+        old_meshes = set()
+        shared_count = 0
+        edited_names = []
+        for region_obj in region_objs:
+            if region_obj.type != ObjectType.MESH or region_obj.library:
+                continue
+            try:
+                shared_mesh = get_region_shape_mesh(region_obj.MSB_REGION.shape_type)
+            except ValueError:
+                continue  # no shared mesh for shape (Composite)
+            if region_obj.data == shared_mesh:
+                continue
+            if not is_generated_region_shape_mesh(region_obj.data, region_obj.MSB_REGION.shape_type):
+                edited_names.append(region_obj.name)
+                continue
+            old_meshes.add(region_obj.data)
+            region_obj.data = shared_mesh
+            shared_count += 1
+
+        for mesh in old_meshes:
+            if mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+
+        if edited_names:
+            self.warning(f"Kept the edited Meshes of {len(edited_names)} MSB Regions: {', '.join(edited_names)}")
+        self.info(f"{shared_count} MSB Regions now use shared shape Meshes.")
+        return {"FINISHED"}
+
+
 class CreateMSBEnvironmentEvent(LoggingOperator):
 
     bl_idname = "object.create_msb_environment_event"
@@ -760,6 +836,23 @@ class DuplicateMSBPartModel(LoggingOperator):
         return new_model_name
 
 
+def _get_part_groups_adapter_and_props(
+    bl_part_class: type[BaseBlenderMSBPart],
+    field_name: str,
+    objs: tp.Sequence[bpy.types.Object],
+) -> tuple[MSBPartGroupsAdapter, list[bpy.types.PropertyGroup]]:
+    """Find the groups adapter for `field_name` in `bl_part_class` and get the type or subtype property group that
+    holds those groups on each of `objs`."""
+    for fields, props_name in (
+        (bl_part_class.TYPE_FIELDS, bl_part_class.TYPE),
+        (bl_part_class.SUBTYPE_FIELDS, bl_part_class.MSB_ENTRY_SUBTYPE),
+    ):
+        for field in fields:
+            if isinstance(field, MSBPartGroupsAdapter) and field.soulstruct_field_name == field_name:
+                return field, [getattr(obj, props_name) for obj in objs]
+    raise ValueError(f"MSB Part class {bl_part_class.__name__} has no groups field '{field_name}'.")
+
+
 class BatchSetPartGroups(LoggingOperator):
 
     bl_idname = "object.batch_set_part_groups"
@@ -846,34 +939,24 @@ class BatchSetPartGroups(LoggingOperator):
             return self.error(f"Failed to parse group indices: {ex}")
 
         counts = [0, 0, 0]
+        selected_objs = context.selected_objects
 
-        for obj in context.selected_objects:
-            bl_part = bl_part_class(obj)
-            bit_set_type = bl_part_class.SOULSTRUCT_CLASS.BIT_SET_TYPE
-            if draw_groups is not None:
-                if self.operation == "SET":
-                    bl_part.draw_groups = bit_set_type(draw_groups)
-                elif self.operation == "ADD":
-                    bl_part.draw_groups |= bit_set_type(draw_groups)
-                elif self.operation == "REMOVE":
-                    bl_part.draw_groups -= bit_set_type(draw_groups)
-                counts[0] += 1
-            if display_groups is not None:
-                if self.operation == "SET":
-                    bl_part.display_groups = bit_set_type(display_groups)
-                elif self.operation == "ADD":
-                    bl_part.display_groups |= bit_set_type(display_groups)
-                elif self.operation == "REMOVE":
-                    bl_part.display_groups -= bit_set_type(display_groups)
-                counts[1] += 1
-            if navmesh_groups is not None and has_navmesh_groups:
-                if self.operation == "SET":
-                    bl_part.navmesh_groups = bit_set_type(navmesh_groups)
-                elif self.operation == "ADD":
-                    bl_part.navmesh_groups |= bit_set_type(navmesh_groups)
-                elif self.operation == "REMOVE":
-                    bl_part.navmesh_groups -= bit_set_type(navmesh_groups)
-                counts[2] += 1
+        # Edit packed group masks of all selected Parts at once.
+        for i, (field_name, groups) in enumerate(
+            (("draw_groups", draw_groups), ("display_groups", display_groups), ("navmesh_groups", navmesh_groups))
+        ):
+            if groups is None:
+                continue
+            groups_adapter, props_list = _get_part_groups_adapter_and_props(bl_part_class, field_name, selected_objs)
+            groups_mask = np.array(groups_adapter.bit_set_type(groups).to_uints(), dtype=np.uint32)
+            if self.operation == "SET":
+                masks = np.tile(groups_mask, (len(props_list), 1))
+            elif self.operation == "ADD":
+                masks = groups_adapter.read_masks(props_list) | groups_mask
+            else:  # "REMOVE"
+                masks = groups_adapter.read_masks(props_list) & ~groups_mask
+            groups_adapter.write_masks(props_list, masks)
+            counts[i] += len(props_list)
 
         self.info(
             f"Set draw groups for {counts[0]} Part{'s' if counts[0] > 1 else ''}, "
@@ -904,18 +987,16 @@ class CopyDrawGroups(LoggingOperator):
         active_part = context.active_object
         active_part_subtype = active_part.MSB_PART.entry_subtype
         bl_part_class = BLENDER_MSB_PART_CLASSES[settings.game][active_part_subtype]  # type: type[BaseBlenderMSBPart]
-        bl_active_part = bl_part_class(active_part)
-        # noinspection PyUnresolvedReferences
-        active_draw_groups = bl_active_part.draw_groups
+        # Draw groups are a base Part field, with the same `BitSet` type for all Part subtypes of a game.
+        groups_adapter, (active_props,) = _get_part_groups_adapter_and_props(
+            bl_part_class, "draw_groups", [active_part]
+        )
+        active_mask = groups_adapter.read_masks([active_props])
 
-        count = 0
-        for part in context.selected_objects:
-            if part is active_part:
-                continue
-            part_subtype = part.MSB_PART.entry_subtype
-            bl_part = BLENDER_MSB_PART_CLASSES[settings.game][part_subtype](part)
-            bl_part.draw_groups = active_draw_groups
-            count += 1
+        other_parts = [part for part in context.selected_objects if part is not active_part]
+        _, props_list = _get_part_groups_adapter_and_props(bl_part_class, "draw_groups", other_parts)
+        groups_adapter.write_masks(props_list, np.tile(active_mask, (len(props_list), 1)))
+        count = len(props_list)
 
         self.info(f"Copied draw groups from active Part to {count} other selected Parts.")
         return {"FINISHED"}
@@ -1178,20 +1259,19 @@ class FindEntityID(LoggingOperator):
 
         entity_id = self.entity_id
         collection = context.collection if self.active_collection_only else context.scene.collection
+        # Index is cached between calls until any MSB entry name or entity ID changes, and rebuilt if it is out of date.
+        objs, entity_id_index, is_new_index = get_entity_id_objects(collection, entity_id)
+        if is_new_index and (duplicate_ids := entity_id_index.duplicate_entity_ids):
+            self.info(
+                f"{len(duplicate_ids)} entity IDs are used by multiple MSB entries in collection "
+                f"'{collection.name}': {sorted(duplicate_ids)}"
+            )
+
         hits = 0
-        for obj in collection.all_objects:
-            if obj.soulstruct_type == SoulstructType.MSB_PART and obj.MSB_PART.entity_id == entity_id:
-                obj.select_set(True)
-                context.view_layer.objects.active = obj
-                hits += 1
-            if obj.soulstruct_type == SoulstructType.MSB_EVENT and obj.MSB_EVENT.entity_id == entity_id:
-                obj.select_set(True)
-                context.view_layer.objects.active = obj
-                hits += 1
-            if obj.soulstruct_type == SoulstructType.MSB_REGION and obj.MSB_REGION.entity_id == entity_id:
-                obj.select_set(True)
-                context.view_layer.objects.active = obj
-                hits += 1
+        for obj in objs:
+            obj.select_set(True)
+            context.view_layer.objects.active = obj
+            hits += 1
 
         if hits == 0:
             return self.error(f"No MSB entries with Entity ID {entity_id} found.")
@@ -27,7 +27,7 @@ from soulstruct.games import *
 
 from soulstruct.blender.bpy_base.property_group import SoulstructPropertyGroup
 from soulstruct.blender.msb.utilities import *
-from soulstruct.blender.types import ObjectType
+from soulstruct.blender.types import ObjectType, SoulstructType
 
 
 class BlenderMSBRegionSubtype(StrEnum):
@@ -109,56 +109,51 @@ class MSBRegionProps(SoulstructPropertyGroup):
         # noinspection PyTypeChecker
         return RegionShapeType[self.shape_type]
 
-    # Three shape fields that are exposed differently depending on `shape` type. These are used to drive object scale.
+    # Three shape fields that are exposed differently depending on `shape` type. These are used to drive object scale,
+    # either through drivers or (if the object has none) by writing it directly in their `update` callback.
     # Note that these are in Blender coordinates, so Z is height here, rather than Y (as in MSB).
     shape_x: bpy.props.FloatProperty(
         name="Shape X",
         description="X dimension of region shape (sphere/cylinder/circle radius or box/rect width)",
         default=1.0,
+        update=lambda self, context: self._update_shape_scale(context),
     )
     shape_y: bpy.props.FloatProperty(
         name="Shape Y",
         description="Y dimension of region shape (box/rect depth)",
         default=1.0,
+        update=lambda self, context: self._update_shape_scale(context),
     )
     shape_z: bpy.props.FloatProperty(
         name="Shape Z",
         description="Z dimension of region shape (cylinder/box height)",
         default=1.0,
+        update=lambda self, context: self._update_shape_scale(context),
     )
 
-    def _auto_shape_mesh(self, _):
-        """Fully replace mesh when a new shape is selected."""
+    def _auto_shape_mesh(self, context):
+        """Swap to the shared unit mesh of the newly selected shape, and drive or set object scale from shape."""
         shape = RegionShapeType[self.shape_type]
         obj = self.id_data  # type: MeshObject
         if obj.type != ObjectType.MESH:
             return  # unsupported region object
-        mesh = obj.data  # type: bpy.types.Mesh
         # Clear scale drivers. New ones will be created as appropriate.
-        for i in range(3):
-            obj.driver_remove("scale", i)
+        remove_region_scale_drivers(obj)
 
         # NOTE: We don't change `obj.show_axis` here. It's enabled by default for Points on import, but is up to
         # the player to enable/disable after that.
 
-        if shape == RegionShapeType.Point:
-            primitive_three_axes(mesh)
-            # No drivers.
-        elif shape == RegionShapeType.Circle:
-            primitive_circle(mesh)
-            create_region_scale_driver(obj, "xx")
-        elif shape == RegionShapeType.Sphere:
-            primitive_sphere(mesh)
-            create_region_scale_driver(obj, "xxx")
-        elif shape == RegionShapeType.Cylinder:
-            primitive_cylinder(mesh)
-            create_region_scale_driver(obj, "xxz")
-        elif shape == RegionShapeType.Rect:
-            primitive_rect(mesh)
-            create_region_scale_driver(obj, "xy")
-        elif shape == RegionShapeType.Box:
-            primitive_cube(mesh)
-            create_region_scale_driver(obj, "xyz")
-        else:
+        if shape == RegionShapeType.Composite:
             # TODO: Handle Composite.
-            pass
+            return
+
+        obj.data = get_region_shape_mesh(shape.name)
+
+        # No drivers are created for Point.
+        set_region_scale_mode(obj, use_drivers=context.scene.msb_tool_settings.use_region_scale_drivers)
+
+    def _update_shape_scale(self, _):
+        """Write shape dimensions to object scale, unless the object has drivers that already do so."""
+        obj = self.id_data
+        if not has_region_scale_drivers(obj):
+            apply_region_shape_scale(obj)
@@ -148,6 +148,7 @@ class MSBExportSettings(SoulstructPropertyGroup):
             "export_soulstruct_jsons",
             "skip_connect_collisions",
             "skip_render_hidden",
+            "skip_unchanged_models",
         ),
         DARK_SOULS_PTDE: (
             "use_world_transforms",
@@ -157,6 +158,7 @@ class MSBExportSettings(SoulstructPropertyGroup):
             "export_soulstruct_jsons",
             "skip_connect_collisions",
             "skip_render_hidden",
+            "skip_unchanged_models",
         ),
     }
 
@@ -206,9 +208,26 @@ class MSBExportSettings(SoulstructPropertyGroup):
         default=False,
     )
 
+    skip_unchanged_models: bpy.props.BoolProperty(
+        name="Skip Unchanged Models",
+        description="Do not re-export the NVMBND or collision HKX files of a map if none of their models have been "
+                    "modified since they were last exported to the same directories in this Blender session, and the "
+                    "exported files are unchanged on disk",
+        default=False,
+    )
+
 
 class MSBToolSettings(SoulstructPropertyGroup):
 
+    use_region_scale_drivers: bpy.props.BoolProperty(
+        name="Use Region Scale Drivers",
+        description="Use drivers to keep MSB Region object scale in sync with shape dimensions. If disabled, scale is "
+                    "written directly when shape dimensions change, which keeps viewport updates fast in maps with "
+                    "many Regions. Applies to new Regions and shape changes; use 'Convert Region Scale Mode' to "
+                    "update existing Regions",
+        default=True,
+    )
+
     event_color: bpy.props.FloatVectorProperty(
         name="Event Color",
         description="Color for setting MSB Event objects in the viewport",
@@ -8,6 +8,7 @@ import typing as tp
 from dataclasses import dataclass
 
 import bpy
+import numpy as np
 
 from soulstruct.base.maps.msb.utils import BitSet
 
@@ -37,13 +38,8 @@ class MSBPartGroupsAdapter(FieldAdapter, tp.Generic[BIT_SET_T]):
         if self.bit_set_type is None:
             raise ValueError("MSBPartGroupsAdapter must have a `BitSet` type to get groups.")
         props = bl_obj.subtype_properties if is_subtype else bl_obj.type_properties
-        bit_vector_32s = self._get_groups_props(props, self.soulstruct_field_name, self.bit_set_type.BIT_COUNT)
-        groups = set()
-        for i, bit_vector_32 in enumerate(bit_vector_32s):
-            for j in range(32):
-                if bit_vector_32[i]:
-                    groups.add(i * 32 + j)
-        return self.bit_set_type(groups)
+        bits = self._read_bits([props])[0]
+        return self.bit_set_type(set(np.flatnonzero(bits).tolist()))
 
     def setter(self, bl_obj: BaseBlenderMSBPart, value: BIT_SET_T, is_subtype=False) -> None:
         if not isinstance(value, self.bit_set_type):
@@ -52,11 +48,40 @@ class MSBPartGroupsAdapter(FieldAdapter, tp.Generic[BIT_SET_T]):
                 f"not: {value.__class__.__name__}.",
             )
         props = bl_obj.subtype_properties if is_subtype else bl_obj.type_properties
-        bit_vector_32s = self._get_groups_props(props, self.soulstruct_field_name, self.bit_set_type.BIT_COUNT)
-        bits = value.enabled_bits
-        for i, bit_vector_32 in enumerate(bit_vector_32s):
-            for j in range(32):
-                bit_vector_32[j] = (i * 32 + j) in bits
+        self.write_masks([props], np.array([value.to_uints()], dtype=np.uint32))
+
+    def read_masks(self, props_list: tp.Sequence[bpy.types.PropertyGroup]) -> np.ndarray:
+        """Read groups from all `props_list` (type or subtype properties of many Parts) into packed `uint32` masks
+        with shape `(len(props_list), BIT_COUNT // 32)`, in the same layout as `BitSet.to_uints()`.
+
+        Masks can then be edited for all Parts at once with NumPy bitwise operations and written with `write_masks()`.
+        """
+        word_count = self.bit_set_type.BIT_COUNT // 32
+        if not props_list:
+            return np.zeros((0, word_count), dtype=np.uint32)
+        bits = self._read_bits(props_list).reshape(len(props_list), word_count, 32)
+        return np.packbits(bits, axis=-1, bitorder="little").view("<u4")[..., 0]
+
+    def write_masks(self, props_list: tp.Sequence[bpy.types.PropertyGroup], masks: np.ndarray):
+        """Write packed `uint32` group masks from `read_masks()` (one row per property group) to all `props_list`."""
+        if not props_list:
+            return
+        bytes_ = np.ascontiguousarray(masks, dtype="<u4").view(np.uint8).reshape(len(props_list), -1, 4)
+        bits = np.unpackbits(bytes_, axis=-1, bitorder="little").astype(bool)
+        bit_count = self.bit_set_type.BIT_COUNT
+        for props, props_bits in zip(props_list, bits):
+            bit_vector_32s = self._get_groups_props(props, self.soulstruct_field_name, bit_count)
+            for bit_vector_32, word_bits in zip(bit_vector_32s, props_bits):
+                bit_vector_32[:] = word_bits.tolist()
+
+    def _read_bits(self, props_list: tp.Sequence[bpy.types.PropertyGroup]) -> np.ndarray:
+        """Read groups from all `props_list` into a `(len(props_list), BIT_COUNT)` boolean array."""
+        bit_count = self.bit_set_type.BIT_COUNT
+        bits = np.zeros((len(props_list), bit_count), dtype=bool)
+        for i, props in enumerate(props_list):
+            bit_vector_32s = self._get_groups_props(props, self.soulstruct_field_name, bit_count)
+            bits[i] = [bit for bit_vector_32 in bit_vector_32s for bit in bit_vector_32]
+        return bits
 
     @staticmethod
     def _get_groups_props(
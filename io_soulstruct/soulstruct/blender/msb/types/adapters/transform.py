@@ -8,6 +8,7 @@ import typing as tp
 from dataclasses import dataclass
 
 import bpy
+from mathutils import Euler, Vector
 
 from soulstruct.blender.types.field_adapters import FieldAdapter
 from soulstruct.blender.utilities.operators import LoggingOperator
@@ -62,21 +63,25 @@ class MSBTransformFieldAdapter(FieldAdapter):
             bl_scale = to_blender(getattr(soulstruct_obj, "scale"))
             bl_obj.transform_obj.scale = bl_scale  # local
 
-    def blender_to_soulstruct(
+    def read_blender_value(
         self,
         operator: LoggingOperator,
         context: bpy.types.Context,
         bl_obj: BaseBlenderMSBEntry[ENTRY_T, TYPE_PROPS_T, SUBTYPE_PROPS_T, MSB_T],
-        soulstruct_obj: ENTRY_T,
-    ):
-        field_names = self._get_field_names()
+    ) -> tuple[Vector, Euler, Vector]:
+        """Returns copied Blender `(translate, rotate, scale)` (local or world)."""
         if context.scene.msb_export_settings.use_world_transforms:
             bl_translate, bl_quaternion, bl_scale = bl_obj.transform_obj.matrix_world.decompose()
             bl_rotate = bl_quaternion.to_euler()
         else:
-            bl_translate = bl_obj.transform_obj.location
-            bl_rotate = bl_obj.transform_obj.rotation_euler
-            bl_scale = bl_obj.transform_obj.scale
+            bl_translate = bl_obj.transform_obj.location.copy()
+            bl_rotate = bl_obj.transform_obj.rotation_euler.copy()
+            bl_scale = bl_obj.transform_obj.scale.copy()
+        return bl_translate, bl_rotate, bl_scale
+
+    def write_soulstruct_value(self, soulstruct_obj: ENTRY_T, bl_value: tuple[Vector, Euler, Vector]):
+        field_names = self._get_field_names()
+        bl_translate, bl_rotate, bl_scale = bl_value
 
         if "translate" in field_names:
             soulstruct_value = to_game(bl_translate)
@@ -19,6 +19,7 @@ from soulstruct.base.maps.msb.msb_entry import MSBEntry
 
 from soulstruct.blender.base import BaseBlenderSoulstructObject
 from soulstruct.blender.msb.types.adapters import MSBReferenceFieldAdapter
+from soulstruct.blender.types.field_adapters import FieldAdapterPlan
 from soulstruct.blender.utilities.operators import LoggingOperator
 
 
@@ -32,6 +33,9 @@ SUBTYPE_PROPS_T = tp.TypeVar("SUBTYPE_PROPS_T", bound=tp.Union[bpy.types.Propert
 MSB_T = tp.TypeVar("MSB_T", bound=BaseMSB)
 SELF_T = tp.TypeVar("SELF_T", bound="BaseBlenderMSBEntry")
 
+# Maps concrete `BaseBlenderMSBEntry` subclasses to their compiled non-reference field plans.
+_FIELD_PLANS = {}  # type: dict[type, FieldAdapterPlan]
+
 
 class BaseBlenderMSBEntry(
     BaseBlenderSoulstructObject[ENTRY_T, TYPE_PROPS_T],
@@ -70,6 +74,25 @@ class BaseBlenderMSBEntry(
         bl_entry.type_properties.entry_subtype = cls.MSB_ENTRY_SUBTYPE
         return bl_entry
 
+    @classmethod
+    def get_field_plan(cls) -> FieldAdapterPlan:
+        """Get all non-reference type and subtype fields of this class, compiled into a `FieldAdapterPlan` on first
+        use."""
+        try:
+            return _FIELD_PLANS[cls]
+        except KeyError:
+            pass
+        fields_and_props_names = [
+            (field, f"{cls.TYPE}") for field in cls.TYPE_FIELDS if not isinstance(field, MSBReferenceFieldAdapter)
+        ]
+        fields_and_props_names += [
+            (field, f"{cls.MSB_ENTRY_SUBTYPE}")
+            for field in cls.SUBTYPE_FIELDS
+            if not isinstance(field, MSBReferenceFieldAdapter)
+        ]
+        plan = _FIELD_PLANS[cls] = FieldAdapterPlan.compile(fields_and_props_names)
+        return plan
+
     def _create_soulstruct_obj(self) -> ENTRY_T:
         """Create a new MSB Entry instance of the appropriate subtype. Args are supplied automatically."""
         # noinspection PyArgumentList
@@ -90,9 +113,7 @@ class BaseBlenderMSBEntry(
 
         Skips MSB reference fields, which are read after all Blender entries are created.
         """
-        for field in self.TYPE_FIELDS + self.SUBTYPE_FIELDS:
-            if not isinstance(field, MSBReferenceFieldAdapter):
-                field.soulstruct_to_blender(operator, context, msb_entry, self)
+        self.get_field_plan().soulstruct_to_blender(operator, context, msb_entry, self)
 
     def resolve_bl_entry_refs(
         self,
@@ -128,9 +149,38 @@ class BaseBlenderMSBEntry(
 
         Skips MSB reference fields, which are read after all MSB entries are created.
         """
-        for field in self.TYPE_FIELDS + self.SUBTYPE_FIELDS:
-            if not isinstance(field, MSBReferenceFieldAdapter):
-                field.blender_to_soulstruct(operator, context, self, msb_entry)
+        plan = self.get_field_plan()
+        plan.write_soulstruct_values(msb_entry, plan.read_blender_values(operator, context, self))
+
+    def read_soulstruct_obj_snapshot(
+        self,
+        operator: LoggingOperator,
+        context: bpy.types.Context,
+    ) -> tuple[ENTRY_T, list[tp.Any]]:
+        """First stage of a split `to_soulstruct_obj()`: create the new MSB Entry and read the raw Blender values of all
+        non-reference fields, without converting them.
+
+        This is the only stage that accesses Blender data. Raw values (in `get_field_plan()` order) are passed to
+        `write_soulstruct_obj_snapshot()`.
+        """
+        msb_entry = self._create_soulstruct_obj()
+        field_values = self.get_field_plan().read_blender_values(operator, context, self)
+        return msb_entry, field_values
+
+    @classmethod
+    def write_soulstruct_obj_snapshot(
+        cls,
+        msb_entry: ENTRY_T,
+        field_values: tp.Iterable[tp.Any],
+    ) -> ENTRY_T:
+        """Second stage of a split `to_soulstruct_obj()`: convert raw values from `read_soulstruct_obj_snapshot()` and
+        write them to `msb_entry`.
+
+        Pure Python that never touches Blender, so it can be run for all entries after all snapshots have been read
+        (e.g. by a worker pool), as long as Blender data is not modified in the meantime.
+        """
+        cls.get_field_plan().write_soulstruct_values(msb_entry, field_values)
+        return msb_entry
 
     def resolve_msb_entry_refs_and_map_stem(
         self,
@@ -4,9 +4,11 @@ __all__ = [
     "PartArmatureDuplicator",
 ]
 
+import hashlib
 import typing as tp
 
 import bpy
+import numpy as np
 from mathutils import Matrix
 
 from soulstruct.blender.flver.models.types import BlenderFLVER, FLVERBoneDataType
@@ -98,18 +100,73 @@ class PartArmatureDuplicator:
             # Rename duplicated Armature and new modifier (name always set to 'FLVER Armature' initially).
             armature_obj.name = f"{bl_part.game_name} Armature"
 
-            # Create a new Bone called '<PART_ROOT>' and parent all other root bones to it.
-            # This is to allow for root motion in the future.
-            # TODO: This is super slow and we don't need it for Cutscenes. Find a better way to animate Parts.
-            # PartArmatureDuplicator._create_part_root_bone(context, armature_obj)
+            # Instance the Armature data shared by all Parts of this model, which has a new Bone called '<PART_ROOT>'
+            # that parents all other root bones. This is to allow for root motion in the future.
+            armature_obj.data = PartArmatureDuplicator._get_part_armature_data(context, bl_flver)
+            context.view_layer.objects.active = armature_obj
 
             bl_part.obj.modifiers["FLVER Armature"].name = "Part Armature"
 
         # Finish moving local transform to new Armature.
         armature_obj.matrix_local = matrix_local
 
+    @staticmethod
+    def _get_part_armature_data(context: bpy.types.Context, bl_flver: BlenderFLVER) -> bpy.types.Armature:
+        """Get or create the Armature data shared by all Part Armatures instanced from `bl_flver`.
+
+        This is a copy of the model's Armature data with a '<PART_ROOT>' bone added by `_create_part_root_bone()`.
+        Adding bones requires Edit Mode, so doing it once per model rather than once per Part keeps this affordable in
+        large maps. The model's own Armature data (which is exported) is never modified.
+
+        The copy records a hash of the model's bones when it is created, and is replaced if the model's bones have
+        changed since (e.g. edited or re-imported under the same name). Parts created before then keep the old data.
+        """
+        model_data = bl_flver.armature.data
+        part_data_name = f"{model_data.name} <PART>"
+        bones_hash = PartArmatureDuplicator._get_bones_hash(model_data)
+        part_data = bpy.data.armatures.get(part_data_name)
+        if part_data is not None:
+            if part_data.get("model_bones_hash") == bones_hash:
+                return part_data
+            # Stale. Free up its name for the new copy.
+            if part_data.users == 0:
+                bpy.data.armatures.remove(part_data)
+            else:
+                part_data.name = f"{part_data_name} <OLD>"
+
+        part_data = model_data.copy()
+        part_data.name = part_data_name
+        part_data["model_bones_hash"] = bones_hash
+        # Edit Mode requires an object in the view layer.
+        temp_obj = bpy.data.objects.new("__TEMP_PART_ARMATURE__", part_data)
+        context.scene.collection.objects.link(temp_obj)
+        try:
+            PartArmatureDuplicator._create_part_root_bone(context, temp_obj)
+        finally:
+            bpy.data.objects.remove(temp_obj)
+        return part_data
+
+    @staticmethod
+    def _get_bones_hash(armature_data: bpy.types.Armature) -> str:
+        """Hash names, parents, and rest matrices and lengths of all bones in `armature_data`."""
+        bones = armature_data.bones
+        matrices = np.empty(len(bones) * 16, dtype=np.float32)
+        bones.foreach_get("matrix_local", matrices)
+        lengths = np.empty(len(bones), dtype=np.float32)
+        bones.foreach_get("length", lengths)
+
+        bones_hash = hashlib.blake2b(matrices.tobytes())
+        bones_hash.update(lengths.tobytes())
+        bones_hash.update("\t".join(bones.keys()).encode())
+        bones_hash.update("\t".join(bone.parent.name if bone.parent else "" for bone in bones).encode())
+        return bones_hash.hexdigest()
+
     @staticmethod
     def _create_part_root_bone(context: bpy.types.Context, armature_obj: ArmatureObject) -> None:
+        # Any other selected Armatures would also enter (multi-object) Edit Mode.
+        selected_objs = context.selected_objects
+        for obj in selected_objs:
+            obj.select_set(False)
         context.view_layer.objects.active = armature_obj
         bpy.ops.object.mode_set(mode="EDIT")
         root_bone = armature_obj.data.edit_bones.new("<PART_ROOT>")
@@ -121,3 +178,5 @@ class PartArmatureDuplicator:
             if not bone.parent:
                 bone.parent = root_bone
         bpy.ops.object.mode_set(mode="OBJECT")
+        for obj in selected_objs:
+            obj.select_set(True)
@@ -181,6 +181,44 @@ class BaseBlenderMSBPart(
 
         return created
 
+    @classmethod
+    def duplicate_flver_model_armatures(
+        cls,
+        operator: LoggingOperator,
+        context: bpy.types.Context,
+        bl_parts: tp.Iterable[BaseBlenderMSBPart],
+        mode: MSBPartArmatureMode,
+        copy_pose=True,
+    ) -> list[BaseBlenderMSBPart]:
+        """Batched `duplicate_flver_model_armature()` for many Parts that only calls `context.view_layer.update()` ONCE,
+        after all Armatures are created, rather than once per Part.
+
+        Parts that already have an Armature are skipped. Returns Parts that had a new Armature created. The view layer
+        is still updated if `copy_pose=False`, so that callers can pose the new Armatures.
+        """
+        created_parts = []
+        for bl_part in bl_parts:
+            if bl_part.armature:
+                continue
+            if bl_part.duplicate_flver_model_armature(operator, context, mode, copy_pose=False):
+                created_parts.append(bl_part)
+
+        if created_parts:
+            if copy_pose:
+                cls.copy_model_armature_poses(context, created_parts)
+            else:
+                context.view_layer.update()  # SLOW - just once for all Parts
+        return created_parts
+
+    @staticmethod
+    def copy_model_armature_poses(context: bpy.types.Context, bl_parts: tp.Sequence[BaseBlenderMSBPart]):
+        """Update view layer ONCE so all newly-created Part Armatures have poses, then copy model pose to each."""
+        if not bl_parts:
+            return
+        context.view_layer.update()  # SLOW - just once for all Parts
+        for bl_part in bl_parts:
+            bl_part.copy_model_armature_pose()
+
     def copy_model_armature_pose(self):
         if self._MODEL_ADAPTER.bl_model_type != SoulstructType.FLVER:
             raise TypeError("Only FLVER-based Parts can have their model Armature pose copied.")
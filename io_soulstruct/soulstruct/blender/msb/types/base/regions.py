@@ -123,55 +123,33 @@ class BaseBlenderMSBRegion(BaseBlenderMSBEntry[REGION_T, MSBRegionProps, None, M
         collection = collection or context.scene.collection
         operator.to_object_mode(context)
 
+        if shape_type == RegionShapeType.Composite:
+            # TODO: Handle Composite... Depends if the children are used anywhere else. Hard to child them if so.
+            raise TypeError(f"Unsupported MSB region shape: {shape_type}")
+
+        # All Regions of the same shape share one unit Mesh. Dimensions are applied via object scale drivers.
+        bl_region = cls.new(name, get_region_shape_mesh(shape_type.name), collection)  # type: tp.Self
+        bl_region.shape_type = shape_type
+
         if shape_type == RegionShapeType.Point:
-            mesh = bpy.data.meshes.new(name)
-            primitive_three_axes(mesh)
-            bl_region = cls.new(name, mesh, collection)  # type: tp.Self
-            bl_region.shape_type = RegionShapeType.Point
             # Points also have axes enabled.
             bl_region.obj.show_axis = True
-        elif shape_type == RegionShapeType.Circle:
-            mesh = bpy.data.meshes.new(name)
-            primitive_circle(mesh)
-            bl_region = cls.new(name, mesh, collection)  # type: tp.Self
-            bl_region.shape_type = RegionShapeType.Circle
-            bl_region.radius = kwargs.pop("radius", 1.0)
-        elif shape_type == RegionShapeType.Sphere:
-            mesh = bpy.data.meshes.new(name)
-            primitive_cube(mesh)
-            bl_region = cls.new(name, mesh, collection)  # type: tp.Self
-            bl_region.shape_type = RegionShapeType.Sphere
+        elif shape_type in {RegionShapeType.Circle, RegionShapeType.Sphere}:
             bl_region.radius = kwargs.pop("radius", 1.0)
         elif shape_type == RegionShapeType.Cylinder:
-            mesh = bpy.data.meshes.new(name)
-            primitive_cube(mesh)
-            bl_region = cls.new(name, mesh, collection)  # type: tp.Self
-            bl_region.shape_type = RegionShapeType.Cylinder
             bl_region.radius = kwargs.pop("radius", 1.0)
             bl_region.height = kwargs.pop("height", 1.0)
         elif shape_type == RegionShapeType.Rect:
-            mesh = bpy.data.meshes.new(name)
-            primitive_rect(mesh)
-            bl_region = cls.new(name, mesh, collection)  # type: tp.Self
-            bl_region.shape_type = RegionShapeType.Rect
             bl_region.width = kwargs.pop("width", 1.0)
             bl_region.depth = kwargs.pop("depth", 1.0)
         elif shape_type == RegionShapeType.Box:
-            mesh = bpy.data.meshes.new(name)
-            primitive_cube(mesh)
-            bl_region = cls.new(name, mesh, collection)  # type: tp.Self
-            bl_region.shape_type = RegionShapeType.Box
             bl_region.width = kwargs.pop("width", 1.0)
             bl_region.depth = kwargs.pop("depth", 1.0)
             bl_region.height = kwargs.pop("height", 1.0)
-        else:
-            # TODO: Handle Composite... Depends if the children are used anywhere else. Hard to child them if so.
-            raise TypeError(f"Unsupported MSB region shape: {shape_type}")
 
         if kwargs:
             raise TypeError(f"Invalid dimension arguments for shape type {shape_type}: {kwargs.keys()}")
 
-        bl_region.shape_type = shape_type
         bl_region.type_properties.region_subtype = BlenderMSBRegionSubtype.All  # no subtypes for DS1
         # Other fields (transform, entity ID) left as default.
 
@@ -9,7 +9,14 @@ __all__ = [
     "primitive_rect",
     "primitive_cube",
     "primitive_three_axes",
+    "get_region_shape_mesh",
+    "is_shared_region_shape_mesh",
+    "is_generated_region_shape_mesh",
     "create_region_scale_driver",
+    "remove_region_scale_drivers",
+    "has_region_scale_drivers",
+    "apply_region_shape_scale",
+    "set_region_scale_mode",
 ]
 
 import re
@@ -18,6 +25,7 @@ import tempfile
 from pathlib import Path
 
 import bpy
+import numpy as np
 
 from soulstruct.base.maps.msb import MSB, MSBEntry  # must not be imported under `TYPE_CHECKING` guard
 
@@ -1440,6 +1448,88 @@ def primitive_three_axes(mesh: bpy.types.Mesh):
     mesh.update()
 
 
+# Unit mesh creation functions for each `RegionShapeType` name. Composite shapes have no mesh.
+# NOTE: Older versions imported Sphere and Cylinder Regions with `primitive_cube` Meshes (and only created a sphere or
+# cylinder Mesh when the shape was changed in Blender). Their shared Meshes are now always a real sphere or cylinder.
+_REGION_SHAPE_PRIMITIVES = {
+    "Point": primitive_three_axes,
+    "Circle": primitive_circle,
+    "Sphere": primitive_sphere,
+    "Cylinder": primitive_cylinder,
+    "Rect": primitive_rect,
+    "Box": primitive_cube,
+}
+
+# All Meshes that older versions generated for each Region shape, which `is_generated_region_shape_mesh()` recognizes.
+_OLD_REGION_SHAPE_PRIMITIVES = {
+    shape_name: (primitive, primitive_cube) if shape_name in {"Sphere", "Cylinder"} else (primitive,)
+    for shape_name, primitive in _REGION_SHAPE_PRIMITIVES.items()
+}
+
+# Geometry arrays of each primitive, created on first use by `is_generated_region_shape_mesh()`.
+_PRIMITIVE_GEOMETRY = {}
+
+
+def _get_region_shape_mesh_name(shape_name: str) -> str:
+    return f"__MSB_REGION_{shape_name.upper()}__"
+
+
+def get_region_shape_mesh(shape_name: str) -> bpy.types.Mesh:
+    """Get the unit Mesh shared by all MSB Region objects of shape `shape_name` (a `RegionShapeType` name), creating
+    it if it does not exist yet.
+
+    Region dimensions are applied entirely through object scale, so every Region of the same shape can use the same
+    Mesh rather than each owning an identical copy. Editing this Mesh changes every Region of that shape.
+    """
+    try:
+        create_primitive = _REGION_SHAPE_PRIMITIVES[shape_name]
+    except KeyError:
+        raise ValueError(f"MSB region shape '{shape_name}' does not have a shared Mesh.")
+    mesh_name = _get_region_shape_mesh_name(shape_name)
+    mesh = bpy.data.meshes.get(mesh_name)
+    if mesh is None:
+        mesh = bpy.data.meshes.new(mesh_name)
+        create_primitive(mesh)
+    return mesh
+
+
+def is_shared_region_shape_mesh(mesh: bpy.types.Mesh) -> bool:
+    """Check if `mesh` is the shared unit Mesh of any Region shape."""
+    return any(mesh.name == _get_region_shape_mesh_name(shape_name) for shape_name in _REGION_SHAPE_PRIMITIVES)
+
+
+def _get_mesh_geometry(mesh: bpy.types.Mesh) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get vertex coordinates, loop vertex indices, and face loop totals of `mesh`."""
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    loop_vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return coords, loop_vertex_indices, loop_totals
+
+
+def is_generated_region_shape_mesh(mesh: bpy.types.Mesh, shape_name: str) -> bool:
+    """Check if `mesh` has exactly the geometry that this or an older version of Soulstruct generated for a Region of
+    shape `shape_name`, i.e. it has not been edited by the user."""
+    geometry = _get_mesh_geometry(mesh)
+    for primitive in _OLD_REGION_SHAPE_PRIMITIVES.get(shape_name, ()):
+        if primitive not in _PRIMITIVE_GEOMETRY:
+            primitive_mesh = bpy.data.meshes.new("__MSB_REGION_PRIMITIVE__")
+            try:
+                primitive(primitive_mesh)
+                _PRIMITIVE_GEOMETRY[primitive] = _get_mesh_geometry(primitive_mesh)
+            finally:
+                bpy.data.meshes.remove(primitive_mesh)
+        primitive_geometry = _PRIMITIVE_GEOMETRY[primitive]
+        if all(
+            array.shape == primitive_array.shape and np.allclose(array, primitive_array)
+            for array, primitive_array in zip(geometry, primitive_geometry)
+        ):
+            return True
+    return False
+
+
 def create_region_scale_driver(obj: bpy.types.Object, prop_axes: str):
     """Create a driver that uses MSB_REGION `prop_axes` (e.g. 'xxz') to drive the matching index of `obj.scale`."""
     if len(prop_axes) > 3:
@@ -1454,3 +1544,50 @@ def create_region_scale_driver(obj: bpy.types.Object, prop_axes: str):
         var.targets[0].id_type = "OBJECT"
         var.targets[0].id = obj
         var.targets[0].data_path = f"MSB_REGION.shape_{ax}"
+
+
+# Region shape dimension properties that apply to each index of object scale (no scale for Point).
+_REGION_SHAPE_SCALE_AXES = {
+    "Circle": "xx",
+    "Sphere": "xxx",
+    "Cylinder": "xxz",
+    "Rect": "xy",
+    "Box": "xyz",
+}
+
+
+def remove_region_scale_drivers(obj: bpy.types.Object):
+    """Remove all `obj.scale` drivers. Current scale (as last evaluated) is kept."""
+    for i in range(3):
+        obj.driver_remove("scale", i)
+
+
+def has_region_scale_drivers(obj: bpy.types.Object) -> bool:
+    """Check if any index of `obj.scale` is driven (e.g. by `create_region_scale_driver()`)."""
+    anim = obj.animation_data
+    if anim is None:
+        return False
+    return any(anim.drivers.find("scale", index=i) is not None for i in range(3))
+
+
+def apply_region_shape_scale(obj: bpy.types.Object):
+    """Write MSB_REGION shape dimensions directly to `obj.scale`, as drivers would. Used by Regions without drivers."""
+    props = obj.MSB_REGION
+    for i, ax in enumerate(_REGION_SHAPE_SCALE_AXES.get(props.shape_type, "")):
+        obj.scale[i] = getattr(props, f"shape_{ax}")
+
+
+def set_region_scale_mode(obj: bpy.types.Object, use_drivers: bool):
+    """Make MSB Region `obj` use either drivers (`use_drivers=True`) or direct writes from shape property `update`
+    callbacks to keep its scale in sync with its shape dimensions.
+
+    Drivers are evaluated on every depsgraph update, which adds up quickly in maps with thousands of Regions. Direct
+    writes only cost anything when a shape dimension actually changes.
+    """
+    remove_region_scale_drivers(obj)
+    prop_axes = _REGION_SHAPE_SCALE_AXES.get(obj.MSB_REGION.shape_type, "")
+    if use_drivers:
+        if prop_axes:
+            create_region_scale_driver(obj, prop_axes)
+    else:
+        apply_region_shape_scale(obj)
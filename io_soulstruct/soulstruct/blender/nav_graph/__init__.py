@@ -9,9 +9,12 @@ __all__ = [
 
     "MCGDrawSettings",
     "update_mcg_draw_caches",
+    "mark_mcg_draw_caches_dirty",
+    "track_mcg_draw_updates",
     "draw_mcg_nodes",
     "draw_mcg_edges",
     "draw_mcg_edge_cost_labels",
+    "clear_navmesh_edge_cost_caches",
 
     "AddMCGNodeNavmeshATriangleIndex",
     "RemoveMCGNodeNavmeshATriangleIndex",
@@ -46,3 +49,4 @@ from .import_operators import *
 from .misc_operators import *
 from .properties import *
 from .gui import *
+from .utilities import clear_navmesh_edge_cost_caches
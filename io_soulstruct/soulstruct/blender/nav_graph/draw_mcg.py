@@ -2,23 +2,31 @@ from __future__ import annotations
 
 __all__ = [
     "MCGDrawSettings",
+    "MCGDrawGeometry",
+    "get_mcg_draw_geometry",
     "update_mcg_draw_caches",
+    "mark_mcg_draw_caches_dirty",
+    "track_mcg_draw_updates",
     "draw_mcg_nodes",
     "draw_mcg_edges",
     "draw_mcg_edge_cost_labels",
 ]
 
 import typing as tp
+from dataclasses import dataclass
 
 import bpy
 import blf
 import gpu
+import numpy as np
+from bpy.app.handlers import persistent
 from bpy_extras.view3d_utils import location_3d_to_region_2d
 from gpu_extras.batch import batch_for_shader
-from mathutils import Vector
 
 from soulstruct.blender.exceptions import SoulstructTypeError
 from soulstruct.blender.bpy_base.property_group import SoulstructPropertyGroup
+from soulstruct.blender.types import SoulstructType
+from soulstruct.blender.utilities import get_mesh_vertex_coords
 
 from .types import *
 
@@ -32,11 +40,17 @@ _CACHED_NODES_BATCH = None  # type: GPUBatch | None
 _CACHED_EDGES_BATCH = None  # type: GPUBatch | None
 _CACHED_TRIANGLES_A_BATCH = None  # type: GPUBatch | None
 _CACHED_TRIANGLES_B_BATCH = None  # type: GPUBatch | None
-# Store last computed geometry to know when to update.
-_LAST_DRAWN_NODES = None  # type: list[Vector] | None
-_LAST_DRAWN_EDGES = None  # type: list[Vector] | None  # flattened list of edge endpoint pairs
-_LAST_DRAWN_TRIANGLES_A = None  # type: list[Vector] | None  # flattened list of triangle vertices
-_LAST_DRAWN_TRIANGLES_B = None  # type: list[Vector] | None  # flattened list of triangle vertices
+# Store last computed geometry to know when to update batches.
+_LAST_DRAWN_GEOMETRY = None  # type: MCGDrawGeometry | None
+# Set by depsgraph updates that may change the drawn graph. Idle redraws do not rebuild anything.
+_MCG_DRAW_CACHES_DIRTY = True
+# Names of edge objects moved by the last cache rebuild. Their next depsgraph updates do not dirty the caches again.
+_REPOSITIONED_MCG_EDGE_NAMES = set()  # type: set[str]
+
+# Objects of these types (and any Mesh) may change the drawn graph when updated.
+_MCG_DRAW_OBJECT_TYPES = {
+    SoulstructType.MCG, SoulstructType.MCG_NODE, SoulstructType.MCG_EDGE, SoulstructType.MSB_PART
+}
 
 
 class MCGDrawSettings(SoulstructPropertyGroup):
@@ -75,53 +89,78 @@ class MCGDrawSettings(SoulstructPropertyGroup):
             return None
 
 
-def update_mcg_draw_caches():
-    """Process selected MCG nodes/edges and update cached batches if necessary."""
-    global _CACHED_SHADER, _CACHED_NODES_BATCH, _CACHED_EDGES_BATCH
-    global _CACHED_TRIANGLES_A_BATCH, _CACHED_TRIANGLES_B_BATCH
-    global _LAST_DRAWN_NODES, _LAST_DRAWN_EDGES
-    global _LAST_DRAWN_TRIANGLES_A, _LAST_DRAWN_TRIANGLES_B
+@dataclass(slots=True)
+class MCGDrawGeometry:
+    """World coordinates of everything drawn for an MCG. Built without any GPU calls."""
 
-    draw_settings = bpy.context.scene.mcg_draw_settings
-    if not draw_settings.draw_graph:
-        # Don't erase caches.
-        return
+    node_coords: np.ndarray  # `(N, 3)`
+    edge_coords: np.ndarray  # `(2 * E, 3)` flattened edge endpoint pairs
+    triangles_a_coords: np.ndarray  # `(3 * T, 3)` flattened triangle vertices
+    triangles_b_coords: np.ndarray  # `(3 * T, 3)` flattened triangle vertices
+    edges_and_nodes: list[tuple[BlenderMCGEdge, BlenderMCGNode, BlenderMCGNode]]  # drawn edges
 
-    bl_mcg = draw_settings.mcg
-    if not bl_mcg:
-        # Erase cached batches.
-        _CACHED_NODES_BATCH = None
-        _CACHED_EDGES_BATCH = None
-        _CACHED_TRIANGLES_A_BATCH = None
-        _CACHED_TRIANGLES_B_BATCH = None
-        _LAST_DRAWN_NODES = None
-        _LAST_DRAWN_EDGES = None
-        _LAST_DRAWN_TRIANGLES_A = None
-        _LAST_DRAWN_TRIANGLES_B = None
-        return
+
+def _get_coords_array(vectors: tp.Iterable) -> np.ndarray:
+    return np.array([tuple(v) for v in vectors], dtype=np.float32).reshape(-1, 3)
+
+
+def _get_face_world_coords(
+    navmesh: bpy.types.Object,
+    face_indices: list[int],
+    navmesh_arrays: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]],
+) -> np.ndarray:
+    """Get world coordinates of all vertices of the given `navmesh` faces (ignoring invalid indices), in face order.
+
+    World vertex coordinates and loop arrays of each navmesh are read once per rebuild with `foreach_get` (and one
+    matrix multiply) and stored in `navmesh_arrays`.
+    """
+    try:
+        world_coords, loop_starts, loop_totals, loop_vert_indices = navmesh_arrays[navmesh.name]
+    except KeyError:
+        mesh = navmesh.data
+        world_coords = get_mesh_vertex_coords(mesh, navmesh.matrix_world)
+        loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        loop_vert_indices = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_vert_indices)
+        navmesh_arrays[navmesh.name] = world_coords, loop_starts, loop_totals, loop_vert_indices
+
+    face_indices = np.array(face_indices, dtype=np.int64)
+    face_indices = face_indices[face_indices < len(loop_starts)]  # skip invalid face indices
+    starts = loop_starts[face_indices]
+    totals = loop_totals[face_indices]
+    # Loop indices of all faces, concatenated.
+    loop_indices = np.arange(totals.sum()) + np.repeat(starts - (np.cumsum(totals) - totals), totals)
+    return world_coords[loop_vert_indices[loop_indices]]
+
+
+def _get_node_triangles(bl_node: BlenderMCGNode, navmesh: bpy.types.Object) -> list[int]:
+    if bl_node.navmesh_a == navmesh:
+        return bl_node.navmesh_a_triangles
+    if bl_node.navmesh_b == navmesh:
+        return bl_node.navmesh_b_triangles
+    return []  # can't find
+
+
+def get_mcg_draw_geometry(bl_mcg: BlenderMCG, draw_settings: MCGDrawSettings) -> MCGDrawGeometry:
+    """Collect all node, edge, and highlighted navmesh triangle coordinates to draw for `bl_mcg`."""
+
+    ordering = bl_mcg.get_ordering()
 
     # Get nodes and (if needed) filter by selection.
-    bl_nodes = bl_mcg.get_nodes()
+    bl_nodes = ordering.nodes
     if draw_settings.draw_selected_only:
         bl_nodes = [node for node in bl_nodes if node.obj.select_get()]
+    node_coords = _get_coords_array(node.location for node in bl_nodes)
 
-    # Build the points list.
-    points = [node.location.copy() for node in bl_nodes]
-
-    # Only update nodes batch if the points have changed.
-    if points != _LAST_DRAWN_NODES:
-        # Cache (or create) the shader
-        if _CACHED_SHADER is None:
-            _CACHED_SHADER = gpu.shader.from_builtin("UNIFORM_COLOR")
-        _CACHED_NODES_BATCH = batch_for_shader(_CACHED_SHADER, 'POINTS', {"pos": points})
-        _LAST_DRAWN_NODES = points
-
-    # Process edges/triangles similarly.
-    all_edge_location_pairs = []
-    node_a_triangles_coords = []
-    node_b_triangles_coords = []
+    edge_locations = []
+    triangles_a_coords = []
+    triangles_b_coords = []
     edges_and_nodes = []  # for moving edges to midpoint if cache refreshed
-    for bl_edge in bl_mcg.get_edges():
+    navmesh_arrays = {}
+    for bl_edge in ordering.edges:
         try:
             bl_node_a = BlenderMCGNode(bl_edge.node_a)
             bl_node_b = BlenderMCGNode(bl_edge.node_b)
@@ -133,7 +172,7 @@ def update_mcg_draw_caches():
             if not (bl_edge.obj.select_get() or bl_node_a.obj.select_get() or bl_node_b.obj.select_get()):
                 continue
 
-        all_edge_location_pairs.extend([bl_node_a.location.copy(), bl_node_b.location.copy()])
+        edge_locations += [bl_node_a.location, bl_node_b.location]
         edges_and_nodes.append((bl_edge, bl_node_a, bl_node_b))
 
         if draw_settings.highlight_edge_navmesh_triangles:
@@ -142,61 +181,124 @@ def update_mcg_draw_caches():
             # Draw triangles over faces linked to start and end nodes.
             navmesh = bl_edge.navmesh_part
             if navmesh is not None:
-                if bl_node_a.navmesh_a == navmesh:
-                    node_a_triangles = bl_node_a.navmesh_a_triangles
-                elif bl_node_a.navmesh_b == navmesh:
-                    node_a_triangles = bl_node_a.navmesh_b_triangles
-                else:
-                    node_a_triangles = []  # can't find
-                for i in node_a_triangles:
-                    if i >= len(navmesh.data.polygons):
-                        continue  # invalid face index
-                    face = navmesh.data.polygons[i]
-                    for vert_index in face.vertices:
-                        vert = navmesh.data.vertices[vert_index]
-                        world_coord = navmesh.matrix_world @ vert.co
-                        node_a_triangles_coords.append(world_coord)
-
-                if bl_node_b.navmesh_a == navmesh:
-                    node_b_triangles = bl_node_b.navmesh_a_triangles
-                elif bl_node_b.navmesh_b == navmesh:
-                    node_b_triangles = bl_node_b.navmesh_b_triangles
-                else:
-                    node_b_triangles = []  # can't find
-                for i in node_b_triangles:
-                    if i >= len(navmesh.data.polygons):
-                        continue  # invalid face index
-                    face = navmesh.data.polygons[i]
-                    for vert_index in face.vertices:
-                        vert = navmesh.data.vertices[vert_index]
-                        world_coord = navmesh.matrix_world @ vert.co
-                        node_b_triangles_coords.append(world_coord)
-
-    if all_edge_location_pairs != _LAST_DRAWN_EDGES:
-        if _CACHED_SHADER is None:
-            _CACHED_SHADER = gpu.shader.from_builtin("UNIFORM_COLOR")
-        _CACHED_EDGES_BATCH = batch_for_shader(_CACHED_SHADER, "LINES", {"pos": all_edge_location_pairs})
-        _LAST_DRAWN_EDGES = all_edge_location_pairs
+                triangles_a_coords.append(
+                    _get_face_world_coords(navmesh, _get_node_triangles(bl_node_a, navmesh), navmesh_arrays)
+                )
+                triangles_b_coords.append(
+                    _get_face_world_coords(navmesh, _get_node_triangles(bl_node_b, navmesh), navmesh_arrays)
+                )
+
+    empty_coords = np.empty((0, 3), dtype=np.float32)
+    return MCGDrawGeometry(
+        node_coords=node_coords,
+        edge_coords=_get_coords_array(edge_locations),
+        triangles_a_coords=np.concatenate(triangles_a_coords) if triangles_a_coords else empty_coords,
+        triangles_b_coords=np.concatenate(triangles_b_coords) if triangles_b_coords else empty_coords,
+        edges_and_nodes=edges_and_nodes,
+    )
+
+
+def update_mcg_draw_caches():
+    """Process selected MCG nodes/edges and update cached batches if necessary.
+
+    Does nothing unless `_MCG_DRAW_CACHES_DIRTY` has been set by a relevant depsgraph update (or file load/undo/redo)
+    since the last rebuild. Batches are only recreated for geometry that actually changed.
+    """
+    global _CACHED_SHADER, _CACHED_NODES_BATCH, _CACHED_EDGES_BATCH
+    global _CACHED_TRIANGLES_A_BATCH, _CACHED_TRIANGLES_B_BATCH
+    global _LAST_DRAWN_GEOMETRY, _MCG_DRAW_CACHES_DIRTY
+
+    draw_settings = bpy.context.scene.mcg_draw_settings
+    if not draw_settings.draw_graph:
+        # Don't erase caches.
+        return
+
+    if not _MCG_DRAW_CACHES_DIRTY:
+        return
+    _MCG_DRAW_CACHES_DIRTY = False
+
+    bl_mcg = draw_settings.mcg
+    if not bl_mcg:
+        # Erase cached batches.
+        _CACHED_NODES_BATCH = None
+        _CACHED_EDGES_BATCH = None
+        _CACHED_TRIANGLES_A_BATCH = None
+        _CACHED_TRIANGLES_B_BATCH = None
+        _LAST_DRAWN_GEOMETRY = None
+        return
+
+    geometry = get_mcg_draw_geometry(bl_mcg, draw_settings)
+    last_geometry = _LAST_DRAWN_GEOMETRY
+    if _CACHED_SHADER is None:
+        _CACHED_SHADER = gpu.shader.from_builtin("UNIFORM_COLOR")
+
+    # Only update each batch if its coordinates have changed.
+    if last_geometry is None or not np.array_equal(geometry.node_coords, last_geometry.node_coords):
+        _CACHED_NODES_BATCH = batch_for_shader(_CACHED_SHADER, "POINTS", {"pos": geometry.node_coords})
+
+    if last_geometry is None or not np.array_equal(geometry.edge_coords, last_geometry.edge_coords):
+        _CACHED_EDGES_BATCH = batch_for_shader(_CACHED_SHADER, "LINES", {"pos": geometry.edge_coords})
 
         # Reposition edge objects between their nodes for convenience.
-        for bl_edge, bl_node_a, bl_node_b in edges_and_nodes:
+        for bl_edge, bl_node_a, bl_node_b in geometry.edges_and_nodes:
             direction = bl_node_b.location - bl_node_a.location
             midpoint = (bl_node_a.location + bl_node_b.location) / 2.0
             bl_edge.location = midpoint
             # Point empty arrow in direction of edge.
             bl_edge.rotation_euler = direction.to_track_quat('Z', 'Y').to_euler()
+            _REPOSITIONED_MCG_EDGE_NAMES.add(bl_edge.name)
 
     if draw_settings.highlight_edge_navmesh_triangles:
-        if node_a_triangles_coords != _LAST_DRAWN_TRIANGLES_A:
-            if _CACHED_SHADER is None:
-                _CACHED_SHADER = gpu.shader.from_builtin("UNIFORM_COLOR")
-            _CACHED_TRIANGLES_A_BATCH = batch_for_shader(_CACHED_SHADER, "TRIS", {"pos": node_a_triangles_coords})
-            _LAST_DRAWN_TRIANGLES_A = node_a_triangles_coords
-        if node_b_triangles_coords != _LAST_DRAWN_TRIANGLES_B:
-            if _CACHED_SHADER is None:
-                _CACHED_SHADER = gpu.shader.from_builtin("UNIFORM_COLOR")
-            _CACHED_TRIANGLES_B_BATCH = batch_for_shader(_CACHED_SHADER, "TRIS", {"pos": node_b_triangles_coords})
-            _LAST_DRAWN_TRIANGLES_B = node_b_triangles_coords
+        if last_geometry is None or not np.array_equal(
+            geometry.triangles_a_coords, last_geometry.triangles_a_coords
+        ):
+            _CACHED_TRIANGLES_A_BATCH = batch_for_shader(
+                _CACHED_SHADER, "TRIS", {"pos": geometry.triangles_a_coords}
+            )
+        if last_geometry is None or not np.array_equal(
+            geometry.triangles_b_coords, last_geometry.triangles_b_coords
+        ):
+            _CACHED_TRIANGLES_B_BATCH = batch_for_shader(
+                _CACHED_SHADER, "TRIS", {"pos": geometry.triangles_b_coords}
+            )
+    elif last_geometry is not None:
+        # Triangles were not collected. Keep last drawn triangles to compare against when highlighting is re-enabled.
+        geometry.triangles_a_coords = last_geometry.triangles_a_coords
+        geometry.triangles_b_coords = last_geometry.triangles_b_coords
+
+    _LAST_DRAWN_GEOMETRY = geometry
+
+
+@persistent  # prevent Blender from unloading handler when a new file is loaded
+def mark_mcg_draw_caches_dirty(*_):
+    """Force MCG draw caches to be rebuilt on next redraw. Used as a load and undo/redo handler."""
+    global _MCG_DRAW_CACHES_DIRTY
+    _MCG_DRAW_CACHES_DIRTY = True
+    _REPOSITIONED_MCG_EDGE_NAMES.clear()
+
+
+@persistent  # prevent Blender from unloading handler when a new file is loaded
+def track_mcg_draw_updates(_scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph):
+    """Mark MCG draw caches dirty if the scene (e.g. selection or draw settings), any MCG/Part object, or any Mesh
+    (e.g. a navmesh) was updated.
+
+    Updates of edge objects that were only moved between their nodes by `update_mcg_draw_caches()` are ignored.
+    """
+    global _MCG_DRAW_CACHES_DIRTY
+    repositioned_edge_names = _REPOSITIONED_MCG_EDGE_NAMES.copy()
+    _REPOSITIONED_MCG_EDGE_NAMES.clear()
+    if _MCG_DRAW_CACHES_DIRTY:
+        return
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        if isinstance(id_data, bpy.types.Object) and id_data.name in repositioned_edge_names:
+            continue
+        if (
+            isinstance(id_data, (bpy.types.Scene, bpy.types.Mesh))
+            or (isinstance(id_data, bpy.types.Object) and id_data.soulstruct_type in _MCG_DRAW_OBJECT_TYPES)
+        ):
+            _MCG_DRAW_CACHES_DIRTY = True
+            return
 
 
 def draw_mcg_nodes():
@@ -297,7 +399,9 @@ def draw_mcg_edge_cost_labels():
     except AttributeError:
         blf.color(bad_match_font_id, 1.0, 0.8, 0.8, 1)  # default (red)
 
-    for bl_edge in bl_mcg.get_edges():
+    # Label order doesn't matter, so edges are not sorted.
+    for edge_obj in bl_mcg.edge_parent.children:
+        bl_edge = BlenderMCGEdge(edge_obj)
         cost = bl_edge.cost
 
         label_position = location_3d_to_region_2d(bpy.context.region, bpy.context.region_data, bl_edge.location)
@@ -273,4 +273,5 @@ class MCGGeneratorPanel(SoulstructPanel):
         layout.operator(FindCheapestPath.bl_idname)
         layout.label(text="Complete MCG Generation:")
         layout.prop(nav_graph_compute_settings, "connected_exit_vertex_distance")
+        layout.prop(nav_graph_compute_settings, "worker_count")
         layout.operator(AutoCreateMCG.bl_idname)
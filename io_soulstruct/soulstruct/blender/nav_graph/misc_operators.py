@@ -14,16 +14,17 @@ __all__ = [
     "AutoCreateMCG",
 ]
 
+import itertools
 import typing as tp
 
 import bmesh
 import bpy
+import numpy as np
 from mathutils import Vector
 
-from soulstruct.base.events.enums import NavmeshFlag
-
 from soulstruct.blender.exceptions import SoulstructTypeError, MCGEdgeCreationError
 from soulstruct.blender.msb.types.darksouls1r import BlenderMSBNavmesh
+from soulstruct.blender.nav_graph_compute import EXIT_CLUSTER, NavmeshMCGData, NavmeshSnapshot, get_all_navmesh_mcg_data
 from soulstruct.blender.types import *
 from soulstruct.blender.utilities import LoggingOperator
 from .utilities import *
@@ -245,8 +246,9 @@ class RefreshMCGNames(LoggingOperator):
         bl_mcg = BlenderMCG.from_active_object(context)
         map_stem = bl_mcg.game_name
 
-        bl_nodes = bl_mcg.get_nodes()
-        bl_edges = bl_mcg.get_edges()
+        ordering = bl_mcg.get_ordering()
+        bl_nodes = ordering.nodes
+        bl_edges = ordering.edges
 
         new_node_indices = {}
         for node in bl_nodes:
@@ -331,6 +333,9 @@ class RecomputeEdgeCost(LoggingOperator):
         bl_edges = BlenderMCGEdge.from_selected_objects(context)  # type: list[BlenderMCGEdge]
         map_stem = bl_edges[0].game_name
 
+        # Each navmesh's cost cache is kept between calls until its geometry changes.
+        cost_caches = {}  # type: dict[str, NavmeshEdgeCostCache]
+        start_search_counts = {}  # type: dict[str, int]
         for bl_edge in bl_edges:
 
             edge_stem = bl_edge.game_name
@@ -371,9 +376,15 @@ class RecomputeEdgeCost(LoggingOperator):
             start_face_i = min(node_a_triangles)
             end_face_i = min(node_b_triangles)
 
+            mesh = edge_navmesh.data
             try:
-                total_cost = get_best_cost(edge_navmesh.data, start_face_i, end_face_i)
+                if mesh.name not in cost_caches:
+                    cost_caches[mesh.name] = get_navmesh_edge_cost_cache(mesh)
+                    start_search_counts[mesh.name] = cost_caches[mesh.name].search_count
+                total_cost = cost_caches[mesh.name].get_best_cost(mesh, start_face_i, end_face_i)
             except Exception as ex:
+                for cache in cost_caches.values():
+                    cache.release_path_costs()
                 raise ValueError(
                     f"Failed to compute cost of edge '{bl_edge.name}' between nodes {bl_node_a.name} and "
                     f"{bl_node_b.name}. Make sure all NVM vertices have been merged by distance. Error: {ex}"
@@ -385,6 +396,14 @@ class RecomputeEdgeCost(LoggingOperator):
             # We just use a custom property for this, not a real `BlenderMCGNode` property.
             bl_edge["New Cost"] = total_cost
 
+        # Only edge costs are kept between calls, not the (much larger) face graphs and search trees.
+        for cache in cost_caches.values():
+            cache.release_path_costs()
+        search_count = sum(cache.search_count - start_search_counts[name] for name, cache in cost_caches.items())
+        self.info(
+            f"Recomputed costs of selected MCG edges in {len(cost_caches)} navmeshes with {search_count} new path "
+            f"searches."
+        )
         return {"FINISHED"}
 
 
@@ -414,7 +433,11 @@ class FindCheapestPath(LoggingOperator):
             return self.error("No active edit mesh object.")
         obj: MeshObject
 
+        # Write edit mesh to `obj.data` so the face graph can be read from it with matching face indices.
+        obj.update_from_editmode()
         bm = bmesh.from_edit_mesh(obj.data)
+        bm.faces.index_update()
+        bm.faces.ensure_lookup_table()
 
         selected_faces = [f for f in bm.faces if f.select]
         if len(selected_faces) != 2:
@@ -426,9 +449,8 @@ class FindCheapestPath(LoggingOperator):
         if start_face == active_face:
             start_face, end_face = end_face, start_face
 
-        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.001)
-
-        path, total_cost, all_passable_fallback = a_star(start_face, end_face, bm)
+        # Vertices are merged by distance in the face graph only, so the edit mesh is not modified.
+        path, total_cost, all_passable_fallback = get_edge_cost(obj.data, start_face.index, end_face.index)
 
         if path:
             if all_passable_fallback:
@@ -441,8 +463,8 @@ class FindCheapestPath(LoggingOperator):
                     f"Shortest path through passable face flags traverses {len(path)} faces with cost: {total_cost}"
                 )
             if context.scene.nav_graph_compute_settings.select_path:
-                for face in path:
-                    face.select_set(True)
+                for face_i in path:
+                    bm.faces[face_i].select_set(True)
         else:
             self.info("No path found between selected faces, even when all faces are passable.")
 
@@ -452,15 +474,17 @@ class FindCheapestPath(LoggingOperator):
 
 
 # Some type hints for `AutoCreateMCG` below.
-FACE_WITH_VERTS = tp.Tuple[bmesh.types.BMFace, frozenset[tuple[float, ...]]]
-EXIT_CLUSTER = tp.Tuple[FACE_WITH_VERTS, ...]
-NODE_WITH_KEY = tp.Tuple[BlenderMCGNode, tp.Tuple[int, int]]
+NODE_WITH_KEY = tp.Tuple[BlenderMCGNode, tp.Tuple[int, int], int]
 
 
 class AutoCreateMCG(LoggingOperator):
     """Create a full MCG structure from scratch but detecting node placements (adjoining 'Exit' faces) and computing
     edge costs between all pairs of nodes in each navmesh.
 
+    Each navmesh's 'Exit' face clusters and the path costs between them are independent of other navmeshes, so after
+    copying navmesh geometry to plain arrays, they can be found in parallel worker processes if the 'Worker Processes'
+    setting is above one (see `nav_graph_compute`). Results do not depend on the worker count.
+
     EXPERIMENTAL! Edge cost algorithm is not yet perfect, especially when Wall drops are involved. Some connections in
     vanilla MCG edges also seem to be manually inflated, presumably to avoid certain paths. However, I doubt this will
     matter in-game.
@@ -472,9 +496,6 @@ class AutoCreateMCG(LoggingOperator):
         "a COMPLETE, ORDERED collection of a map's MSB Navmesh parts, typically 'mAA_BB_CC_DD Navmesh Parts'"
     )
 
-    # Holds all navmesh BMeshes so they can be freed and deleted without fail.
-    navmesh_bmeshes: list[bmesh.types.BMesh]
-
     @classmethod
     def poll(cls, context):
         if context.mode != "OBJECT":
@@ -490,30 +511,23 @@ class AutoCreateMCG(LoggingOperator):
         return context.window_manager.invoke_confirm(self, event)
 
     def execute(self, context):
-
-        self.navmesh_bmeshes = []
-
         try:
             return self.auto_create_mcg(context)
         except Exception as ex:
             import traceback
             traceback.print_exc()
             return self.error(f"An error occurred during automatic MCG creation: {ex}")
-        finally:
-            for bm in self.navmesh_bmeshes:
-                bm.free()
-                del bm
 
     def auto_create_mcg(self, context: bpy.types.Context):
 
         map_stem = context.collection.name.split(" ")[0]
         navmesh_parts = BlenderMSBNavmesh.from_collection_objects(context.collection)
+        compute_settings = context.scene.nav_graph_compute_settings
+        exit_sq_dist = compute_settings.connected_exit_vertex_distance ** 2
 
-        navmesh_exit_clusters = []  # type: list[tuple[EXIT_CLUSTER, ...]]
-
-        exit_sq_dist = context.scene.nav_graph_compute_settings.connected_exit_vertex_distance ** 2
-
-        for navmesh_part in navmesh_parts:
+        snapshots = []  # type: list[NavmeshSnapshot]
+        snapshot_nav_indices = []  # type: list[int]
+        for nav_index, navmesh_part in enumerate(navmesh_parts):
 
             # Validate name format here, rather than waiting until below.
             try:
@@ -521,33 +535,31 @@ class AutoCreateMCG(LoggingOperator):
             except ValueError:
                 return self.error(f"Navmesh part '{navmesh_part.name}' must start with 'n####'.")
 
-            bm = bmesh.new()
-            bm.from_mesh(navmesh_part.mesh)  # same Mesh as NVM model
-            # We do NOT remove doubles here, as it could modify face indices.
-            bm.faces.ensure_lookup_table()  # face indices won't change again
-            self.navmesh_bmeshes.append(bm)
-
-            flags_layer = bm.faces.layers.int.get("nvm_face_flags")
-            if flags_layer is None:
+            if "nvm_face_flags" not in navmesh_part.mesh.attributes:
                 self.warning(
                     f"Navmesh '{navmesh_part.name}' has no 'nvm_face_flags' `int` layer. Ignoring it for MCG creation."
                 )
-                navmesh_exit_clusters.append(())
                 continue
 
-            exit_clusters = self.get_navmesh_exit_clusters(navmesh_part, bm, flags_layer)
-            self.info(f"Found {len(exit_clusters)} exit clusters for MSB Navmesh {navmesh_part.name}.")
-            navmesh_exit_clusters.append(exit_clusters)
+            # Same Mesh as NVM model. Face indices are unchanged. (`BlenderMSBPart.location` is not the obj location.)
+            snapshots.append(get_navmesh_snapshot(navmesh_part.name, navmesh_part.mesh, navmesh_part.obj.location))
+            snapshot_nav_indices.append(nav_index)
+
+        navmesh_data = [NavmeshMCGData((), np.zeros((0, 0))) for _ in navmesh_parts]
+        all_snapshot_data = get_all_navmesh_mcg_data(snapshots, compute_settings.worker_count)
+        for nav_index, data in zip(snapshot_nav_indices, all_snapshot_data, strict=True):
+            navmesh_data[nav_index] = data
+            self.info(f"Found {len(data.exit_clusters)} exit clusters for MSB Navmesh {navmesh_parts[nav_index].name}.")
 
         collection = context.scene.collection
         bl_mcg = BlenderMCG.new(f"{map_stem} MCG", data=None, collection=collection)
 
         navmesh_nodes_and_keys = self._create_mcg_nodes(
-            bl_mcg, collection, map_stem, navmesh_parts, navmesh_exit_clusters, exit_sq_dist
+            bl_mcg, collection, map_stem, navmesh_parts, navmesh_data, exit_sq_dist
         )
         try:
             self._create_mcg_edges(
-                bl_mcg, collection, map_stem, navmesh_parts, navmesh_nodes_and_keys
+                bl_mcg, collection, map_stem, navmesh_parts, navmesh_data, navmesh_nodes_and_keys
             )
         except ValueError as ex:
             return self.error(f"Cannot create MCG. Error occurred during edge creation: {ex}")
@@ -556,176 +568,103 @@ class AutoCreateMCG(LoggingOperator):
         context.scene.mcg_draw_settings.mcg_parent = bl_mcg.obj
         return {"FINISHED"}
 
-    @staticmethod
-    def get_navmesh_exit_clusters(
-        navmesh_part: BlenderMSBNavmesh, bm: bmesh.types.BMesh, flags_layer: bmesh.types.BMLayerItem
-    ) -> tuple[EXIT_CLUSTER, ...]:
-
-        # First, find all clusters of connected 'Exit' faces in each navmesh.
-        exit_clusters = []
-        checked = []
-
-        for face in bm.faces:
-
-            if face in checked:
-                continue
-            checked.append(face)
-
-            if face[flags_layer] & NavmeshFlag.Exit:
-                # Find all connected 'Exit' faces.
-                cluster = []  # type: list[FACE_WITH_VERTS]
-                stack = [face]
-                while stack:
-                    f = stack.pop()
-                    if f in cluster:
-                        continue
-
-                    verts = frozenset(tuple(v.co + navmesh_part.location) for v in f.verts)
-                    cluster.append((f, verts))
-                    for edge in f.edges:
-                        for other_face in edge.link_faces:
-                            if other_face in checked:
-                                continue
-                            checked.append(other_face)  # cannot possibly already be checked
-                            if other_face not in cluster and other_face[flags_layer] & NavmeshFlag.Exit:
-                                stack.append(other_face)
-                exit_clusters.append(tuple(cluster))
-
-        return tuple(exit_clusters)
-
     def _create_mcg_nodes(
         self,
         bl_mcg: BlenderMCG,
         collection: bpy.types.Collection,
         map_stem: str,
         navmesh_parts: list[BlenderMSBNavmesh],
-        navmesh_exit_clusters: list[tuple[EXIT_CLUSTER, ...]],
+        navmesh_data: list[NavmeshMCGData],
         exit_sq_dist: float,
     ) -> list[list[NODE_WITH_KEY]]:
         """Find connected exit clusters across navmeshes and create MCG nodes in Blender at those sites.
 
-        Returns a list of lists of `(BlenderMCGNode, (navmesh_a, navmesh_b))` tuples (one node list per navmesh part),
-        where the inner navmesh tuples are always in ascending order.
+        Returns a list of lists of `(BlenderMCGNode, (navmesh_a, navmesh_b), cluster_index)` tuples (one node list per
+        navmesh part), where the inner navmesh tuples are always in ascending order and `cluster_index` is the index of
+        the node's exit cluster in that navmesh part's `NavmeshMCGData`.
         """
 
-        # List of node objects stored for each navmesh part, along with ordered navmesh model IDs.
+        # List of node objects stored for each navmesh part, along with ordered navmesh model IDs and cluster index.
         # Actual returned list.
-        navmesh_nodes_and_keys = [[] for _ in navmesh_parts]  # type: list[list[tuple[BlenderMCGNode, tuple[int, int]]]]
-
-        # All MCG nodes, keyed by non-ordered (ascending navmesh ID) pairs of navmesh model IDs AND exact exit clusters.
-        # Used to prevent the same node from being generated multiple times (from both sides).
-        all_nodes = set()  # type: set[tuple[tuple[int, int], tuple[tuple[int, ...], tuple[int, ...]]]]
+        navmesh_nodes_and_keys = [[] for _ in navmesh_parts]  # type: list[list[NODE_WITH_KEY]]
 
         # Maps non-ordered (ascending) pairs of navmesh part indices to the nodes connecting them.
         # Used to detect and add name suffix to multiple nodes between the same navmesh part pair.
         navmesh_pair_nodes = {}  # type: dict[tuple[int, int], list[BlenderMCGNode]]
 
-        for nav_index, (navmesh_part, exit_clusters) in enumerate(
-            zip(navmesh_parts, navmesh_exit_clusters, strict=True)
-        ):
+        navmesh_model_ids = [int(navmesh_part.name[1:5]) for navmesh_part in navmesh_parts]  # validated above
+
+        for nav_index, navmesh_part in enumerate(navmesh_parts):
+            for cluster_index, cluster in enumerate(navmesh_data[nav_index].exit_clusters):
 
-            navmesh_model_id = int(navmesh_part.name[1:5])  # validated above
-            for cluster in exit_clusters:
-                for face, face_verts in cluster:
+                # Don't compare navmeshes we've already compared (or to self).
+                for other_nav_index in range(nav_index + 1, len(navmesh_parts)):
+                    # Don't forget that navmesh indices are not necessarily equal to the navmesh model IDs.
+                    other_exit_clusters = navmesh_data[other_nav_index].exit_clusters
+                    for other_cluster_index, other_cluster in enumerate(other_exit_clusters):
 
-                    for other_nav_index, (other_navmesh_part, other_exit_clusters) in enumerate(
-                        zip(navmesh_parts, navmesh_exit_clusters, strict=True)
-                    ):
-                        if nav_index >= other_nav_index:
-                            # Don't compare navmeshes we've already compared (or to self).
+                        if not AutoCreateMCG.are_clusters_touching(cluster, other_cluster, exit_sq_dist):
                             continue
 
-                        other_navmesh_id = int(other_navmesh_part.name[1:5])  # validated above
-
-                        # Don't forget that `i` and `j` are not necessarily equal to the navmesh model IDs.
-
-                        for other_cluster in other_exit_clusters:
-
-                            # Get node key and model pair key in ascending *navmesh ID* order.
-                            if navmesh_model_id < other_navmesh_id:
-                                model_pair_key = (navmesh_model_id, other_navmesh_id)
-                                node_key = (cluster, other_cluster)
-                            else:
-                                model_pair_key = (other_navmesh_id, navmesh_model_id)
-                                node_key = (other_cluster, cluster)
-
-                            if (model_pair_key, node_key) in all_nodes:
-                                # Already created this exact node.
-                                continue
-
-                            for other_face, other_face_verts in other_cluster:
-                                # Check if faces are connected by an edge.
-                                # As vertices may not be completely identical, this is unfortunately a bit slow.
-                                hits = 0
-                                for v in face_verts:
-                                    for ov in other_face_verts:
-                                        if self.sq_dist(v, ov) < exit_sq_dist:
-                                            hits += 1
-                                            if hits >= 2:
-                                                break
-                                    else:
-                                        continue
-                                    break
-
-                                if hits < 2:
-                                    # No shared edge.
-                                    continue
-
-                                # Found a touching cluster. Create a new `BlenderMCGNode`.
-                                node_name = f"{map_stem} Node [{model_pair_key[0]} | {model_pair_key[1]}]"
-                                if model_pair_key in navmesh_pair_nodes:
-                                    # Have already created a node for this pair of navmeshes. Add index suffices.
-                                    index = len(navmesh_pair_nodes[model_pair_key])  # at least 1
-                                    if index == 1:
-                                        # Edit first node to add '(0)' suffix.
-                                        navmesh_pair_nodes[model_pair_key][0].name += " (0)"
-                                    node_name += f" ({index})"
-                                else:
-                                    # First node between these navmeshes. May not need to add index suffices.
-                                    navmesh_pair_nodes[model_pair_key] = []
-
-                                # Node position is average of all vertices in both clusters.
-                                node_position = Vector()
-                                v_count = 0
-                                for _, f_verts in cluster:
-                                    for v in f_verts:
-                                        node_position += Vector(v)
-                                        v_count += 1
-                                for _, f_verts in other_cluster:
-                                    for v in f_verts:
-                                        node_position += Vector(v)
-                                        v_count += 1
-                                node_position /= v_count
-
-                                bl_node = BlenderMCGNode.new(node_name, None, collection)  # type: BlenderMCGNode
-                                bl_node.obj.location = node_position
-                                bl_node.obj.empty_display_type = "SPHERE"
-                                bl_node.obj.parent = bl_mcg.node_parent
-
-                                # Record node connecting this navmesh pair.
-                                navmesh_pair_nodes[model_pair_key].append(bl_node)
-
-                                if navmesh_model_id > other_navmesh_id:
-                                    # Swap order of node's navmeshes, so node navmesh A is the earlier one.
-                                    navmesh_part, other_navmesh_part = other_navmesh_part, navmesh_part
-                                    cluster, other_cluster = other_cluster, cluster
-                                    # Not used after this (except for logging), but for clarity:
-                                    navmesh_model_id, other_navmesh_id = other_navmesh_id, navmesh_model_id
-
-                                bl_node.navmesh_a = navmesh_part.obj
-                                bl_node.navmesh_a_triangles = [f.index for f, _ in cluster]
-                                bl_node.navmesh_b = other_navmesh_part.obj
-                                bl_node.navmesh_b_triangles = [f.index for f, _ in other_cluster]
-
-                                all_nodes.add((model_pair_key, node_key))
-                                navmesh_nodes_and_keys[nav_index].append((bl_node, model_pair_key))
-                                navmesh_nodes_and_keys[other_nav_index].append((bl_node, model_pair_key))
-
-                                self.info(
-                                    f"Created node: {bl_node.name} from {navmesh_part.name} to "
-                                    f"{other_navmesh_part.name} ({bl_node.navmesh_a.name}, {bl_node.navmesh_b.name}) "
-                                    f"with model IDs {navmesh_model_id} and {other_navmesh_id}."
-                                )
+                        # Found a touching cluster. Get navmesh A and B in ascending *navmesh ID* order.
+                        if navmesh_model_ids[nav_index] < navmesh_model_ids[other_nav_index]:
+                            a_nav_index, b_nav_index = nav_index, other_nav_index
+                            a_cluster, b_cluster = cluster, other_cluster
+                        else:
+                            a_nav_index, b_nav_index = other_nav_index, nav_index
+                            a_cluster, b_cluster = other_cluster, cluster
+                        model_pair_key = (navmesh_model_ids[a_nav_index], navmesh_model_ids[b_nav_index])
+
+                        # Create a new `BlenderMCGNode`.
+                        node_name = f"{map_stem} Node [{model_pair_key[0]} | {model_pair_key[1]}]"
+                        if model_pair_key in navmesh_pair_nodes:
+                            # Have already created a node for this pair of navmeshes. Add index suffices.
+                            index = len(navmesh_pair_nodes[model_pair_key])  # at least 1
+                            if index == 1:
+                                # Edit first node to add '(0)' suffix.
+                                navmesh_pair_nodes[model_pair_key][0].name += " (0)"
+                            node_name += f" ({index})"
+                        else:
+                            # First node between these navmeshes. May not need to add index suffices.
+                            navmesh_pair_nodes[model_pair_key] = []
+
+                        # Node position is average of all vertices in both clusters.
+                        node_position = Vector()
+                        v_count = 0
+                        for _, f_verts in cluster:
+                            for v in f_verts:
+                                node_position += Vector(v)
+                                v_count += 1
+                        for _, f_verts in other_cluster:
+                            for v in f_verts:
+                                node_position += Vector(v)
+                                v_count += 1
+                        node_position /= v_count
+
+                        bl_node = BlenderMCGNode.new(node_name, None, collection)  # type: BlenderMCGNode
+                        bl_node.obj.location = node_position
+                        bl_node.obj.empty_display_type = "SPHERE"
+                        bl_node.obj.parent = bl_mcg.node_parent
+
+                        # Record node connecting this navmesh pair.
+                        navmesh_pair_nodes[model_pair_key].append(bl_node)
+
+                        # Cluster face indices are sorted (see `get_navmesh_mcg_data()`), not in traversal order.
+                        bl_node.navmesh_a = navmesh_parts[a_nav_index].obj
+                        bl_node.navmesh_a_triangles = [f for f, _ in a_cluster]
+                        bl_node.navmesh_b = navmesh_parts[b_nav_index].obj
+                        bl_node.navmesh_b_triangles = [f for f, _ in b_cluster]
+
+                        navmesh_nodes_and_keys[nav_index].append((bl_node, model_pair_key, cluster_index))
+                        navmesh_nodes_and_keys[other_nav_index].append(
+                            (bl_node, model_pair_key, other_cluster_index)
+                        )
+
+                        self.info(
+                            f"Created node: {bl_node.name} from {navmesh_parts[a_nav_index].name} to "
+                            f"{navmesh_parts[b_nav_index].name} with model IDs {model_pair_key[0]} and "
+                            f"{model_pair_key[1]}."
+                        )
 
             self.info(f"Found {len(navmesh_nodes_and_keys[nav_index])} nodes for navmesh {navmesh_part.name}.")
 
@@ -737,11 +676,12 @@ class AutoCreateMCG(LoggingOperator):
         collection: bpy.types.Collection,
         map_stem: str,
         navmesh_parts: list[BlenderMSBNavmesh],
+        navmesh_data: list[NavmeshMCGData],
         navmesh_nodes_and_keys: list[list[NODE_WITH_KEY]],
     ):
-        """Create edges between connected node pairs in Blender MCG."""
-        for navmesh_part, nodes_and_keys in zip(navmesh_parts, navmesh_nodes_and_keys, strict=True):
-            created = set()
+        """Create edges between connected node pairs in Blender MCG, with costs already found between their exit
+        clusters."""
+        for navmesh_part, data, nodes_and_keys in zip(navmesh_parts, navmesh_data, navmesh_nodes_and_keys, strict=True):
 
             if len(nodes_and_keys) == 1:
                 # DEAD END navmesh with a single node. Only case where `MCGNode` references a navmesh part.
@@ -753,72 +693,57 @@ class AutoCreateMCG(LoggingOperator):
                 continue  # no edges to create
 
             # We need to create non-directional edges on every pair of nodes touching this navmesh.
-            for i, (bl_node_a, (a_navmesh_a, a_navmesh_b)) in enumerate(nodes_and_keys):
-                for j, (bl_node_b, (b_navmesh_a, b_navmesh_b)) in enumerate(nodes_and_keys):
-                    if i == j or (i, j) in created or (j, i) in created:
-                        continue
-
-                    # Neither of these can fail, by design.
-                    node_a_triangles = bl_node_a.get_navmesh_triangles(navmesh_part.obj)
-                    node_b_triangles = bl_node_b.get_navmesh_triangles(navmesh_part.obj)
-                    if node_a_triangles is None or node_b_triangles is None:
-                        print(navmesh_part.name, bl_node_a.navmesh_a.name, bl_node_b.navmesh_a.name)
-                        raise ValueError(
-                            f"Node {bl_node_a.name} and/or {bl_node_b.name} references no triangles in MSB Navmesh "
-                            f"'{navmesh_part.name}'. Indicates MCG generator bug."
-                        )
-
-                    try:
-                        start_face_i = min(node_a_triangles)
-                        end_face_i = min(node_b_triangles)
-                    except ValueError:
-                        # No triangles! Only permitted by dead end navmeshes.
-                        raise ValueError(
-                            f"Node {bl_node_a.name} and/or {bl_node_b.name} references no "
-                            f"triangles in MSB Navmesh '{navmesh_part.name}'."
-                        )
+            for node_and_key_a, node_and_key_b in itertools.combinations(nodes_and_keys, 2):
+                bl_node_a, (a_navmesh_a, a_navmesh_b), a_cluster_index = node_and_key_a
+                bl_node_b, (b_navmesh_a, b_navmesh_b), b_cluster_index = node_and_key_b
+
+                if a_cluster_index == b_cluster_index:
+                    start_face_i = data.exit_clusters[a_cluster_index][0][0]
+                    raise ValueError(
+                        f"Node {bl_node_a.name} and {bl_node_b.name} reference the same triangle "
+                        f"({start_face_i}) in MSB Navmesh '{navmesh_part.name}'. This indicates that duplicate "
+                        f"nodes have been created for the same cluster of Exit faces in the navmesh (an error)."
+                    )
 
-                    if start_face_i == end_face_i:
-                        raise ValueError(
-                            f"Node {bl_node_a.name} and {bl_node_b.name} reference the same triangle "
-                            f"({start_face_i}) in MSB Navmesh '{navmesh_part.name}'. This indicates that duplicate "
-                            f"nodes have been created for the same cluster of Exit faces in the navmesh (an error)."
-                        )
+                total_cost = float(data.exit_cluster_costs[a_cluster_index, b_cluster_index])
+                if total_cost == 0.0:
+                    total_cost = 10000.0  # arbitrary error catch
 
-                    # Note that this creates its own `BMesh` that removes vertex doubles.
-                    try:
-                        total_cost = get_best_cost(navmesh_part.mesh, start_face_i, end_face_i)
-                    except Exception as ex:
-                        raise ValueError(
-                            f"Failed to compute cost between nodes {bl_node_a.name} and {bl_node_b.name} in "
-                            f"MSB Navmesh '{navmesh_part.name}'. Make sure all NVM vertices have been merged by "
-                            f"distance. Error: {ex}"
-                        )
-                    if total_cost == 0.0:
-                        total_cost = 10000.0  # arbitrary error catch
+                edge_name = (
+                    f"{map_stem} Edge ([{a_navmesh_a} | {a_navmesh_b}] "
+                    f"-> [{b_navmesh_a} | {b_navmesh_b}]) <{navmesh_part.name}>"
+                )
 
-                    edge_name = (
-                        f"{map_stem} Edge ([{a_navmesh_a} | {a_navmesh_b}] "
-                        f"-> [{b_navmesh_a} | {b_navmesh_b}]) <{navmesh_part.name}>"
-                    )
+                bl_edge = BlenderMCGEdge.new(edge_name, None, collection)  # type: BlenderMCGEdge
+                bl_edge.parent = bl_mcg.edge_parent
+                start = bl_node_a.location
+                end = bl_node_b.location
+                direction = end - start
+                midpoint = (start + end) / 2.0
+                bl_edge.obj.empty_display_type = "PLAIN_AXES"
+                bl_edge.location = midpoint
+                # Point empty arrow in direction of edge.
+                bl_edge.rotation_euler = direction.to_track_quat('Z', 'Y').to_euler()
+
+                bl_edge.cost = total_cost
+                bl_edge.node_a = bl_node_a.obj
+                bl_edge.node_b = bl_node_b.obj
+                bl_edge.navmesh_part = navmesh_part.obj
 
-                    bl_edge = BlenderMCGEdge.new(edge_name, None, collection)  # type: BlenderMCGEdge
-                    bl_edge.parent = bl_mcg.edge_parent
-                    start = bl_node_a.location
-                    end = bl_node_b.location
-                    direction = end - start
-                    midpoint = (start + end) / 2.0
-                    bl_edge.obj.empty_display_type = "PLAIN_AXES"
-                    bl_edge.location = midpoint
-                    # Point empty arrow in direction of edge.
-                    bl_edge.rotation_euler = direction.to_track_quat('Z', 'Y').to_euler()
-
-                    bl_edge.cost = total_cost
-                    bl_edge.node_a = bl_node_a.obj
-                    bl_edge.node_b = bl_node_b.obj
-                    bl_edge.navmesh_part = navmesh_part.obj
-
-                    created.add((i, j))
+    @staticmethod
+    def are_clusters_touching(cluster: EXIT_CLUSTER, other_cluster: EXIT_CLUSTER, exit_sq_dist: float) -> bool:
+        """Check if any face in `cluster` shares an edge (two vertices within `exit_sq_dist`) with any face in
+        `other_cluster`. As vertices may not be completely identical, this is unfortunately a bit slow."""
+        for _, face_verts in cluster:
+            for _, other_face_verts in other_cluster:
+                hits = 0
+                for v in face_verts:
+                    for ov in other_face_verts:
+                        if AutoCreateMCG.sq_dist(v, ov) < exit_sq_dist:
+                            hits += 1
+                            if hits >= 2:
+                                return True
+        return False
 
     @staticmethod
     def sq_dist(v1, v2) -> float:
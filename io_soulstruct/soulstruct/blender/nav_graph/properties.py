@@ -139,3 +139,11 @@ class NavGraphComputeSettings(SoulstructPropertyGroup):
         default=0.01,
         description="Maximum distance for connected 'Exit' face vertices during node creation",
     )
+    worker_count: bpy.props.IntProperty(
+        name="Worker Processes",
+        default=1,
+        min=1,
+        description="Number of processes used to find exit clusters and edge costs of navmeshes during MCG creation. "
+                    "1 does everything in Blender. Starting each process takes about a second, so more than one only "
+                    "helps for maps with many large navmeshes",
+    )
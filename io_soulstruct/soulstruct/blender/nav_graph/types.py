@@ -2,11 +2,13 @@ from __future__ import annotations
 
 __all__ = [
     "BlenderMCG",
+    "BlenderMCGOrdering",
     "BlenderMCGNode",
     "BlenderMCGEdge",
 ]
 
 import typing as tp
+from dataclasses import dataclass
 
 import bpy
 
@@ -75,9 +77,21 @@ class BlenderMCG(BaseBlenderSoulstructObject[MCG, MCGProps]):
         return [BlenderMCGEdge(edge) for edge in sorted(self.edge_parent.children, key=lambda c: natural_keys(c.name))]
 
     def get_node_index(self, node_obj: bpy.types.Object) -> int:
-        """Get index of given node (raw object) in this MCG's nodes. Will raise a ValueError if absent."""
+        """Get index of given node (raw object) in this MCG's nodes. Will raise a ValueError if absent.
+
+        Sorts all nodes every call. Use `get_ordering().get_node_index()` to look up many nodes.
+        """
         return [bl_node.obj for bl_node in self.get_nodes()].index(node_obj)
 
+    def get_ordering(self) -> BlenderMCGOrdering:
+        """Sort nodes and edges once, for an entire operation."""
+        bl_nodes = self.get_nodes()
+        return BlenderMCGOrdering(
+            nodes=bl_nodes,
+            edges=self.get_edges(),
+            node_indices={bl_node.obj: i for i, bl_node in enumerate(bl_nodes)},
+        )
+
     # NOTE: No edge index method ever needed.
 
     @classmethod
@@ -173,13 +187,17 @@ class BlenderMCG(BaseBlenderSoulstructObject[MCG, MCGProps]):
             # Connected node/edge indices not kept; inferred from edges.
             node_objs.append(bl_node)
 
+        # Edges reference the same node instances that are in `mcg.nodes`.
+        node_indices = {id(node): i for i, node in enumerate(mcg.nodes)}
         for i, edge in enumerate(mcg.edges):
-            node_a_index = mcg.nodes.index(edge.node_a)
-            node_b_index = mcg.nodes.index(edge.node_b)
-            if node_a_index >= len(mcg.nodes):
-                raise ValueError(f"Edge {i} has invalid node A index: {node_a_index}")
-            if node_b_index >= len(mcg.nodes):
-                raise ValueError(f"Edge {i} has invalid node B index: {node_b_index}")
+            try:
+                node_a_index = node_indices[id(edge.node_a)]
+            except KeyError:
+                raise ValueError(f"Edge {i} has invalid node A (not in MCG nodes): {edge.node_a}")
+            try:
+                node_b_index = node_indices[id(edge.node_b)]
+            except KeyError:
+                raise ValueError(f"Edge {i} has invalid node B (not in MCG nodes): {edge.node_b}")
             try:
                 navmesh_name = navmesh_part_names[edge.navmesh_index]
             except IndexError:
@@ -216,11 +234,12 @@ class BlenderMCG(BaseBlenderSoulstructObject[MCG, MCGProps]):
         operator: LoggingOperator,
         context: bpy.types.Context,
         navmesh_part_indices: dict[str, int] = None,
+        ordering: BlenderMCGOrdering = None,
     ) -> MCG:
         """Create MCG from Blender nodes and edges.
 
         `bl_nodes` and `bl_edges` are assumed to be correctly ordered for MCG indexing. This should generally match the
-        order they appear in Blender.
+        order they appear in Blender. An existing `ordering` from `get_ordering()` can be passed in to avoid re-sorting.
 
         Requires a dictionary mapping navmesh part names to indices (from MSB) for export, and a `map_id` for edges.
         """
@@ -241,7 +260,9 @@ class BlenderMCG(BaseBlenderSoulstructObject[MCG, MCGProps]):
         # Iterate over all nodes to build a dictionary of Nodes that ignores 'dead end' navmesh suffixes.
         node_dict = {}  # type: dict[str, int]
         node_prefix = f"{map_stem} Node "  # map-specific node prefix (multiple MCGs can exist with the same node names)
-        bl_nodes = self.get_nodes()  # natural keys sorting
+        if ordering is None:
+            ordering = self.get_ordering()  # natural keys sorting
+        bl_nodes = ordering.nodes
 
         for i, bl_node in enumerate(bl_nodes):
             if bl_node.name.startswith(node_prefix):
@@ -287,7 +308,7 @@ class BlenderMCG(BaseBlenderSoulstructObject[MCG, MCGProps]):
         operator.info(f"Exported {len(nodes)} MCG nodes.")
 
         edges = []
-        for i, bl_edge in enumerate(self.get_edges()):  # natural keys sorting
+        for i, bl_edge in enumerate(ordering.edges):
             edge = bl_edge.to_soulstruct_obj(
                 operator,
                 context,
@@ -306,6 +327,26 @@ class BlenderMCG(BaseBlenderSoulstructObject[MCG, MCGProps]):
         return mcg
 
 
+@dataclass(slots=True, frozen=True)
+class BlenderMCGOrdering:
+    """Snapshot of the MCG indices of all nodes and edges (natural key order of names), from
+    `BlenderMCG.get_ordering()`.
+
+    Must be rebuilt after nodes or edges are added, removed, or renamed.
+    """
+
+    nodes: list[BlenderMCGNode]
+    edges: list[BlenderMCGEdge]
+    node_indices: dict[bpy.types.Object, int]
+
+    def get_node_index(self, node_obj: bpy.types.Object) -> int:
+        """Get index of given node (raw object) in MCG nodes. Will raise a ValueError if absent."""
+        try:
+            return self.node_indices[node_obj]
+        except KeyError:
+            raise ValueError(f"Object '{node_obj.name}' is not a node of this MCG.")
+
+
 class BlenderMCGNode(BaseBlenderSoulstructObject[MCGNode, MCGNodeProps]):
 
     TYPE = SoulstructType.MCG_NODE
@@ -1,187 +1,210 @@
 from __future__ import annotations
 
 __all__ = [
-    "get_neighbors",
-    "a_star",
-    "get_navmesh_step_cost",
+    "NavmeshFaceGraph",
     "get_best_cost",
+    "choose_best_cost",
+    "get_mesh_face_graph",
+    "get_merged_vert_indices",
     "get_edge_cost",
+    "NavmeshEdgeCostCache",
+    "get_navmesh_edge_cost_cache",
+    "clear_navmesh_edge_cost_caches",
+    "get_navmesh_snapshot",
 ]
 
-import heapq
-import itertools
-import math
+import hashlib
 
 import bpy
 import bmesh
-from bmesh.types import BMesh, BMFace
+import numpy as np
+from bpy.app.handlers import persistent
 from mathutils import Vector
 
-from soulstruct.base.events.enums import NavmeshFlag
+from soulstruct.blender.nav_graph_compute import NavmeshFaceGraph, NavmeshPathCosts, NavmeshSnapshot, choose_best_cost
 
 
-def get_neighbors(face: BMFace) -> list[BMFace]:
-    """Get all neighbors of BMesh face."""
-    neighbors = []
-    for edge in face.edges:
-        linked_faces = [f for f in edge.link_faces if f != face]
-        neighbors.extend(linked_faces)
-    return neighbors
-
+def _get_compute_settings_multipliers() -> dict[str, float]:
+    """Read face cost multipliers from scene settings (once per graph)."""
+    settings = bpy.context.scene.nav_graph_compute_settings
+    return dict(wall_multiplier=settings.wall_multiplier, obstacle_multiplier=settings.obstacle_multiplier)
 
-def a_star(
-    start_face: BMFace, end_face: BMFace, bm: BMesh, all_faces_passable=False, try_all_faces_passable_fallback=True
-) -> tuple[list[BMFace] | None, float, bool]:
-    """Find shortest path between two faces in a BMesh using A* algorithm.
 
-    If `all_faces_passable` is `True`, the cost of each step is simply the distance between the faces. Otherwise,
-    some face flags may modify the distance to get the cost. If `try_all_faces_passable_fallback` is `True`, and no path
-    is found when `all_faces_passable` is `False`, the function will try again with `all_faces_passable` set to
-    `True` to see if a path can be found through disabled/wall-climbing faces.
+def get_best_cost(mesh: bpy.types.Mesh, start_face_i: int, end_face_i: int, graph: NavmeshFaceGraph = None) -> float:
+    """We calculate cost in both directions and use the cheaper one.
 
-    Returns the list of faces in the path (including start and end), the total cost of the path, and the value of
-    `all_faces_passable` so the caller can tell if the fallback option was used. If no path is found, returns
-    `(None, float("inf"), True/False)`.
+    An existing `graph` of `mesh` (from `get_mesh_face_graph()`) can be given to avoid building a new one.
     """
+    if graph is None:
+        graph = get_mesh_face_graph(mesh)
+    _, forward_cost, forward_all_passable = graph.a_star(start_face_i, end_face_i)
+    _, backward_cost, backward_all_passable = graph.a_star(end_face_i, start_face_i)
+    return choose_best_cost(forward_cost, forward_all_passable, backward_cost, backward_all_passable)
 
-    flags_layer = bm.faces.layers.int.get("nvm_face_flags")  # could be `None` for non-NVM meshes
-
-    # Cached centroids.
-    centroids = {i: None for i in range(len(bm.faces))}  # type: dict[int, None | Vector]
-
-    def get_centroid(_face: BMFace):
-        if centroids[_face.index] is None:
-            centroids[_face.index] = (_face.verts[0].co + _face.verts[1].co + _face.verts[2].co) / 3.0
-        return centroids[_face.index]
-
-    def get_distance(_face1: BMFace, _face2: BMFace):
-        return (get_centroid(_face1) - get_centroid(_face2)).length
-
-    start_centroid = get_centroid(start_face)
-    end_centroid = get_centroid(end_face)
-
-    open_set = []
-    counter = itertools.count()  # unique sequence count for heap ordering (prevent undefined `BMFace` comparison)
-    heapq.heappush(open_set, (0.0, next(counter), start_face))  # heap of `(f_score, counter, face)` tuples
-
-    came_from = {}
-    g_score = {face: float("inf") for face in bm.faces}
-    g_score[start_face] = 0
-
-    f_score = {face: float("inf") for face in bm.faces}
-    f_score[start_face] = (start_centroid - end_centroid).length
-
-    while open_set:
-        _, _, current_face = heapq.heappop(open_set)  # discard F-score and counter
-
-        if current_face == end_face:
-            # Path complete. Compute total cost.
-            path = []  # type: list[BMFace]
-            total_cost = 0
-            while current_face in came_from:
-                path.append(current_face)
-                current_face = came_from[current_face]
-            path.append(start_face)
-            path.reverse()
-
-            for i in range(len(path) - 1):
-                step_distance = get_distance(path[i], path[i + 1])
-                step_cost = get_navmesh_step_cost(
-                    path[i], path[i + 1], step_distance, flags_layer, all_faces_passable
-                )
-                total_cost += step_cost
-
-            return path, total_cost, all_faces_passable
-
-        for neighbor in get_neighbors(current_face):
-            distance = get_distance(current_face, neighbor)
-            cost = get_navmesh_step_cost(current_face, neighbor, distance, flags_layer, all_faces_passable)
-            if math.isinf(cost):
-                continue  # impassable
-            tentative_g_score = g_score[current_face] + cost
-            if tentative_g_score < g_score[neighbor]:
-                # Found a cheaper path to `neighbor`.
-                came_from[neighbor] = current_face
-                g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = tentative_g_score + (get_centroid(neighbor) - end_centroid).length
-                heapq.heappush(open_set, (f_score[neighbor], next(counter), neighbor))
-
-    # No path found.
-    if not all_faces_passable and try_all_faces_passable_fallback:
-        # Try again with distance cost override.
-        return a_star(start_face, end_face, bm, all_faces_passable=True, try_all_faces_passable_fallback=False)
-    return None, float("inf"), all_faces_passable
-
-
-def get_navmesh_step_cost(
-    from_face: BMFace,
-    to_face: BMFace,
-    distance: float,
-    flags_layer=None,
-    all_faces_passable=False,
-) -> float:
-    """Get the cost (for MCG edges) of travelling to a face with `face_flags` whose centroid is `distance` away.
-
-    My multipliers in here are an attempt to match the costs set in vanilla MCG edges.
-    """
-
-    from_face_flags = from_face[flags_layer] if flags_layer is not None else 0
-    to_face_flags = to_face[flags_layer] if flags_layer is not None else 0
-    if to_face_flags == 0:
-        # Cost is just distance.
-        return distance
-
-    if not all_faces_passable:
-        if to_face_flags & NavmeshFlag.Disable:
-            # Impassable face.
-            return float("inf")
-        if (from_face_flags & NavmeshFlag.FloorBeneathWall) and (to_face_flags & NavmeshFlag.Wall):
-            # Cannot climb up wall (or drop is 'manually disabled' from the top).
-            return float("inf")
-        # NOTE: Degenerate faces are passable. They are sometimes used to join faces with different edge lengths.
-
-    settings = bpy.context.scene.nav_graph_compute_settings
-
-    if to_face_flags & NavmeshFlag.Obstacle:
-        return settings.obstacle_multiplier * distance
-
-    # TODO: Ladders don't seem to be penalized in general.
-    # if to_face_flags & NavmeshFlag.Ladder:
-    #     return 200 * distance
 
-    if to_face_flags & NavmeshFlag.Wall:
-        return settings.wall_multiplier * distance  # drop
+def get_mesh_face_graph(mesh: bpy.types.Mesh) -> NavmeshFaceGraph:
+    """Build a `NavmeshFaceGraph` of `mesh` (with its `nvm_face_flags` attribute, if present) after merging its vertices
+    by distance.
 
-    return distance
+    Vertices are merged by remapping vertex indices (see `get_merged_vert_indices()`), so every face is kept and face
+    indices match `mesh.polygons`.
+    """
+    vert_coords = np.empty((len(mesh.vertices), 3), dtype=np.float32)
+    mesh.vertices.foreach_get("co", vert_coords.ravel())
+    loop_vert_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vert_indices)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    if (flags_attribute := mesh.attributes.get("nvm_face_flags")) is not None:
+        face_flags = np.empty(len(mesh.polygons), dtype=np.int32)
+        flags_attribute.data.foreach_get("value", face_flags)
+    else:
+        face_flags = None  # non-NVM mesh
+
+    return NavmeshFaceGraph.from_polygons(
+        vert_coords,
+        get_merged_vert_indices(mesh)[loop_vert_indices],
+        loop_totals,
+        face_flags,
+        **_get_compute_settings_multipliers(),
+    )
+
+
+def get_merged_vert_indices(mesh: bpy.types.Mesh, dist=0.001) -> np.ndarray:
+    """Get the index of the vertex that each vertex of `mesh` would be merged into by distance (or its own index).
+
+    Unlike `bmesh.ops.remove_doubles()`, this does not remove any (e.g. degenerate) faces, so face indices are kept.
+    """
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        bm.verts.index_update()
+        target_map = bmesh.ops.find_doubles(bm, verts=bm.verts, dist=dist)["targetmap"]
+        merged_vert_indices = np.arange(len(bm.verts), dtype=np.int32)
+        for vert, target_vert in target_map.items():
+            merged_vert_indices[vert.index] = target_vert.index
+    finally:
+        bm.free()
+    return merged_vert_indices
 
 
-def get_best_cost(mesh: bpy.types.Mesh, start_face_i: int, end_face_i: int) -> float:
-    """We calculate cost in both directions and use the cheaper one."""
-    forward_path, forward_cost, forward_all_passable = get_edge_cost(mesh, start_face_i, end_face_i)
-    backward_path, backward_cost, backward_all_passable = get_edge_cost(mesh, end_face_i, start_face_i)
+def get_edge_cost(mesh: bpy.types.Mesh, start_face_i: int, end_face_i: int) -> tuple[list[int] | None, float, bool]:
+    """Find cheapest path between two faces of `mesh`. Path is returned as a list of face indices."""
+    return get_mesh_face_graph(mesh).a_star(start_face_i, end_face_i)
 
-    if not forward_path and not backward_path:
-        return 0.0
 
-    if forward_all_passable == backward_all_passable:
-        return min(forward_cost, backward_cost)
-    elif not forward_all_passable:
-        # Use forward cost, as it didn't fall back to distance as cost.
-        return forward_cost
-    else:  # not backward_is_distance
-        return backward_cost
+class NavmeshEdgeCostCache:
+    """Best MCG edge costs between pairs of faces of one navmesh Mesh, for as long as its geometry (and the cost
+    settings) are unchanged, as identified by `geometry_hash`.
 
+    Costs come from a `NavmeshPathCosts` of the Mesh, so any number of edges starting or ending at the same node
+    triangle share a single search. Its graph and Dijkstra trees (one cost per face for every searched face) are only
+    needed while costs are being computed, and should be dropped afterward with `release_path_costs()`. Only the edge
+    costs are kept between calls.
+    """
 
-def get_edge_cost(
-    mesh: bpy.types.Mesh, start_face_i: int, end_face_i: int
-) -> tuple[list[BMFace] | None, float, bool]:
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.001)
-    bm.faces.ensure_lookup_table()
-    start_face = bm.faces[start_face_i]
-    end_face = bm.faces[end_face_i]
-    try:
-        return a_star(start_face, end_face, bm)
-    finally:
-        bm.free()
+    geometry_hash: bytes
+    _path_costs: NavmeshPathCosts | None  # built on first use
+    _released_search_count: int  # searches run by released `_path_costs`
+    _edge_costs: dict[tuple[int, int], float]
+
+    def __init__(self, geometry_hash: bytes):
+        self.geometry_hash = geometry_hash
+        self._path_costs = None
+        self._released_search_count = 0
+        self._edge_costs = {}
+
+    @property
+    def search_count(self) -> int:
+        """Total path searches run (for logging)."""
+        if self._path_costs is None:
+            return self._released_search_count
+        return self._released_search_count + self._path_costs.search_count
+
+    def get_best_cost(self, mesh: bpy.types.Mesh, start_face_i: int, end_face_i: int) -> float:
+        """Get cached cost or compute it like `get_best_cost()`. `mesh` is only read if the graph must be built."""
+        try:
+            return self._edge_costs[start_face_i, end_face_i]
+        except KeyError:
+            pass
+        if self._path_costs is None:
+            self._path_costs = NavmeshPathCosts(get_mesh_face_graph(mesh))
+        cost = self._edge_costs[start_face_i, end_face_i] = self._path_costs.get_best_cost(start_face_i, end_face_i)
+        return cost
+
+    def release_path_costs(self):
+        """Drop the face graph and Dijkstra trees. Cached edge costs are kept."""
+        if self._path_costs is not None:
+            self._released_search_count += self._path_costs.search_count
+            self._path_costs = None
+
+
+# Maps Mesh names to their current edge cost cache. Cleared on file load and undo/redo.
+_NAVMESH_EDGE_COST_CACHES = {}  # type: dict[str, NavmeshEdgeCostCache]
+
+
+def _get_mesh_geometry_hash(mesh: bpy.types.Mesh, multipliers: dict[str, float]) -> bytes:
+    """Hash vertex coordinates, faces, `nvm_face_flags` (if present), and cost multipliers of `mesh`."""
+    vert_coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", vert_coords)
+    loop_vert_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vert_indices)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    geometry_hash = hashlib.blake2b()
+    for array in (vert_coords, loop_vert_indices, loop_totals):
+        geometry_hash.update(len(array).to_bytes(8, "little"))
+        geometry_hash.update(array.tobytes())
+    if (flags_attribute := mesh.attributes.get("nvm_face_flags")) is not None:
+        face_flags = np.empty(len(mesh.polygons), dtype=np.int32)
+        flags_attribute.data.foreach_get("value", face_flags)
+        geometry_hash.update(face_flags.tobytes())
+    geometry_hash.update(repr(sorted(multipliers.items())).encode())
+    return geometry_hash.digest()
+
+
+def get_navmesh_edge_cost_cache(mesh: bpy.types.Mesh) -> NavmeshEdgeCostCache:
+    """Get the edge cost cache of `mesh`, which is replaced with an empty cache if the geometry of `mesh` or the cost
+    settings have changed since it was last used."""
+    geometry_hash = _get_mesh_geometry_hash(mesh, _get_compute_settings_multipliers())
+    cache = _NAVMESH_EDGE_COST_CACHES.get(mesh.name)
+    if cache is None or cache.geometry_hash != geometry_hash:
+        cache = _NAVMESH_EDGE_COST_CACHES[mesh.name] = NavmeshEdgeCostCache(geometry_hash)
+    return cache
+
+
+@persistent  # prevent Blender from unloading handler when a new file is loaded
+def clear_navmesh_edge_cost_caches(*_):
+    """Clear all navmesh edge cost caches. Used as a load and undo/redo handler."""
+    _NAVMESH_EDGE_COST_CACHES.clear()
+
+
+def get_navmesh_snapshot(name: str, mesh: bpy.types.Mesh, location: Vector) -> NavmeshSnapshot:
+    """Copy everything `get_navmesh_mcg_data()` needs from navmesh `mesh` (which must have triangle faces and an
+    `nvm_face_flags` attribute) into plain arrays, with face vertex coordinates offset by `location`.
+
+    Vertices are also merged by distance for pathfinding, like `get_mesh_face_graph()`.
+    """
+    vert_coords = np.empty((len(mesh.vertices), 3), dtype=np.float32)
+    mesh.vertices.foreach_get("co", vert_coords.ravel())
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    if np.any(loop_totals != 3):
+        raise ValueError(f"Navmesh '{name}' has non-triangle faces.")
+    triangles = np.empty((len(mesh.polygons), 3), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", triangles.ravel())
+    face_flags = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.attributes["nvm_face_flags"].data.foreach_get("value", face_flags)
+
+    # Merge vertices by distance (as in `get_mesh_face_graph()`) by remapping vertex indices, so face order is kept.
+    merged_vert_indices = get_merged_vert_indices(mesh)
+
+    return NavmeshSnapshot(
+        face_vert_coords=vert_coords[triangles] + np.array(location, dtype=np.float32),
+        triangles=triangles,
+        face_flags=face_flags,
+        merged_vert_coords=vert_coords,
+        merged_triangles=merged_vert_indices[triangles],
+        **_get_compute_settings_multipliers(),
+    )
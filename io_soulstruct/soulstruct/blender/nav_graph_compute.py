@@ -0,0 +1,474 @@
+"""Blender-independent navmesh graph computations, used to find MCG nodes and edge costs.
+
+Nothing in here imports `bpy`, and this module is deliberately NOT inside the `nav_graph` package (which imports `bpy`
+on import), so it can be imported by the worker processes of `AutoCreateMCG`. Blender data is read into plain
+`NavmeshSnapshot` arrays on the main thread first.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "NavmeshFaceGraph",
+    "NavmeshPathCosts",
+    "choose_best_cost",
+    "get_triangle_face_pairs",
+    "get_polygon_face_pairs",
+    "NavmeshSnapshot",
+    "NavmeshMCGData",
+    "get_navmesh_mcg_data",
+    "get_all_navmesh_mcg_data",
+    "EXIT_CLUSTER",
+]
+
+import heapq
+import itertools
+import logging
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+
+import numpy as np
+
+from soulstruct.base.events.enums import NavmeshFlag
+
+_LOGGER = logging.getLogger("soulstruct.io")
+
+# Tuple of `(face_index, face_vert_coords)` pairs of connected 'Exit' faces in one navmesh.
+EXIT_CLUSTER = tuple[tuple[int, frozenset[tuple[float, float, float]]], ...]
+
+
+def get_triangle_face_pairs(triangles: np.ndarray) -> np.ndarray:
+    """Get an `(M, 2)` array of the indices of all triangles that share an edge, i.e. two vertex indices, from an
+    `(F, 3)` array of triangle vertex indices."""
+    triangles = np.asarray(triangles, dtype=np.int64)
+    face_edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    return _get_shared_edge_face_pairs(face_edges, np.repeat(np.arange(len(triangles)), 3))
+
+
+def get_polygon_face_pairs(loop_vert_indices: np.ndarray, loop_totals: np.ndarray) -> np.ndarray:
+    """Get an `(M, 2)` array of the indices of all polygons that share an edge, i.e. two consecutive vertex indices,
+    from the vertex index of every face loop and the loop count of every face (as in Blender `Mesh` loops)."""
+    loop_vert_indices = np.asarray(loop_vert_indices, dtype=np.int64)
+    loop_totals = np.asarray(loop_totals, dtype=np.int64)
+    # Each loop's edge runs to the next loop of its face, wrapping around from the last loop to the first.
+    loop_starts = np.cumsum(loop_totals) - loop_totals
+    next_loops = np.arange(1, len(loop_vert_indices) + 1)
+    next_loops[loop_starts + loop_totals - 1] = loop_starts
+    face_edges = np.sort(np.stack((loop_vert_indices, loop_vert_indices[next_loops]), axis=1), axis=1)
+    return _get_shared_edge_face_pairs(face_edges, np.repeat(np.arange(len(loop_totals)), loop_totals))
+
+
+def _get_shared_edge_face_pairs(face_edges: np.ndarray, edge_faces: np.ndarray) -> np.ndarray:
+    """Pair up every face that shares each edge, given `(E, 2)` sorted vertex index pairs and the face of each one."""
+    if len(face_edges) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Sort all face edges by their (sorted) vertex pair, then pair up every face that shares each edge.
+    _, edge_keys = np.unique(face_edges, axis=0, return_inverse=True)
+    edge_keys = edge_keys.ravel()
+    order = np.argsort(edge_keys, kind="stable")
+    sorted_keys = edge_keys[order]
+    sorted_faces = edge_faces[order]
+    group_starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    group_sizes = np.diff(np.r_[group_starts, len(sorted_keys)])
+    # Manifold edges (two faces) are paired at once. Rare non-manifold edges pair all their faces.
+    manifold_starts = group_starts[group_sizes == 2]
+    face_pairs = [np.stack((sorted_faces[manifold_starts], sorted_faces[manifold_starts + 1]), axis=1)]
+    for start, size in zip(group_starts[group_sizes > 2], group_sizes[group_sizes > 2]):
+        face_pairs.append(np.array(list(itertools.combinations(sorted_faces[start:start + size], 2))))
+    return np.concatenate(face_pairs)
+
+
+class NavmeshFaceGraph:
+    """Face adjacency graph of a navmesh (or any mesh) for pathfinding, using only NumPy arrays and integer face
+    indices.
+
+    Holds face centroids, a CSR face adjacency (faces sharing an edge), and the cost of every directed CSR step, which
+    is the distance between face centroids multiplied by a per-face multiplier from the navmesh flags of the face being
+    entered (see `get_face_cost_multipliers()`). Cost settings are only read once, on construction.
+
+    Does not depend on Blender once built, so it can be built from synthetic arrays with `from_arrays()`,
+    `from_triangles()`, or `from_polygons()`, and sent to other processes.
+    """
+
+    centroids: np.ndarray  # `(F, 3)` float
+    offsets: np.ndarray  # `(F + 1,)` CSR row offsets
+    neighbors: np.ndarray  # CSR neighbor face indices
+    face_flags: np.ndarray  # `(F,)` int `NavmeshFlag` values (all zero for non-NVM meshes)
+    step_costs: np.ndarray  # cost of each CSR step, respecting impassable faces (`inf`)
+    all_passable_step_costs: np.ndarray  # cost of each CSR step, with every face passable
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        offsets: np.ndarray,
+        neighbors: np.ndarray,
+        face_flags: np.ndarray,
+        wall_multiplier=1.0,
+        obstacle_multiplier=1.0,
+    ):
+        self.centroids = np.asarray(centroids, dtype=np.float64)
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.face_flags = np.asarray(face_flags, dtype=np.int64)
+
+        sources = np.repeat(np.arange(len(self.centroids)), np.diff(offsets))
+        distances = np.linalg.norm(self.centroids[neighbors] - self.centroids[sources], axis=1)
+        self.all_passable_step_costs = distances * self.get_face_cost_multipliers(
+            self.face_flags, wall_multiplier, obstacle_multiplier
+        )[neighbors]
+
+        # Disabled faces cannot be entered, and walls cannot be climbed from the floor beneath them.
+        is_disabled = (self.face_flags & NavmeshFlag.Disable) != 0
+        is_wall = (self.face_flags & NavmeshFlag.Wall) != 0
+        is_floor_beneath_wall = (self.face_flags & NavmeshFlag.FloorBeneathWall) != 0
+        impassable = is_disabled[neighbors] | (is_floor_beneath_wall[sources] & is_wall[neighbors])
+        # NOTE: Degenerate faces are passable. They are sometimes used to join faces with different edge lengths.
+        self.step_costs = np.where(impassable, np.inf, self.all_passable_step_costs)
+
+    @staticmethod
+    def get_face_cost_multipliers(
+        face_flags: np.ndarray, wall_multiplier=1.0, obstacle_multiplier=1.0
+    ) -> np.ndarray:
+        """Get the multiplier of the distance cost of entering each face, from its flags.
+
+        My multipliers in here are an attempt to match the costs set in vanilla MCG edges.
+        """
+        multipliers = np.ones(len(face_flags), dtype=np.float64)
+        # TODO: Ladders don't seem to be penalized in general.
+        multipliers[(face_flags & NavmeshFlag.Wall) != 0] = wall_multiplier  # drop
+        multipliers[(face_flags & NavmeshFlag.Obstacle) != 0] = obstacle_multiplier  # takes precedence over Wall
+        return multipliers
+
+    @classmethod
+    def from_arrays(
+        cls,
+        centroids: np.ndarray,
+        face_pairs: np.ndarray,
+        face_flags: np.ndarray,
+        wall_multiplier=1.0,
+        obstacle_multiplier=1.0,
+    ) -> NavmeshFaceGraph:
+        """Build from face centroids and an `(M, 2)` array of face index pairs that share an edge (one pair per shared
+        edge)."""
+        face_pairs = np.asarray(face_pairs, dtype=np.int64).reshape(-1, 2)
+        # Undirected CSR adjacency, as in `utilities.meshes.get_csr_adjacency()` (which imports `bpy`).
+        sources = np.concatenate((face_pairs[:, 0], face_pairs[:, 1]))
+        targets = np.concatenate((face_pairs[:, 1], face_pairs[:, 0]))
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(len(centroids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(centroids)), out=offsets[1:])
+        return cls(centroids, offsets, targets[order], face_flags, wall_multiplier, obstacle_multiplier)
+
+    @classmethod
+    def from_triangles(
+        cls,
+        vert_coords: np.ndarray,
+        triangles: np.ndarray,
+        face_flags: np.ndarray = None,
+        wall_multiplier=1.0,
+        obstacle_multiplier=1.0,
+    ) -> NavmeshFaceGraph:
+        """Build from vertex coordinates and an `(F, 3)` array of triangle vertex indices. Triangles are adjacent if
+        they share two vertex indices (so vertices must already be merged)."""
+        vert_coords = np.asarray(vert_coords, dtype=np.float64)
+        triangles = np.asarray(triangles, dtype=np.int64)
+        if face_flags is None:
+            face_flags = np.zeros(len(triangles), dtype=np.int64)
+        centroids = vert_coords[triangles].mean(axis=1)
+
+        return cls.from_arrays(
+            centroids, get_triangle_face_pairs(triangles), face_flags, wall_multiplier, obstacle_multiplier
+        )
+
+    @classmethod
+    def from_polygons(
+        cls,
+        vert_coords: np.ndarray,
+        loop_vert_indices: np.ndarray,
+        loop_totals: np.ndarray,
+        face_flags: np.ndarray = None,
+        wall_multiplier=1.0,
+        obstacle_multiplier=1.0,
+    ) -> NavmeshFaceGraph:
+        """Build from vertex coordinates and the vertex index of every face loop and the loop count of every face (as
+        read from Blender `Mesh` loops and polygons with `foreach_get()`), for meshes that may not be triangulated.
+
+        Centroids use the first three vertices of each face. Faces are adjacent if they share two consecutive vertex
+        indices (so vertices must already be merged).
+        """
+        vert_coords = np.asarray(vert_coords, dtype=np.float64)
+        loop_vert_indices = np.asarray(loop_vert_indices, dtype=np.int64)
+        loop_totals = np.asarray(loop_totals, dtype=np.int64)
+        if face_flags is None:
+            face_flags = np.zeros(len(loop_totals), dtype=np.int64)
+        loop_starts = np.cumsum(loop_totals) - loop_totals
+        centroids = vert_coords[loop_vert_indices[loop_starts[:, np.newaxis] + np.arange(3)]].mean(axis=1)
+
+        return cls.from_arrays(
+            centroids,
+            get_polygon_face_pairs(loop_vert_indices, loop_totals),
+            face_flags,
+            wall_multiplier,
+            obstacle_multiplier,
+        )
+
+    @property
+    def face_count(self) -> int:
+        return len(self.centroids)
+
+    def a_star(
+        self, start_face: int, end_face: int, all_faces_passable=False, try_all_faces_passable_fallback=True
+    ) -> tuple[list[int] | None, float, bool]:
+        """Find cheapest path between two faces using A*, with centroid distance to `end_face` as the heuristic.
+
+        If `all_faces_passable` is `True`, impassable faces (e.g. disabled) are allowed and only cost their usual
+        multiplier. If `try_all_faces_passable_fallback` is `True`, and no path is found when `all_faces_passable` is
+        `False`, the search is repeated with `all_faces_passable=True` to see if a path can be found through
+        disabled/wall-climbing faces.
+
+        Returns the list of face indices in the path (including start and end), the total cost of the path, and the
+        value of `all_faces_passable` so the caller can tell if the fallback option was used. If no path is found,
+        returns `(None, float("inf"), True/False)`.
+        """
+        # Python lists are much faster than NumPy arrays for scalar access in the search loop.
+        offsets = self.offsets.tolist()
+        neighbors = self.neighbors.tolist()
+        step_costs = (self.all_passable_step_costs if all_faces_passable else self.step_costs).tolist()
+        heuristics = np.linalg.norm(self.centroids - self.centroids[end_face], axis=1).tolist()
+
+        inf = math.inf
+        came_from = [-1] * self.face_count
+        g_score = [inf] * self.face_count
+        g_score[start_face] = 0.0
+        f_score = [inf] * self.face_count
+        f_score[start_face] = heuristics[start_face]
+
+        counter = itertools.count()  # unique sequence count for FIFO ordering of equal F-scores
+        open_set = [(f_score[start_face], next(counter), start_face)]  # heap of `(f_score, counter, face)` tuples
+        while open_set:
+            current_f_score, _, current_face = heapq.heappop(open_set)  # discard counter
+            if current_f_score > f_score[current_face]:
+                continue  # stale entry; face was already expanded with a better score
+
+            if current_face == end_face:
+                # Path complete.
+                path = [current_face]
+                while current_face != start_face:
+                    current_face = came_from[current_face]
+                    path.append(current_face)
+                path.reverse()
+                return path, g_score[end_face], all_faces_passable
+
+            current_g_score = g_score[current_face]
+            for i in range(offsets[current_face], offsets[current_face + 1]):
+                cost = step_costs[i]
+                if cost == inf:
+                    continue  # impassable
+                neighbor = neighbors[i]
+                tentative_g_score = current_g_score + cost
+                if tentative_g_score < g_score[neighbor]:
+                    # Found a cheaper path to `neighbor`.
+                    came_from[neighbor] = current_face
+                    g_score[neighbor] = tentative_g_score
+                    f_score[neighbor] = tentative_g_score + heuristics[neighbor]
+                    heapq.heappush(open_set, (f_score[neighbor], next(counter), neighbor))
+
+        # No path found.
+        if not all_faces_passable and try_all_faces_passable_fallback:
+            # Try again with all faces passable.
+            return self.a_star(start_face, end_face, all_faces_passable=True, try_all_faces_passable_fallback=False)
+        return None, float("inf"), all_faces_passable
+
+    def dijkstra(self, start_face: int, all_faces_passable=False, end_faces=None) -> np.ndarray:
+        """Get the cheapest path cost from `start_face` to every face (`inf` if unreachable) using Dijkstra's algorithm.
+
+        If `end_faces` is given, the search stops as soon as all of them have been reached, and other faces may not
+        have final costs.
+        """
+        offsets = self.offsets.tolist()
+        neighbors = self.neighbors.tolist()
+        step_costs = (self.all_passable_step_costs if all_faces_passable else self.step_costs).tolist()
+        remaining_end_faces = set(end_faces) if end_faces is not None else None
+
+        inf = math.inf
+        costs = [inf] * self.face_count
+        costs[start_face] = 0.0
+        open_set = [(0.0, start_face)]
+        while open_set:
+            current_cost, current_face = heapq.heappop(open_set)
+            if current_cost > costs[current_face]:
+                continue  # stale entry
+            if remaining_end_faces is not None:
+                remaining_end_faces.discard(current_face)
+                if not remaining_end_faces:
+                    break
+            for i in range(offsets[current_face], offsets[current_face + 1]):
+                cost = step_costs[i]
+                if cost == inf:
+                    continue  # impassable
+                neighbor = neighbors[i]
+                tentative_cost = current_cost + cost
+                if tentative_cost < costs[neighbor]:
+                    costs[neighbor] = tentative_cost
+                    heapq.heappush(open_set, (tentative_cost, neighbor))
+
+        return np.array(costs, dtype=np.float64)
+
+
+def choose_best_cost(
+    forward_cost: float, forward_all_passable: bool, backward_cost: float, backward_all_passable: bool
+) -> float:
+    """Choose the best of forward and backward path costs (`inf` if no path) and whether they needed the
+    all-faces-passable fallback. Returns 0.0 if neither path exists."""
+    if math.isinf(forward_cost) and math.isinf(backward_cost):
+        return 0.0
+
+    if forward_all_passable == backward_all_passable:
+        return min(forward_cost, backward_cost)
+    elif not forward_all_passable:
+        # Use forward cost, as it didn't fall back to distance as cost.
+        return forward_cost
+    else:  # not backward_is_distance
+        return backward_cost
+
+
+class NavmeshPathCosts:
+    """Best path costs between faces of a `NavmeshFaceGraph`, for MCG edges.
+
+    Costs are computed from full Dijkstra trees (`NavmeshFaceGraph.dijkstra()`), which are cached per source face, so
+    any number of paths starting or ending at the same face share a single search. This gives the same costs as A* in
+    both directions (`nav_graph.utilities.get_best_cost()`) for the default cost multipliers (A* is exact for
+    multipliers of at least one).
+    """
+
+    graph: NavmeshFaceGraph
+    search_count: int  # total Dijkstra searches run (for logging)
+    _trees: dict[tuple[int, bool], np.ndarray]  # maps `(source_face, all_faces_passable)` to path costs
+
+    def __init__(self, graph: NavmeshFaceGraph):
+        self.graph = graph
+        self.search_count = 0
+        self._trees = {}
+
+    def get_best_cost(self, start_face_i: int, end_face_i: int) -> float:
+        """Get the best of the forward and backward path costs, as chosen by `choose_best_cost()`."""
+        forward_cost, forward_all_passable = self.get_path_cost(start_face_i, end_face_i)
+        backward_cost, backward_all_passable = self.get_path_cost(end_face_i, start_face_i)
+        return choose_best_cost(forward_cost, forward_all_passable, backward_cost, backward_all_passable)
+
+    def get_path_cost(self, start_face_i: int, end_face_i: int) -> tuple[float, bool]:
+        """Get cheapest path cost and whether the all-faces-passable fallback was needed (as in `a_star()`)."""
+        cost = self._get_tree(start_face_i, all_faces_passable=False)[end_face_i]
+        if not math.isinf(cost):
+            return float(cost), False
+        return float(self._get_tree(start_face_i, all_faces_passable=True)[end_face_i]), True
+
+    def _get_tree(self, source_face_i: int, all_faces_passable: bool) -> np.ndarray:
+        try:
+            return self._trees[source_face_i, all_faces_passable]
+        except KeyError:
+            pass
+        tree = self._trees[source_face_i, all_faces_passable] = self.graph.dijkstra(source_face_i, all_faces_passable)
+        self.search_count += 1
+        return tree
+
+
+@dataclass(slots=True)
+class NavmeshSnapshot:
+    """Plain array copy of everything MCG generation needs from one navmesh, which can be sent to other processes."""
+
+    face_vert_coords: np.ndarray  # `(F, 3, 3)` float32 coordinates of each face's vertices (offset by part location)
+    triangles: np.ndarray  # `(F, 3)` vertex indices of each face (vertices NOT merged)
+    face_flags: np.ndarray  # `(F,)` int `NavmeshFlag` values
+    merged_vert_coords: np.ndarray  # `(V, 3)` vertex coordinates after merging vertices by distance
+    merged_triangles: np.ndarray  # `(F, 3)` vertex indices of each face after merging vertices by distance
+    wall_multiplier: float = 1.0
+    obstacle_multiplier: float = 1.0
+
+
+@dataclass(slots=True)
+class NavmeshMCGData:
+    """Result of `get_navmesh_mcg_data()` for one navmesh."""
+
+    exit_clusters: tuple[EXIT_CLUSTER, ...]
+    # `(C, C)` best path costs between the lowest face indices of each pair of exit clusters (`choose_best_cost()`).
+    exit_cluster_costs: np.ndarray
+
+
+def get_navmesh_mcg_data(snapshot: NavmeshSnapshot) -> NavmeshMCGData:
+    """Find all clusters of connected 'Exit' faces in one navmesh and the path costs between all pairs of them.
+
+    Clusters are ordered by their lowest face index, and so are the faces in each cluster. Exit faces are connected if
+    they share an edge in the original (unmerged) triangles, whereas paths use the merged triangles.
+
+    Module-level function (of plain data only) so it can be run in worker processes. The result only depends on
+    `snapshot`, so it is identical in any process.
+    """
+    is_exit = (snapshot.face_flags & NavmeshFlag.Exit) != 0
+    exit_faces = np.flatnonzero(is_exit).tolist()
+
+    # Connect all 'Exit' faces that share an edge.
+    face_pairs = get_triangle_face_pairs(snapshot.triangles)
+    exit_face_pairs = face_pairs[is_exit[face_pairs[:, 0]] & is_exit[face_pairs[:, 1]]]
+    exit_neighbors = {}  # type: dict[int, list[int]]
+    for face_a, face_b in exit_face_pairs.tolist():
+        exit_neighbors.setdefault(face_a, []).append(face_b)
+        exit_neighbors.setdefault(face_b, []).append(face_a)
+
+    face_vert_coords = snapshot.face_vert_coords.tolist()
+    exit_clusters = []
+    checked = set()
+    for face in exit_faces:
+        if face in checked:
+            continue
+        checked.add(face)
+        cluster_faces = []
+        stack = [face]
+        while stack:
+            f = stack.pop()
+            cluster_faces.append(f)
+            for other_face in exit_neighbors.get(f, ()):
+                if other_face not in checked:
+                    checked.add(other_face)
+                    stack.append(other_face)
+        cluster_faces.sort()
+        exit_clusters.append(tuple((f, frozenset(tuple(v) for v in face_vert_coords[f])) for f in cluster_faces))
+
+    cluster_count = len(exit_clusters)
+    exit_cluster_costs = np.zeros((cluster_count, cluster_count), dtype=np.float64)
+    if cluster_count > 1:
+        graph = NavmeshFaceGraph.from_triangles(
+            snapshot.merged_vert_coords,
+            snapshot.merged_triangles,
+            snapshot.face_flags,
+            snapshot.wall_multiplier,
+            snapshot.obstacle_multiplier,
+        )
+        path_costs = NavmeshPathCosts(graph)
+        cluster_faces = [cluster[0][0] for cluster in exit_clusters]  # lowest face index
+        for i, j in itertools.combinations(range(cluster_count), 2):
+            # Best cost is symmetric, as both directions are always checked.
+            exit_cluster_costs[i, j] = exit_cluster_costs[j, i] = path_costs.get_best_cost(
+                cluster_faces[i], cluster_faces[j]
+            )
+
+    return NavmeshMCGData(tuple(exit_clusters), exit_cluster_costs)
+
+
+def get_all_navmesh_mcg_data(snapshots: list[NavmeshSnapshot], worker_count=1) -> list[NavmeshMCGData]:
+    """Run `get_navmesh_mcg_data()` on all `snapshots`, in that many worker processes if `worker_count` is more than
+    one.
+
+    Results are always in `snapshots` order. Worker processes are spawned rather than forked, so they never inherit
+    Blender state. If the worker processes cannot be started or die, everything is done in this process instead.
+    """
+    worker_count = min(worker_count, len(snapshots))
+    if worker_count > 1:
+        try:
+            with ProcessPoolExecutor(worker_count, mp_context=multiprocessing.get_context("spawn")) as executor:
+                return list(executor.map(get_navmesh_mcg_data, snapshots))
+        except (OSError, BrokenProcessPool) as ex:
+            _LOGGER.warning(f"MCG worker processes failed ({ex}). Finding MCG data in this process instead.")
+    return [get_navmesh_mcg_data(snapshot) for snapshot in snapshots]
@@ -14,18 +14,29 @@ __all__ = [
     "GenerateNavmeshFromCollision",
 ]
 
+import math
+
 import bmesh
 import bpy
-from mathutils import Vector
+import numpy as np
+from mathutils import Matrix
 
 from soulstruct.base.events.enums import NavmeshFlag
 
 from soulstruct.blender.bpy_base.property_group import SoulstructPropertyGroup
 from soulstruct.blender.exceptions import SoulstructTypeError
 from soulstruct.blender.types import *
-from soulstruct.blender.utilities import LoggingOperator, replace_shared_prefix
+from soulstruct.blender.utilities import (
+    LoggingOperator,
+    replace_shared_prefix,
+    new_mesh_object,
+    get_mesh_vertex_coords,
+    set_mesh_vertices_and_faces,
+    get_mesh_face_edge_pairs,
+    get_connected_component_labels,
+)
 from .types import BlenderNVM
-from .utilities import set_face_material, get_navmesh_material
+from .utilities import set_face_material, get_navmesh_material, simplify_navmesh_triangles
 
 # Get all non-default `NavmeshFlag` values for Blender `EnumProperty`.
 _navmesh_flag_items = [
@@ -344,31 +355,13 @@ class RemoveNVMEventEntityTriangleIndex(bpy.types.Operator):
         return {'FINISHED'}
 
 
-def get_connected_component(face, visited):
-    """Flood-fill connected selected faces starting from `face`."""
-    island = set()
-    stack = [face]
-    while stack:
-        current = stack.pop()
-        if current in visited:
-            continue
-        visited.add(current)
-        island.add(current)
-        # Look at all faces sharing an edge with the current face.
-        for edge in current.edges:
-            for linked_face in edge.link_faces:
-                if linked_face.select and linked_face not in visited:
-                    stack.append(linked_face)
-    return island
-
-
 class GenerateNavmeshFromCollision(LoggingOperator):
     bl_idname = "object.generate_navmesh_from_collision"
     bl_label = "Generate Navmesh from Collision"
     bl_description = (
         "Generate a simplified navmesh from a collision mesh. "
         "Walkable faces (those with normals nearly vertical) are duplicated into a new object, "
-        "triangulated, and then simplified via Limited Dissolve"
+        "triangulated, and then simplified by merging coplanar triangles"
     )
 
     walkable_threshold: bpy.props.FloatProperty(
@@ -383,12 +376,23 @@ class GenerateNavmeshFromCollision(LoggingOperator):
         default=0.1,
         min=0.0
     )
+    simplify: bpy.props.BoolProperty(
+        name="Simplify",
+        description="Merge coplanar triangles, keeping the navmesh outline and flag regions",
+        default=False,
+    )
     dissolve_angle_limit: bpy.props.FloatProperty(
-        name="Dissolve Angle Limit",
-        description="Angle limit (in degrees) for Limited Dissolve operator",
+        name="Simplify Angle Limit",
+        description="Maximum angle (in degrees) between triangle normals that can be merged during simplification",
         default=5.0,
         min=0.0, max=180.0
     )
+    max_edge_length: bpy.props.FloatProperty(
+        name="Max Edge Length",
+        description="Maximum length of new triangle edges created during simplification",
+        default=5.0,
+        min=0.0,
+    )
     min_walkable_faces: bpy.props.IntProperty(
         name="Minimum Walkable Faces",
         description="Minimum number of walkable faces required to generate a navmesh (or operator will abort)",
@@ -419,106 +423,124 @@ class GenerateNavmeshFromCollision(LoggingOperator):
         # Assume the active object is the collision mesh.
         # noinspection PyTypeChecker
         collision_obj = context.active_object  # type: MeshObject
-
-        # Ensure we are in Edit mode so we can use bmesh.
-        bpy.ops.object.mode_set(mode='EDIT')
-        bm = bmesh.from_edit_mesh(collision_obj.data)
-
-        # Deselect all faces first.
-        for face in bm.faces:
-            face.select = False
-
-        # Global up vector (world space).
-        up = Vector((0, 0, 1))
-        # For each face, transform its normal to world space and select if walkable.
-        # Note: if the collision object has a non-identity transform, we must transform the face normals.
-        # TODO: Can ignore world matrix, I think.
-        matrix = collision_obj.matrix_world.to_3x3()
-        for face in bm.faces:
-            # For Collisions, we only use 'Lo' faces.
-            if collision_obj.soulstruct_type == SoulstructType.COLLISION:
-                material = collision_obj.data.materials[face.material_index]
-                if "(Lo)" not in material.name:
-                    continue
-            world_normal = matrix @ face.normal
-            # If the face normal is close enough to up, mark it as selected.
-            if world_normal.dot(up) >= self.walkable_threshold:
-                face.select = True
-
-        bmesh.update_edit_mesh(collision_obj.data)
-
-        # Now deselect small islands of selected faces.
-        visited = set()
-        for face in list(bm.faces):
-            if face.select and face not in visited:
-                island = get_connected_component(face, visited)
-                # Compute total area of the island.
-                total_area = sum(f.calc_area() for f in island)
-                if total_area < self.island_area_threshold:
-                    for f in island:
-                        f.select = False
-        bmesh.update_edit_mesh(collision_obj.data)
+        walkable = self.get_walkable_face_mask(
+            collision_obj.data,
+            collision_obj.matrix_world,
+            self.walkable_threshold,
+            self.island_area_threshold,
+            lo_faces_only=collision_obj.soulstruct_type == SoulstructType.COLLISION,  # for Collisions, use 'Lo' faces
+        )
 
         # Make sure we selected enough walkable faces.
-        select_count = sum(1 for face in bm.faces if face.select)
-        bm.free()  # done with this BMesh
-
+        select_count = int(np.count_nonzero(walkable))
         if select_count < self.min_walkable_faces:
             return self.error(
                 f"Not enough walkable faces found ({select_count} < {self.min_walkable_faces}) with current settings."
             )
 
-        # Duplicate and separate the selected faces into a new object.
-        bpy.ops.mesh.duplicate()
-        bpy.ops.mesh.separate(type='SELECTED')
-
-        # Switch back to Object mode.
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-        # Identify the new navmesh object: it should be the one selected that is not our original collision object.
-        for obj in context.selected_objects:
-            if obj != collision_obj and obj.type == 'MESH':
-                # noinspection PyTypeChecker
-                navmesh_obj = obj  # type: MeshObject
-                break
-        else:
-            return self.error("Failed to separate walkable faces into a new object.")
-
-        # Rename the navmesh object.
-        navmesh_obj.name = f"{collision_obj.name} Navmesh"
-        navmesh_obj.soulstruct_type = SoulstructType.NAVMESH
+        # Copy the walkable faces into a new navmesh object, with the same transform and collections.
+        navmesh_mesh = self.new_mesh_from_faces(collision_obj.data, walkable, f"{collision_obj.name} Navmesh")
+        navmesh_obj = new_mesh_object(navmesh_mesh.name, navmesh_mesh, SoulstructType.NAVMESH)
+        navmesh_obj.matrix_world = collision_obj.matrix_world.copy()
+        for collection in collision_obj.users_collection:
+            collection.objects.link(navmesh_obj)
         navmesh_obj.show_wire = True
 
         # Now we simplify the navmesh geometry.
-        
-        self.edit_object(context, navmesh_obj)
 
         # Just 'Default' navmesh material on new object.
         bl_material = get_navmesh_material(0)  # Default
-        navmesh_obj.data.materials.clear()
-        navmesh_obj.data.materials.append(bl_material)
+        navmesh_mesh.materials.append(bl_material)
 
-        # Use BMesh to triangulate the mesh, set its material, and bump it up vertically.
-        bm_nav = bmesh.from_edit_mesh(navmesh_obj.data)
+        # Use BMesh to triangulate the mesh, set its material, bump it up vertically, and merge by distance.
+        bm_nav = bmesh.new()
+        bm_nav.from_mesh(navmesh_mesh)
         bmesh.ops.triangulate(bm_nav, faces=bm_nav.faces, quad_method="BEAUTY", ngon_method="BEAUTY")
         for face in bm_nav.faces:
             face.material_index = 0
         if self.vertical_bump > 0.0:
             for vertex in bm_nav.verts:
                 vertex.co.z += self.vertical_bump
-        bmesh.update_edit_mesh(navmesh_obj.data)
+        bmesh.ops.remove_doubles(bm_nav, verts=bm_nav.verts, dist=0.0001)
+        bm_nav.to_mesh(navmesh_mesh)
         bm_nav.free()
         del bm_nav
 
-        # Select all geometry and Merge by Distance (remove doubles).
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.remove_doubles()
-        # TODO: Limit dissolve is too aggressive.
-        # bpy.ops.mesh.dissolve_limited(angle_limit=self.dissolve_angle_limit)
-
-        # Switch back to Object mode.
-        bpy.ops.object.mode_set(mode='OBJECT')
+        if self.simplify:
+            # Limited Dissolve is too aggressive (ignores edge lengths and creates slivers), so we use our own pass.
+            old_face_count = len(navmesh_mesh.polygons)
+            self.simplify_mesh(navmesh_mesh, math.radians(self.dissolve_angle_limit), self.max_edge_length)
+            self.info(f"Simplified navmesh from {old_face_count} to {len(navmesh_mesh.polygons)} triangles.")
 
+        self.set_active_obj(navmesh_obj)
         self.info(f"Navmesh generated: '{navmesh_obj.name}'")
-        bm.free()
         return {'FINISHED'}
+
+    @staticmethod
+    def get_walkable_face_mask(
+        mesh: bpy.types.Mesh,
+        matrix: Matrix,
+        walkable_threshold: float,
+        island_area_threshold: float,
+        lo_faces_only=False,
+    ) -> np.ndarray:
+        """Get a mask of the faces of `mesh` whose normal (transformed by `matrix`) is close enough to global up, in
+        islands of such faces (connected by shared edges) with at least `island_area_threshold` total area.
+
+        If `lo_faces_only` is `True`, only faces with a '(Lo)' material can be walkable.
+        """
+        face_count = len(mesh.polygons)
+
+        # Select faces whose world normal is close enough to global up (0, 0, 1), i.e. has a large enough Z component.
+        # Note: if the collision object has a non-identity transform, we must transform the face normals.
+        # TODO: Can ignore world matrix, I think.
+        normals = np.empty((face_count, 3), dtype=np.float32)
+        mesh.polygons.foreach_get("normal", normals.ravel())
+        np_matrix = np.array(matrix.to_3x3(), dtype=np.float32)
+        walkable = normals @ np_matrix[2] >= walkable_threshold
+
+        if lo_faces_only:
+            material_indices = np.empty(face_count, dtype=np.int32)
+            mesh.polygons.foreach_get("material_index", material_indices)
+            is_lo_material = np.array(["(Lo)" in material.name for material in mesh.materials], dtype=bool)
+            walkable &= is_lo_material[material_indices]
+
+        # Now deselect small islands of walkable faces (connected by shared edges).
+        island_labels = get_connected_component_labels(face_count, get_mesh_face_edge_pairs(mesh, walkable))
+        face_areas = np.empty(face_count, dtype=np.float32)
+        mesh.polygons.foreach_get("area", face_areas)
+        island_areas = np.bincount(island_labels, weights=np.where(walkable, face_areas, 0.0))
+        walkable &= island_areas[island_labels] >= island_area_threshold
+        return walkable
+
+    @staticmethod
+    def simplify_mesh(mesh: bpy.types.Mesh, angle_limit: float, max_edge_length: float):
+        """Replace the triangles of `mesh` with those from `simplify_navmesh_triangles()`.
+
+        Only vertices and faces are kept; all faces use material 0.
+        """
+        face_count = len(mesh.polygons)
+        triangles = np.empty((face_count, 3), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", triangles.ravel())
+        vertex_coords, triangles, _ = simplify_navmesh_triangles(
+            get_mesh_vertex_coords(mesh), triangles, angle_limit=angle_limit, max_edge_length=max_edge_length
+        )
+
+        mesh.clear_geometry()
+        set_mesh_vertices_and_faces(mesh, vertex_coords, triangles)
+
+    @staticmethod
+    def new_mesh_from_faces(mesh: bpy.types.Mesh, face_mask: np.ndarray, name: str) -> bpy.types.Mesh:
+        """Create a new Mesh from only the faces of `mesh` in `face_mask` and the vertices they use."""
+        loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        loop_vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+
+        loop_mask = np.repeat(face_mask, loop_totals)
+        used_vertex_indices, new_loop_vertex_indices = np.unique(loop_vertex_indices[loop_mask], return_inverse=True)
+        vertex_coords = get_mesh_vertex_coords(mesh)[used_vertex_indices]
+
+        new_mesh = bpy.data.meshes.new(name)
+        set_mesh_vertices_and_faces(new_mesh, vertex_coords, new_loop_vertex_indices, loop_totals[face_mask])
+        return new_mesh
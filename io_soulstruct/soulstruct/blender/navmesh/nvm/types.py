@@ -9,7 +9,6 @@ import typing as tp
 
 import numpy as np
 
-import bmesh
 import bpy
 from mathutils import Vector
 
@@ -20,7 +19,7 @@ from soulstruct.blender.exceptions import NVMExportError
 from soulstruct.blender.types import *
 from soulstruct.blender.utilities import *
 from .properties import *
-from .utilities import set_face_material
+from .utilities import set_face_materials, get_nvm_connected_face_indices
 
 
 class BlenderNVM(BaseBlenderSoulstructObject[NVM, NVMProps]):
@@ -48,42 +47,40 @@ class BlenderNVM(BaseBlenderSoulstructObject[NVM, NVMProps]):
 
         nvm = soulstruct_obj
 
-        # Create mesh.
+        # Gather all triangle data in one pass.
+        triangle_data = np.array(
+            [(*triangle.vertex_indices, triangle.flags, triangle.obstacle_count) for triangle in nvm.triangles],
+            dtype=np.int32,
+        ).reshape(-1, 5)
+        faces = triangle_data[:, :3]
+
+        # Create mesh. No edges in NVM.
         mesh = bpy.data.meshes.new(name=name)
         vertices = game_vector_array_to_bl_vector_array(nvm.vertices)
-        edges = []  # no edges in NVM
-        faces = [triangle.vertex_indices for triangle in nvm.triangles]
-        mesh.from_pydata(vertices, edges, faces)
-
-        # Create `BMesh` (as we need to assign face flag data to a custom `int` layer).
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-        flags_layer = bm.faces.layers.int.new("nvm_face_flags")
-        obstacle_count_layer = bm.faces.layers.int.new("nvm_face_obstacle_count")
-        for f_i, face in enumerate(bm.faces):
-            nvm_triangle = nvm.triangles[f_i]
-            face[flags_layer] = nvm_triangle.flags
-            face[obstacle_count_layer] = nvm_triangle.obstacle_count
+        set_mesh_vertices_and_faces(mesh, vertices, faces)
 
-        bl_nvm = cls.new(name, data=mesh, collection=collection)  # type: BlenderNVM
+        # Assign face flag data to custom `int` face attributes (which are also `BMesh` face layers).
+        flags_attribute = mesh.attributes.new("nvm_face_flags", "INT", "FACE")
+        flags_attribute.data.foreach_set("value", np.ascontiguousarray(triangle_data[:, 3]))
+        obstacle_count_attribute = mesh.attributes.new("nvm_face_obstacle_count", "INT", "FACE")
+        obstacle_count_attribute.data.foreach_set("value", np.ascontiguousarray(triangle_data[:, 4]))
 
-        for nvm_event in nvm.event_entities:
-            # Get the average position of the faces. This is purely for show and is not exported.
-            avg_pos = Vector((0, 0, 0))
-            for i in nvm_event.triangle_indices:
-                face = bm.faces[i]
-                avg_pos += face.calc_center_median()
-            avg_pos /= len(nvm_event.triangle_indices)
-            nvm_event_name = f"{name} Event {nvm_event.entity_id}"
-            bl_event = BlenderNVMEventEntity.new_from_soulstruct_obj(
-                operator, context, nvm_event, nvm_event_name, collection, location=avg_pos
-            )
-            bl_event.obj.parent = bl_nvm.obj
+        bl_nvm = cls.new(name, data=mesh, collection=collection)  # type: BlenderNVM
 
-        bm.to_mesh(mesh)
-        del bm
+        if nvm.event_entities:
+            face_centers = vertices[faces].mean(axis=1)
+            for nvm_event in nvm.event_entities:
+                # Get the average position of the faces (or origin if none). This is purely for show and is not
+                # exported.
+                if nvm_event.triangle_indices:
+                    avg_pos = Vector(face_centers[nvm_event.triangle_indices].mean(axis=0))
+                else:
+                    avg_pos = Vector()
+                nvm_event_name = f"{name} Event {nvm_event.entity_id}"
+                bl_event = BlenderNVMEventEntity.new_from_soulstruct_obj(
+                    operator, context, nvm_event, nvm_event_name, collection, location=avg_pos
+                )
+                bl_event.obj.parent = bl_nvm.obj
 
         return bl_nvm
 
@@ -103,72 +100,51 @@ class BlenderNVM(BaseBlenderSoulstructObject[NVM, NVMProps]):
         triangles actually matter for navigation.
         """
         mesh_data = self.obj.data
-        nvm_verts = np.array([vert.co for vert in mesh_data.vertices], dtype=np.float32)
-        # Swap Y and Z coordinates.
-        nvm_verts[:, [1, 2]] = nvm_verts[:, [2, 1]]
-
-        nvm_faces = []  # type: list[tuple[int, int, int]]
-        for face in mesh_data.polygons:
-            if len(face.vertices) != 3:
-                raise NVMExportError(
-                    f"Found a non-triangle mesh face in NVM {self.name} (face {face.index}). You must triangulate it."
-                )
-            # noinspection PyTypeChecker
-            vertices = tuple(face.vertices)  # type: tuple[int, int, int]
-            nvm_faces.append(vertices)
-
-        def find_connected_face_index(edge_v1: int, edge_v2: int, not_face) -> int:
-            """Find face that shares an edge with the given edge.
-
-            Returns -1 if no connected face is found (i.e. edge is on the edge of the mesh).
-            """
-            # TODO: Could surely iterate over faces just once for this?
-            for i_, f_ in enumerate(nvm_faces):
-                if f_ != not_face and edge_v1 in f_ and edge_v2 in f_:  # order doesn't matter
-                    return i_
-            return -1
+        nvm_verts = bl_vector_array_to_game_vector_array(get_mesh_vertex_coords(mesh_data))  # swap Y and Z
+
+        loop_totals = np.empty(len(mesh_data.polygons), dtype=np.int32)
+        mesh_data.polygons.foreach_get("loop_total", loop_totals)
+        non_triangles = np.flatnonzero(loop_totals != 3)
+        if non_triangles.size > 0:
+            raise NVMExportError(
+                f"Found a non-triangle mesh face in NVM {self.name} (face {non_triangles[0]}). You must triangulate it."
+            )
+        nvm_faces = np.empty((len(mesh_data.polygons), 3), dtype=np.int32)
+        mesh_data.loops.foreach_get("vertex_index", nvm_faces.ravel())
 
         # Get connected faces along each edge of each face.
-        nvm_connected_face_indices = []  # type: list[tuple[int, int, int]]
-        for face in nvm_faces:
-            connected_v1 = find_connected_face_index(face[0], face[1], face)
-            connected_v2 = find_connected_face_index(face[1], face[2], face)
-            connected_v3 = find_connected_face_index(face[2], face[0], face)
-            nvm_connected_face_indices.append((connected_v1, connected_v2, connected_v3))
-            if connected_v1 == -1 and connected_v2 == -1 and connected_v3 == -1:
-                operator.warning(
-                    f"NVM face {face} in '{self.name}' appears to have no connected faces, which is very suspicious!"
-                )
-
-        # Create `BMesh` to access custom face layers for `flags` and `obstacle_count`.
-        bm = bmesh.new()
-        bm.from_mesh(mesh_data)
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
+        nvm_connected_face_indices = get_nvm_connected_face_indices(nvm_faces)
+        for face_index in np.flatnonzero(np.all(nvm_connected_face_indices == -1, axis=1)):
+            operator.warning(
+                f"NVM face {tuple(nvm_faces[face_index].tolist())} in '{self.name}' appears to have no connected "
+                f"faces, which is very suspicious!"
+            )
 
-        flags_layer = bm.faces.layers.int.get("nvm_face_flags")
-        if not flags_layer:
+        # Read custom face attributes for `flags` and `obstacle_count`.
+        nvm_flags = np.empty(len(mesh_data.polygons), dtype=np.int32)
+        nvm_obstacle_counts = np.empty(len(mesh_data.polygons), dtype=np.int32)
+        flags_attribute = mesh_data.attributes.get("nvm_face_flags")
+        if not flags_attribute:
             raise ValueError("NVM mesh does not have 'nvm_face_flags' custom face layer.")
-        obstacle_count_layer = bm.faces.layers.int.get("nvm_face_obstacle_count")
-        if not obstacle_count_layer:
+        flags_attribute.data.foreach_get("value", nvm_flags)
+        obstacle_count_attribute = mesh_data.attributes.get("nvm_face_obstacle_count")
+        if not obstacle_count_attribute:
             raise ValueError("NVM mesh does not have 'nvm_face_obstacle_count' custom face layer.")
-
-        nvm_flags = []
-        nvm_obstacle_counts = []
-        for bm_face in bm.faces:
-            nvm_flags.append(bm_face[flags_layer])
-            nvm_obstacle_counts.append(bm_face[obstacle_count_layer])
-        if len(nvm_flags) != len(nvm_faces):
-            raise ValueError("NVM mesh has different number of `Mesh` faces and `BMesh` face flags.")
+        obstacle_count_attribute.data.foreach_get("value", nvm_obstacle_counts)
 
         nvm_triangles = [
             NVMTriangle(
-                vertex_indices=nvm_faces[i],
-                connected_indices=nvm_connected_face_indices[i],
-                obstacle_count=nvm_obstacle_counts[i],
-                flags=nvm_flags[i],
+                vertex_indices=tuple(vertex_indices),
+                connected_indices=tuple(connected_indices),
+                obstacle_count=obstacle_count,
+                flags=flags,
+            )
+            for vertex_indices, connected_indices, obstacle_count, flags in zip(
+                nvm_faces.tolist(),
+                nvm_connected_face_indices.tolist(),
+                nvm_obstacle_counts.tolist(),
+                nvm_flags.tolist(),
             )
-            for i in range(len(nvm_faces))
         ]
 
         event_entities = [
@@ -190,8 +166,12 @@ class BlenderNVM(BaseBlenderSoulstructObject[NVM, NVMProps]):
 
     def set_face_materials(self, nvm: NVM):
         mesh_data = self.obj.data
-        for bl_tri, nvm_triangle in zip(mesh_data.polygons, nvm.triangles, strict=True):
-            set_face_material(mesh_data, bl_tri, nvm_triangle.flags)
+        if len(mesh_data.polygons) != len(nvm.triangles):
+            raise ValueError(
+                f"NVM mesh '{self.name}' has {len(mesh_data.polygons)} faces, but NVM has {len(nvm.triangles)} "
+                f"triangles."
+            )
+        set_face_materials(mesh_data, np.array([triangle.flags for triangle in nvm.triangles], dtype=np.int32))
 
     def create_nvm_quadtree(
         self, context: bpy.types.Context, nvm: NVM, model_name: str, collection: bpy.types.Collection = None
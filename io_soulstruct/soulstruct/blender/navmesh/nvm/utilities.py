@@ -7,12 +7,17 @@ __all__ = [
     "NAVMESH_FLAG_COLORS",
     "NAVMESH_MULTIPLE_FLAG_COLOR",
     "set_face_material",
+    "set_face_materials",
     "get_navmesh_material",
+    "get_nvm_connected_face_indices",
+    "simplify_navmesh_triangles",
 ]
 
+import math
 import re
 
 import bpy
+import numpy as np
 
 from soulstruct.base.events.enums import NavmeshFlag
 
@@ -55,6 +60,26 @@ def set_face_material(bl_mesh, bl_face, face_flags: int):
 
     NOTE: `bl_face` can be from a `Mesh` or `BMesh`. Both have `material_index`.
     """
+    material_index = _get_flags_material_index(bl_mesh, face_flags)
+    bl_face.material_index = material_index
+    return bl_mesh.materials[material_index]
+
+
+def set_face_materials(bl_mesh: bpy.types.Mesh, face_flags: np.ndarray):
+    """Set materials of all faces of `bl_mesh` from an array of their `NVMTriangle` flags, like `set_face_material()`.
+
+    Each unique flags value is only looked up once (in order of first appearance, so new material slots are added in
+    the same order as face-by-face), and all face material indices are set with one `foreach_set()` call.
+    """
+    unique_flags, first_indices, inverse = np.unique(face_flags, return_index=True, return_inverse=True)
+    unique_material_indices = np.empty(len(unique_flags), dtype=np.int32)
+    for i in np.argsort(first_indices):
+        unique_material_indices[i] = _get_flags_material_index(bl_mesh, int(unique_flags[i]))
+    bl_mesh.polygons.foreach_set("material_index", unique_material_indices[inverse.ravel()])
+
+
+def _get_flags_material_index(bl_mesh, face_flags: int) -> int:
+    """Find the index of the material for `face_flags` on `bl_mesh`, adding the material to the mesh if absent."""
 
     # Color face according to its single `flag` if present.
     try:
@@ -66,15 +91,13 @@ def set_face_material(bl_mesh, bl_face, face_flags: int):
 
     material_index = bl_mesh.materials.find(material_name)
     if material_index >= 0:
-        bl_face.material_index = material_index
-        return bl_mesh.materials[material_name]
+        return material_index
 
     bl_material = get_navmesh_material(flag)
 
-    # Add material to this mesh and this face.
-    bl_face.material_index = len(bl_mesh.materials)
+    # Add material to this mesh.
     bl_mesh.materials.append(bl_material)
-    return bl_material
+    return len(bl_mesh.materials) - 1
 
 
 def get_navmesh_material(flag: int | NavmeshFlag) -> bpy.types.Material:
@@ -108,3 +131,248 @@ def get_navmesh_material(flag: int | NavmeshFlag) -> bpy.types.Material:
             pass  # ignore
 
     return bl_material
+
+
+def get_nvm_connected_face_indices(triangles: np.ndarray) -> np.ndarray:
+    """Get the index of the first other triangle that shares each edge (1-2, 2-3, and 3-1) of each triangle in an
+    `(F, 3)` array of vertex indices, or -1 if there is none (i.e. the edge is on the edge of the mesh).
+
+    Triangles with exactly the same vertex indices as each other are never connected. All edges are sorted at once,
+    and only edges shared by more than two triangles or joining a vertex to itself are checked one by one.
+    """
+    triangles = np.asarray(triangles, dtype=np.int64)
+    face_count = len(triangles)
+    connected = np.full(face_count * 3, -1, dtype=np.int64)
+    if face_count == 0:
+        return connected.reshape(-1, 3)
+
+    edge_faces = np.repeat(np.arange(face_count), 3)
+    edge_verts = np.stack((triangles, np.roll(triangles, -1, axis=1)), axis=2).reshape(-1, 2)
+    edge_verts.sort(axis=1)
+    edge_keys = edge_verts[:, 0] * (int(triangles.max()) + 1) + edge_verts[:, 1]
+
+    # Sort unique `(edge_key, face)` pairs, so the faces on each edge are grouped in ascending order.
+    order = np.lexsort((edge_faces, edge_keys))
+    sorted_keys = edge_keys[order]
+    sorted_faces = edge_faces[order]
+    is_unique = np.r_[True, (sorted_keys[1:] != sorted_keys[:-1]) | (sorted_faces[1:] != sorted_faces[:-1])]
+    sorted_keys = sorted_keys[is_unique]
+    sorted_faces = sorted_faces[is_unique]
+    group_starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    group_sizes = np.diff(np.r_[group_starts, len(sorted_keys)])
+
+    # Most edges have one or two faces: the connected face is whichever of the first two faces is not this one.
+    edge_groups = np.searchsorted(sorted_keys[group_starts], edge_keys)
+    edge_group_sizes = group_sizes[edge_groups]
+    first_faces = sorted_faces[group_starts[edge_groups]]
+    second_faces = sorted_faces[np.minimum(group_starts[edge_groups] + 1, len(sorted_faces) - 1)]
+    other_faces = np.where(first_faces == edge_faces, second_faces, first_faces)
+    is_paired = (edge_group_sizes == 2) & np.any(triangles[other_faces] != triangles[edge_faces], axis=1)
+    connected[is_paired] = other_faces[is_paired]
+
+    # Rare non-manifold edges and edges of degenerate faces.
+    face_tuples = [tuple(face) for face in triangles.tolist()]
+    for edge_i in np.flatnonzero((edge_group_sizes > 2) | (edge_verts[:, 0] == edge_verts[:, 1])).tolist():
+        face = face_tuples[edge_faces[edge_i]]
+        v1, v2 = edge_verts[edge_i].tolist()
+        connected[edge_i] = -1
+        if v1 == v2:
+            # Any other face using this vertex is 'connected'.
+            candidates = range(face_count)
+        else:
+            start = group_starts[edge_groups[edge_i]]
+            candidates = sorted_faces[start:start + edge_group_sizes[edge_i]].tolist()
+        for other_face_i in candidates:
+            other_face = face_tuples[other_face_i]
+            if other_face != face and v1 in other_face and v2 in other_face:
+                connected[edge_i] = other_face_i
+                break
+
+    return connected.reshape(-1, 3)
+
+
+def simplify_navmesh_triangles(
+    vertices: np.ndarray,
+    triangles: np.ndarray,
+    face_flags: np.ndarray = None,
+    angle_limit=math.radians(5.0),
+    max_edge_length=5.0,
+    max_passes=20,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reduce the triangle count of a navmesh by collapsing interior vertices of (nearly) coplanar triangle fans into
+    one of their neighbors, which merges their triangles into fewer, larger ones over the same area.
+
+    Vertices on boundary or non-manifold edges, on edges between faces with different `face_flags`, or whose faces'
+    normals are more than `angle_limit` (radians) from their average are never removed, so the navmesh outline and
+    flag regions are preserved. Collapses that would flip or degenerate a triangle, tilt it beyond `angle_limit`, or
+    create an edge longer than `max_edge_length` are skipped.
+
+    Each pass collapses vertices with non-overlapping one-rings, so every collapse can be checked against the mesh as
+    it was at the start of the pass. Passes repeat until nothing changes (or `max_passes`).
+
+    Returns `(vertices, triangles, face_indices)`, where unused vertices have been removed and `face_indices` gives the
+    input index of each remaining triangle (e.g. to take its flags).
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    face_indices = np.arange(len(triangles))
+    if face_flags is None:
+        face_flags = np.zeros(len(triangles), dtype=np.int64)
+    min_cos = math.cos(angle_limit)
+    max_sq_length = max_edge_length ** 2
+
+    for _ in range(max_passes):
+        removable, normals, vertex_normals = _get_removable_navmesh_vertices(
+            vertices, triangles, face_flags[face_indices], min_cos
+        )
+        if not np.any(removable):
+            break
+
+        # CSR of faces using each vertex.
+        corner_vertices = triangles.ravel()
+        order = np.argsort(corner_vertices, kind="stable")
+        offsets = np.zeros(len(vertices) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(corner_vertices, minlength=len(vertices)), out=offsets[1:])
+        # Python lists are much faster than NumPy arrays for scalar access in the loop below.
+        offsets = offsets.tolist()
+        vertex_faces = (order // 3).tolist()
+        face_list = triangles.tolist()
+        coords = vertices.tolist()
+        normal_list = normals.tolist()
+        vertex_normal_list = vertex_normals.tolist()
+
+        face_alive = [True] * len(face_list)
+        claimed = [False] * len(vertices)
+        collapse_count = 0
+        for v in np.flatnonzero(removable).tolist():
+            if claimed[v]:
+                continue
+            v_faces = vertex_faces[offsets[v]:offsets[v + 1]]
+            ring = {w for f in v_faces for w in face_list[f]}
+            ring.discard(v)
+            if any(claimed[w] for w in ring):
+                continue  # overlaps a collapse from this pass
+
+            collapse = _find_navmesh_vertex_collapse(
+                v, v_faces, ring, face_list, vertex_faces, offsets, coords, normal_list, vertex_normal_list[v],
+                min_cos, max_sq_length,
+            )
+            if collapse is None:
+                continue
+            target, removed_faces = collapse
+            for f in v_faces:
+                if f in removed_faces:
+                    face_alive[f] = False
+                else:
+                    face_list[f] = [target if w == v else w for w in face_list[f]]
+            claimed[v] = True
+            for w in ring:
+                claimed[w] = True
+            collapse_count += 1
+
+        if collapse_count == 0:
+            break
+        face_alive = np.array(face_alive, dtype=bool)
+        triangles = np.array(face_list, dtype=np.int64).reshape(-1, 3)[face_alive]
+        face_indices = face_indices[face_alive]
+
+    used_vertices, new_triangles = np.unique(triangles, return_inverse=True)
+    return vertices[used_vertices], new_triangles.reshape(-1, 3), face_indices
+
+
+def _get_removable_navmesh_vertices(
+    vertices: np.ndarray, triangles: np.ndarray, face_flags: np.ndarray, min_cos: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find vertices that `simplify_navmesh_triangles()` may remove, and also return unit face and vertex normals."""
+    vertex_count = len(vertices)
+    corners = vertices[triangles]
+    cross = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    double_areas = np.linalg.norm(cross, axis=1)
+    is_degenerate = double_areas <= 1e-9
+    normals = cross / np.where(is_degenerate, 1.0, double_areas)[:, np.newaxis]
+
+    corner_vertices = triangles.ravel()
+    corner_faces = np.repeat(np.arange(len(triangles)), 3)
+    vertex_normals = np.zeros((vertex_count, 3))
+    np.add.at(vertex_normals, corner_vertices, normals[corner_faces])
+    vertex_normals /= np.maximum(np.linalg.norm(vertex_normals, axis=1), 1e-12)[:, np.newaxis]
+
+    # Minimum cosine between each vertex's normal and the normals of its faces.
+    corner_cos = np.einsum("ij,ij->i", normals[corner_faces], vertex_normals[corner_vertices])
+    vertex_min_cos = np.full(vertex_count, np.inf)
+    np.minimum.at(vertex_min_cos, corner_vertices, corner_cos)
+
+    # Vertices between faces with different flags.
+    corner_flags = face_flags[corner_faces]
+    vertex_min_flags = np.full(vertex_count, np.iinfo(np.int64).max)
+    vertex_max_flags = np.full(vertex_count, np.iinfo(np.int64).min)
+    np.minimum.at(vertex_min_flags, corner_vertices, corner_flags)
+    np.maximum.at(vertex_max_flags, corner_vertices, corner_flags)
+
+    # Vertices on edges that don't have exactly two faces (boundary or non-manifold), or on degenerate faces.
+    edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    _, edge_keys, edge_face_counts = np.unique(edges, axis=0, return_inverse=True, return_counts=True)
+    is_locked = np.zeros(vertex_count, dtype=bool)
+    is_locked[edges[edge_face_counts[edge_keys.ravel()] != 2].ravel()] = True
+    is_locked[triangles[is_degenerate].ravel()] = True
+
+    is_used = np.zeros(vertex_count, dtype=bool)
+    is_used[corner_vertices] = True
+
+    removable = is_used & ~is_locked & (vertex_min_cos >= min_cos) & (vertex_min_flags == vertex_max_flags)
+    return removable, normals, vertex_normals
+
+
+def _find_navmesh_vertex_collapse(
+    v: int,
+    v_faces: list[int],
+    ring: set[int],
+    face_list: list[list[int]],
+    vertex_faces: list[int],
+    offsets: list[int],
+    coords: list[list[float]],
+    normals: list[list[float]],
+    vertex_normal: list[float],
+    min_cos: float,
+    max_sq_length: float,
+) -> tuple[int, set[int]] | None:
+    """Find the nearest neighbor of interior vertex `v` that it can be collapsed into, and the faces that the collapse
+    removes (those on the collapsed edge). Returns `None` if no collapse is valid."""
+    def sq_dist(w: int, x: float, y: float, z: float) -> float:
+        wx_, wy_, wz_ = coords[w]
+        return (wx_ - x) ** 2 + (wy_ - y) ** 2 + (wz_ - z) ** 2
+
+    for target in sorted(ring, key=lambda w: sq_dist(w, *coords[v])):
+        removed_faces = {f for f in v_faces if target in face_list[f]}
+        if len(removed_faces) != 2:
+            continue
+
+        # Link condition: the only shared neighbors of `v` and `target` are the opposite vertices of removed faces.
+        opposite = {w for f in removed_faces for w in face_list[f]} - {v, target}
+        target_neighbors = {w for f in vertex_faces[offsets[target]:offsets[target + 1]] for w in face_list[f]}
+        if (ring & target_neighbors) - {target} != opposite:
+            continue
+
+        tx, ty, tz = coords[target]
+        for f in v_faces:
+            if f in removed_faces:
+                continue
+            new_face = [target if w == v else w for w in face_list[f]]
+            (ax, ay, az), (bx, by, bz), (cx, cy, cz) = (coords[w] for w in new_face)
+            ux, uy, uz = bx - ax, by - ay, bz - az
+            wx, wy, wz = cx - ax, cy - ay, cz - az
+            nx, ny, nz = uy * wz - uz * wy, uz * wx - ux * wz, ux * wy - uy * wx
+            length = math.sqrt(nx * nx + ny * ny + nz * nz)
+            if length <= 1e-9:
+                break  # degenerate
+            old_nx, old_ny, old_nz = normals[f]
+            if (nx * old_nx + ny * old_ny + nz * old_nz) / length < min_cos:
+                break  # flipped or tilted too far from old face
+            if (nx * vertex_normal[0] + ny * vertex_normal[1] + nz * vertex_normal[2]) / length < min_cos:
+                break  # tilted too far from fan
+            if any(sq_dist(w, tx, ty, tz) > max_sq_length for w in new_face if w != target):
+                break  # new edge too long
+        else:
+            return target, removed_faces
+
+    return None
@@ -27,25 +27,20 @@ class NVMHKTImporter:
     def __post_init__(self):
         if not self.collection:
             self.collection = self.context.scene.collection
+        # Deselect all objects. Nothing here needs OBJECT mode, so we don't use slow `bpy.ops` mode switches.
+        for obj in self.context.selected_objects:
+            obj.select_set(False)
 
     def import_nvmhkt(
         self, nvmhkt: NavmeshHKX, name: str, use_material=True, vertex_merge_dist=0.0,
     ) -> MeshObject:
         """Read a NVMHKT into a Blender mesh object."""
 
-        # Set mode to OBJECT and deselect all objects.
-        if bpy.ops.object.mode_set.poll():
-            bpy.ops.object.mode_set(mode="OBJECT", toggle=False)
-        if bpy.ops.object.select_all.poll():
-            bpy.ops.object.select_all(action="DESELECT")
-        if bpy.ops.object.mode_set.poll():  # just to be safe
-            bpy.ops.object.mode_set(mode="OBJECT", toggle=False)
-
         # Create mesh.
         bl_mesh = bpy.data.meshes.new(name=name)
         mesh = nvmhkt.get_simple_mesh(merge_dist=vertex_merge_dist)
         vertices = game_vector_array_to_bl_vector_array(mesh.vertices)
-        bl_mesh.from_pydata(vertices, [], mesh.faces)
+        set_mesh_vertices_and_faces(bl_mesh, vertices, mesh.faces)
         # noinspection PyTypeChecker
         mesh_obj = bpy.data.objects.new(name, bl_mesh)  # type: MeshObject
         self.collection.objects.link(mesh_obj)
@@ -5,11 +5,13 @@ __all__ = [
     "CustomFieldAdapter",
     "SpatialVectorFieldAdapter",
     "EulerAnglesFieldAdapter",
+    "FieldAdapterPlan",
     "soulstruct_adapter",
 ]
 
 import typing as tp
 from dataclasses import dataclass, KW_ONLY
+from operator import attrgetter, methodcaller
 
 import bpy
 
@@ -22,6 +24,11 @@ if tp.TYPE_CHECKING:
     from soulstruct.blender.base.soulstruct_object import BaseBlenderSoulstructObject, SOULSTRUCT_T, TYPE_PROPS_T
     SOULSTRUCT_OBJECT_T = tp.TypeVar("SOULSTRUCT_OBJECT_T", bound=BaseBlenderSoulstructObject)
 
+# `(import_func, read_func, write_func)` value converters of a flattened adapter. `None` means no conversion.
+PLAN_CONVERTERS_T = tuple[
+    tp.Callable[[tp.Any], tp.Any] | None, tp.Callable[[tp.Any], tp.Any] | None, tp.Callable[[tp.Any], tp.Any] | None
+]
+
 
 @dataclass(slots=True, frozen=True)
 class FieldAdapter:
@@ -64,10 +71,27 @@ class FieldAdapter:
     ):
         """Convert a property from Blender's wrapper to Soulstruct.
 
+        Simply combines `read_blender_value()` and `write_soulstruct_value()`, which can also be called separately to
+        read Blender values for many objects first and convert them all later (see `BaseBlenderMSBEntry`).
+        """
+        self.write_soulstruct_value(soulstruct_obj, self.read_blender_value(operator, context, bl_obj))
+
+    def read_blender_value(
+        self,
+        operator: LoggingOperator,
+        context: bpy.types.Context,
+        bl_obj: BaseBlenderSoulstructObject[SOULSTRUCT_T, TYPE_PROPS_T],
+    ) -> tp.Any:
+        """Read the raw value of this property from Blender's wrapper. This is the only export stage that accesses
+        Blender data, so it must run on the main thread.
+
         Base method does not use `operator` or `context`, but subclasses may do so.
         """
-        soulstruct_value = getattr(bl_obj, self.bl_prop_name)
-        setattr(soulstruct_obj, self.soulstruct_field_name, soulstruct_value)
+        return getattr(bl_obj, self.bl_prop_name)
+
+    def write_soulstruct_value(self, soulstruct_obj: SOULSTRUCT_T, bl_value: tp.Any):
+        """Convert a raw value from `read_blender_value()` and set it on Soulstruct object. Does not access Blender."""
+        setattr(soulstruct_obj, self.soulstruct_field_name, bl_value)
 
     def getter(self, bl_obj: BaseBlenderSoulstructObject, is_subtype=False) -> tp.Any:
         """Inherently supports use of subtype properties rather than type properties."""
@@ -79,6 +103,16 @@ class FieldAdapter:
         props = getattr(bl_obj, "subtype_properties" if is_subtype else "type_properties")
         setattr(props, self.bl_prop_name, value)
 
+    def get_plan_converters(self) -> PLAN_CONVERTERS_T | None:
+        """Return the value converters that `soulstruct_to_blender()`, `read_blender_value()`, and
+        `write_soulstruct_value()` apply, so `FieldAdapterPlan` can inline them.
+
+        Returns `None` for subclasses that don't override this, as they may change more than values (e.g. getters).
+        """
+        if type(self) is not FieldAdapter:
+            return None
+        return None, None, None
+
 
 @dataclass(slots=True, frozen=True)
 class CustomFieldAdapter(FieldAdapter):
@@ -115,19 +149,18 @@ class CustomFieldAdapter(FieldAdapter):
         bl_value = self.read_func(getattr(soulstruct_obj, self.soulstruct_field_name))
         setattr(bl_obj, self.bl_prop_name, bl_value)
 
-    def blender_to_soulstruct(
-        self,
-        operator: LoggingOperator,
-        context: bpy.types.Context,
-        bl_obj: BaseBlenderSoulstructObject[SOULSTRUCT_T, TYPE_PROPS_T],
-        soulstruct_obj: SOULSTRUCT_T,
-    ):
+    def write_soulstruct_value(self, soulstruct_obj: SOULSTRUCT_T, bl_value: tp.Any):
         if self.write_func is None:
             # For IDE analysis (should not happen due to __post_init__ default).
             raise ValueError("CustomFieldAdapter requires a write_func to convert from Blender to Soulstruct.")
-        soulstruct_value = self.write_func(getattr(bl_obj, self.bl_prop_name))
+        soulstruct_value = self.write_func(bl_value)
         setattr(soulstruct_obj, self.soulstruct_field_name, soulstruct_value)
 
+    def get_plan_converters(self) -> PLAN_CONVERTERS_T | None:
+        if type(self) is not CustomFieldAdapter:
+            return None
+        return self.read_func, None, self.write_func
+
 
 @dataclass(slots=True, frozen=True)
 class SpatialVectorFieldAdapter(FieldAdapter):
@@ -143,16 +176,24 @@ class SpatialVectorFieldAdapter(FieldAdapter):
         bl_value = to_blender(getattr(soulstruct_obj, self.soulstruct_field_name))
         setattr(bl_obj, self.bl_prop_name, bl_value)
 
-    def blender_to_soulstruct(
+    def read_blender_value(
         self,
         operator: LoggingOperator,
         context: bpy.types.Context,
         bl_obj: BaseBlenderSoulstructObject[SOULSTRUCT_T, TYPE_PROPS_T],
-        soulstruct_obj: SOULSTRUCT_T,
-    ):
-        soulstruct_value = to_game(getattr(bl_obj, self.bl_prop_name))
+    ) -> tp.Any:
+        """Copied, as `mathutils` property values are views of Blender data."""
+        return getattr(bl_obj, self.bl_prop_name).copy()
+
+    def write_soulstruct_value(self, soulstruct_obj: SOULSTRUCT_T, bl_value: tp.Any):
+        soulstruct_value = to_game(bl_value)
         setattr(soulstruct_obj, self.soulstruct_field_name, soulstruct_value)
 
+    def get_plan_converters(self) -> PLAN_CONVERTERS_T | None:
+        if type(self) is not SpatialVectorFieldAdapter:
+            return None
+        return to_blender, methodcaller("copy"), to_game
+
 
 @dataclass(slots=True, frozen=True)
 class EulerAnglesFieldAdapter(FieldAdapter):
@@ -171,15 +212,118 @@ class EulerAnglesFieldAdapter(FieldAdapter):
         bl_value = to_blender(game_euler_deg.to_rad())  # `to_blender()` would also convert, but we are explicit
         setattr(bl_obj, self.bl_prop_name, bl_value)
 
-    def blender_to_soulstruct(
+    def read_blender_value(
         self,
         operator: LoggingOperator,
         context: bpy.types.Context,
         bl_obj: BaseBlenderSoulstructObject[SOULSTRUCT_T, TYPE_PROPS_T],
+    ) -> tp.Any:
+        """Copied, as `mathutils` property values are views of Blender data."""
+        return getattr(bl_obj, self.bl_prop_name).copy()
+
+    def write_soulstruct_value(self, soulstruct_obj: SOULSTRUCT_T, bl_value: tp.Any):
+        game_euler_deg = to_game(bl_value).to_deg()
+        setattr(soulstruct_obj, self.soulstruct_field_name, game_euler_deg)
+
+    def get_plan_converters(self) -> PLAN_CONVERTERS_T | None:
+        if type(self) is not EulerAnglesFieldAdapter:
+            return None
+
+        def import_func(game_euler_deg: EulerDeg):
+            if not isinstance(game_euler_deg, EulerDeg):
+                raise TypeError(f"Soulstruct field '{self.soulstruct_field_name}' is not an EulerDeg.")
+            return to_blender(game_euler_deg.to_rad())
+
+        return import_func, methodcaller("copy"), lambda bl_value: to_game(bl_value).to_deg()
+
+
+@dataclass(slots=True, frozen=True)
+class FieldAdapterPlan:
+    """Sequence of `FieldAdapter`s compiled once (per wrapper class) into flat tuples of step functions.
+
+    Steps of adapters that report their value converters (`get_plan_converters()`) and use `auto_prop` access the
+    property group on the wrapped Blender object directly with precomputed `attrgetter`s, rather than going through the
+    wrapper property, `getter()`/`setter()`, and `type_properties` on every call. Other adapters just use their bound
+    methods. Either way, results are identical to calling the adapter methods one by one.
+    """
+
+    fields: tuple[FieldAdapter, ...]
+    import_steps: tuple[tp.Callable[[LoggingOperator, bpy.types.Context, tp.Any, tp.Any], None], ...]
+    read_steps: tuple[tp.Callable[[LoggingOperator, bpy.types.Context, tp.Any], tp.Any], ...]
+    write_steps: tuple[tp.Callable[[tp.Any, tp.Any], None], ...]
+
+    @classmethod
+    def compile(cls, fields_and_props_names: tp.Iterable[tuple[FieldAdapter, str]]) -> FieldAdapterPlan:
+        """Compile `(field, props_name)` pairs, where `props_name` is the name of the wrapped Blender object's property
+        group holding that field (i.e. `TYPE` for `type_properties`, or the MSB entry subtype for subtype fields)."""
+        fields = []
+        import_steps = []
+        read_steps = []
+        write_steps = []
+        for field, props_name in fields_and_props_names:
+            fields.append(field)
+            converters = field.get_plan_converters()
+            if converters is None or not field.auto_prop:
+                import_steps.append(field.soulstruct_to_blender)
+                read_steps.append(field.read_blender_value)
+                write_steps.append(field.write_soulstruct_value)
+                continue
+            import_func, read_func, write_func = converters
+            import_steps.append(cls._compile_import_step(field, props_name, import_func))
+            read_steps.append(cls._compile_read_step(field, props_name, read_func))
+            write_steps.append(cls._compile_write_step(field, write_func))
+        return cls(tuple(fields), tuple(import_steps), tuple(read_steps), tuple(write_steps))
+
+    @staticmethod
+    def _compile_import_step(field: FieldAdapter, props_name: str, import_func: tp.Callable | None):
+        name, bl_name = field.soulstruct_field_name, field.bl_prop_name
+        get_props = attrgetter(f"obj.{props_name}")
+        if import_func is None:
+            return lambda _operator, _context, soulstruct_obj, bl_obj: setattr(
+                get_props(bl_obj), bl_name, getattr(soulstruct_obj, name)
+            )
+        return lambda _operator, _context, soulstruct_obj, bl_obj: setattr(
+            get_props(bl_obj), bl_name, import_func(getattr(soulstruct_obj, name))
+        )
+
+    @staticmethod
+    def _compile_read_step(field: FieldAdapter, props_name: str, read_func: tp.Callable | None):
+        get_value = attrgetter(f"obj.{props_name}.{field.bl_prop_name}")
+        if read_func is None:
+            return lambda _operator, _context, bl_obj: get_value(bl_obj)
+        return lambda _operator, _context, bl_obj: read_func(get_value(bl_obj))
+
+    @staticmethod
+    def _compile_write_step(field: FieldAdapter, write_func: tp.Callable | None):
+        name = field.soulstruct_field_name
+        if write_func is None:
+            return lambda soulstruct_obj, bl_value: setattr(soulstruct_obj, name, bl_value)
+        return lambda soulstruct_obj, bl_value: setattr(soulstruct_obj, name, write_func(bl_value))
+
+    def soulstruct_to_blender(
+        self,
+        operator: LoggingOperator,
+        context: bpy.types.Context,
         soulstruct_obj: SOULSTRUCT_T,
+        bl_obj: BaseBlenderSoulstructObject[SOULSTRUCT_T, TYPE_PROPS_T],
     ):
-        game_euler_deg = to_game(getattr(bl_obj, self.bl_prop_name)).to_deg()
-        setattr(soulstruct_obj, self.soulstruct_field_name, game_euler_deg)
+        """Run all import steps."""
+        for step in self.import_steps:
+            step(operator, context, soulstruct_obj, bl_obj)
+
+    def read_blender_values(
+        self,
+        operator: LoggingOperator,
+        context: bpy.types.Context,
+        bl_obj: BaseBlenderSoulstructObject[SOULSTRUCT_T, TYPE_PROPS_T],
+    ) -> list[tp.Any]:
+        """Run all read steps and return raw Blender values in field order (for `write_soulstruct_values()`)."""
+        return [step(operator, context, bl_obj) for step in self.read_steps]
+
+    def write_soulstruct_values(self, soulstruct_obj: SOULSTRUCT_T, bl_values: tp.Iterable[tp.Any]):
+        """Run all write steps on raw values from `read_blender_values()`."""
+        for step, bl_value in zip(self.write_steps, bl_values):
+            step(soulstruct_obj, bl_value)
 
 
 def soulstruct_adapter(cls: type[SOULSTRUCT_OBJECT_T]) -> type[SOULSTRUCT_OBJECT_T]:
@@ -3,5 +3,6 @@ from .bpy_context import *
 from .bpy_data import *
 from .materials import *
 from .maths import *
+from .meshes import *
 from .misc import *
 from .operators import *
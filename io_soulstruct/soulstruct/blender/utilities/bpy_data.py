@@ -15,6 +15,7 @@ __all__ = [
 import typing as tp
 
 import bpy
+import numpy as np
 
 from soulstruct.blender.types import *
 from .misc import remove_dupe_suffix
@@ -220,19 +221,37 @@ def copy_armature_pose(
     dest_armature: ArmatureObject,
     ignore_bone_names: tp.Collection[str] = (),
 ):
-    """Copy pose bone transforms.
+    """Copy pose bone transforms (location, rotation quaternion, scale) to all `dest_armature` bones not in
+    `ignore_bone_names` from the `source_armature` bones with the same names.
+
+    Transforms are copied with one `foreach_get()`/`foreach_set()` per property rather than per bone. Ignored bones keep
+    their current transforms.
 
     NOTE: You need to call `context.view_layer.update()` between creating an `Armature` and accessing its `pose`.
     """
+    source_bones = source_armature.pose.bones
+    dest_bones = dest_armature.pose.bones
 
-    for pose_bone in dest_armature.pose.bones:
+    source_bone_indices = {name: i for i, name in enumerate(source_bones.keys())}
+    dest_indices = []
+    source_indices = []
+    for i, pose_bone in enumerate(dest_bones):
         if pose_bone.name in ignore_bone_names:
             continue  # e.g. '<PART_ROOT>'
-        source_bone = source_armature.pose.bones[pose_bone.name]
-        pose_bone.rotation_mode = "QUATERNION"  # should be default but being explicit
-        pose_bone.location = source_bone.location
-        pose_bone.rotation_quaternion = source_bone.rotation_quaternion
-        pose_bone.scale = source_bone.scale
+        source_indices.append(source_bone_indices[pose_bone.name])  # `KeyError` if missing from source
+        dest_indices.append(i)
+        if pose_bone.rotation_mode != "QUATERNION":
+            pose_bone.rotation_mode = "QUATERNION"  # should be default but being explicit
+    if not dest_indices:
+        return
+
+    for prop_name, size in (("location", 3), ("rotation_quaternion", 4), ("scale", 3)):
+        source_values = np.empty((len(source_bones), size), dtype=np.float32)
+        source_bones.foreach_get(prop_name, source_values.ravel())
+        dest_values = np.empty((len(dest_bones), size), dtype=np.float32)
+        dest_bones.foreach_get(prop_name, dest_values.ravel())
+        dest_values[dest_indices] = source_values[source_indices]
+        dest_bones.foreach_set(prop_name, dest_values.ravel())
 
 
 def find_or_create_collection(root_collection: bpy.types.Collection, *names: str) -> bpy.types.Collection:
@@ -1,11 +1,208 @@
 from __future__ import annotations
 
-__all__ = []
+__all__ = [
+    "get_mesh_vertex_coords",
+    "set_mesh_vertices_and_faces",
+    "get_mesh_loop_face_indices",
+    "get_mesh_face_edge_pairs",
+    "get_mesh_face_island_labels",
+    "get_connected_component_labels",
+    "get_mesh_vertex_adjacency",
+    "get_csr_adjacency",
+    "get_csr_hop_distances",
+]
 
+import itertools
 import typing as tp
 
 import bmesh
+import bpy
+import numpy as np
 from bmesh.types import BMVert, BMEdge, BMFace
+from mathutils import Matrix
+
+
+def get_mesh_vertex_coords(mesh: bpy.types.Mesh, matrix: Matrix | None = None) -> np.ndarray:
+    """Get all vertex coordinates of `mesh` as an `(N, 3)` array with one `foreach_get()` call.
+
+    If `matrix` is given (e.g. an object's `matrix_world`), the coordinates are transformed by it with a single array
+    multiplication.
+
+    NOTE: If `mesh` is being edited, call `obj.update_from_editmode()` first, or the coordinates may be stale.
+    """
+    coords = np.empty((len(mesh.vertices), 3), dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords.ravel())
+    if matrix is not None:
+        np_matrix = np.array(matrix, dtype=np.float32)
+        coords = coords @ np_matrix[:3, :3].T + np_matrix[:3, 3]
+    return coords
+
+
+def set_mesh_vertices_and_faces(
+    mesh: bpy.types.Mesh,
+    vertex_coords: np.ndarray,
+    faces: np.ndarray | tp.Sequence,
+    loop_totals: np.ndarray | None = None,
+):
+    """Add vertices and faces to empty `mesh` with `foreach_set()` calls, like `mesh.from_pydata(vertex_coords, [],
+    faces)` but without converting every element in Python. Edges are calculated from the faces.
+
+    `faces` can be an `(F, N)` array of vertex indices, or a sequence of vertex index sequences of any lengths. If
+    `loop_totals` (the vertex count of each face) is given, `faces` is instead a flat array of the vertex indices of
+    all faces, as read from `Mesh.loops` with `foreach_get()`.
+    """
+    if loop_totals is not None:
+        loop_totals = np.asarray(loop_totals, dtype=np.int32)
+        loop_vertex_indices = np.asarray(faces, dtype=np.int32).ravel()
+    elif isinstance(faces, np.ndarray) and faces.ndim == 2:
+        loop_totals = np.full(len(faces), faces.shape[1], dtype=np.int32)
+        loop_vertex_indices = faces.astype(np.int32).ravel()
+    else:
+        loop_totals = np.fromiter(map(len, faces), dtype=np.int32, count=len(faces))
+        loop_vertex_indices = np.fromiter(
+            itertools.chain.from_iterable(faces), dtype=np.int32, count=int(loop_totals.sum())
+        )
+
+    mesh.vertices.add(len(vertex_coords))
+    mesh.vertices.foreach_set("co", np.asarray(vertex_coords, dtype=np.float32).ravel())
+    mesh.loops.add(len(loop_vertex_indices))
+    mesh.loops.foreach_set("vertex_index", loop_vertex_indices)
+    mesh.polygons.add(len(loop_totals))
+    mesh.polygons.foreach_set("loop_start", (np.cumsum(loop_totals) - loop_totals).astype(np.int32))
+    mesh.polygons.foreach_set("loop_total", loop_totals)
+    mesh.update(calc_edges=True)
+
+
+def get_mesh_loop_face_indices(mesh: bpy.types.Mesh) -> np.ndarray:
+    """Get the index of the face (polygon) that owns each loop of `mesh`."""
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return np.repeat(np.arange(len(mesh.polygons), dtype=np.int32), loop_totals)
+
+
+def get_mesh_face_edge_pairs(
+    mesh: bpy.types.Mesh, face_mask: np.ndarray | None = None, contiguous_only=False
+) -> np.ndarray:
+    """Get an `(M, 2)` array of the indices of faces (polygons) of `mesh` that share an edge.
+
+    If `face_mask` is given, only faces in it are paired. Edges with more than two faces give a chain of pairs, which
+    still connects all of them, so pairs must NOT be filtered by a face mask afterward (which could split the chain).
+
+    If `contiguous_only=True`, only faces that share a manifold edge and have matching winding (normals) are paired,
+    like `bpy.ops.mesh.select_linked(delimit={"NORMAL"})`.
+    """
+    loop_edge_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edge_indices)
+    loop_vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    if contiguous_only:
+        mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+    loop_face_indices = get_mesh_loop_face_indices(mesh)
+    if face_mask is not None:
+        loop_mask = face_mask[loop_face_indices]
+        loop_edge_indices = loop_edge_indices[loop_mask]
+        loop_vertex_indices = loop_vertex_indices[loop_mask]
+        loop_face_indices = loop_face_indices[loop_mask]
+
+    # Sort loops by edge. Consecutive loops on the same edge belong to faces that share that edge.
+    order = np.argsort(loop_edge_indices, kind="stable")
+    sorted_edges = loop_edge_indices[order]
+    sorted_faces = loop_face_indices[order]
+    shared = sorted_edges[:-1] == sorted_edges[1:]
+    if contiguous_only:
+        # Edge must have exactly two loops, which start at different vertices (i.e. run in opposite directions).
+        sorted_vertices = loop_vertex_indices[order]
+        manifold = shared.copy()
+        manifold[1:] &= ~shared[:-1]
+        manifold[:-1] &= ~shared[1:]
+        shared = manifold & (sorted_vertices[:-1] != sorted_vertices[1:])
+    return np.stack((sorted_faces[:-1][shared], sorted_faces[1:][shared]), axis=1)
+
+
+def get_mesh_face_island_labels(mesh: bpy.types.Mesh, delimit_normal=False) -> np.ndarray:
+    """Label every face of `mesh` with the index of its island of faces connected by shared edges.
+
+    If `delimit_normal=True`, islands are also split at non-manifold edges and between faces with opposite winding,
+    like `bpy.ops.mesh.select_linked(delimit={"NORMAL"})`.
+
+    Labels are dense, i.e. in `range(island_count)`.
+    """
+    return get_connected_component_labels(
+        len(mesh.polygons), get_mesh_face_edge_pairs(mesh, contiguous_only=delimit_normal)
+    )
+
+
+def get_connected_component_labels(count: int, pairs: np.ndarray) -> np.ndarray:
+    """Array union-find: label each of `count` elements with the index of its connected component, where `pairs` is
+    an `(M, 2)` array of connected element indices.
+
+    Each pass hooks the root of each pair onto the smaller root, then fully compresses paths, until nothing changes.
+    Labels are dense, i.e. in `range(component_count)`, and ordered by the lowest element index in each component.
+    """
+    labels = np.arange(count)
+    if count == 0 or len(pairs) == 0:
+        return labels
+
+    a = np.asarray(pairs[:, 0])
+    b = np.asarray(pairs[:, 1])
+    while True:
+        roots_a = labels[a]
+        roots_b = labels[b]
+        min_roots = np.minimum(roots_a, roots_b)
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, roots_a, min_roots)
+        np.minimum.at(new_labels, roots_b, min_roots)
+        while True:
+            jumped = new_labels[new_labels]
+            if np.array_equal(jumped, new_labels):
+                break
+            new_labels = jumped
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    return np.unique(labels, return_inverse=True)[1]
+
+
+def get_mesh_vertex_adjacency(mesh: bpy.types.Mesh) -> tuple[np.ndarray, np.ndarray]:
+    """Build a CSR vertex adjacency `(offsets, neighbors)` from the edges of `mesh`.
+
+    Neighbors of vertex `i` are `neighbors[offsets[i]:offsets[i + 1]]`.
+    """
+    edge_vertex_indices = np.empty((len(mesh.edges), 2), dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_vertex_indices.ravel())
+    return get_csr_adjacency(len(mesh.vertices), edge_vertex_indices)
+
+
+def get_csr_adjacency(count: int, pairs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Build an undirected CSR adjacency `(offsets, neighbors)` for `count` elements from an `(M, 2)` array of
+    connected element index `pairs`."""
+    sources = np.concatenate((pairs[:, 0], pairs[:, 1]))
+    targets = np.concatenate((pairs[:, 1], pairs[:, 0]))
+    order = np.argsort(sources, kind="stable")
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=count), out=offsets[1:])
+    return offsets, targets[order]
+
+
+def get_csr_hop_distances(
+    offsets: np.ndarray, neighbors: np.ndarray, source_mask: np.ndarray, max_hops: int
+) -> np.ndarray:
+    """Frontier BFS over a CSR adjacency. Returns the hop count of every element from the nearest element in
+    `source_mask` (zero for sources), or -1 for elements further than `max_hops` away (or unreachable)."""
+    distances = np.full(len(offsets) - 1, -1, dtype=np.int64)
+    distances[source_mask] = 0
+    frontier = np.flatnonzero(source_mask)
+    for hop in range(1, max_hops + 1):
+        if frontier.size == 0:
+            break
+        # Gather all CSR rows of the frontier at once.
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        row_offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        frontier_neighbors = neighbors[np.arange(counts.sum()) + row_offsets]
+        frontier = np.unique(frontier_neighbors[distances[frontier_neighbors] < 0])
+        distances[frontier] = hop
+    return distances
 
 
 def visit_connected_bmesh_islands(
@@ -0,0 +1,7 @@
+"""Make `soulstruct.blender` importable from the add-on directory, as `io_soulstruct/__init__.py` does in Blender."""
+import sys
+from pathlib import Path
+
+_IO_SOULSTRUCT_PATH = str(Path(__file__).parent.parent / "io_soulstruct")
+if _IO_SOULSTRUCT_PATH not in sys.path:
+    sys.path.append(_IO_SOULSTRUCT_PATH)
@@ -0,0 +1,67 @@
+"""Check that exporting a single FLVER into an existing Binder (as `BaseGameFLVERBinderExportOperator` does) passes all
+other entries through as their raw bytes, with the same result as rebuilding the whole Binder."""
+from pathlib import Path
+
+import pytest
+
+from soulstruct.containers import BinderEntry, BinderVersion
+from soulstruct.containers.binder_types import FLVERBinder
+from soulstruct.dcx import DCXType
+from soulstruct.flver import FLVER
+
+
+class _SyntheticCHRBND(FLVERBinder):
+    DEFAULT_ENTRY_ROOT = "N:\\FRPG\\data\\INTERROOT_x64\\chr"
+    version = BinderVersion.V3
+    v4_info = None
+
+
+_MODEL_STEM = "c1234"
+
+# Untouched entries with arbitrary contents that could not be unpacked as their real types.
+_RAW_ENTRIES = {
+    300: ("c1234.anibnd", bytes(range(256)) * 3),
+    400: ("c1234.hkx", b"HKX\x00" + bytes(reversed(range(256)))),
+    500: ("c1234.mystery", b"\xFF" * 17),
+}
+_OLD_FLVER_DATA = b"old FLVER entry, never loaded"
+
+
+def _new_binder(dcx_type: DCXType) -> _SyntheticCHRBND:
+    return _SyntheticCHRBND(model_stem=_MODEL_STEM, dcx_type=dcx_type, path=Path(f"{_MODEL_STEM}.chrbnd"))
+
+
+def _add_entry(binder: _SyntheticCHRBND, entry_id: int, name: str, data: bytes):
+    binder.add_entry(BinderEntry(data, entry_id, binder.get_default_entry_path(f"{_MODEL_STEM}\\{name}"), 0x2))
+
+
+@pytest.mark.parametrize("dcx_type", [DCXType.Null, DCXType.DCX_DFLT_10000_24_9])
+def test_single_flver_export_passes_other_entries_through(dcx_type):
+    original = _new_binder(dcx_type)
+    _add_entry(original, 200, f"{_MODEL_STEM}.flver", _OLD_FLVER_DATA)
+    for entry_id, (name, data) in _RAW_ENTRIES.items():
+        _add_entry(original, entry_id, name, data)
+    original_bytes = bytes(original)
+
+    # Export path: load existing Binder and only set the new FLVER.
+    new_flver = FLVER()
+    binder = _SyntheticCHRBND.from_bytes(original_bytes)
+    raw_data_objects = {entry_id: binder.find_entry_id(entry_id).data for entry_id in _RAW_ENTRIES}
+    binder.set_flver(_MODEL_STEM, new_flver)
+    exported_bytes = bytes(binder)
+
+    # Untouched entries were never unpacked or replaced.
+    for entry_id, data in raw_data_objects.items():
+        assert binder.find_entry_id(entry_id).data is data
+
+    # Full rewrite: build the whole Binder again from scratch, with the same new FLVER.
+    rebuilt = _new_binder(dcx_type)
+    _add_entry(rebuilt, 200, f"{_MODEL_STEM}.flver", bytes(new_flver))
+    for entry_id, (name, data) in _RAW_ENTRIES.items():
+        _add_entry(rebuilt, entry_id, name, data)
+    assert exported_bytes == bytes(rebuilt)
+
+    exported = _SyntheticCHRBND.from_bytes(exported_bytes)
+    assert exported.find_entry_id(200).data == bytes(new_flver)
+    for entry_id, (_, data) in _RAW_ENTRIES.items():
+        assert exported.find_entry_id(entry_id).data == data
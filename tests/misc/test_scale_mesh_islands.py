@@ -0,0 +1,149 @@
+"""Compare `ScaleMeshIslands` with its original island-by-island 'Select Linked' loop on a grid of cubes (requires
+`bpy`).
+
+Run with `-s` to print times.
+"""
+import time
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+import bmesh
+from mathutils import Matrix, Vector
+
+from soulstruct.blender.misc.misc_mesh import ScaleMeshIslands
+
+CUBE_VERTICES = np.array([(x, y, z) for z in (0.0, 1.0) for y in (0.0, 1.0) for x in (0.0, 1.0)])
+CUBE_FACES = [(0, 2, 3, 1), (4, 5, 7, 6), (0, 1, 5, 4), (1, 3, 7, 5), (3, 2, 6, 7), (2, 0, 4, 6)]
+SCALE_FACTOR = 0.5
+
+
+def _new_cubes_obj(grid_size: int) -> tuple[bpy.types.Object, set[int]]:
+    """Grid of disconnected, randomly rotated cubes (every third one selected), followed by two selected cubes that
+    touch at one corner vertex and a selected strip of three quads whose last quad is flipped (which 'Select Linked'
+    delimits by normal).
+
+    Returns the object and the selected face indices.
+    """
+    rng = np.random.default_rng(0)
+    vertices = []
+    faces = []
+    selected_faces = set()
+
+    def add_cube(offset, matrix=np.eye(3), select_face=None):
+        v = len(vertices)
+        vertices.extend(CUBE_VERTICES @ matrix.T + offset)
+        for i, face in enumerate(CUBE_FACES):
+            faces.append([v + vi for vi in face])
+            if i == select_face:
+                selected_faces.add(len(faces) - 1)
+
+    for i in range(grid_size * grid_size):
+        rotation = np.array(Matrix.Rotation(rng.uniform(0.0, 3.0), 3, Vector(rng.normal(size=3))))
+        add_cube((3.0 * (i % grid_size), 3.0 * (i // grid_size), 0.0), rotation, 2 if i % 3 == 0 else None)
+
+    add_cube((-5.0, 0.0, 0.0), select_face=4)
+    add_cube((-4.0, 1.0, 1.0), select_face=0)  # shares the (-4, 1, 1) corner
+    v = len(vertices)
+    vertices.extend((x - 10.0, y, 0.0) for x in range(4) for y in (0.0, 1.0))
+    selected_faces.add(len(faces))
+    faces += [(v, v + 2, v + 3, v + 1), (v + 2, v + 4, v + 5, v + 3), (v + 4, v + 5, v + 7, v + 6)]
+
+    mesh = bpy.data.meshes.new("Cubes")
+    mesh.from_pydata(vertices, [], faces)
+    # Merge the touching corner vertices.
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bmesh.ops.remove_doubles(bm, verts=bm.verts[len(vertices) - 24:len(vertices) - 8], dist=1e-5)
+    bm.to_mesh(mesh)
+    bm.free()
+    assert len(mesh.vertices) == len(vertices) - 1
+
+    obj = bpy.data.objects.new("Cubes", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj, selected_faces
+
+
+def _set_face_selection(mesh: bpy.types.Mesh, selected_faces: set[int]):
+    bm = bmesh.from_edit_mesh(mesh)
+    for face in bm.faces:
+        face.select_set(face.index in selected_faces)
+    bmesh.update_edit_mesh(mesh)
+
+
+def _scale_with_select_linked(mesh: bpy.types.Mesh, scale_factor: float):
+    """Original `ScaleMeshIslands.execute()`: 'Select Linked' from each selected face in turn and scale each island
+    about its vertex centroid.
+
+    The original 'deselected all' with `bpy.ops.object.select_all()`, which does not run in Edit Mode, so all selected
+    islands were selected and scaled together as one. Faces are deselected here, as intended. Faces are visited in
+    index order (rather than set order) so islands that share vertices are scaled in a predictable order.
+    """
+    bm = bmesh.from_edit_mesh(mesh)
+    bm.faces.ensure_lookup_table()
+    initially_selected_faces = sorted((face for face in bm.faces if face.select), key=lambda f: f.index)
+    for face in bm.faces:
+        face.tag = False
+
+    for face in initially_selected_faces:
+        if face.tag:
+            continue
+        bpy.ops.mesh.select_all(action="DESELECT")
+        face.select_set(True)
+        bpy.ops.mesh.select_linked(delimit={"NORMAL"})
+        current_island_faces = {f for f in bm.faces if f.select}
+        for island_face in current_island_faces:
+            island_face.tag = True
+        island_verts = {v for f in current_island_faces for v in f.verts}
+        center = sum((v.co for v in island_verts), Vector()) / len(island_verts)
+        scale_matrix = Matrix.Translation(center) @ Matrix.Scale(scale_factor, 4) @ Matrix.Translation(-center)
+        for vert in island_verts:
+            vert.co = scale_matrix @ vert.co
+
+    bmesh.update_edit_mesh(mesh)
+
+
+def _get_coords(mesh: bpy.types.Mesh) -> np.ndarray:
+    coords = np.empty((len(mesh.vertices), 3), dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords.ravel())
+    return coords
+
+
+@pytest.fixture
+def empty_scene():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bpy.context.scene.tool_settings.mesh_select_mode = (False, False, True)
+
+
+def test_scale_cube_islands_matches_select_linked(empty_scene):
+    grid_size = 12
+    expected_obj, selected_faces = _new_cubes_obj(grid_size)
+    obj, _ = _new_cubes_obj(grid_size)
+    original_coords = _get_coords(obj.data)
+
+    bpy.context.view_layer.objects.active = expected_obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    _set_face_selection(expected_obj.data, selected_faces)
+    start = time.perf_counter()
+    _scale_with_select_linked(expected_obj.data, SCALE_FACTOR)
+    old_time = time.perf_counter() - start
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    _set_face_selection(obj.data, selected_faces)
+    bpy.ops.object.mode_set(mode="OBJECT")
+    start = time.perf_counter()
+    island_count = ScaleMeshIslands._scale_selected_islands(obj.data, SCALE_FACTOR)
+    new_time = time.perf_counter() - start
+
+    print(f"\nScaled {island_count} cube islands: Select Linked {old_time:.3f} s, arrays {new_time:.3f} s")
+    # Every third grid cube, both touching cubes, and the first two quads of the strip.
+    assert island_count == len(range(0, grid_size * grid_size, 3)) + 3
+    coords = _get_coords(obj.data)
+    np.testing.assert_allclose(coords, _get_coords(expected_obj.data), atol=1e-5)
+    assert np.all(coords[8:24] == original_coords[8:24])  # unselected grid cubes are unchanged
+    assert not np.allclose(coords[-8:-2], original_coords[-8:-2])  # first two strip quads are scaled
+    assert np.all(coords[-2:] == original_coords[-2:])  # flipped strip quad is not
@@ -0,0 +1,203 @@
+"""Compare `SpawnObjectIntoMeshAtFaces` with its original `BMesh` duplication, using the same random seed (requires
+`bpy`)."""
+import math
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+import bmesh
+from mathutils import Matrix, Vector
+
+from soulstruct.blender.misc.misc_mesh import SpawnObjectIntoMeshAtFaces
+
+SELECTED_FACES = {0, 2, 5, 8, 10, 15}  # do not share vertices
+
+
+def _new_source_obj() -> bpy.types.Object:
+    """Cube with materials, UVs, colors, smooth shading, custom normals, and generic attributes on every domain."""
+    vertices = [(x, y, z) for z in (0.0, 1.0) for y in (-0.5, 0.5) for x in (-0.5, 0.5)]
+    faces = [(0, 2, 3, 1), (4, 5, 7, 6), (0, 1, 5, 4), (1, 3, 7, 5), (3, 2, 6, 7), (2, 0, 4, 6)]
+    mesh = bpy.data.meshes.new("Source")
+    mesh.from_pydata(vertices, [], faces)
+    rng = np.random.default_rng(0)
+
+    mesh.attributes.new("material_index", "INT", "FACE").data.foreach_set("value", [0, 1, 0, 1, 2, 1])
+    mesh.attributes.new("sharp_face", "BOOLEAN", "FACE").data.foreach_set("value", [True, False] * 3)
+    mesh.attributes.new("sharp_edge", "BOOLEAN", "EDGE").data.foreach_set(
+        "value", [i % 3 == 0 for i in range(len(mesh.edges))]
+    )
+    mesh.attributes.new("point_weight", "FLOAT", "POINT").data.foreach_set("value", rng.random(8))
+    mesh.attributes.new("edge_weight", "FLOAT", "EDGE").data.foreach_set("value", rng.random(len(mesh.edges)))
+    for name in ("UVMap", "UVMap2"):
+        mesh.uv_layers.new(name=name).data.foreach_set("uv", rng.random(2 * len(mesh.loops)))
+    mesh.color_attributes.new("Col", "BYTE_COLOR", "CORNER").data.foreach_set(
+        "color", rng.random(4 * len(mesh.loops))
+    )
+    mesh.normals_split_custom_set([tuple(v) for v in rng.normal(0.0, 1.0, (len(mesh.loops), 3))])
+
+    obj = bpy.data.objects.new("Source", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def _new_dest_obj(name: str) -> bpy.types.Object:
+    """Bumpy grid with one upside-down face."""
+    size = 4
+    rng = np.random.default_rng(1)
+    vertices = [(x, y, rng.normal(0.0, 0.3)) for y in range(size + 1) for x in range(size + 1)]
+    faces = []
+    for y in range(size):
+        for x in range(size):
+            v = y * (size + 1) + x
+            faces.append((v, v + 1, v + size + 2, v + size + 1))
+    faces[0] = faces[0][::-1]
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(vertices, [], faces)
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def _spawn_with_bmesh(operator, dest_obj: bpy.types.Object):
+    """Original `SpawnObjectIntoMeshAtFaces.execute()`: merge the source into the edited BMesh, then duplicate and
+    transform its faces once for each selected face.
+
+    The original passed only faces to `bmesh.ops.delete(context="VERTS")`, which deleted nothing and left the merged
+    source in place. Its vertices are deleted here, as intended.
+    """
+    source_obj = bpy.data.objects[operator.object_name]
+    dest_mesh = dest_obj.data
+    bm = bmesh.from_edit_mesh(dest_mesh)
+    spawn_data = [(face.calc_center_median(), face.normal.copy()) for face in bm.faces if face.select]
+    orig_face_count = len(bm.faces)
+    bm.from_mesh(source_obj.data)
+    bm.faces.ensure_lookup_table()
+    source_faces = bm.faces[orig_face_count:]
+
+    temp_center = Vector((0, 0, 0))
+    for f in source_faces:
+        temp_center += f.calc_center_median()
+    temp_center /= len(source_faces)
+
+    for centroid, normal in spawn_data:
+        new_geom = bmesh.ops.duplicate(bm, geom=source_faces)["geom"]
+        new_verts = [elem for elem in new_geom if isinstance(elem, bmesh.types.BMVert)]
+        rand_slide = random.uniform(operator.translation_min, operator.translation_max)
+        rand_angle = math.radians(random.uniform(operator.rotation_min, operator.rotation_max))
+        rand_scale = random.uniform(operator.scale_min, operator.scale_max)
+        rand_slide *= rand_scale
+        if operator.rotate_to_face_normal:
+            r_to_face = Vector((0, 0, 1)).rotation_difference(normal).to_matrix().to_4x4()
+        else:
+            r_to_face = Matrix.Identity(4)
+        transform = (
+            Matrix.Translation(normal * rand_slide)
+            @ Matrix.Translation(centroid)
+            @ Matrix.Scale(rand_scale, 4)
+            @ Matrix.Rotation(rand_angle, 4, normal)
+            @ r_to_face
+            @ Matrix.Translation(-temp_center)
+        )
+        for v in new_verts:
+            v.co = transform @ v.co
+
+    bmesh.ops.delete(bm, geom=list({v for face in source_faces for v in face.verts}), context="VERTS")
+    bmesh.update_edit_mesh(dest_mesh)
+
+
+def _spawn(spawn_func, operator, dest_obj: bpy.types.Object):
+    bpy.context.view_layer.objects.active = dest_obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    bm = bmesh.from_edit_mesh(dest_obj.data)
+    for face in bm.faces:
+        face.select_set(face.index in SELECTED_FACES)
+    bmesh.update_edit_mesh(dest_obj.data)
+    random.seed(1234)
+    spawn_func(operator, dest_obj)
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+
+def _get_face_data(mesh: bpy.types.Mesh) -> dict[str, np.ndarray]:
+    """Per-face data of `mesh`, with faces sorted by center and loops in face order."""
+    face_count = len(mesh.polygons)
+    loop_totals = np.empty(face_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    assert np.all(loop_totals == 4)
+    centers = np.empty((face_count, 3), dtype=np.float32)
+    mesh.polygons.foreach_get("center", centers.ravel())
+    face_order = np.lexsort(np.round(centers, 3).T[::-1])
+    loop_order = (4 * face_order[:, np.newaxis] + np.arange(4)).ravel()
+
+    coords = np.empty((len(mesh.vertices), 3), dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords.ravel())
+    loop_vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+    corner_normals = np.empty((len(mesh.loops), 3), dtype=np.float32)
+    mesh.corner_normals.foreach_get("vector", corner_normals.ravel())
+
+    data = {
+        "coords": coords[loop_vertex_indices][loop_order],
+        "corner_normals": corner_normals[loop_order],
+    }
+    for attribute in mesh.attributes:
+        if attribute.is_internal or attribute.name in {"position", "custom_normal"}:
+            continue
+        key = "color" if attribute.domain == "CORNER" and attribute.data_type == "BYTE_COLOR" else (
+            "vector" if attribute.data_type == "FLOAT2" else "value"
+        )
+        values = np.array([getattr(item, key) for item in attribute.data], dtype=np.float32)
+        if attribute.domain == "FACE":
+            values = values[face_order]
+        elif attribute.domain == "CORNER":
+            values = values[loop_order]
+        elif attribute.domain == "POINT":
+            values = values[loop_vertex_indices][loop_order]
+        elif attribute.domain == "EDGE":
+            # Compare edge values by their sorted vertex coordinates.
+            edge_coords = [tuple(sorted(np.round(coords[list(edge.vertices)], 3).tolist())) for edge in mesh.edges]
+            values = np.array([v for _, v in sorted(zip(edge_coords, values.tolist()))])
+        data[attribute.name] = values
+    return data
+
+
+@pytest.fixture
+def source_obj():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    return _new_source_obj()
+
+
+@pytest.mark.parametrize("rotate_to_face_normal", [True, False])
+def test_spawn_matches_bmesh(source_obj, rotate_to_face_normal):
+    operator = SimpleNamespace(
+        object_name=source_obj.name,
+        rotate_to_face_normal=rotate_to_face_normal,
+        translation_min=-0.2,
+        translation_max=0.5,
+        rotation_min=-90.0,
+        rotation_max=90.0,
+        scale_min=0.5,
+        scale_max=1.5,
+        info=lambda msg: None,
+        error=lambda msg: pytest.fail(msg),
+    )
+    expected_obj = _new_dest_obj("Expected")
+    _spawn(_spawn_with_bmesh, operator, expected_obj)
+    dest_obj = _new_dest_obj("Dest")
+    _spawn(lambda op, _: SpawnObjectIntoMeshAtFaces.execute(op, bpy.context), operator, dest_obj)
+
+    expected_mesh = expected_obj.data
+    mesh = dest_obj.data
+    assert len(mesh.vertices) == len(expected_mesh.vertices) == 25 + 6 * 8
+    assert len(mesh.polygons) == len(expected_mesh.polygons) == 16 + 6 * 6
+    assert len(mesh.edges) == len(expected_mesh.edges)
+
+    data = _get_face_data(mesh)
+    expected_data = _get_face_data(expected_mesh)
+    assert data.keys() == expected_data.keys()
+    assert {"material_index", "sharp_face", "sharp_edge", "UVMap", "UVMap2", "Col", "point_weight"} <= data.keys()
+    for name, expected_values in expected_data.items():
+        np.testing.assert_allclose(data[name], expected_values, atol=1e-4, err_msg=name)
@@ -0,0 +1,97 @@
+"""Compare `WeightVerticesWithFalloff` with its original ring-by-ring `BMesh` expansion on a grid (requires `bpy`)."""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+import bmesh
+
+from soulstruct.blender.misc.misc_mesh import WeightVerticesWithFalloff
+
+GRID_SIZE = 20
+SELECTED_VERTICES = {0, 45, 46, 230, 231, 252}
+
+
+def _new_grid_obj() -> bpy.types.Object:
+    """Triangulated grid (diagonals make rings uneven), plus a separate quad that is never reached."""
+    vertices = [(x, y, 0.0) for y in range(GRID_SIZE + 1) for x in range(GRID_SIZE + 1)]
+    faces = []
+    for y in range(GRID_SIZE):
+        for x in range(GRID_SIZE):
+            v = y * (GRID_SIZE + 1) + x
+            faces += [(v, v + 1, v + GRID_SIZE + 2), (v, v + GRID_SIZE + 2, v + GRID_SIZE + 1)]
+    v = len(vertices)
+    vertices += [(-5.0, 0.0, 0.0), (-4.0, 0.0, 0.0), (-4.0, 1.0, 0.0), (-5.0, 1.0, 0.0)]
+    faces.append((v, v + 1, v + 2, v + 3))
+
+    mesh = bpy.data.meshes.new("Grid")
+    mesh.from_pydata(vertices, [], faces)
+    obj = bpy.data.objects.new("Grid", mesh)
+    obj.vertex_groups.new(name="Falloff")
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def _get_bmesh_ring_weights(mesh: bpy.types.Mesh, steps: int) -> dict[int, float]:
+    """Original `WeightVerticesWithFalloff.execute()` rings: expand the selection through `BMVert.link_edges` one ring
+    at a time. (The original also called `VertexGroup.add()` in Edit Mode, which Blender does not allow.)"""
+    bm = bmesh.from_edit_mesh(mesh)
+    bm.verts.ensure_lookup_table()
+    initial_verts = set(v.index for v in bm.verts if v.select)
+    visited = set(initial_verts)
+    weights = {idx: 1.0 for idx in initial_verts}
+    current_ring = initial_verts
+    falloff = 1.0 / (steps + 1)
+    for step in range(1, steps + 1):
+        new_ring = set()
+        for vertex_idx in current_ring:
+            for edge in bm.verts[vertex_idx].link_edges:
+                for other in edge.verts:
+                    if other.index not in visited:
+                        new_ring.add(other.index)
+        weights |= {idx: 1.0 - step * falloff for idx in new_ring}
+        visited.update(new_ring)
+        current_ring = new_ring
+    return weights
+
+
+@pytest.fixture
+def grid_obj():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    obj = _new_grid_obj()
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    bm = bmesh.from_edit_mesh(obj.data)
+    for elements in (bm.faces, bm.edges):
+        for element in elements:
+            element.select = False
+    for v in bm.verts:
+        v.select = v.index in SELECTED_VERTICES
+    bmesh.update_edit_mesh(obj.data)
+    yield obj
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+
+@pytest.mark.parametrize("steps", [1, 5, 40])
+def test_weights_match_bmesh_rings(grid_obj, steps):
+    expected_weights = _get_bmesh_ring_weights(grid_obj.data, steps)
+    operator = SimpleNamespace(
+        vertex_group="Falloff",
+        steps=steps,
+        info=lambda msg: None,
+        error=lambda msg: pytest.fail(msg),
+    )
+    assert WeightVerticesWithFalloff.execute(operator, bpy.context) == {"FINISHED"}
+    assert bpy.context.mode == "EDIT_MESH"
+
+    bpy.ops.object.mode_set(mode="OBJECT")
+    group_index = grid_obj.vertex_groups["Falloff"].index
+    weights = {
+        v.index: g.weight for v in grid_obj.data.vertices for g in v.groups if g.group == group_index
+    }
+    assert weights.keys() == expected_weights.keys()
+    assert weights == pytest.approx(expected_weights)
+    assert len(set(expected_weights.values())) == min(steps, 15) + 1  # grid is filled after 15 rings
+    assert len(weights) < len(grid_obj.data.vertices)  # separate quad is never reached
@@ -0,0 +1,23 @@
+"""Fixtures for MSB tests that need MSB Region objects (requires `bpy`)."""
+import pytest
+
+
+@pytest.fixture
+def region_props():
+    """Register only the property groups that MSB Region objects use, in a new empty file."""
+    bpy = pytest.importorskip("bpy")
+    from soulstruct.blender.msb.properties import MSBRegionProps
+    from soulstruct.blender.msb.properties.settings import MSBToolSettings
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bpy.utils.register_class(MSBRegionProps)
+    bpy.utils.register_class(MSBToolSettings)
+    bpy.types.Object.soulstruct_type = bpy.props.StringProperty()
+    bpy.types.Object.MSB_REGION = bpy.props.PointerProperty(type=MSBRegionProps)
+    bpy.types.Scene.msb_tool_settings = bpy.props.PointerProperty(type=MSBToolSettings)
+    yield
+    del bpy.types.Scene.msb_tool_settings
+    del bpy.types.Object.MSB_REGION
+    del bpy.types.Object.soulstruct_type
+    bpy.utils.unregister_class(MSBToolSettings)
+    bpy.utils.unregister_class(MSBRegionProps)
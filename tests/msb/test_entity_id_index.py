@@ -0,0 +1,157 @@
+"""Test the cached MSB entity ID index with stand-in objects and depsgraph updates, and with Blender objects changed
+without depsgraph updates (requires `bpy`)."""
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from soulstruct.blender.msb import entity_id_index
+from soulstruct.blender.msb.entity_id_index import *
+
+_SESSION_UIDS = itertools.count(1)
+
+
+def _new_obj(name: str, entity_id: int, soulstruct_type="MSB_PART") -> SimpleNamespace:
+    """Stand-in for an MSB entry `bpy.types.Object`."""
+    return SimpleNamespace(
+        name=name,
+        id_type="OBJECT",
+        session_uid=next(_SESSION_UIDS),
+        soulstruct_type=soulstruct_type,
+        **{soulstruct_type: SimpleNamespace(entity_id=entity_id)},
+    )
+
+
+def _update(*objs: SimpleNamespace):
+    """Run the depsgraph handler as if `objs` were updated."""
+    updates = [SimpleNamespace(id=SimpleNamespace(original=obj)) for obj in objs]
+    track_entity_id_updates(None, SimpleNamespace(updates=updates))
+
+
+@pytest.fixture
+def collection():
+    clear_entity_id_indices()
+    return SimpleNamespace(
+        session_uid=next(_SESSION_UIDS),
+        all_objects=[
+            _new_obj("c1000_0000", 1000),
+            _new_obj("c1000_0001", 1001),
+            _new_obj("Region", 1000, "MSB_REGION"),
+            _new_obj("Event", 0, "MSB_EVENT"),
+            _new_obj("Not MSB", 1002, "NONE"),
+        ],
+    )
+
+
+def test_index_built_once(collection):
+    index, is_new = get_entity_id_index(collection)
+    assert is_new
+    assert index.object_names == {1000: ["c1000_0000", "Region"], 1001: ["c1000_0001"]}
+    assert index.duplicate_entity_ids == {1000: ["c1000_0000", "Region"]}
+
+    same_index, is_new = get_entity_id_index(collection)
+    assert not is_new
+    assert same_index is index
+
+
+def test_index_kept_after_unrelated_updates(collection):
+    index, _ = get_entity_id_index(collection)
+    objs = collection.all_objects
+    for _ in range(100):  # e.g. repeated `FindEntityID` selections, or moving objects
+        _update(*objs)
+        assert get_entity_id_index(collection) == (index, False)
+    # Non-MSB objects and other ID types are ignored.
+    _update(SimpleNamespace(id_type="MESH"), _new_obj("New Not MSB", 5000, "NONE"))
+    assert get_entity_id_index(collection) == (index, False)
+
+
+def test_index_rebuilt_after_entity_id_change(collection):
+    get_entity_id_index(collection)
+    obj = collection.all_objects[1]
+    obj.MSB_PART.entity_id = 1005
+    _update(*collection.all_objects)
+    index, is_new = get_entity_id_index(collection)
+    assert is_new
+    assert index.object_names[1005] == ["c1000_0001"]
+    assert 1001 not in index.object_names
+
+
+def test_index_rebuilt_after_rename(collection):
+    get_entity_id_index(collection)
+    collection.all_objects[0].name = "c1000_0002"
+    _update(collection.all_objects[0])
+    index, is_new = get_entity_id_index(collection)
+    assert is_new
+    assert index.object_names[1000] == ["c1000_0002", "Region"]
+
+
+def test_index_rebuilt_after_new_object(collection):
+    get_entity_id_index(collection)
+    new_obj = _new_obj("c1000_0003", 1003)
+    # New object with an entity ID (even in a different collection, e.g. about to be moved) invalidates indices.
+    _update(new_obj)
+    assert get_entity_id_index(collection)[1]
+    # Object count changes too.
+    collection.all_objects.append(new_obj)
+    index, is_new = get_entity_id_index(collection)
+    assert is_new
+    assert index.object_names[1003] == ["c1000_0003"]
+
+
+def test_clear(collection):
+    get_entity_id_index(collection)
+    clear_entity_id_indices()
+    assert not entity_id_index._OBJECT_ENTITY_IDS
+    assert get_entity_id_index(collection)[1]
+
+
+def _new_region_obj(name: str, entity_id: int) -> bpy.types.Object:
+    obj = bpy.data.objects.new(name, None)
+    obj.soulstruct_type = "MSB_REGION"
+    obj.MSB_REGION.entity_id = entity_id
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def test_objects_checked_without_depsgraph_update(region_props):
+    clear_entity_id_indices()
+    collection = bpy.context.scene.collection
+    region_1 = _new_region_obj("Region 1", 1000)
+    region_2 = _new_region_obj("Region 2", 1001)
+    objs, index, is_new = get_entity_id_objects(collection, 1000)
+    assert objs == [region_1]
+    assert is_new
+    assert get_entity_id_objects(collection, 1000) == ([region_1], index, False)
+
+    # Changed entity IDs are not reported to `track_entity_id_updates()` here, so the cached index is out of date.
+    region_1.MSB_REGION.entity_id = 1002
+    region_2.MSB_REGION.entity_id = 1000
+    assert index.get_objects(1000) == []  # stale hit is dropped
+    objs, new_index, is_new = get_entity_id_objects(collection, 1000)
+    assert objs == [region_2]
+    assert is_new
+    assert new_index is not index
+    assert get_entity_id_objects(collection, 1002) == ([region_1], new_index, False)
+
+    # New ID that is missing from the index.
+    region_2.MSB_REGION.entity_id = 1003
+    objs, index, is_new = get_entity_id_objects(collection, 1003)
+    assert objs == [region_2]
+    assert is_new
+
+    # Another object given an ID that still has valid hits is only found after a depsgraph update.
+    region_1.MSB_REGION.entity_id = 1003
+    assert get_entity_id_objects(collection, 1003)[0] == [region_2]
+    _update(region_1)
+    assert get_entity_id_objects(collection, 1003)[0] == [region_1, region_2]  # collection order
+
+    # Only one of two hits is stale.
+    region_2.MSB_REGION.entity_id = 1004
+    objs, _, is_new = get_entity_id_objects(collection, 1003)
+    assert objs == [region_1]
+    assert is_new
+
+    # IDs that are not used rebuild the index once per lookup and find nothing.
+    assert get_entity_id_objects(collection, 9999)[::2] == ([], True)
@@ -0,0 +1,150 @@
+"""Test the MSB export cache (requires `bpy`)."""
+import typing as tp
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from soulstruct.base.maps.msb.region_shapes import BoxShape
+from soulstruct.base.maps.msb.utils import BitSet128
+from soulstruct.darksouls1r.maps.msb import MSB
+from soulstruct.darksouls1r.maps.parts import MSBCharacter
+from soulstruct.darksouls1r.maps.regions import MSBRegion
+from soulstruct.utilities.maths import Vector3
+
+from soulstruct.blender.msb.export_cache import *
+
+
+def _get_bit_set(bools: list[bool]) -> BitSet128:
+    return BitSet128({i for i, enabled in enumerate(bools) if enabled})
+
+
+class _StandInBlenderEntry:
+    """Stands in for a `BaseBlenderMSBEntry` with a real Blender object, whose `write_soulstruct_obj_snapshot()`
+    converts raw Blender values like a field plan does, and counts calls."""
+
+    def __init__(
+        self,
+        obj: bpy.types.Object,
+        create_entry: tp.Callable[[], tp.Any],
+        converters: dict[str, tp.Callable[[tp.Any], tp.Any]],
+        field_values: list[tp.Any],
+    ):
+        self.obj = obj
+        self.create_entry = create_entry
+        self.converters = converters
+        self.field_values = field_values
+        self.conversion_count = 0
+
+    def write_soulstruct_obj_snapshot(self, msb_entry, field_values):
+        self.conversion_count += 1
+        for (field_name, converter), value in zip(self.converters.items(), field_values):
+            setattr(msb_entry, field_name, converter(value))
+        return msb_entry
+
+
+def _export(bl_entries: list[_StandInBlenderEntry]) -> tuple[MSB, int]:
+    """Export like `_export_msb()`: new MSB and new MSB entries every time, with field values copied from Blender."""
+    msb = MSB()
+    converted_count = 0
+    for bl_entry in bl_entries:
+        msb_entry, converted = get_or_convert_msb_entry(
+            "DARK_SOULS_DSR", "m10_00_00_00", bl_entry, bl_entry.create_entry(), list(bl_entry.field_values)
+        )
+        converted_count += converted
+        msb.add_entry(msb_entry)
+    return msb, converted_count
+
+
+@pytest.fixture
+def bl_entries():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    clear_msb_export_cache()
+    character_obj = bpy.data.objects.new("c1000_0000", None)
+    region_obj = bpy.data.objects.new("Box Region", None)
+    return [
+        _StandInBlenderEntry(
+            character_obj,
+            lambda: MSBCharacter(name="c1000_0000"),
+            {"translate": Vector3, "draw_groups": _get_bit_set, "entity_id": int},
+            [(1.0, 2.0, 3.0), [True, False, True], 0],
+        ),
+        _StandInBlenderEntry(
+            region_obj,
+            lambda: MSBRegion(name="Box Region", shape=BoxShape(2.0, 3.0, 4.0)),
+            {"translate": Vector3, "entity_id": int},
+            [(4.0, 5.0, 6.0), 0],
+        ),
+    ]
+
+
+def test_unchanged_reexport_makes_no_conversion_calls(bl_entries):
+    first_msb, first_converted_count = _export(bl_entries)
+    assert first_converted_count == 2
+
+    second_msb, second_converted_count = _export(bl_entries)
+    assert second_converted_count == 0
+    assert all(bl_entry.conversion_count == 1 for bl_entry in bl_entries)
+    assert second_msb.characters[0] is first_msb.characters[0]
+    # New (but equal) shape instance and BitSet from Blender still match cached entries.
+    assert second_msb.regions[0] is first_msb.regions[0]
+    assert second_msb.characters[0].draw_groups == BitSet128({0, 2})
+
+    # Changed Blender values are converted again (only for that entry).
+    bl_entries[0].field_values[2] = 1000
+    third_msb, third_converted_count = _export(bl_entries)
+    assert third_converted_count == 1
+    assert third_msb.characters[0] is not first_msb.characters[0]
+    assert third_msb.characters[0].entity_id == 1000
+    assert third_msb.regions[0] is first_msb.regions[0]
+
+
+def test_changed_creation_values_are_converted(bl_entries):
+    _export(bl_entries)
+    bl_entries[1].create_entry = lambda: MSBRegion(name="Box Region", shape=BoxShape(2.0, 3.0, 5.0))
+    msb, converted_count = _export(bl_entries)
+    assert converted_count == 1
+    assert msb.regions[0].shape == BoxShape(2.0, 3.0, 5.0)
+
+
+def test_reused_entry_references_are_reset(bl_entries):
+    first_msb, _ = _export(bl_entries)
+    character = first_msb.characters[0]
+    character.patrol_regions = [first_msb.regions[0]] + [None] * (len(character.patrol_regions) - 1)
+    assert first_msb.regions[0].referring_entry_fields
+
+    second_msb, converted_count = _export(bl_entries)
+    assert converted_count == 0
+    assert not second_msb.regions[0].referring_entry_fields  # references are resolved again on every export
+
+
+def test_unchanged_model_file_skipped_only_while_written_files_exist(tmp_path):
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    clear_msb_export_cache()
+    model_objs = [bpy.data.objects.new(f"n000{i}B0A10", bpy.data.meshes.new(f"n000{i}B0A10")) for i in range(3)]
+    project_path = tmp_path / "project" / "map" / "m10_00_00_00" / "m10_00_00_00.nvmbnd"
+    project_path.parent.mkdir(parents=True)
+    project_path.write_bytes(b"NVMBND")
+    file_key = ("DARK_SOULS_DSR", "m10_00_00_00", "NVMBND", str(tmp_path / "project"), "")
+
+    assert not is_msb_model_file_unchanged(file_key, model_objs)  # never exported
+    cache_msb_model_file(file_key, model_objs, [project_path])
+    assert is_msb_model_file_unchanged(file_key, model_objs)
+
+    # Different export directories (e.g. project changed or 'Also Export to Game' enabled).
+    other_key = ("DARK_SOULS_DSR", "m10_00_00_00", "NVMBND", str(tmp_path / "project"), str(tmp_path / "game"))
+    assert not is_msb_model_file_unchanged(other_key, model_objs)
+    # Different models.
+    assert not is_msb_model_file_unchanged(file_key, model_objs[:2])
+
+    # Written file modified or deleted.
+    project_path.write_bytes(b"NVMBND but different")
+    assert not is_msb_model_file_unchanged(file_key, model_objs)
+    cache_msb_model_file(file_key, model_objs, [project_path])
+    assert is_msb_model_file_unchanged(file_key, model_objs)
+    project_path.unlink()
+    assert not is_msb_model_file_unchanged(file_key, model_objs)
+
+    # Nothing written.
+    cache_msb_model_file(file_key, model_objs, [])
+    assert not is_msb_model_file_unchanged(file_key, model_objs)
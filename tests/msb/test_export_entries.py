@@ -0,0 +1,113 @@
+"""Compare two-stage MSB entry export with the original per-field export for many Regions (requires `bpy`).
+
+Run with `-s` to print benchmark times.
+"""
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from soulstruct.base.maps.msb.region_shapes import RegionShapeType
+from soulstruct.darksouls1ptde.maps.msb import MSB
+
+from soulstruct.blender.msb.export_cache import clear_msb_export_cache, get_or_convert_msb_entry
+from soulstruct.blender.msb.properties.settings import MSBExportSettings
+from soulstruct.blender.msb.types.adapters import MSBReferenceFieldAdapter
+from soulstruct.blender.msb.types.darksouls1ptde.regions import BlenderMSBRegion
+
+ENTRY_COUNT = 10000
+MAP_STEM = "m10_00_00_00"
+SHAPE_DIMENSIONS = {
+    RegionShapeType.Point: {},
+    RegionShapeType.Circle: dict(radius=2.0),
+    RegionShapeType.Sphere: dict(radius=3.0),
+    RegionShapeType.Cylinder: dict(radius=1.5, height=4.0),
+    RegionShapeType.Rect: dict(width=2.0, depth=3.0),
+    RegionShapeType.Box: dict(width=2.0, depth=3.0, height=4.0),
+}
+
+
+def _new_msb() -> MSB:
+    msb = MSB()
+    msb.path = Path(f"map/{MAP_STEM}/{MAP_STEM}.msb")
+    return msb
+
+
+def _export_per_field(operator, context, bl_entries: list[BlenderMSBRegion]) -> MSB:
+    """Original `_export_msb()` entry loop: create and convert each entry with its adapters, one field at a time."""
+    msb = _new_msb()
+    for bl_entry in bl_entries:
+        msb_entry = bl_entry._create_soulstruct_obj()
+        for field in bl_entry.TYPE_FIELDS + bl_entry.SUBTYPE_FIELDS:
+            if not isinstance(field, MSBReferenceFieldAdapter):
+                field.blender_to_soulstruct(operator, context, bl_entry, msb_entry)
+        msb.add_entry(msb_entry)
+    return msb
+
+
+def _export_two_stage(operator, context, bl_entries: list[BlenderMSBRegion]) -> tuple[MSB, int]:
+    """Current `_export_msb()` entry loop: read all snapshots, then convert them (or reuse cached entries)."""
+    msb = _new_msb()
+    snapshots = [(bl_entry, *bl_entry.read_soulstruct_obj_snapshot(operator, context)) for bl_entry in bl_entries]
+    converted_count = 0
+    for bl_entry, msb_entry, field_values in snapshots:
+        msb_entry, converted = get_or_convert_msb_entry("DARK_SOULS_PTDE", MAP_STEM, bl_entry, msb_entry, field_values)
+        converted_count += converted
+        msb.add_entry(msb_entry)
+    return msb, converted_count
+
+
+@pytest.fixture
+def export_settings(region_props):
+    bpy.utils.register_class(MSBExportSettings)
+    bpy.types.Scene.msb_export_settings = bpy.props.PointerProperty(type=MSBExportSettings)
+    clear_msb_export_cache()
+    yield
+    clear_msb_export_cache()
+    del bpy.types.Scene.msb_export_settings
+    bpy.utils.unregister_class(MSBExportSettings)
+
+
+@pytest.mark.parametrize("use_world_transforms", [True, False])
+def test_two_stage_export_matches_per_field_export(export_settings, use_world_transforms):
+    context = bpy.context
+    context.scene.msb_tool_settings.use_region_scale_drivers = False
+    context.scene.msb_export_settings.use_world_transforms = use_world_transforms
+    operator = SimpleNamespace(to_object_mode=lambda _: None)
+    rng = np.random.default_rng(0)
+    shape_types = list(SHAPE_DIMENSIONS)
+    bl_entries = []
+    for i in range(ENTRY_COUNT):
+        shape_type = shape_types[i % len(shape_types)]
+        bl_entry = BlenderMSBRegion.new_from_shape_type(
+            operator, context, shape_type, f"Region {i}", **SHAPE_DIMENSIONS[shape_type]
+        )
+        bl_entry.obj.location = rng.uniform(-100.0, 100.0, 3)
+        bl_entry.obj.rotation_euler = rng.uniform(-np.pi, np.pi, 3)
+        bl_entry.entity_id = int(rng.integers(-1, 10000))
+        bl_entries.append(bl_entry)
+    context.view_layer.update()
+
+    start = time.perf_counter()
+    expected_msb = _export_per_field(operator, context, bl_entries)
+    old_time = time.perf_counter() - start
+    start = time.perf_counter()
+    msb, converted_count = _export_two_stage(operator, context, bl_entries)
+    new_time = time.perf_counter() - start
+    start = time.perf_counter()
+    cached_msb, cached_converted_count = _export_two_stage(operator, context, bl_entries)
+    cached_time = time.perf_counter() - start
+
+    print(
+        f"\nExported {ENTRY_COUNT} Regions: per field {old_time:.3f} s, two-stage {new_time:.3f} s, "
+        f"two-stage unchanged {cached_time:.3f} s"
+    )
+    assert converted_count == ENTRY_COUNT
+    assert cached_converted_count == 0
+    expected_bytes = expected_msb.to_bytes()
+    assert msb.to_bytes() == expected_bytes
+    assert cached_msb.to_bytes() == expected_bytes
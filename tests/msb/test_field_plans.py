@@ -0,0 +1,184 @@
+"""Compare compiled `FieldAdapterPlan`s of DS1 MSB Events with their field adapters called one by one (requires
+`bpy`).
+
+Run with `-s` to print benchmark times.
+"""
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from soulstruct.darksouls1ptde.maps.events import MSBSoundEvent, MSBVFXEvent, MSBWindEvent
+from soulstruct.utilities.maths import Vector3
+
+from soulstruct.blender.msb.properties import (
+    MSBEventProps,
+    MSBSoundEventProps,
+    MSBVFXEventProps,
+    MSBWindEventProps,
+)
+from soulstruct.blender.msb.types.adapters import MSBReferenceFieldAdapter
+from soulstruct.blender.msb.types.darksouls1ptde.events import (
+    BlenderMSBSoundEvent,
+    BlenderMSBVFXEvent,
+    BlenderMSBWindEvent,
+)
+
+BENCHMARK_COUNT = 2000
+SUBTYPE_PROPS = {
+    "MSB_SOUND": MSBSoundEventProps,
+    "MSB_VFX": MSBVFXEventProps,
+    "MSB_WIND": MSBWindEventProps,
+}
+
+
+def _new_msb_events(rng: np.random.Generator, index: int) -> list:
+    def vector():
+        return Vector3(rng.uniform(-10.0, 10.0, 3).tolist())
+
+    def type_kwargs(name: str):
+        return dict(name=f"{name} {index}", entity_id=int(rng.integers(-1, 10000)), unknowns=[index, 0, 1, 2])
+
+    return [
+        MSBSoundEvent(
+            sound_type=int(rng.integers(0, 3)), sound_id=int(rng.integers(0, 10000)), **type_kwargs("Sound")
+        ),
+        MSBVFXEvent(vfx_id=int(rng.integers(0, 10000)), **type_kwargs("VFX")),
+        MSBWindEvent(
+            wind_vector_min=vector(),
+            unk_x0c=float(rng.uniform()),
+            wind_vector_max=vector(),
+            unk_x1c=float(rng.uniform()),
+            wind_swing_cycles=[float(x) for x in rng.uniform(size=4)],
+            wind_swing_powers=[float(x) for x in rng.uniform(size=4)],
+            **type_kwargs("Wind"),
+        ),
+    ]
+
+
+_BL_EVENT_CLASSES = {
+    MSBSoundEvent: BlenderMSBSoundEvent,
+    MSBVFXEvent: BlenderMSBVFXEvent,
+    MSBWindEvent: BlenderMSBWindEvent,
+}
+
+
+def _get_fields(bl_event_class) -> list:
+    return [
+        field for field in bl_event_class.TYPE_FIELDS + bl_event_class.SUBTYPE_FIELDS
+        if not isinstance(field, MSBReferenceFieldAdapter)
+    ]
+
+
+def _import_per_field(operator, context, msb_event, bl_event):
+    """Original `_read_props_from_soulstruct_obj()`."""
+    for field in _get_fields(type(bl_event)):
+        field.soulstruct_to_blender(operator, context, msb_event, bl_event)
+
+
+def _export_per_field(operator, context, bl_event, msb_event):
+    """Original `_write_props_to_soulstruct_obj()` for non-reference fields."""
+    for field in _get_fields(type(bl_event)):
+        field.blender_to_soulstruct(operator, context, bl_event, msb_event)
+    return msb_event
+
+
+def _export_with_plan(operator, context, bl_event, msb_event):
+    """Current `_write_props_to_soulstruct_obj()`, as in `write_soulstruct_obj_snapshot()`."""
+    plan = bl_event.get_field_plan()
+    plan.write_soulstruct_values(msb_event, plan.read_blender_values(operator, context, bl_event))
+    return msb_event
+
+
+def _new_bl_event(msb_event, name: str):
+    bl_event_class = _BL_EVENT_CLASSES[type(msb_event)]
+    return bl_event_class.new(name, None)
+
+
+def _get_props_values(bl_event) -> dict:
+    values = {}
+    for props_name in ("MSB_EVENT", bl_event.MSB_ENTRY_SUBTYPE):
+        props = getattr(bl_event.obj, props_name)
+        for prop_name in props.bl_rna.properties.keys():
+            if prop_name not in {"rna_type", "name"}:
+                value = getattr(props, prop_name)
+                if hasattr(value, "__len__") and not isinstance(value, str):
+                    value = tuple(value)  # copy arrays
+                values[props_name, prop_name] = value
+    return values
+
+
+def _get_entry_values(msb_event) -> dict:
+    return {field.name: getattr(msb_event, field.name) for field in msb_event.get_entry_fields()}
+
+
+@pytest.fixture
+def event_props():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bpy.utils.register_class(MSBEventProps)
+    bpy.types.Object.soulstruct_type = bpy.props.StringProperty()
+    bpy.types.Object.MSB_EVENT = bpy.props.PointerProperty(type=MSBEventProps)
+    for props_name, props_class in SUBTYPE_PROPS.items():
+        bpy.utils.register_class(props_class)
+        setattr(bpy.types.Object, props_name, bpy.props.PointerProperty(type=props_class))
+    yield
+    for props_name, props_class in SUBTYPE_PROPS.items():
+        delattr(bpy.types.Object, props_name)
+        bpy.utils.unregister_class(props_class)
+    del bpy.types.Object.MSB_EVENT
+    del bpy.types.Object.soulstruct_type
+    bpy.utils.unregister_class(MSBEventProps)
+
+
+def test_plans_match_field_adapters(event_props):
+    context = bpy.context
+    operator = SimpleNamespace()
+    rng = np.random.default_rng(0)
+    msb_events = [msb_event for i in range(BENCHMARK_COUNT) for msb_event in _new_msb_events(rng, i)]
+
+    # Import.
+    plan_bl_events = []
+    field_bl_events = []
+    for i, msb_event in enumerate(msb_events):
+        plan_bl_events.append(_new_bl_event(msb_event, f"Plan {i}"))
+        field_bl_events.append(_new_bl_event(msb_event, f"Field {i}"))
+    start = time.perf_counter()
+    for msb_event, bl_event in zip(msb_events, field_bl_events):
+        _import_per_field(operator, context, msb_event, bl_event)
+    old_import_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for msb_event, bl_event in zip(msb_events, plan_bl_events):
+        bl_event._read_props_from_soulstruct_obj(operator, context, msb_event)
+    new_import_time = time.perf_counter() - start
+    for plan_bl_event, field_bl_event in zip(plan_bl_events, field_bl_events):
+        assert _get_props_values(plan_bl_event) == _get_props_values(field_bl_event)
+    assert tuple(plan_bl_events[-1].wind_vector_min) == pytest.approx(tuple(msb_events[-1].wind_vector_min))
+
+    # Export. New entries are created first, as their (validated) creation takes as long as conversion.
+    field_msb_events = [bl_event._create_soulstruct_obj() for bl_event in plan_bl_events]
+    plan_msb_events = [bl_event._create_soulstruct_obj() for bl_event in plan_bl_events]
+    start = time.perf_counter()
+    for bl_event, msb_event in zip(plan_bl_events, field_msb_events):
+        _export_per_field(operator, context, bl_event, msb_event)
+    old_export_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for bl_event, msb_event in zip(plan_bl_events, plan_msb_events):
+        _export_with_plan(operator, context, bl_event, msb_event)
+    new_export_time = time.perf_counter() - start
+    for plan_msb_event, field_msb_event in zip(plan_msb_events, field_msb_events):
+        assert _get_entry_values(plan_msb_event) == _get_entry_values(field_msb_event)
+    assert plan_msb_events[0].sound_id == msb_events[0].sound_id
+    assert plan_msb_events[0].unknowns == [0, 0, 1, 2]
+    # Snapshot export uses the same plan.
+    snapshot_msb_event = plan_bl_events[-1].write_soulstruct_obj_snapshot(
+        *plan_bl_events[-1].read_soulstruct_obj_snapshot(operator, context)
+    )
+    assert _get_entry_values(snapshot_msb_event) == _get_entry_values(field_msb_events[-1])
+
+    print(
+        f"\n{len(msb_events)} MSB Events: import per field {old_import_time:.3f} s, plan {new_import_time:.3f} s; "
+        f"export per field {old_export_time:.3f} s, plan {new_export_time:.3f} s"
+    )
@@ -0,0 +1,94 @@
+"""Test the Armature data shared by all Part Armatures of a FLVER model (requires `bpy`)."""
+import time
+from types import SimpleNamespace
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from soulstruct.blender.msb.types.base.part_armature_duplicator import PartArmatureDuplicator
+
+
+def _new_armature_obj(name: str, bone_count: int) -> bpy.types.Object:
+    context = bpy.context
+    armature_obj = bpy.data.objects.new(name, bpy.data.armatures.new(name))
+    context.scene.collection.objects.link(armature_obj)
+    context.view_layer.objects.active = armature_obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    parent_bone = None
+    for i in range(bone_count):
+        bone = armature_obj.data.edit_bones.new(f"Bone{i}")
+        bone.head = (i, 0, 0)
+        bone.tail = (i, 0.1, 0)
+        if i % 10:
+            bone.parent = parent_bone
+        parent_bone = bone
+    bpy.ops.object.mode_set(mode="OBJECT")
+    return armature_obj
+
+
+@pytest.fixture
+def model_armature_obj():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    return _new_armature_obj("c1234", 100)
+
+
+def test_part_root_bone_created_once_per_model(model_armature_obj, monkeypatch):
+    context = bpy.context
+    bl_flver = SimpleNamespace(armature=model_armature_obj)
+    other_obj = _new_armature_obj("c5678", 10)
+    other_obj.select_set(True)
+
+    create_calls = []
+    create_part_root_bone = PartArmatureDuplicator._create_part_root_bone
+
+    def counting_create_part_root_bone(*args):
+        create_calls.append(time.perf_counter())
+        create_part_root_bone(*args)
+        create_calls[-1] = time.perf_counter() - create_calls[-1]
+
+    monkeypatch.setattr(PartArmatureDuplicator, "_create_part_root_bone", staticmethod(counting_create_part_root_bone))
+
+    start = time.perf_counter()
+    part_datas = {PartArmatureDuplicator._get_part_armature_data(context, bl_flver) for _ in range(500)}
+    total_time = time.perf_counter() - start
+    print(f"500 Parts: {total_time:.4f} s total, {create_calls[0]:.4f} s for the single Edit Mode session.")
+
+    assert len(create_calls) == 1
+    assert len(part_datas) == 1
+    part_data = part_datas.pop()
+    assert part_data.name == "c1234 <PART>"
+    assert "<PART_ROOT>" in part_data.bones
+    assert all(bone.parent for bone in part_data.bones if bone.name != "<PART_ROOT>")
+    assert "<PART_ROOT>" not in model_armature_obj.data.bones  # model data never modified
+
+    # Other selected Armature was not pulled into Edit Mode, and is still selected.
+    assert other_obj.mode == "OBJECT"
+    assert "<PART_ROOT>" not in other_obj.data.bones
+    assert other_obj.select_get()
+
+
+def test_part_armature_data_rebuilt_after_model_change(model_armature_obj):
+    context = bpy.context
+    bl_flver = SimpleNamespace(armature=model_armature_obj)
+    old_part_data = PartArmatureDuplicator._get_part_armature_data(context, bl_flver)
+    old_part_data.use_fake_user = True  # stand-in for an existing Part using it
+
+    # Unchanged model reuses the same data.
+    assert PartArmatureDuplicator._get_part_armature_data(context, bl_flver) == old_part_data
+
+    model_armature_obj.data.bones["Bone5"].name = "Renamed"
+    new_part_data = PartArmatureDuplicator._get_part_armature_data(context, bl_flver)
+    assert new_part_data != old_part_data
+    assert new_part_data.name == "c1234 <PART>"
+    assert "Renamed" in new_part_data.bones
+    assert old_part_data.name == "c1234 <PART> <OLD>"  # kept for existing Parts
+
+    context.view_layer.objects.active = model_armature_obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    model_armature_obj.data.edit_bones["Bone7"].tail = (7, 0.5, 0)
+    bpy.ops.object.mode_set(mode="OBJECT")
+    newer_part_data = PartArmatureDuplicator._get_part_armature_data(context, bl_flver)
+    assert newer_part_data != new_part_data
+    assert newer_part_data.bones["Bone7"].length == pytest.approx(0.5)
+    assert "c1234 <PART>.001" not in bpy.data.armatures  # unused stale data was removed
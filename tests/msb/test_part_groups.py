@@ -0,0 +1,134 @@
+"""Compare packed-mask `BatchSetPartGroups` and `CopyDrawGroups` with their original per-Part `BitSet` edits on a
+synthetic selection of MSB Navmesh Parts (requires `bpy`)."""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from soulstruct.base.maps.msb.utils import BitSet128
+from soulstruct.games import DARK_SOULS_PTDE
+
+from soulstruct.blender.msb.misc_operators import BatchSetPartGroups, CopyDrawGroups
+from soulstruct.blender.msb.properties import MSBNavmeshProps, MSBPartProps
+from soulstruct.blender.msb.types.darksouls1ptde import BlenderMSBNavmesh
+
+PART_COUNT = 50
+GROUP_PROPS = {"draw_groups": "MSB_PART", "display_groups": "MSB_PART", "navmesh_groups": "MSB_NAVMESH"}
+
+
+def _get_groups(obj: bpy.types.Object, field_name: str) -> BitSet128:
+    props = getattr(obj, GROUP_PROPS[field_name])
+    return BitSet128({
+        32 * i + j for i in range(4) for j, bit in enumerate(getattr(props, f"{field_name}_{i}")) if bit
+    })
+
+
+def _set_groups(obj: bpy.types.Object, field_name: str, groups: BitSet128):
+    props = getattr(obj, GROUP_PROPS[field_name])
+    for i in range(4):
+        setattr(props, f"{field_name}_{i}", [32 * i + j in groups.enabled_bits for j in range(32)])
+
+
+def _batch_set_per_part(objs: list[bpy.types.Object], operation: str, groups_by_field: dict[str, set[int]]):
+    """Original `BatchSetPartGroups.execute()`, with each Part's groups read and written as a `BitSet`."""
+    for obj in objs:
+        for field_name, groups in groups_by_field.items():
+            bit_set = BitSet128(groups)
+            if operation == "SET":
+                _set_groups(obj, field_name, bit_set)
+            elif operation == "ADD":
+                _set_groups(obj, field_name, _get_groups(obj, field_name) | bit_set)
+            elif operation == "REMOVE":
+                _set_groups(obj, field_name, _get_groups(obj, field_name) - bit_set)
+
+
+def _new_part_objs(prefix: str, rng: np.random.Generator) -> list[bpy.types.Object]:
+    objs = []
+    for i in range(PART_COUNT):
+        obj = bpy.data.objects.new(f"{prefix} {i}", None)
+        obj.soulstruct_type = "MSB_PART"
+        obj.MSB_PART.entry_subtype = "MSB_NAVMESH"
+        bpy.context.scene.collection.objects.link(obj)
+        for field_name in GROUP_PROPS:
+            _set_groups(obj, field_name, BitSet128(set(np.flatnonzero(rng.random(128) < 0.3).tolist())))
+        objs.append(obj)
+    return objs
+
+
+def _select(objs: list[bpy.types.Object], active: bpy.types.Object = None):
+    bpy.context.view_layer.update()  # add new objects to view layer
+    for obj in bpy.context.view_layer.objects:
+        obj.select_set(obj in objs)
+    bpy.context.view_layer.objects.active = active
+
+
+def _new_operator(**kwargs) -> SimpleNamespace:
+    return SimpleNamespace(
+        settings=lambda _: SimpleNamespace(game=DARK_SOULS_PTDE),
+        info=lambda msg: None,
+        error=lambda msg: pytest.fail(msg),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def part_props():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bpy.utils.register_class(MSBPartProps)
+    bpy.utils.register_class(MSBNavmeshProps)
+    bpy.types.Object.soulstruct_type = bpy.props.StringProperty()
+    bpy.types.Object.MSB_PART = bpy.props.PointerProperty(type=MSBPartProps)
+    bpy.types.Object.MSB_NAVMESH = bpy.props.PointerProperty(type=MSBNavmeshProps)
+    yield
+    del bpy.types.Object.MSB_NAVMESH
+    del bpy.types.Object.MSB_PART
+    del bpy.types.Object.soulstruct_type
+    bpy.utils.unregister_class(MSBNavmeshProps)
+    bpy.utils.unregister_class(MSBPartProps)
+
+
+@pytest.mark.parametrize("operation", ["SET", "ADD", "REMOVE"])
+def test_batch_set_part_groups_matches_per_part(part_props, operation):
+    expected_objs = _new_part_objs("Expected", np.random.default_rng(0))
+    objs = _new_part_objs("Part", np.random.default_rng(0))
+    unselected_obj = objs.pop()
+    unselected_groups = {field_name: _get_groups(unselected_obj, field_name) for field_name in GROUP_PROPS}
+    groups_by_field = {"draw_groups": {0, 31, 32, 100, 127}, "navmesh_groups": {1, 2, 64}}
+    _batch_set_per_part(expected_objs[:-1], operation, groups_by_field)
+
+    _select(objs)
+    operator = _new_operator(
+        operation=operation, draw_groups="[0, 31, 32, 100, 127]", display_groups="", navmesh_groups="{1, 2, 64}"
+    )
+    assert BatchSetPartGroups.execute(operator, bpy.context) == {"FINISHED"}
+
+    for expected_obj, obj in zip(expected_objs, objs):
+        for field_name in GROUP_PROPS:
+            assert _get_groups(obj, field_name) == _get_groups(expected_obj, field_name), field_name
+    for field_name in GROUP_PROPS:
+        assert _get_groups(unselected_obj, field_name) == unselected_groups[field_name]
+
+
+def test_copy_draw_groups_matches_per_part(part_props):
+    expected_objs = _new_part_objs("Expected", np.random.default_rng(1))
+    objs = _new_part_objs("Part", np.random.default_rng(1))
+    for expected_obj in expected_objs[1:]:
+        _set_groups(expected_obj, "draw_groups", _get_groups(expected_objs[0], "draw_groups"))
+
+    _select(objs, active=objs[0])
+    assert CopyDrawGroups.execute(_new_operator(), bpy.context) == {"FINISHED"}
+
+    for expected_obj, obj in zip(expected_objs, objs):
+        for field_name in GROUP_PROPS:
+            assert _get_groups(obj, field_name) == _get_groups(expected_obj, field_name), field_name
+
+
+def test_empty_props_list(part_props):
+    groups_adapter = next(
+        field for field in BlenderMSBNavmesh.TYPE_FIELDS if field.soulstruct_field_name == "draw_groups"
+    )
+    masks = groups_adapter.read_masks([])
+    assert masks.shape == (0, 4)
+    groups_adapter.write_masks([], masks)
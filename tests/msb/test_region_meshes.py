@@ -0,0 +1,89 @@
+"""Test the unit Meshes shared by MSB Regions of each shape (requires `bpy`)."""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from soulstruct.base.maps.msb.region_shapes import RegionShapeType
+
+from soulstruct.blender.msb.misc_operators import ShareMSBRegionMeshes
+from soulstruct.blender.msb.types.darksouls1ptde.regions import BlenderMSBRegion
+from soulstruct.blender.msb.utilities import *
+
+SHAPE_DIMENSIONS = {
+    RegionShapeType.Point: {},
+    RegionShapeType.Circle: dict(radius=2.0),
+    RegionShapeType.Sphere: dict(radius=3.0),
+    RegionShapeType.Cylinder: dict(radius=1.5, height=4.0),
+    RegionShapeType.Rect: dict(width=2.0, depth=3.0),
+    RegionShapeType.Box: dict(width=2.0, depth=3.0, height=4.0),
+}
+
+
+def test_importing_regions_creates_one_mesh_per_shape(region_props):
+    operator = SimpleNamespace(to_object_mode=lambda context: None)
+    region_count = 50
+    bl_regions = {shape_type: [] for shape_type in SHAPE_DIMENSIONS}
+    for i in range(region_count):
+        for shape_type, dimensions in SHAPE_DIMENSIONS.items():
+            bl_regions[shape_type].append(
+                BlenderMSBRegion.new_from_shape_type(
+                    operator, bpy.context, shape_type, f"{shape_type.name} {i}", **dimensions
+                )
+            )
+
+    assert len(bpy.data.meshes) == len(SHAPE_DIMENSIONS)
+    for shape_type, shape_regions in bl_regions.items():
+        shared_mesh = get_region_shape_mesh(shape_type.name)
+        assert all(bl_region.obj.data == shared_mesh for bl_region in shape_regions)
+        assert shared_mesh.users == region_count
+        assert is_shared_region_shape_mesh(shared_mesh)
+    # Sphere and Cylinder Regions are no longer boxes.
+    box_vertex_count = len(get_region_shape_mesh("Box").vertices)
+    assert len(get_region_shape_mesh("Sphere").vertices) != box_vertex_count
+    assert len(get_region_shape_mesh("Cylinder").vertices) != box_vertex_count
+
+    # Dimensions are still applied to object scale.
+    box_region = bl_regions[RegionShapeType.Box][0]
+    bpy.context.view_layer.update()
+    np.testing.assert_allclose(box_region.obj.scale, (2.0, 3.0, 4.0))
+
+
+def _new_old_region_obj(name: str, shape_name: str, primitive) -> bpy.types.Object:
+    """Region from an older file, which owns a copy of its shape Mesh made by `primitive`."""
+    mesh = bpy.data.meshes.new(name)
+    primitive(mesh)
+    obj = bpy.data.objects.new(name, mesh)
+    obj.soulstruct_type = "MSB_REGION"
+    obj.MSB_REGION["shape_type"] = list(SHAPE_DIMENSIONS).index(RegionShapeType[shape_name])  # no update callback
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def test_share_region_meshes_keeps_edited_meshes(region_props):
+    old_sphere_obj = _new_old_region_obj("Sphere", "Sphere", primitive_cube)  # older versions imported boxes
+    old_box_obj = _new_old_region_obj("Box", "Box", primitive_cube)
+    edited_box_obj = _new_old_region_obj("Edited Box", "Box", primitive_cube)
+    edited_box_obj.data.vertices[0].co.z -= 1.0
+    edited_mesh = edited_box_obj.data
+    old_mesh_names = {old_sphere_obj.data.name, old_box_obj.data.name}
+
+    messages = []
+    operator = SimpleNamespace(info=messages.append, warning=messages.append)
+    assert ShareMSBRegionMeshes.execute(operator, bpy.context) == {"FINISHED"}
+
+    assert old_sphere_obj.data == get_region_shape_mesh("Sphere")
+    assert old_box_obj.data == get_region_shape_mesh("Box")
+    assert edited_box_obj.data == edited_mesh
+    assert not old_mesh_names & set(bpy.data.meshes.keys())  # unused copies are deleted
+    assert messages == [
+        "Kept the edited Meshes of 1 MSB Regions: Edited Box",
+        "2 MSB Regions now use shared shape Meshes.",
+    ]
+
+    # Nothing changes the second time.
+    messages.clear()
+    ShareMSBRegionMeshes.execute(operator, bpy.context)
+    assert messages[-1] == "0 MSB Regions now use shared shape Meshes."
@@ -0,0 +1,67 @@
+"""Test and measure MSB Region scale drivers against direct scale writes (requires `bpy`).
+
+Run with `-s` to print `view_layer.update()` times for 5000 Regions.
+"""
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from soulstruct.base.maps.msb.region_shapes import RegionShapeType
+
+from soulstruct.blender.msb.misc_operators import ConvertRegionScaleMode
+from soulstruct.blender.msb.types.darksouls1ptde.regions import BlenderMSBRegion
+from soulstruct.blender.msb.utilities import has_region_scale_drivers
+
+REGION_COUNT = 5000
+
+
+def _get_scales(objs: list[bpy.types.Object]) -> np.ndarray:
+    return np.array([tuple(obj.scale) for obj in objs])
+
+
+def _time_updates(objs: list[bpy.types.Object], update_count=20) -> float:
+    """Time `view_layer.update()` after moving one Region, as when dragging an object in the viewport."""
+    view_layer = bpy.context.view_layer
+    view_layer.update()
+    start = time.perf_counter()
+    for i in range(update_count):
+        objs[i].location.x += 1.0
+        view_layer.update()
+    return (time.perf_counter() - start) / update_count
+
+
+def test_region_scale_modes_benchmark(region_props):
+    context = bpy.context
+    context.scene.msb_tool_settings.use_region_scale_drivers = True
+    operator = SimpleNamespace(to_object_mode=lambda _: None, info=lambda msg: None)
+    rng = np.random.default_rng(0)
+    objs = []
+    for i in range(REGION_COUNT):
+        width, depth, height = rng.uniform(0.5, 10.0, 3)
+        bl_region = BlenderMSBRegion.new_from_shape_type(
+            operator, context, RegionShapeType.Box, f"Region {i}", width=width, depth=depth, height=height
+        )
+        objs.append(bl_region.obj)
+    context.view_layer.update()
+    driver_scales = _get_scales(objs)
+    assert all(has_region_scale_drivers(obj) for obj in objs)
+    driver_time = _time_updates(objs)
+
+    context.scene.msb_tool_settings.use_region_scale_drivers = False
+    assert ConvertRegionScaleMode.execute(operator, context) == {"FINISHED"}
+    assert not any(has_region_scale_drivers(obj) for obj in objs)
+    np.testing.assert_allclose(_get_scales(objs), driver_scales, rtol=1e-6)  # conversion keeps scale
+    direct_time = _time_updates(objs)
+
+    print(
+        f"\n`view_layer.update()` with {REGION_COUNT} Regions: drivers {1000 * driver_time:.2f} ms, "
+        f"direct scale {1000 * direct_time:.2f} ms"
+    )
+
+    # Shape dimensions are still written to scale without drivers.
+    objs[0].MSB_REGION.shape_y = 12.0
+    assert objs[0].scale.y == pytest.approx(12.0)
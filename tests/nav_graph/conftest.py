@@ -0,0 +1,37 @@
+"""Fixtures for nav graph tests that need MCG objects (requires `bpy`)."""
+import pytest
+
+
+@pytest.fixture
+def mcg_props():
+    """Register only the property groups that MCG objects and MCG operators use, in a new empty file."""
+    bpy = pytest.importorskip("bpy")
+    from soulstruct.blender.nav_graph.draw_mcg import MCGDrawSettings
+    from soulstruct.blender.nav_graph.properties import (
+        MCGEdgeProps,
+        MCGNodeProps,
+        MCGProps,
+        NavGraphComputeSettings,
+        NVMFaceIndex,
+    )
+
+    props_classes = {"MCG": MCGProps, "MCG_NODE": MCGNodeProps, "MCG_EDGE": MCGEdgeProps}
+    settings_classes = {"mcg_draw_settings": MCGDrawSettings, "nav_graph_compute_settings": NavGraphComputeSettings}
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bpy.utils.register_class(NVMFaceIndex)
+    bpy.types.Object.soulstruct_type = bpy.props.StringProperty()
+    for props_name, props_class in props_classes.items():
+        bpy.utils.register_class(props_class)
+        setattr(bpy.types.Object, props_name, bpy.props.PointerProperty(type=props_class))
+    for settings_name, settings_class in settings_classes.items():
+        bpy.utils.register_class(settings_class)
+        setattr(bpy.types.Scene, settings_name, bpy.props.PointerProperty(type=settings_class))
+    yield
+    for settings_name, settings_class in settings_classes.items():
+        delattr(bpy.types.Scene, settings_name)
+        bpy.utils.unregister_class(settings_class)
+    for props_name, props_class in props_classes.items():
+        delattr(bpy.types.Object, props_name)
+        bpy.utils.unregister_class(props_class)
+    del bpy.types.Object.soulstruct_type
+    bpy.utils.unregister_class(NVMFaceIndex)
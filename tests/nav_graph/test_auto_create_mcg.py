@@ -0,0 +1,344 @@
+"""Compare `AutoCreateMCG` nodes and edges with its original `BMesh` and per-edge `get_best_cost()` version on
+synthetic maps of MSB Navmesh Parts (requires `bpy`)."""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+bmesh = pytest.importorskip("bmesh")
+
+from mathutils import Vector
+
+from soulstruct.base.events.enums import NavmeshFlag
+
+from soulstruct.blender.msb.properties import MSBNavmeshProps, MSBPartProps
+from soulstruct.blender.nav_graph.misc_operators import AutoCreateMCG
+from soulstruct.blender.nav_graph.types import BlenderMCG
+from soulstruct.blender.nav_graph.utilities import get_best_cost
+
+MAP_STEM = "m10_00_00_00"
+TILE_SIZE = 6
+# Model IDs of navmesh tiles in a 3x2 grid, which are not their indices in the collection.
+TILE_MODEL_IDS = {(0, 0): 0, (1, 0): 1, (2, 0): 2, (0, 1): 10, (1, 1): 11, (2, 1): 12}
+# `(start, length)` of every strip of 'Exit' quads along the border between two neighboring tiles.
+BORDER_EXIT_STRIPS = {
+    ((0, 0), (1, 0)): [(1, 3)],
+    ((1, 0), (2, 0)): [(1, 1), (3, 2)],  # two nodes between the same navmeshes
+    ((0, 0), (0, 1)): [(2, 2)],
+    ((1, 0), (1, 1)): [(1, 4)],
+    ((2, 0), (2, 1)): [(2, 3)],
+    ((0, 1), (1, 1)): [(2, 2)],
+}
+
+
+class _AutoCreateMCG:
+    """`AutoCreateMCG` methods on a plain object, which discards logs and fails the test on errors."""
+
+    auto_create_mcg = AutoCreateMCG.auto_create_mcg
+    _create_mcg_nodes = AutoCreateMCG._create_mcg_nodes
+    _create_mcg_edges = staticmethod(AutoCreateMCG._create_mcg_edges)
+
+    def info(self, msg):
+        pass
+
+    def warning(self, msg):
+        pass
+
+    def error(self, msg):
+        pytest.fail(msg)
+
+
+def _new_navmesh(
+    collection: bpy.types.Collection,
+    name: str,
+    quads: list[tuple[int, int]],
+    exit_quads=(),
+    obstacle_quads=(),
+    flipped_quads=(),
+    location=(0.0, 0.0, 0.0),
+) -> bpy.types.Object:
+    """Navmesh Part with two triangles in each unit quad (split along the other diagonal in `flipped_quads`)."""
+    vert_indices = {}
+    faces = []
+    face_flags = []
+    for x, y in quads:
+        corners = ((x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1))
+        v = [vert_indices.setdefault(corner, len(vert_indices)) for corner in corners]
+        if (x, y) in flipped_quads:
+            faces += [(v[0], v[1], v[3]), (v[1], v[2], v[3])]
+        else:
+            faces += [(v[0], v[1], v[2]), (v[0], v[2], v[3])]
+        flags = NavmeshFlag.Exit if (x, y) in exit_quads else NavmeshFlag.Obstacle if (x, y) in obstacle_quads else 0
+        face_flags += [flags] * 2
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata([(x, y, 0.0) for x, y in vert_indices], [], faces)
+    mesh.attributes.new("nvm_face_flags", "INT", "FACE").data.foreach_set("value", face_flags)
+    obj = bpy.data.objects.new(name, mesh)
+    obj.soulstruct_type = "MSB_PART"
+    obj.MSB_PART.entry_subtype = "MSB_NAVMESH"
+    obj.location = location
+    collection.objects.link(obj)
+    return obj
+
+
+def _new_tile_map(collection: bpy.types.Collection):
+    """Grid of square navmesh tiles, each with random Obstacle quads and 'Exit' quad strips on its borders."""
+    exit_quads = {tile: set() for tile in TILE_MODEL_IDS}
+    for (tile_a, tile_b), strips in BORDER_EXIT_STRIPS.items():
+        is_vertical = tile_a[0] == tile_b[0]
+        for start, length in strips:
+            for i in range(start, start + length):
+                exit_quads[tile_a].add((i, TILE_SIZE - 1) if is_vertical else (TILE_SIZE - 1, i))
+                exit_quads[tile_b].add((i, 0) if is_vertical else (0, i))
+    rng = np.random.default_rng(0)
+    quads = [(x, y) for y in range(TILE_SIZE) for x in range(TILE_SIZE)]
+    for (col, row), model_id in TILE_MODEL_IDS.items():
+        obstacle_quads = {quad for quad in quads if rng.random() < 0.2}
+        _new_navmesh(
+            collection,
+            f"n{model_id:04d} B0",
+            quads,
+            exit_quads[col, row],
+            obstacle_quads - exit_quads[col, row],
+            location=(TILE_SIZE * col, TILE_SIZE * row, 0.0),
+        )
+
+
+def _get_old_exit_clusters(navmesh: bpy.types.Object) -> tuple:
+    """Original `AutoCreateMCG.get_navmesh_exit_clusters()`, with faces replaced by their indices.
+
+    Uses the navmesh object's location, as the original `navmesh_part.location` was always `None` for Parts.
+    """
+    bm = bmesh.new()
+    bm.from_mesh(navmesh.data)
+    bm.faces.ensure_lookup_table()
+    flags_layer = bm.faces.layers.int.get("nvm_face_flags")
+
+    exit_clusters = []
+    checked = []
+    for face in bm.faces:
+        if face in checked:
+            continue
+        checked.append(face)
+
+        if face[flags_layer] & NavmeshFlag.Exit:
+            cluster = []
+            stack = [face]
+            while stack:
+                f = stack.pop()
+                if f in cluster:
+                    continue
+                cluster.append(f)
+                for edge in f.edges:
+                    for other_face in edge.link_faces:
+                        if other_face in checked:
+                            continue
+                        checked.append(other_face)
+                        if other_face not in cluster and other_face[flags_layer] & NavmeshFlag.Exit:
+                            stack.append(other_face)
+            exit_clusters.append(tuple(
+                (f.index, frozenset(tuple(v.co + navmesh.location) for v in f.verts)) for f in cluster
+            ))
+
+    bm.free()
+    return tuple(exit_clusters)
+
+
+def _get_old_mcg(navmeshes: list[bpy.types.Object], exit_sq_dist: float) -> tuple[list[dict], list[dict]]:
+    """Original `AutoCreateMCG._create_mcg_nodes()` and `_create_mcg_edges()`, returning plain node and edge dicts
+    instead of creating MCG objects."""
+    navmesh_exit_clusters = [_get_old_exit_clusters(navmesh) for navmesh in navmeshes]
+    nodes = []
+    navmesh_nodes_and_keys = [[] for _ in navmeshes]
+    all_nodes = set()
+    navmesh_pair_nodes = {}
+
+    for nav_index, (navmesh, exit_clusters) in enumerate(zip(navmeshes, navmesh_exit_clusters)):
+        navmesh_model_id = int(navmesh.name[1:5])
+        for cluster in exit_clusters:
+            for face, face_verts in cluster:
+                for other_nav_index, (other_navmesh, other_exit_clusters) in enumerate(
+                    zip(navmeshes, navmesh_exit_clusters)
+                ):
+                    if nav_index >= other_nav_index:
+                        continue
+                    other_navmesh_id = int(other_navmesh.name[1:5])
+                    for other_cluster in other_exit_clusters:
+                        if navmesh_model_id < other_navmesh_id:
+                            model_pair_key = (navmesh_model_id, other_navmesh_id)
+                            node_key = (cluster, other_cluster)
+                        else:
+                            model_pair_key = (other_navmesh_id, navmesh_model_id)
+                            node_key = (other_cluster, cluster)
+                        if (model_pair_key, node_key) in all_nodes:
+                            continue
+
+                        for other_face, other_face_verts in other_cluster:
+                            hits = 0
+                            for v in face_verts:
+                                for ov in other_face_verts:
+                                    if sum((v[i] - ov[i]) ** 2 for i in range(3)) < exit_sq_dist:
+                                        hits += 1
+                                        if hits >= 2:
+                                            break
+                                else:
+                                    continue
+                                break
+                            if hits < 2:
+                                continue
+
+                            node_name = f"{MAP_STEM} Node [{model_pair_key[0]} | {model_pair_key[1]}]"
+                            if model_pair_key in navmesh_pair_nodes:
+                                index = len(navmesh_pair_nodes[model_pair_key])
+                                if index == 1:
+                                    navmesh_pair_nodes[model_pair_key][0]["name"] += " (0)"
+                                node_name += f" ({index})"
+                            else:
+                                navmesh_pair_nodes[model_pair_key] = []
+
+                            node_position = Vector()
+                            v_count = 0
+                            for _, f_verts in cluster + other_cluster:
+                                for v in f_verts:
+                                    node_position += Vector(v)
+                                    v_count += 1
+                            node_position /= v_count
+
+                            node = dict(name=node_name, location=tuple(node_position))
+                            navmesh_pair_nodes[model_pair_key].append(node)
+                            if navmesh_model_id > other_navmesh_id:
+                                navmesh, other_navmesh = other_navmesh, navmesh
+                                cluster, other_cluster = other_cluster, cluster
+                                navmesh_model_id, other_navmesh_id = other_navmesh_id, navmesh_model_id
+                            node |= dict(
+                                navmesh_a=navmesh.name,
+                                navmesh_a_triangles=[f for f, _ in cluster],
+                                navmesh_b=other_navmesh.name,
+                                navmesh_b_triangles=[f for f, _ in other_cluster],
+                            )
+                            nodes.append(node)
+                            all_nodes.add((model_pair_key, node_key))
+                            navmesh_nodes_and_keys[nav_index].append(node)
+                            navmesh_nodes_and_keys[other_nav_index].append(node)
+
+    edges = []
+    for navmesh, navmesh_nodes in zip(navmeshes, navmesh_nodes_and_keys):
+        if len(navmesh_nodes) == 1:
+            navmesh_nodes[0]["name"] += " <DEAD END>"
+            continue
+        for i, node_a in enumerate(navmesh_nodes):
+            for node_b in navmesh_nodes[i + 1:]:
+                start_face_i = min(_get_node_triangles(node_a, navmesh.name))
+                end_face_i = min(_get_node_triangles(node_b, navmesh.name))
+                if start_face_i == end_face_i:
+                    raise ValueError(f"Node {node_a['name']} and {node_b['name']} reference the same triangle.")
+                total_cost = get_best_cost(navmesh.data, start_face_i, end_face_i)
+                edges.append(dict(
+                    node_a=node_a, node_b=node_b, navmesh_part=navmesh.name, cost=total_cost or 10000.0
+                ))
+    return nodes, edges
+
+
+def _get_node_triangles(node: dict, navmesh_name: str) -> list[int]:
+    if node["navmesh_a"] == navmesh_name:
+        return node["navmesh_a_triangles"]
+    return node["navmesh_b_triangles"]
+
+
+def _auto_create_mcg(collection: bpy.types.Collection) -> BlenderMCG:
+    context = SimpleNamespace(collection=collection, scene=bpy.context.scene)
+    assert _AutoCreateMCG().auto_create_mcg(context) == {"FINISHED"}
+    return BlenderMCG(bpy.context.scene.mcg_draw_settings.mcg_parent)
+
+
+def _get_node_key(name_a: str, triangles_a: list[int], name_b: str, triangles_b: list[int]) -> tuple:
+    return name_a, frozenset(triangles_a), name_b, frozenset(triangles_b)
+
+
+@pytest.fixture
+def navmesh_collection(mcg_props) -> bpy.types.Collection:
+    bpy.utils.register_class(MSBPartProps)
+    bpy.utils.register_class(MSBNavmeshProps)
+    bpy.types.Object.MSB_PART = bpy.props.PointerProperty(type=MSBPartProps)
+    bpy.types.Object.MSB_NAVMESH = bpy.props.PointerProperty(type=MSBNavmeshProps)
+    compute_settings = bpy.context.scene.nav_graph_compute_settings
+    compute_settings.obstacle_multiplier = 2.0
+    collection = bpy.data.collections.new(f"{MAP_STEM} Navmesh Parts")
+    bpy.context.scene.collection.children.link(collection)
+    yield collection
+    del bpy.types.Object.MSB_NAVMESH
+    del bpy.types.Object.MSB_PART
+    bpy.utils.unregister_class(MSBNavmeshProps)
+    bpy.utils.unregister_class(MSBPartProps)
+
+
+def test_auto_create_mcg_matches_old_output(navmesh_collection):
+    _new_tile_map(navmesh_collection)
+    navmeshes = sorted(navmesh_collection.objects, key=lambda o: o.name)
+    exit_sq_dist = bpy.context.scene.nav_graph_compute_settings.connected_exit_vertex_distance ** 2
+    old_nodes, old_edges = _get_old_mcg(navmeshes, exit_sq_dist)
+
+    ordering = _auto_create_mcg(navmesh_collection).get_ordering()
+
+    # Nodes have the same names, navmeshes, and locations. Triangles are the same, but now sorted by face index.
+    expected_nodes = {
+        _get_node_key(n["navmesh_a"], n["navmesh_a_triangles"], n["navmesh_b"], n["navmesh_b_triangles"]): n
+        for n in old_nodes
+    }
+    assert len(expected_nodes) == len(old_nodes) == len(ordering.nodes) == sum(map(len, BORDER_EXIT_STRIPS.values()))
+    for bl_node in ordering.nodes:
+        node_key = _get_node_key(
+            bl_node.navmesh_a.name, bl_node.navmesh_a_triangles, bl_node.navmesh_b.name, bl_node.navmesh_b_triangles
+        )
+        expected_node = expected_nodes[node_key]
+        assert bl_node.name == expected_node["name"]
+        assert tuple(bl_node.location) == pytest.approx(expected_node["location"])
+        assert bl_node.navmesh_a_triangles == sorted(expected_node["navmesh_a_triangles"])
+        assert bl_node.navmesh_b_triangles == sorted(expected_node["navmesh_b_triangles"])
+    assert any(
+        node["navmesh_a_triangles"] != sorted(node["navmesh_a_triangles"])
+        or node["navmesh_b_triangles"] != sorted(node["navmesh_b_triangles"])
+        for node in old_nodes
+    )  # some old triangles were in cluster traversal order
+
+    # Edges connect the same nodes through the same navmeshes, with the same costs.
+    expected_costs = {
+        (frozenset((e["node_a"]["name"], e["node_b"]["name"])), e["navmesh_part"]): e["cost"] for e in old_edges
+    }
+    edge_costs = {
+        (frozenset((bl_edge.node_a.name, bl_edge.node_b.name)), bl_edge.navmesh_part.name): bl_edge.cost
+        for bl_edge in ordering.edges
+    }
+    assert len(expected_costs) == len(old_edges) == len(edge_costs)
+    assert edge_costs == pytest.approx(expected_costs)
+    assert len(set(expected_costs.values())) > 1
+
+
+def test_one_node_per_cluster_pair(navmesh_collection):
+    """The old code created a node for every face of a cluster that touched a face of the other cluster, so a corner
+    'Exit' triangle with two edges on another navmesh got two identical nodes (and the old edge creation then failed).
+    """
+    # Flipped corner quad of n0000 has a triangle with edges on both sides of the L of Exit quads in n0001 around it.
+    _new_navmesh(
+        navmesh_collection,
+        "n0000 B0",
+        [(x, y) for y in range(4) for x in range(4)],
+        exit_quads={(3, 3), (0, 0), (0, 1)},
+        flipped_quads={(3, 3)},
+    )
+    _new_navmesh(navmesh_collection, "n0001 B0", [(4, 3), (4, 4), (3, 4)], exit_quads={(4, 3), (4, 4), (3, 4)})
+    _new_navmesh(
+        navmesh_collection, "n0002 B0", [(x, y) for y in range(2) for x in range(-2, 0)], exit_quads={(-1, 0), (-1, 1)}
+    )
+    navmeshes = sorted(navmesh_collection.objects, key=lambda o: o.name)
+    exit_sq_dist = bpy.context.scene.nav_graph_compute_settings.connected_exit_vertex_distance ** 2
+    with pytest.raises(ValueError, match="same triangle"):
+        _get_old_mcg(navmeshes, exit_sq_dist)
+
+    ordering = _auto_create_mcg(navmesh_collection).get_ordering()
+    assert sorted(bl_node.name for bl_node in ordering.nodes) == [
+        f"{MAP_STEM} Node [0 | 1] <DEAD END>", f"{MAP_STEM} Node [0 | 2] <DEAD END>"
+    ]
+    assert len(ordering.edges) == 1
+    assert ordering.edges[0].navmesh_part.name == "n0000 B0"
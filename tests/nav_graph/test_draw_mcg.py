@@ -0,0 +1,144 @@
+"""Test MCG draw geometry and draw cache rebuilds on a synthetic MCG, without any GPU calls (requires `bpy`)."""
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from soulstruct.blender.nav_graph import draw_mcg
+from soulstruct.blender.nav_graph.draw_mcg import (
+    get_mcg_draw_geometry,
+    track_mcg_draw_updates,
+    update_mcg_draw_caches,
+)
+from soulstruct.blender.nav_graph.types import BlenderMCG, BlenderMCGEdge, BlenderMCGNode
+
+NODE_LOCATIONS = [(0.0, 0.0, 0.0), (4.0, 0.0, 0.0), (4.0, 4.0, 1.0)]
+NODE_TRIANGLES = [[0, 1], [7], [16, 17]]
+
+
+@pytest.fixture
+def batches(mcg_props, monkeypatch) -> list[tuple[str, np.ndarray]]:
+    """Record batches created by `update_mcg_draw_caches()` instead of creating any on the GPU."""
+    created_batches = []
+
+    def batch_for_shader(_shader, batch_type: str, content: dict):
+        created_batches.append((batch_type, content["pos"]))
+        return batch_type
+
+    monkeypatch.setattr(draw_mcg, "_CACHED_SHADER", "UNIFORM_COLOR")
+    monkeypatch.setattr(draw_mcg, "batch_for_shader", batch_for_shader)
+    monkeypatch.setattr(draw_mcg, "_LAST_DRAWN_GEOMETRY", None)
+    monkeypatch.setattr(draw_mcg, "_MCG_DRAW_CACHES_DIRTY", True)
+    bpy.app.handlers.depsgraph_update_post.append(track_mcg_draw_updates)
+    yield created_batches
+    bpy.app.handlers.depsgraph_update_post.remove(track_mcg_draw_updates)
+    draw_mcg._REPOSITIONED_MCG_EDGE_NAMES.clear()
+
+
+def _new_mcg() -> BlenderMCG:
+    """MCG with three nodes on a 3x3 quad grid navmesh Part (moved away from the origin) and two edges."""
+    collection = bpy.context.scene.collection
+    size = 3
+    vertices = [(x, y, 0.0) for y in range(size + 1) for x in range(size + 1)]
+    faces = []
+    for y in range(size):
+        for x in range(size):
+            v = y * (size + 1) + x
+            faces += [(v, v + 1, v + size + 2), (v, v + size + 2, v + size + 1)]
+    mesh = bpy.data.meshes.new("n0000")
+    mesh.from_pydata(vertices, [], faces)
+    navmesh = bpy.data.objects.new("n0000", mesh)
+    navmesh.soulstruct_type = "MSB_PART"
+    navmesh.location = (10.0, 20.0, 30.0)
+    collection.objects.link(navmesh)
+
+    bl_mcg = BlenderMCG.new("MCG", None, collection)
+    bl_nodes = []
+    for i, (location, triangles) in enumerate(zip(NODE_LOCATIONS, NODE_TRIANGLES)):
+        bl_node = BlenderMCGNode.new(f"Node {i}", None, collection)
+        bl_node.obj.parent = bl_mcg.node_parent
+        bl_node.obj.location = location
+        bl_node.navmesh_a = navmesh
+        bl_node.navmesh_a_triangles = triangles
+        bl_nodes.append(bl_node)
+    for i in range(2):
+        bl_edge = BlenderMCGEdge.new(f"Edge {i}", None, collection)
+        bl_edge.obj.parent = bl_mcg.edge_parent
+        bl_edge.node_a = bl_nodes[i].obj
+        bl_edge.node_b = bl_nodes[i + 1].obj
+        bl_edge.navmesh_part = navmesh
+    bpy.context.scene.mcg_draw_settings.mcg_parent = bl_mcg.obj
+    bpy.context.view_layer.update()
+    return bl_mcg
+
+
+def _get_face_world_coords(navmesh: bpy.types.Object, face_indices: list[int]) -> np.ndarray:
+    return np.array([
+        tuple(navmesh.matrix_world @ navmesh.data.vertices[vertex_index].co)
+        for face_index in face_indices
+        for vertex_index in navmesh.data.polygons[face_index].vertices
+    ])
+
+
+def test_draw_geometry(mcg_props):
+    bl_mcg = _new_mcg()
+    navmesh = bpy.data.objects["n0000"]
+    draw_settings = bpy.context.scene.mcg_draw_settings
+    draw_settings.draw_selected_only = False
+    draw_settings.highlight_selected_only = False
+
+    geometry = get_mcg_draw_geometry(bl_mcg, draw_settings)
+    np.testing.assert_array_equal(geometry.node_coords, NODE_LOCATIONS)
+    np.testing.assert_array_equal(geometry.edge_coords, [NODE_LOCATIONS[i] for i in (0, 1, 1, 2)])
+    np.testing.assert_allclose(
+        geometry.triangles_a_coords, _get_face_world_coords(navmesh, NODE_TRIANGLES[0] + NODE_TRIANGLES[1])
+    )
+    np.testing.assert_allclose(
+        geometry.triangles_b_coords, _get_face_world_coords(navmesh, NODE_TRIANGLES[1] + NODE_TRIANGLES[2])
+    )
+    assert [(e.name, a.name, b.name) for e, a, b in geometry.edges_and_nodes] == [
+        ("Edge 0", "Node 0", "Node 1"), ("Edge 1", "Node 1", "Node 2")
+    ]
+
+    # Only the selected node and the edges that touch it, with no triangles for unselected edges.
+    draw_settings.draw_selected_only = True
+    draw_settings.highlight_selected_only = True
+    bpy.data.objects["Node 0"].select_set(True)
+    geometry = get_mcg_draw_geometry(bl_mcg, draw_settings)
+    np.testing.assert_array_equal(geometry.node_coords, NODE_LOCATIONS[:1])
+    np.testing.assert_array_equal(geometry.edge_coords, NODE_LOCATIONS[:2])
+    assert geometry.triangles_a_coords.shape == geometry.triangles_b_coords.shape == (0, 3)
+
+
+def test_clean_caches_not_rebuilt(batches):
+    _new_mcg()
+    draw_settings = bpy.context.scene.mcg_draw_settings
+    draw_settings.draw_selected_only = False
+    draw_settings.highlight_selected_only = False
+
+    update_mcg_draw_caches()
+    assert [batch_type for batch_type, _ in batches] == ["POINTS", "LINES", "TRIS", "TRIS"]
+    edge_0 = bpy.data.objects["Edge 0"]
+    assert tuple(edge_0.location) == pytest.approx((2.0, 0.0, 0.0))  # moved to midpoint
+
+    # Moving the edges to their midpoints does not dirty the caches again.
+    bpy.context.view_layer.update()
+    assert not draw_mcg._MCG_DRAW_CACHES_DIRTY
+    update_mcg_draw_caches()
+    assert len(batches) == 4
+
+    # Moving a node rebuilds only the node and edge batches.
+    bpy.data.objects["Node 0"].location.y = -2.0
+    bpy.context.view_layer.update()
+    assert draw_mcg._MCG_DRAW_CACHES_DIRTY
+    update_mcg_draw_caches()
+    assert [batch_type for batch_type, _ in batches[4:]] == ["POINTS", "LINES"]
+    np.testing.assert_array_equal(batches[-1][1][0], (0.0, -2.0, 0.0))
+    assert tuple(edge_0.location) == pytest.approx((2.0, -1.0, 0.0))
+    bpy.context.view_layer.update()
+    assert not draw_mcg._MCG_DRAW_CACHES_DIRTY
+
+    # User edits of an edge object still dirty the caches.
+    edge_0.location.z = 5.0
+    bpy.context.view_layer.update()
+    assert draw_mcg._MCG_DRAW_CACHES_DIRTY
@@ -0,0 +1,70 @@
+"""Test navmesh edge cost caches on a synthetic navmesh Mesh (requires `bpy`)."""
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from soulstruct.blender.nav_graph import utilities
+from soulstruct.blender.nav_graph.utilities import *
+
+
+@pytest.fixture
+def mesh(monkeypatch):
+    """Flat triangle grid with an `nvm_face_flags` attribute."""
+    monkeypatch.setattr(
+        utilities, "_get_compute_settings_multipliers", lambda: dict(wall_multiplier=1.0, obstacle_multiplier=1.0)
+    )
+    clear_navmesh_edge_cost_caches()
+
+    size = 6
+    vertices = [(x, y, 0.0) for y in range(size + 1) for x in range(size + 1)]
+    faces = []
+    for y in range(size):
+        for x in range(size):
+            v = y * (size + 1) + x
+            faces += [(v, v + 1, v + size + 2), (v, v + size + 2, v + size + 1)]
+    mesh = bpy.data.meshes.new("TestNavmesh")
+    mesh.from_pydata(vertices, [], faces)
+    mesh.attributes.new("nvm_face_flags", "INT", "FACE")
+    yield mesh
+    clear_navmesh_edge_cost_caches()
+    bpy.data.meshes.remove(mesh)
+
+
+def _recompute(mesh: bpy.types.Mesh, face_pairs) -> tuple[list[float], int]:
+    """Compute edge costs like `RecomputeEdgeCost`, returning them and the number of new path searches."""
+    cache = get_navmesh_edge_cost_cache(mesh)
+    start_search_count = cache.search_count
+    costs = [cache.get_best_cost(mesh, start_face_i, end_face_i) for start_face_i, end_face_i in face_pairs]
+    cache.release_path_costs()
+    return costs, cache.search_count - start_search_count
+
+
+def test_second_recompute_does_no_search(mesh):
+    face_pairs = [(0, 71), (0, 40), (71, 40)]
+    costs, search_count = _recompute(mesh, face_pairs)
+    assert search_count == 3  # one tree from each of the three faces
+    assert costs == [pytest.approx(get_best_cost(mesh, a, b)) for a, b in face_pairs]
+    assert get_navmesh_edge_cost_cache(mesh)._path_costs is None  # trees released
+
+    second_costs, second_search_count = _recompute(mesh, face_pairs)
+    assert second_costs == costs
+    assert second_search_count == 0
+
+
+def test_cache_replaced_on_geometry_change(mesh):
+    cache = get_navmesh_edge_cost_cache(mesh)
+    assert get_navmesh_edge_cost_cache(mesh) is cache
+
+    mesh.vertices[0].co.z = 1.0
+    assert get_navmesh_edge_cost_cache(mesh) is not cache
+
+
+def test_caches_cleared_by_handler(mesh):
+    _recompute(mesh, [(0, 71)])
+    cache = get_navmesh_edge_cost_cache(mesh)
+
+    clear_navmesh_edge_cost_caches()
+    new_cache = get_navmesh_edge_cost_cache(mesh)
+    assert new_cache is not cache
+    _, search_count = _recompute(mesh, [(0, 71)])
+    assert search_count > 0
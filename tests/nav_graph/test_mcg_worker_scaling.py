@@ -0,0 +1,84 @@
+"""Test and measure MCG data computation of synthetic navmeshes in worker processes.
+
+Run with `-s` to print the time taken for each worker count.
+"""
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from soulstruct.base.events.enums import NavmeshFlag
+from soulstruct.blender import nav_graph_compute
+from soulstruct.blender.nav_graph_compute import NavmeshSnapshot, get_all_navmesh_mcg_data, get_navmesh_mcg_data
+
+
+def _get_navmesh_snapshot(size: int, offset: float) -> NavmeshSnapshot:
+    """Flat triangle grid of `size * size` quads with an 'Exit' quad in each corner, at x `offset`."""
+    xs, ys = np.meshgrid(np.arange(size + 1), np.arange(size + 1), indexing="xy")
+    vert_coords = np.stack((xs.ravel() + offset, ys.ravel(), np.zeros(xs.size)), axis=1).astype(np.float32)
+    triangles = []
+    face_flags = []
+    for y in range(size):
+        for x in range(size):
+            v = y * (size + 1) + x
+            triangles += [(v, v + 1, v + size + 2), (v, v + size + 2, v + size + 1)]
+            is_corner = x in (0, size - 1) and y in (0, size - 1)
+            face_flags += [NavmeshFlag.Exit if is_corner else 0] * 2
+    triangles = np.array(triangles, dtype=np.int32)
+    return NavmeshSnapshot(
+        face_vert_coords=vert_coords[triangles],
+        triangles=triangles,
+        face_flags=np.array(face_flags, dtype=np.int32),
+        merged_vert_coords=vert_coords,
+        merged_triangles=triangles,
+    )
+
+
+def _assert_same_data(all_data, expected_all_data):
+    assert len(all_data) == len(expected_all_data)
+    for data, expected_data in zip(all_data, expected_all_data):
+        assert data.exit_clusters == expected_data.exit_clusters
+        np.testing.assert_array_equal(data.exit_cluster_costs, expected_data.exit_cluster_costs)
+
+
+def test_exit_clusters_and_costs():
+    data = get_navmesh_mcg_data(_get_navmesh_snapshot(10, 0.0))
+
+    assert len(data.exit_clusters) == 4
+    # Cluster faces are sorted by face index.
+    assert [[f for f, _ in cluster] for cluster in data.exit_clusters] == [[0, 1], [18, 19], [180, 181], [198, 199]]
+    assert data.exit_cluster_costs.shape == (4, 4)
+    np.testing.assert_array_equal(data.exit_cluster_costs, data.exit_cluster_costs.T)
+    assert np.all(data.exit_cluster_costs[~np.eye(4, dtype=bool)] > 0.0)
+
+
+def test_worker_scaling():
+    snapshots = [_get_navmesh_snapshot(40, 100.0 * i) for i in range(8)]
+
+    times = {}
+    expected_all_data = None
+    for worker_count in (1, 2, 4):
+        start = time.perf_counter()
+        all_data = get_all_navmesh_mcg_data(snapshots, worker_count)
+        times[worker_count] = time.perf_counter() - start
+        if expected_all_data is None:
+            expected_all_data = all_data
+        else:
+            _assert_same_data(all_data, expected_all_data)  # results never depend on worker count
+
+    face_count = sum(len(snapshot.triangles) for snapshot in snapshots)
+    print(f"\nMCG data of {len(snapshots)} navmeshes ({face_count} faces) with 1/2/4 workers: ", end="")
+    print(" / ".join(f"{t:.2f} s" for t in times.values()))
+
+
+def test_pool_failure_falls_back_to_serial(monkeypatch):
+    class _BrokenExecutor:
+        def __init__(self, *args, **kwargs):
+            raise OSError("cannot spawn")
+
+    monkeypatch.setattr(nav_graph_compute, "ProcessPoolExecutor", _BrokenExecutor)
+    snapshots = [_get_navmesh_snapshot(5, 10.0 * i) for i in range(3)]
+
+    _assert_same_data(get_all_navmesh_mcg_data(snapshots, 2), get_all_navmesh_mcg_data(snapshots, 1))
@@ -0,0 +1,162 @@
+"""Tests of Blender-independent navmesh face graphs on synthetic meshes."""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from soulstruct.base.events.enums import NavmeshFlag
+from soulstruct.blender.nav_graph_compute import (
+    NavmeshFaceGraph,
+    NavmeshPathCosts,
+    get_polygon_face_pairs,
+    get_triangle_face_pairs,
+)
+
+
+def _get_grid_quads(size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Get vertex coordinates and `(size * size, 4)` quad vertex indices of a flat unit grid."""
+    xs, ys = np.meshgrid(np.arange(size + 1), np.arange(size + 1), indexing="xy")
+    vert_coords = np.stack((xs.ravel(), ys.ravel(), np.zeros(xs.size)), axis=1).astype(np.float32)
+    quads = []
+    for y in range(size):
+        for x in range(size):
+            v = y * (size + 1) + x
+            quads.append((v, v + 1, v + size + 2, v + size + 1))
+    return vert_coords, np.array(quads, dtype=np.int32)
+
+
+def _get_grid_triangles(size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Get vertex coordinates and `(2 * size * size, 3)` triangle vertex indices of a flat unit grid."""
+    vert_coords, quads = _get_grid_quads(size)
+    triangles = np.concatenate((quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]), axis=1).reshape(-1, 3)
+    return vert_coords, triangles
+
+
+def _unmerge_vertices(vert_coords: np.ndarray, triangles: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Give every triangle its own three vertices, as in an unwelded mesh.
+
+    Returns the unmerged vertex coordinates and triangles, and the index of the first new vertex at the same position
+    as each new vertex (the remap that merging by distance would find).
+    """
+    original_vert_indices = triangles.ravel()
+    _, first_indices, inverse = np.unique(original_vert_indices, return_index=True, return_inverse=True)
+    merged_vert_indices = first_indices[inverse.ravel()]
+    return vert_coords[original_vert_indices], np.arange(triangles.size).reshape(-1, 3), merged_vert_indices
+
+
+def _get_path_cost(graph: NavmeshFaceGraph, path: list[int]) -> float:
+    cost = 0.0
+    for face_a, face_b in zip(path, path[1:]):
+        start, stop = graph.offsets[face_a], graph.offsets[face_a + 1]
+        cost += graph.all_passable_step_costs[start:stop][graph.neighbors[start:stop] == face_b][0]
+    return cost
+
+
+def test_triangle_grid_adjacency():
+    vert_coords, triangles = _get_grid_triangles(3)
+    graph = NavmeshFaceGraph.from_triangles(vert_coords, triangles)
+
+    assert graph.face_count == 18
+    # Every inner edge is shared by exactly two triangles: 9 diagonals and 2 * 3 * 2 grid edges.
+    assert len(get_triangle_face_pairs(triangles)) == 21
+    assert len(graph.neighbors) == 42
+    # Both triangles of each quad are neighbors.
+    for quad in range(9):
+        assert 2 * quad + 1 in graph.neighbors[graph.offsets[2 * quad]:graph.offsets[2 * quad + 1]]
+    np.testing.assert_allclose(graph.centroids[0], vert_coords[triangles[0]].mean(axis=0))
+
+
+def test_polygon_pairs_match_triangle_pairs():
+    vert_coords, triangles = _get_grid_triangles(4)
+    polygon_pairs = get_polygon_face_pairs(triangles.ravel(), np.full(len(triangles), 3))
+    triangle_pairs = get_triangle_face_pairs(triangles)
+    assert sorted(map(tuple, np.sort(polygon_pairs, axis=1).tolist())) == sorted(
+        map(tuple, np.sort(triangle_pairs, axis=1).tolist())
+    )
+
+
+def test_quad_grid_path():
+    vert_coords, quads = _get_grid_quads(4)
+    graph = NavmeshFaceGraph.from_polygons(vert_coords, quads.ravel(), np.full(len(quads), 4))
+
+    # Quads only share edges with their four orthogonal neighbors.
+    assert np.diff(graph.offsets).tolist() == [2, 3, 3, 2, 3, 4, 4, 3, 3, 4, 4, 3, 2, 3, 3, 2]
+    path, cost, all_faces_passable = graph.a_star(0, 15)
+    assert len(path) == 7
+    assert not all_faces_passable
+    # Centroids use the first three vertices of each face, so all quads are offset equally.
+    assert cost == pytest.approx(6.0)
+
+
+def test_merged_vertices_keep_face_order():
+    vert_coords, triangles = _get_grid_triangles(3)
+    unmerged_coords, unmerged_triangles, merged_vert_indices = _unmerge_vertices(vert_coords, triangles)
+
+    unmerged_graph = NavmeshFaceGraph.from_triangles(unmerged_coords, unmerged_triangles)
+    assert len(unmerged_graph.neighbors) == 0  # no shared vertex indices
+
+    merged_graph = NavmeshFaceGraph.from_triangles(unmerged_coords, merged_vert_indices[unmerged_triangles])
+    graph = NavmeshFaceGraph.from_triangles(vert_coords, triangles)
+    np.testing.assert_array_equal(merged_graph.offsets, graph.offsets)
+    for face in range(graph.face_count):
+        start, stop = graph.offsets[face], graph.offsets[face + 1]
+        assert sorted(merged_graph.neighbors[start:stop]) == sorted(graph.neighbors[start:stop])
+    np.testing.assert_allclose(merged_graph.centroids, graph.centroids)
+
+
+def test_degenerate_face_is_kept_and_passable():
+    # Two triangles joined only through a zero-area triangle on their shared edge, which `remove_doubles` would delete.
+    vert_coords = np.array([[0, 0, 0], [1, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]], dtype=np.float32)
+    triangles = np.array([[0, 1, 3], [1, 2, 3], [2, 4, 3]])
+    graph = NavmeshFaceGraph.from_triangles(vert_coords, triangles)
+
+    assert graph.face_count == 3
+    path, cost, all_faces_passable = graph.a_star(0, 2)
+    assert path == [0, 1, 2]
+    assert not all_faces_passable
+
+
+def test_a_star_matches_dijkstra():
+    vert_coords, triangles = _get_grid_triangles(6)
+    rng = np.random.default_rng(0)
+    vert_coords[:, 2] = rng.random(len(vert_coords))  # uneven terrain
+    face_flags = np.zeros(len(triangles), dtype=np.int32)
+    face_flags[rng.choice(len(triangles), 10, replace=False)] = NavmeshFlag.Obstacle
+    graph = NavmeshFaceGraph.from_triangles(vert_coords, triangles, face_flags, obstacle_multiplier=2.0)
+
+    tree = graph.dijkstra(0)
+    for end_face in range(1, graph.face_count, 7):
+        path, cost, all_faces_passable = graph.a_star(0, end_face)
+        assert path[0] == 0 and path[-1] == end_face
+        assert cost == pytest.approx(tree[end_face])
+        assert cost == pytest.approx(_get_path_cost(graph, path))
+
+
+def test_impassable_faces_and_fallback():
+    vert_coords, triangles = _get_grid_triangles(3)
+    face_flags = np.zeros(len(triangles), dtype=np.int32)
+    # Disable the middle column of quads, cutting the grid in two.
+    for y in range(3):
+        face_flags[[2 * (y * 3 + 1), 2 * (y * 3 + 1) + 1]] = NavmeshFlag.Disable
+    graph = NavmeshFaceGraph.from_triangles(vert_coords, triangles, face_flags)
+
+    path, cost, all_faces_passable = graph.a_star(0, 5)
+    assert all_faces_passable  # only found through disabled faces
+    assert cost == pytest.approx(_get_path_cost(graph, path))
+
+    assert graph.a_star(0, 5, try_all_faces_passable_fallback=False) == (None, math.inf, False)
+    assert math.isinf(graph.dijkstra(0)[5])
+
+
+def test_path_costs_share_searches():
+    vert_coords, triangles = _get_grid_triangles(5)
+    graph = NavmeshFaceGraph.from_triangles(vert_coords, triangles)
+    path_costs = NavmeshPathCosts(graph)
+
+    for end_face in (10, 20, 30, 40):
+        _, forward_cost, _ = graph.a_star(0, end_face)
+        _, backward_cost, _ = graph.a_star(end_face, 0)
+        assert path_costs.get_best_cost(0, end_face) == pytest.approx(min(forward_cost, backward_cost))
+    assert path_costs.search_count == 5  # one tree from face 0 and one back from each end face
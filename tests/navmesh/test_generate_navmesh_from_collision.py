@@ -0,0 +1,157 @@
+"""Test walkable face selection and mesh building of `GenerateNavmeshFromCollision` on synthetic terrain (requires
+`bpy`)."""
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+import bmesh
+from mathutils import Matrix, Vector
+
+from soulstruct.blender.navmesh.nvm.misc_operators import GenerateNavmeshFromCollision
+from soulstruct.blender.navmesh.nvm.utilities import simplify_navmesh_triangles
+
+WALKABLE_THRESHOLD = 0.95
+
+
+def _new_terrain_mesh(size=30, seed=0) -> bpy.types.Mesh:
+    """Bumpy quad grid (so some faces are too steep) with a few raised plateaus, which make small islands.
+
+    The first three faces are a non-manifold edge of two walkable triangles and a vertical fin between them (in face
+    order), whose walkable triangles only make a large enough island together.
+    """
+    rng = np.random.default_rng(seed)
+    heights = rng.normal(0.0, 0.12, (size + 1, size + 1))
+    for x, y in rng.integers(2, size - 2, (6, 2)):
+        heights[y:y + 2, x:x + 2] += 2.0  # plateau of one quad, surrounded by steep faces
+
+    vertices = [(x, y, heights[y, x]) for y in range(size + 1) for x in range(size + 1)]
+    faces = []
+    for y in range(size):
+        for x in range(size):
+            v = y * (size + 1) + x
+            faces.append((v, v + 1, v + size + 2, v + size + 1))
+
+    # Non-manifold edge from (-5, 0) to (-5, 1), away from the terrain.
+    v = len(vertices)
+    vertices += [(-5.0, 0.0, 0.0), (-5.0, 1.0, 0.0), (-7.0, 0.5, 0.0), (-5.0, 0.5, 2.0), (-3.0, 0.5, 0.0)]
+    faces = [(v, v + 1, v + 2), (v, v + 3, v + 1), (v, v + 4, v + 1)] + faces
+
+    mesh = bpy.data.meshes.new("Terrain")
+    mesh.from_pydata(vertices, [], faces)
+    mesh.update()
+    return mesh
+
+
+def _get_bmesh_walkable_faces(mesh: bpy.types.Mesh, matrix: Matrix, island_area_threshold: float) -> set[int]:
+    """Walkable faces found with BMesh face by face, as `GenerateNavmeshFromCollision` originally did."""
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bm.faces.ensure_lookup_table()
+    up = Vector((0, 0, 1))
+    normal_matrix = matrix.to_3x3()
+    selected = {face for face in bm.faces if (normal_matrix @ face.normal).dot(up) >= WALKABLE_THRESHOLD}
+
+    walkable = set()
+    visited = set()
+    for face in bm.faces:
+        if face not in selected or face in visited:
+            continue
+        island = set()
+        stack = [face]
+        while stack:
+            current = stack.pop()
+            if current in visited:
+                continue
+            visited.add(current)
+            island.add(current)
+            for edge in current.edges:
+                stack.extend(f for f in edge.link_faces if f in selected and f not in visited)
+        if sum(f.calc_area() for f in island) >= island_area_threshold:
+            walkable |= {f.index for f in island}
+    bm.free()
+    return walkable
+
+
+@pytest.fixture
+def terrain_mesh():
+    mesh = _new_terrain_mesh()
+    yield mesh
+    bpy.data.meshes.remove(mesh)
+
+
+@pytest.mark.parametrize("matrix", [Matrix.Identity(4), Matrix.Rotation(0.2, 4, "X")])
+@pytest.mark.parametrize("island_area_threshold", [1.5, 3.0])
+def test_walkable_faces_match_bmesh(terrain_mesh, matrix, island_area_threshold):
+    walkable = GenerateNavmeshFromCollision.get_walkable_face_mask(
+        terrain_mesh, matrix, WALKABLE_THRESHOLD, island_area_threshold
+    )
+    expected_walkable = _get_bmesh_walkable_faces(terrain_mesh, matrix, island_area_threshold)
+
+    assert 0 < len(expected_walkable) < len(terrain_mesh.polygons)  # some faces are steep or in small islands
+    assert set(np.flatnonzero(walkable).tolist()) == expected_walkable
+
+
+def test_non_manifold_edge_joins_walkable_faces(terrain_mesh):
+    # Each walkable triangle has an area of 1.0, and the fin between them is not walkable.
+    walkable = GenerateNavmeshFromCollision.get_walkable_face_mask(
+        terrain_mesh, Matrix.Identity(4), WALKABLE_THRESHOLD, 1.5
+    )
+    assert walkable[:3].tolist() == [True, False, True]
+
+    walkable = GenerateNavmeshFromCollision.get_walkable_face_mask(
+        terrain_mesh, Matrix.Identity(4), WALKABLE_THRESHOLD, 2.5
+    )
+    assert walkable[:3].tolist() == [False, False, False]
+
+
+def test_new_mesh_from_faces(terrain_mesh):
+    face_mask = GenerateNavmeshFromCollision.get_walkable_face_mask(
+        terrain_mesh, Matrix.Identity(4), WALKABLE_THRESHOLD, 1.5
+    )
+    new_mesh = GenerateNavmeshFromCollision.new_mesh_from_faces(terrain_mesh, face_mask, "Navmesh")
+    try:
+        assert len(new_mesh.polygons) == np.count_nonzero(face_mask)
+        new_faces = [[tuple(new_mesh.vertices[v].co) for v in face.vertices] for face in new_mesh.polygons]
+        old_faces = [
+            [tuple(terrain_mesh.vertices[v].co) for v in face.vertices]
+            for face, is_walkable in zip(terrain_mesh.polygons, face_mask)
+            if is_walkable
+        ]
+        assert new_faces == old_faces
+        assert len(new_mesh.vertices) == len({v for face in new_mesh.polygons for v in face.vertices})
+    finally:
+        bpy.data.meshes.remove(new_mesh)
+
+
+def test_simplify_mesh_matches_from_pydata():
+    size = 20
+    vertices = [(x, y, 0.0) for y in range(size + 1) for x in range(size + 1)]
+    faces = []
+    for y in range(size):
+        for x in range(size):
+            v = y * (size + 1) + x
+            faces += [(v, v + 1, v + size + 2), (v, v + size + 2, v + size + 1)]
+    mesh = bpy.data.meshes.new("Navmesh")
+    mesh.from_pydata(vertices, [], faces)
+    material = bpy.data.materials.new("Navmesh Flag Default")
+    mesh.materials.append(material)
+    expected_mesh = bpy.data.meshes.new("Expected")
+    try:
+        new_vertices, new_triangles, _ = simplify_navmesh_triangles(
+            np.array(vertices), np.array(faces), angle_limit=0.1, max_edge_length=5.0
+        )
+        expected_mesh.from_pydata(new_vertices, [], new_triangles.tolist())
+
+        GenerateNavmeshFromCollision.simplify_mesh(mesh, 0.1, 5.0)
+        assert 0 < len(mesh.polygons) < len(faces)
+        assert [tuple(v.co) for v in mesh.vertices] == [tuple(v.co) for v in expected_mesh.vertices]
+        assert [tuple(f.vertices) for f in mesh.polygons] == [tuple(f.vertices) for f in expected_mesh.polygons]
+        assert sorted(e.key for e in mesh.edges) == sorted(e.key for e in expected_mesh.edges)
+        assert {f.material_index for f in mesh.polygons} == {0}
+        assert len(mesh.materials) == 1
+        assert not mesh.validate()
+    finally:
+        bpy.data.meshes.remove(mesh)
+        bpy.data.meshes.remove(expected_mesh)
+        bpy.data.materials.remove(material)
@@ -0,0 +1,160 @@
+"""Compare array-based `BlenderNVM.to_soulstruct_obj()` and `get_nvm_connected_face_indices()` with the original
+per-edge face search and `BMesh` export, on random meshes with duplicate and degenerate triangles (requires `bpy`).
+
+Run with `-s` to print export times.
+"""
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+bmesh = pytest.importorskip("bmesh")
+
+from soulstruct.base.maps.navmesh.nvm import NVM, NVMTriangle
+
+from soulstruct.blender.navmesh.nvm.properties import NVMEventEntityProps, NVMFaceIndex, NVMProps
+from soulstruct.blender.navmesh.nvm.types import BlenderNVM, BlenderNVMEventEntity
+from soulstruct.blender.navmesh.nvm.utilities import get_nvm_connected_face_indices
+from soulstruct.blender.utilities import set_mesh_vertices_and_faces
+
+
+def _get_connected_face_indices_per_edge(nvm_faces: list[tuple[int, int, int]]) -> list[tuple[int, int, int]]:
+    """Original connected face search of `BlenderNVM.to_soulstruct_obj()`."""
+
+    def find_connected_face_index(edge_v1: int, edge_v2: int, not_face) -> int:
+        for i_, f_ in enumerate(nvm_faces):
+            if f_ != not_face and edge_v1 in f_ and edge_v2 in f_:  # order doesn't matter
+                return i_
+        return -1
+
+    return [
+        (
+            find_connected_face_index(face[0], face[1], face),
+            find_connected_face_index(face[1], face[2], face),
+            find_connected_face_index(face[2], face[0], face),
+        )
+        for face in nvm_faces
+    ]
+
+
+def _to_nvm_with_bmesh(bl_nvm: BlenderNVM) -> NVM:
+    """Original `BlenderNVM.to_soulstruct_obj()`, which read flags from `BMesh` face layers."""
+    mesh_data = bl_nvm.obj.data
+    nvm_verts = np.array([vert.co for vert in mesh_data.vertices], dtype=np.float32)
+    nvm_verts[:, [1, 2]] = nvm_verts[:, [2, 1]]
+    nvm_faces = [tuple(face.vertices) for face in mesh_data.polygons]
+    nvm_connected_face_indices = _get_connected_face_indices_per_edge(nvm_faces)
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh_data)
+    bm.faces.ensure_lookup_table()
+    flags_layer = bm.faces.layers.int.get("nvm_face_flags")
+    obstacle_count_layer = bm.faces.layers.int.get("nvm_face_obstacle_count")
+    nvm_flags = [bm_face[flags_layer] for bm_face in bm.faces]
+    nvm_obstacle_counts = [bm_face[obstacle_count_layer] for bm_face in bm.faces]
+    bm.free()
+
+    nvm_triangles = [
+        NVMTriangle(
+            vertex_indices=nvm_faces[i],
+            connected_indices=nvm_connected_face_indices[i],
+            obstacle_count=nvm_obstacle_counts[i],
+            flags=nvm_flags[i],
+        )
+        for i in range(len(nvm_faces))
+    ]
+    event_entities = [
+        bl_event.to_soulstruct_obj(None, bpy.context) for bl_event in bl_nvm.get_nvm_event_entities()
+    ]
+    return NVM(big_endian=False, vertices=nvm_verts, triangles=nvm_triangles, event_entities=event_entities)
+
+
+def _get_random_triangles(rng: np.random.Generator, vertex_count: int, face_count: int) -> np.ndarray:
+    """Random triangles of a small vertex pool (so many edges are shared by more than two triangles), with some exact
+    and reordered duplicates and some degenerate triangles."""
+    triangles = rng.integers(0, vertex_count, (face_count, 3))
+    face_indices = rng.permutation(face_count)
+    duplicates, reordered, degenerate = np.array_split(face_indices[:face_count // 5], 3)
+    triangles[duplicates] = triangles[duplicates - 1]
+    triangles[reordered] = triangles[reordered - 1][:, ::-1]
+    triangles[degenerate, 1] = triangles[degenerate, 0]
+    return triangles
+
+
+@pytest.fixture
+def nvm_props():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bpy.utils.register_class(NVMProps)
+    bpy.utils.register_class(NVMFaceIndex)
+    bpy.utils.register_class(NVMEventEntityProps)
+    bpy.types.Object.soulstruct_type = bpy.props.StringProperty()
+    bpy.types.Object.NVM = bpy.props.PointerProperty(type=NVMProps)
+    bpy.types.Object.NVM_EVENT_ENTITY = bpy.props.PointerProperty(type=NVMEventEntityProps)
+    yield
+    del bpy.types.Object.NVM_EVENT_ENTITY
+    del bpy.types.Object.NVM
+    del bpy.types.Object.soulstruct_type
+    bpy.utils.unregister_class(NVMEventEntityProps)
+    bpy.utils.unregister_class(NVMFaceIndex)
+    bpy.utils.unregister_class(NVMProps)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_connected_face_indices_match_per_edge_search(seed):
+    rng = np.random.default_rng(seed)
+    triangles = _get_random_triangles(rng, vertex_count=40, face_count=300)
+    expected = _get_connected_face_indices_per_edge([tuple(face) for face in triangles.tolist()])
+    connected = get_nvm_connected_face_indices(triangles)
+    assert connected.tolist() == [list(face) for face in expected]
+
+
+def test_connected_face_indices_edge_cases():
+    assert get_nvm_connected_face_indices(np.zeros((0, 3), dtype=np.int32)).shape == (0, 3)
+    # Exact duplicates are never connected to each other, but reordered duplicates are.
+    assert get_nvm_connected_face_indices([(0, 1, 2), (0, 1, 2), (2, 1, 0)]).tolist() == [
+        [2, 2, 2], [2, 2, 2], [0, 0, 0]
+    ]
+    # Degenerate edges connect to the first other face with that vertex.
+    assert get_nvm_connected_face_indices([(0, 0, 1), (3, 4, 0), (1, 0, 2)]).tolist() == [
+        [1, 2, 2], [-1, -1, -1], [0, -1, -1]
+    ]
+
+
+def test_to_soulstruct_obj_matches_bmesh_export(nvm_props):
+    rng = np.random.default_rng(0)
+    vertex_count = 500
+    triangles = np.concatenate((
+        _get_random_triangles(rng, vertex_count, 3000),
+        rng.integers(0, vertex_count, (10, 3)),  # faces with no connected faces
+    ))
+    mesh = bpy.data.meshes.new("n0000")
+    set_mesh_vertices_and_faces(mesh, rng.uniform(-50.0, 50.0, (vertex_count, 3)), triangles)
+    mesh.attributes.new("nvm_face_flags", "INT", "FACE").data.foreach_set(
+        "value", rng.integers(0, 0x10000, len(triangles)).astype(np.int32)
+    )
+    mesh.attributes.new("nvm_face_obstacle_count", "INT", "FACE").data.foreach_set(
+        "value", rng.integers(0, 4, len(triangles)).astype(np.int32)
+    )
+    bl_nvm = BlenderNVM.new("n0000", mesh)
+    bl_event = BlenderNVMEventEntity.new("n0000 Event 100", None)
+    bl_event.obj.parent = bl_nvm.obj
+    bl_event.entity_id = 100
+    bl_event.triangle_indices = [3, 1, 4]
+
+    warnings = []
+    operator = SimpleNamespace(warning=warnings.append)
+    context = SimpleNamespace(scene=SimpleNamespace(soulstruct_settings=SimpleNamespace(is_game=lambda game: False)))
+    start = time.perf_counter()
+    expected_nvm = _to_nvm_with_bmesh(bl_nvm)
+    old_time = time.perf_counter() - start
+    start = time.perf_counter()
+    nvm = bl_nvm.to_soulstruct_obj(operator, context)
+    new_time = time.perf_counter() - start
+
+    print(f"\nExported {len(triangles)} NVM triangles: per edge {old_time:.3f} s, arrays {new_time:.3f} s")
+    expected_isolated_count = sum(t.connected_indices == (-1, -1, -1) for t in expected_nvm.triangles)
+    assert len(warnings) == expected_isolated_count >= 10
+    assert [t.connected_indices for t in nvm.triangles] == [t.connected_indices for t in expected_nvm.triangles]
+    assert nvm.to_bytes() == expected_nvm.to_bytes()
@@ -0,0 +1,149 @@
+"""Compare array-based `BlenderNVM.new_from_soulstruct_obj()` and `set_face_materials()` with the original `BMesh`
+import and face-by-face materials on a random NVM (requires `bpy`).
+
+Run with `-s` to print import times.
+"""
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+bmesh = pytest.importorskip("bmesh")
+from mathutils import Vector
+
+from soulstruct.base.events.enums import NavmeshFlag
+from soulstruct.base.maps.navmesh.nvm import NVM, NVMEventEntity, NVMTriangle
+
+from soulstruct.blender.navmesh.nvm.properties import NVMEventEntityProps, NVMFaceIndex, NVMProps
+from soulstruct.blender.navmesh.nvm.types import BlenderNVM
+from soulstruct.blender.navmesh.nvm.utilities import get_navmesh_material
+from soulstruct.blender.utilities import LoggingOperator, game_vector_array_to_bl_vector_array
+
+OPERATOR = SimpleNamespace(to_object_mode=LoggingOperator.to_object_mode, deselect_all=LoggingOperator.deselect_all)
+
+
+def _new_mesh_with_bmesh(nvm: NVM, name: str) -> tuple[bpy.types.Mesh, dict[int, tuple[float, float, float]]]:
+    """Original `BlenderNVM.new_from_soulstruct_obj()` mesh and event positions, with face flags written to `BMesh`
+    face layers and materials set face by face."""
+    mesh = bpy.data.meshes.new(name=name)
+    vertices = game_vector_array_to_bl_vector_array(nvm.vertices)
+    mesh.from_pydata(vertices, [], [triangle.vertex_indices for triangle in nvm.triangles])
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bm.faces.ensure_lookup_table()
+    flags_layer = bm.faces.layers.int.new("nvm_face_flags")
+    obstacle_count_layer = bm.faces.layers.int.new("nvm_face_obstacle_count")
+    for f_i, face in enumerate(bm.faces):
+        face[flags_layer] = nvm.triangles[f_i].flags
+        face[obstacle_count_layer] = nvm.triangles[f_i].obstacle_count
+    event_positions = {}
+    for nvm_event in nvm.event_entities:
+        avg_pos = sum((bm.faces[i].calc_center_median() for i in nvm_event.triangle_indices), Vector())
+        event_positions[nvm_event.entity_id] = tuple(avg_pos / len(nvm_event.triangle_indices))
+    bm.to_mesh(mesh)
+    bm.free()
+
+    for bl_tri, nvm_triangle in zip(mesh.polygons, nvm.triangles, strict=True):
+        try:
+            flag = NavmeshFlag(nvm_triangle.flags)
+            material_name = f"Navmesh Flag {flag.name}"
+        except ValueError:
+            flag = None
+            material_name = "Navmesh Flag <Multiple>"
+        material_index = mesh.materials.find(material_name)
+        if material_index >= 0:
+            bl_tri.material_index = material_index
+        else:
+            bl_tri.material_index = len(mesh.materials)
+            mesh.materials.append(get_navmesh_material(flag))
+    return mesh, event_positions
+
+
+def _get_face_ints(mesh: bpy.types.Mesh, attribute_name: str) -> np.ndarray:
+    values = np.empty(len(mesh.polygons), dtype=np.int32)
+    if attribute_name == "material_index":
+        mesh.polygons.foreach_get("material_index", values)
+    else:
+        mesh.attributes[attribute_name].data.foreach_get("value", values)
+    return values
+
+
+def _new_random_nvm(rng: np.random.Generator, vertex_count: int, face_count: int) -> NVM:
+    single_flags = [flag.value for flag in NavmeshFlag]
+    multiple_flags = [NavmeshFlag.Exit | NavmeshFlag.Edge, NavmeshFlag.Wall | NavmeshFlag.Obstacle | NavmeshFlag.Hole]
+    flags = rng.choice(single_flags + [int(f) for f in multiple_flags], face_count)
+    triangles = [
+        NVMTriangle(
+            vertex_indices=tuple(rng.choice(vertex_count, 3, replace=False).tolist()),
+            connected_indices=(-1, -1, -1),
+            obstacle_count=int(rng.integers(0, 4)),
+            flags=int(face_flags),
+        )
+        for face_flags in flags
+    ]
+    event_entities = [
+        NVMEventEntity(entity_id=100, triangle_indices=[3, 1, 4]),
+        NVMEventEntity(entity_id=101, triangle_indices=rng.choice(face_count, 20, replace=False).tolist()),
+    ]
+    return NVM(
+        big_endian=False,
+        vertices=rng.uniform(-50.0, 50.0, (vertex_count, 3)).astype(np.float32),
+        triangles=triangles,
+        event_entities=event_entities,
+    )
+
+
+@pytest.fixture
+def nvm_props():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bpy.utils.register_class(NVMProps)
+    bpy.utils.register_class(NVMFaceIndex)
+    bpy.utils.register_class(NVMEventEntityProps)
+    bpy.types.Object.soulstruct_type = bpy.props.StringProperty()
+    bpy.types.Object.NVM = bpy.props.PointerProperty(type=NVMProps)
+    bpy.types.Object.NVM_EVENT_ENTITY = bpy.props.PointerProperty(type=NVMEventEntityProps)
+    yield
+    del bpy.types.Object.NVM_EVENT_ENTITY
+    del bpy.types.Object.NVM
+    del bpy.types.Object.soulstruct_type
+    bpy.utils.unregister_class(NVMEventEntityProps)
+    bpy.utils.unregister_class(NVMFaceIndex)
+    bpy.utils.unregister_class(NVMProps)
+
+
+def test_new_from_soulstruct_obj_matches_bmesh_import(nvm_props):
+    nvm = _new_random_nvm(np.random.default_rng(0), vertex_count=400, face_count=2000)
+
+    start = time.perf_counter()
+    expected_mesh, expected_event_positions = _new_mesh_with_bmesh(nvm, "Expected")
+    old_time = time.perf_counter() - start
+    start = time.perf_counter()
+    bl_nvm = BlenderNVM.new_from_soulstruct_obj(OPERATOR, bpy.context, nvm, "n0000")
+    bl_nvm.set_face_materials(nvm)
+    new_time = time.perf_counter() - start
+    mesh = bl_nvm.obj.data
+
+    print(f"\nImported {len(nvm.triangles)} NVM triangles: BMesh {old_time:.3f} s, arrays {new_time:.3f} s")
+    assert [tuple(v.co) for v in mesh.vertices] == [tuple(v.co) for v in expected_mesh.vertices]
+    assert [tuple(p.vertices) for p in mesh.polygons] == [tuple(p.vertices) for p in expected_mesh.polygons]
+    for name in ("nvm_face_flags", "nvm_face_obstacle_count", "material_index"):
+        np.testing.assert_array_equal(_get_face_ints(mesh, name), _get_face_ints(expected_mesh, name), name)
+    assert [m.name for m in mesh.materials] == [m.name for m in expected_mesh.materials]
+    assert len(mesh.materials) == len(NavmeshFlag) + 1  # one "<Multiple>" slot
+
+    events = {bl_event.entity_id: bl_event for bl_event in bl_nvm.get_nvm_event_entities()}
+    assert events.keys() == expected_event_positions.keys()
+    for entity_id, expected_position in expected_event_positions.items():
+        assert tuple(events[entity_id].obj.location) == pytest.approx(expected_position, abs=1e-4)
+
+
+def test_event_with_no_triangles(nvm_props, recwarn):
+    nvm = _new_random_nvm(np.random.default_rng(1), vertex_count=30, face_count=30)
+    nvm.event_entities = [NVMEventEntity(entity_id=100, triangle_indices=[])]
+    bl_nvm = BlenderNVM.new_from_soulstruct_obj(OPERATOR, bpy.context, nvm, "n0000")
+    (bl_event,) = bl_nvm.get_nvm_event_entities()
+    assert tuple(bl_event.obj.location) == (0.0, 0.0, 0.0)
+    assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
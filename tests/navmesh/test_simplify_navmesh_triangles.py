@@ -0,0 +1,78 @@
+"""Test navmesh simplification on synthetic terraced terrain (requires `bpy`)."""
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("bpy")
+
+from soulstruct.base.events.enums import NavmeshFlag
+from soulstruct.blender.navmesh.nvm.utilities import simplify_navmesh_triangles
+
+
+def _get_terraced_terrain(size=40, terrace_width=10) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Triangulated unit grid of flat terraces, one unit higher each, joined by steep one-quad ramps. A square patch of
+    the first terrace has different flags."""
+    xs, ys = np.meshgrid(np.arange(size + 1), np.arange(size + 1), indexing="xy")
+    heights = np.minimum(xs // terrace_width, (xs - 1) // terrace_width + 1).astype(np.float64)
+    vertices = np.stack((xs.ravel(), ys.ravel(), heights.ravel()), axis=1).astype(np.float64)
+
+    triangles = []
+    face_flags = []
+    for y in range(size):
+        for x in range(size):
+            v = y * (size + 1) + x
+            triangles += [(v, v + 1, v + size + 2), (v, v + size + 2, v + size + 1)]
+            is_patch = 2 <= x < 6 and 2 <= y < 6
+            face_flags += [NavmeshFlag.Obstacle if is_patch else 0] * 2
+    return vertices, np.array(triangles), np.array(face_flags)
+
+
+def _get_triangle_areas(vertices: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    corners = vertices[triangles]
+    return 0.5 * np.linalg.norm(np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1)
+
+
+def _get_boundary_edges(vertices: np.ndarray, triangles: np.ndarray) -> set:
+    """Boundary edges as pairs of sorted vertex coordinates (so they can be compared across vertex indices)."""
+    edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    unique_edges, counts = np.unique(edges, axis=0, return_counts=True)
+    return {
+        tuple(sorted((tuple(vertices[a]), tuple(vertices[b])))) for a, b in unique_edges[counts == 1].tolist()
+    }
+
+
+def test_simplify_terraced_terrain():
+    vertices, triangles, face_flags = _get_terraced_terrain()
+    new_vertices, new_triangles, face_indices = simplify_navmesh_triangles(
+        vertices, triangles, face_flags, angle_limit=math.radians(5.0), max_edge_length=5.0
+    )
+    new_face_flags = face_flags[face_indices]
+
+    # Flat terraces are merged into much fewer triangles.
+    reduction = 1.0 - len(new_triangles) / len(triangles)
+    print(f"\nSimplified terraced terrain from {len(triangles)} to {len(new_triangles)} triangles ({reduction:.0%}).")
+    assert reduction > 0.5
+
+    # Walkable area is preserved, in total and for each flag.
+    areas = _get_triangle_areas(vertices, triangles)
+    new_areas = _get_triangle_areas(new_vertices, new_triangles)
+    assert new_areas.sum() == pytest.approx(areas.sum(), rel=1e-3)
+    for flag in (0, NavmeshFlag.Obstacle):
+        assert new_areas[new_face_flags == flag].sum() == pytest.approx(areas[face_flags == flag].sum(), rel=1e-3)
+
+    # No degenerate triangles, no edges longer than the limit, and the navmesh outline is unchanged.
+    assert new_areas.min() > 1e-6
+    corners = new_vertices[new_triangles]
+    edge_lengths = np.linalg.norm(corners - np.roll(corners, 1, axis=1), axis=2)
+    assert edge_lengths.max() <= 5.0 + 1e-6
+    assert _get_boundary_edges(new_vertices, new_triangles) == _get_boundary_edges(vertices, triangles)
+
+
+def test_simplify_keeps_non_coplanar_triangles():
+    vertices, triangles, _ = _get_terraced_terrain(size=4)
+    vertices[:, 2] += np.random.default_rng(0).normal(0.0, 0.5, len(vertices))  # nothing is coplanar
+    new_vertices, new_triangles, face_indices = simplify_navmesh_triangles(vertices, triangles)
+
+    assert len(new_triangles) == len(triangles)
+    np.testing.assert_array_equal(face_indices, np.arange(len(triangles)))
@@ -0,0 +1,101 @@
+"""Compare `copy_armature_pose()` with its original per-bone copy for many targets (requires `bpy`).
+
+Run with `-s` to print benchmark times.
+"""
+import time
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from soulstruct.blender.utilities.bpy_data import copy_armature_pose
+
+BONE_COUNT = 250
+TARGET_COUNT = 100
+IGNORED_BONE_NAMES = {"<PART_ROOT>"}
+
+
+def _new_armature_obj(name: str, bone_names: list[str]) -> bpy.types.Object:
+    armature = bpy.data.armatures.new(name)
+    obj = bpy.data.objects.new(name, armature)
+    bpy.context.scene.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    for i, bone_name in enumerate(bone_names):
+        edit_bone = armature.edit_bones.new(bone_name)
+        edit_bone.head = (0.0, 0.0, i)
+        edit_bone.tail = (0.0, 1.0, i)
+    bpy.ops.object.mode_set(mode="OBJECT")
+    bpy.context.view_layer.update()
+    return obj
+
+
+def _copy_pose_per_bone(source_armature, dest_armature, ignore_bone_names=()):
+    """Original `copy_armature_pose()`."""
+    for pose_bone in dest_armature.pose.bones:
+        if pose_bone.name in ignore_bone_names:
+            continue
+        source_bone = source_armature.pose.bones[pose_bone.name]
+        pose_bone.rotation_mode = "QUATERNION"
+        pose_bone.location = source_bone.location
+        pose_bone.rotation_quaternion = source_bone.rotation_quaternion
+        pose_bone.scale = source_bone.scale
+
+
+def _new_targets(prefix: str, bone_names: list[str]) -> list[bpy.types.Object]:
+    """Targets sharing an Armature with bones in reverse order, each with an Euler-rotated bone and a posed ignored
+    bone."""
+    armature = _new_armature_obj(prefix, bone_names[::-1]).data
+    targets = []
+    for i in range(TARGET_COUNT):
+        obj = bpy.data.objects.new(f"{prefix} {i}", armature)
+        bpy.context.scene.collection.objects.link(obj)
+        targets.append(obj)
+    bpy.context.view_layer.update()
+    for obj in targets:
+        obj.pose.bones[bone_names[1]].rotation_mode = "XYZ"
+        obj.pose.bones["<PART_ROOT>"].location = (1.0, 2.0, 3.0)
+    return targets
+
+
+def _get_pose(armature_obj: bpy.types.Object) -> dict[str, tuple]:
+    return {
+        bone.name: (
+            bone.rotation_mode, tuple(bone.location), tuple(bone.rotation_quaternion), tuple(bone.scale)
+        )
+        for bone in armature_obj.pose.bones
+    }
+
+
+def test_copy_armature_pose_matches_per_bone_copy():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bone_names = ["<PART_ROOT>"] + [f"Bone{i}" for i in range(BONE_COUNT - 1)]
+    source_obj = _new_armature_obj("Source", bone_names)
+    rng = np.random.default_rng(0)
+    for pose_bone in source_obj.pose.bones:
+        pose_bone.location = rng.normal(size=3)
+        quaternion = rng.normal(size=4)
+        pose_bone.rotation_quaternion = quaternion / np.linalg.norm(quaternion)
+        pose_bone.scale = rng.uniform(0.5, 2.0, 3)
+
+    expected_targets = _new_targets("Expected", bone_names)
+    targets = _new_targets("Target", bone_names)
+
+    start = time.perf_counter()
+    for target in expected_targets:
+        _copy_pose_per_bone(source_obj, target, IGNORED_BONE_NAMES)
+    old_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for target in targets:
+        copy_armature_pose(source_obj, target, IGNORED_BONE_NAMES)
+    new_time = time.perf_counter() - start
+
+    print(
+        f"\nCopied {BONE_COUNT} bones to {TARGET_COUNT} armatures: per bone {old_time:.3f} s, "
+        f"foreach {new_time:.3f} s"
+    )
+    for expected_target, target in zip(expected_targets, targets):
+        assert _get_pose(target) == _get_pose(expected_target)
+    assert tuple(targets[0].pose.bones["<PART_ROOT>"].location) == (1.0, 2.0, 3.0)
+    assert targets[0].pose.bones["Bone5"].location == source_obj.pose.bones["Bone5"].location
@@ -0,0 +1,119 @@
+"""Test bulk Mesh creation, and compare it with `from_pydata()` for importing many navmeshes (requires `bpy`).
+
+Run with `-s` to print benchmark times.
+"""
+import time
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from soulstruct.blender.utilities.meshes import set_mesh_vertices_and_faces
+
+
+def _get_navmesh_data(size: int, seed: int) -> tuple[np.ndarray, list[list[int]]]:
+    """Vertices and faces of varying lengths (like `NavmeshHKX.get_simple_mesh()`) of a bumpy grid, where each row of
+    quads is split into triangles, kept as quads, or merged in pairs into pentagons. `size` must be even."""
+    rng = np.random.default_rng(seed)
+    xs, ys = np.meshgrid(np.arange(size + 1), np.arange(size + 1), indexing="xy")
+    vertices = np.stack((xs.ravel(), ys.ravel(), rng.random(xs.size)), axis=1)
+    faces = []
+    for y in range(size):
+        for x in range(size):
+            v = y * (size + 1) + x
+            quad = [v, v + 1, v + size + 2, v + size + 1]
+            if y % 3 == 0:
+                faces += [quad[:3], [quad[0], quad[2], quad[3]]]
+            elif y % 3 == 1 or x == size - 1:
+                faces.append(quad)
+            elif x % 2 == 0:
+                # Pentagon over this quad and the next one, which is skipped.
+                faces.append([v, v + 1, v + 2, v + size + 3, v + size + 1])
+    return vertices, faces
+
+
+def _get_mesh_faces(mesh: bpy.types.Mesh) -> list[list[int]]:
+    return [list(face.vertices) for face in mesh.polygons]
+
+
+def _get_mesh_vertices(mesh: bpy.types.Mesh) -> np.ndarray:
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    return coords.reshape(-1, 3)
+
+
+@pytest.fixture
+def meshes():
+    """Create new Meshes and remove them after the test."""
+    created = []
+
+    def new_mesh(name: str) -> bpy.types.Mesh:
+        created.append(bpy.data.meshes.new(name))
+        return created[-1]
+
+    yield new_mesh
+    for mesh in created:
+        bpy.data.meshes.remove(mesh)
+
+
+@pytest.mark.parametrize("face_format", ["sequences", "array", "loops"])
+def test_set_mesh_vertices_and_faces_matches_from_pydata(meshes, face_format):
+    vertices, faces = _get_navmesh_data(6, seed=0)
+    if face_format == "array":
+        faces = [face for face in faces if len(face) == 3]
+        face_args = (np.array(faces),)
+    elif face_format == "loops":
+        face_args = (np.concatenate(faces), [len(face) for face in faces])
+    else:
+        face_args = (faces,)
+
+    expected_mesh = meshes("Expected")
+    expected_mesh.from_pydata(vertices, [], faces)
+    mesh = meshes("Mesh")
+    set_mesh_vertices_and_faces(mesh, vertices, *face_args)
+
+    assert not mesh.validate()  # nothing to fix
+    assert _get_mesh_faces(mesh) == _get_mesh_faces(expected_mesh)
+    np.testing.assert_array_equal(_get_mesh_vertices(mesh), _get_mesh_vertices(expected_mesh))
+    assert sorted(tuple(edge.vertices) for edge in mesh.edges) == sorted(
+        tuple(edge.vertices) for edge in expected_mesh.edges
+    )
+
+
+def test_import_200_navmeshes_benchmark(meshes):
+    """Compare Mesh creation for 200 synthetic NVMHKT navmeshes between the original `NVMHKTImporter` path (`bpy.ops`
+    mode switches and `from_pydata()` for each navmesh) and the current one (`set_mesh_vertices_and_faces()`)."""
+    all_navmesh_data = [_get_navmesh_data(30, seed=i) for i in range(200)]
+
+    def import_with_from_pydata(name: str, vertices: np.ndarray, faces: list[list[int]]) -> bpy.types.Mesh:
+        if bpy.ops.object.mode_set.poll():
+            bpy.ops.object.mode_set(mode="OBJECT", toggle=False)
+        if bpy.ops.object.select_all.poll():
+            bpy.ops.object.select_all(action="DESELECT")
+        if bpy.ops.object.mode_set.poll():
+            bpy.ops.object.mode_set(mode="OBJECT", toggle=False)
+        mesh = meshes(name)
+        mesh.from_pydata(vertices, [], faces)
+        return mesh
+
+    def import_with_foreach_set(name: str, vertices: np.ndarray, faces: list[list[int]]) -> bpy.types.Mesh:
+        mesh = meshes(name)
+        set_mesh_vertices_and_faces(mesh, vertices, faces)
+        return mesh
+
+    times = {}
+    loop_counts = {}
+    for import_func in (import_with_from_pydata, import_with_foreach_set):
+        start = time.perf_counter()
+        new_meshes = [
+            import_func(f"{import_func.__name__} {i}", vertices, faces)
+            for i, (vertices, faces) in enumerate(all_navmesh_data)
+        ]
+        times[import_func.__name__] = time.perf_counter() - start
+        loop_counts[import_func.__name__] = [len(mesh.loops) for mesh in new_meshes]
+
+    face_count = sum(len(faces) for _, faces in all_navmesh_data)
+    print(f"\nCreated 200 navmesh Meshes ({face_count} faces): ", end="")
+    print(", ".join(f"{name}: {t:.2f} s" for name, t in times.items()))
+    assert loop_counts["import_with_foreach_set"] == loop_counts["import_with_from_pydata"]